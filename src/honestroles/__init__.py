@@ -1,133 +1,274 @@
 from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from honestroles.__about__ import __version__
-from honestroles.config import (
-    AdapterCastType,
-    AdapterOnError,
-    InputAdapterFieldConfig,
-    InputAliasesConfig,
-    PipelineSpec,
-    PluginManifestConfig,
-    PluginManifestItem,
-    RuntimeConfig,
-    RuntimeQualityConfig,
-    SourceAdapterSpec,
-    load_pipeline_config,
-    load_plugin_manifest,
-)
-from honestroles.diagnostics import RuntimeDiagnostics
-from honestroles.domain import ApplicationPlanEntry, CanonicalJobRecord, JobDataset
 from honestroles.errors import (
     ConfigValidationError,
     HonestRolesError,
     RuntimeInitializationError,
     StageExecutionError,
 )
-from honestroles.eda import (
-    EDAArtifactsBundle,
-    EDAArtifactsManifest,
-    EDARules,
-    DriftRules,
-    GateRules,
-    EDAProfileResult,
-    build_eda_diff,
-    build_eda_profile,
-    evaluate_eda_gate,
-    generate_eda_artifacts,
-    generate_eda_diff_artifacts,
-    load_eda_artifacts,
-    load_eda_rules,
-)
-from honestroles.ingest import (
-    BatchIngestionResult,
-    IngestQualityPolicy,
-    IngestQualityResult,
-    IngestionDefaults,
-    IngestionManifest,
-    IngestionMergePolicy,
-    IngestionReport,
-    IngestionRequest,
-    IngestionResult,
-    IngestionSource,
-    IngestionSourceConfig,
-    IngestionStateEntry,
-    IngestionValidationResult,
-    evaluate_ingest_quality,
-    load_ingest_manifest,
-    load_ingest_quality_policy,
-    sync_source,
-    sync_sources_from_manifest,
-    validate_ingestion_source,
-)
-from honestroles.io import (
-    AdapterInferenceResult,
-    DataQualityAccumulator,
-    DataQualityReport,
-    _validate_read_query,
-    _validate_table_name,
-    apply_source_adapter,
-    build_data_quality_report,
-    infer_source_adapter,
-    normalize_source_data_contract,
-    read_parquet,
-    render_adapter_toml_fragment,
-    resolve_source_aliases,
-    validate_source_data_contract,
-    write_parquet,
-)
-from honestroles.plugins import (
-    FilterPlugin,
-    FilterStageContext,
-    LabelPlugin,
-    LabelStageContext,
-    PluginExecutionError,
-    PluginKind,
-    PluginDefinition,
-    PluginLoadError,
-    PluginRegistry,
-    PluginSpec,
-    PluginValidationError,
-    RatePlugin,
-    RateStageContext,
-    StageContext,
-)
-from honestroles.publish import (
-    NeonCheck,
-    NeonMigrationResult,
-    NeonPublishResult,
-    NeonRuntimeError,
-    NeonVerifyResult,
-    migrate_neondb,
-    publish_neondb_sync,
-    upsert_profile_cache_neondb,
-    verify_neondb_contract,
-)
-from honestroles.recommend import (
-    CandidateProfile,
-    EvalThresholds,
-    FeedbackResult,
-    FeedbackSummary,
-    MatchResult,
-    RecommendationPolicy,
-    RelevanceEvaluationResult,
-    RetrievalIndexResult,
-    SalaryTargets,
-    VisaWorkAuth,
-    build_retrieval_index,
-    evaluate_relevance,
-    load_eval_thresholds,
-    load_recommendation_policy,
-    match_jobs,
-    parse_candidate_json_file,
-    parse_candidate_profile_payload,
-    parse_resume_text,
-    parse_resume_text_file,
-    record_feedback_event,
-    summarize_feedback,
-)
-from honestroles.runtime import HonestRolesRuntime
-from honestroles.objects import PipelineRun
-from honestroles.schema import CANONICAL_SOURCE_FIELDS
+
+if TYPE_CHECKING:
+    from honestroles.config import (
+        AdapterCastType,
+        AdapterOnError,
+        InputAdapterFieldConfig,
+        InputAliasesConfig,
+        IpcWriterConfig,
+        ParquetWriterConfig,
+        PipelineSpec,
+        PluginManifestConfig,
+        PluginManifestItem,
+        RuntimeCacheConfig,
+        RuntimeConfig,
+        RuntimeHtmlCacheConfig,
+        RuntimeIncrementalConfig,
+        RuntimePartitionsConfig,
+        RuntimeProjectionConfig,
+        RuntimeQualityConfig,
+        RuntimeShardingConfig,
+        RuntimeStreamingConfig,
+        SourceAdapterSpec,
+        load_pipeline_config,
+        load_plugin_manifest,
+    )
+    from honestroles.diagnostics import RuntimeDiagnostics
+    from honestroles.domain import ApplicationPlanEntry, CanonicalJobRecord, JobDataset
+    from honestroles.eda import (
+        EDAArtifactsBundle,
+        EDAArtifactsManifest,
+        EDARules,
+        DriftRules,
+        GateRules,
+        EDAProfileResult,
+        build_eda_diff,
+        build_eda_profile,
+        evaluate_eda_gate,
+        generate_eda_artifacts,
+        generate_eda_diff_artifacts,
+        load_eda_artifacts,
+        load_eda_rules,
+    )
+    from honestroles.ingest import (
+        BatchIngestionResult,
+        IngestQualityPolicy,
+        IngestQualityResult,
+        IngestionDefaults,
+        IngestionManifest,
+        IngestionMergePolicy,
+        IngestionReport,
+        IngestionRequest,
+        IngestionResult,
+        IngestionSource,
+        IngestionSourceConfig,
+        IngestionStateEntry,
+        IngestionValidationResult,
+        evaluate_ingest_quality,
+        load_ingest_manifest,
+        load_ingest_quality_policy,
+        sync_source,
+        sync_sources_from_manifest,
+        validate_ingestion_source,
+    )
+    from honestroles.io import (
+        AdapterInferenceResult,
+        DataQualityAccumulator,
+        DataQualityReport,
+        _validate_read_query,
+        _validate_table_name,
+        apply_source_adapter,
+        build_data_quality_report,
+        infer_source_adapter,
+        normalize_source_data_contract,
+        read_parquet,
+        read_table,
+        render_adapter_toml_fragment,
+        resolve_source_aliases,
+        validate_source_data_contract,
+        write_ipc,
+        write_parquet,
+    )
+    from honestroles.plugins import (
+        FilterPlugin,
+        FilterStageContext,
+        LabelPlugin,
+        LabelStageContext,
+        PluginExecutionError,
+        PluginKind,
+        PluginDefinition,
+        PluginExpressions,
+        PluginLoadError,
+        PluginRegistry,
+        PluginSpec,
+        PluginValidationError,
+        RatePlugin,
+        RateStageContext,
+        StageContext,
+    )
+    from honestroles.publish import (
+        NeonCheck,
+        NeonMigrationResult,
+        NeonPublishResult,
+        NeonRuntimeError,
+        NeonVerifyResult,
+        migrate_neondb,
+        publish_neondb_sync,
+        upsert_profile_cache_neondb,
+        verify_neondb_contract,
+    )
+    from honestroles.recommend import (
+        CandidateProfile,
+        EvalThresholds,
+        FeedbackResult,
+        FeedbackSummary,
+        MatchResult,
+        RecommendationPolicy,
+        RelevanceEvaluationResult,
+        RetrievalIndexResult,
+        SalaryTargets,
+        VisaWorkAuth,
+        build_retrieval_index,
+        evaluate_relevance,
+        load_eval_thresholds,
+        load_recommendation_policy,
+        match_jobs,
+        parse_candidate_json_file,
+        parse_candidate_profile_payload,
+        parse_resume_text,
+        parse_resume_text_file,
+        record_feedback_event,
+        summarize_feedback,
+    )
+    from honestroles.runtime import HonestRolesRuntime
+    from honestroles.objects import PipelineRun
+    from honestroles.schema import CANONICAL_SOURCE_FIELDS
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "AdapterCastType": "honestroles.config",
+    "AdapterOnError": "honestroles.config",
+    "InputAdapterFieldConfig": "honestroles.config",
+    "InputAliasesConfig": "honestroles.config",
+    "IpcWriterConfig": "honestroles.config",
+    "ParquetWriterConfig": "honestroles.config",
+    "PipelineSpec": "honestroles.config",
+    "PluginManifestConfig": "honestroles.config",
+    "PluginManifestItem": "honestroles.config",
+    "RuntimeCacheConfig": "honestroles.config",
+    "RuntimeConfig": "honestroles.config",
+    "RuntimeHtmlCacheConfig": "honestroles.config",
+    "RuntimeIncrementalConfig": "honestroles.config",
+    "RuntimePartitionsConfig": "honestroles.config",
+    "RuntimeProjectionConfig": "honestroles.config",
+    "RuntimeQualityConfig": "honestroles.config",
+    "RuntimeShardingConfig": "honestroles.config",
+    "RuntimeStreamingConfig": "honestroles.config",
+    "SourceAdapterSpec": "honestroles.config",
+    "load_pipeline_config": "honestroles.config",
+    "load_plugin_manifest": "honestroles.config",
+    "RuntimeDiagnostics": "honestroles.diagnostics",
+    "ApplicationPlanEntry": "honestroles.domain",
+    "CanonicalJobRecord": "honestroles.domain",
+    "JobDataset": "honestroles.domain",
+    "EDAArtifactsBundle": "honestroles.eda",
+    "EDAArtifactsManifest": "honestroles.eda",
+    "EDARules": "honestroles.eda",
+    "DriftRules": "honestroles.eda",
+    "GateRules": "honestroles.eda",
+    "EDAProfileResult": "honestroles.eda",
+    "build_eda_diff": "honestroles.eda",
+    "build_eda_profile": "honestroles.eda",
+    "evaluate_eda_gate": "honestroles.eda",
+    "generate_eda_artifacts": "honestroles.eda",
+    "generate_eda_diff_artifacts": "honestroles.eda",
+    "load_eda_artifacts": "honestroles.eda",
+    "load_eda_rules": "honestroles.eda",
+    "BatchIngestionResult": "honestroles.ingest",
+    "IngestQualityPolicy": "honestroles.ingest",
+    "IngestQualityResult": "honestroles.ingest",
+    "IngestionDefaults": "honestroles.ingest",
+    "IngestionManifest": "honestroles.ingest",
+    "IngestionMergePolicy": "honestroles.ingest",
+    "IngestionReport": "honestroles.ingest",
+    "IngestionRequest": "honestroles.ingest",
+    "IngestionResult": "honestroles.ingest",
+    "IngestionSource": "honestroles.ingest",
+    "IngestionSourceConfig": "honestroles.ingest",
+    "IngestionStateEntry": "honestroles.ingest",
+    "IngestionValidationResult": "honestroles.ingest",
+    "evaluate_ingest_quality": "honestroles.ingest",
+    "load_ingest_manifest": "honestroles.ingest",
+    "load_ingest_quality_policy": "honestroles.ingest",
+    "sync_source": "honestroles.ingest",
+    "sync_sources_from_manifest": "honestroles.ingest",
+    "validate_ingestion_source": "honestroles.ingest",
+    "AdapterInferenceResult": "honestroles.io",
+    "DataQualityAccumulator": "honestroles.io",
+    "DataQualityReport": "honestroles.io",
+    "_validate_read_query": "honestroles.io",
+    "_validate_table_name": "honestroles.io",
+    "apply_source_adapter": "honestroles.io",
+    "build_data_quality_report": "honestroles.io",
+    "infer_source_adapter": "honestroles.io",
+    "normalize_source_data_contract": "honestroles.io",
+    "read_parquet": "honestroles.io",
+    "read_table": "honestroles.io",
+    "render_adapter_toml_fragment": "honestroles.io",
+    "resolve_source_aliases": "honestroles.io",
+    "validate_source_data_contract": "honestroles.io",
+    "write_ipc": "honestroles.io",
+    "write_parquet": "honestroles.io",
+    "FilterPlugin": "honestroles.plugins",
+    "FilterStageContext": "honestroles.plugins",
+    "LabelPlugin": "honestroles.plugins",
+    "LabelStageContext": "honestroles.plugins",
+    "PluginExecutionError": "honestroles.plugins",
+    "PluginKind": "honestroles.plugins",
+    "PluginDefinition": "honestroles.plugins",
+    "PluginExpressions": "honestroles.plugins",
+    "PluginLoadError": "honestroles.plugins",
+    "PluginRegistry": "honestroles.plugins",
+    "PluginSpec": "honestroles.plugins",
+    "PluginValidationError": "honestroles.plugins",
+    "RatePlugin": "honestroles.plugins",
+    "RateStageContext": "honestroles.plugins",
+    "StageContext": "honestroles.plugins",
+    "NeonCheck": "honestroles.publish",
+    "NeonMigrationResult": "honestroles.publish",
+    "NeonPublishResult": "honestroles.publish",
+    "NeonRuntimeError": "honestroles.publish",
+    "NeonVerifyResult": "honestroles.publish",
+    "migrate_neondb": "honestroles.publish",
+    "publish_neondb_sync": "honestroles.publish",
+    "upsert_profile_cache_neondb": "honestroles.publish",
+    "verify_neondb_contract": "honestroles.publish",
+    "CandidateProfile": "honestroles.recommend",
+    "EvalThresholds": "honestroles.recommend",
+    "FeedbackResult": "honestroles.recommend",
+    "FeedbackSummary": "honestroles.recommend",
+    "MatchResult": "honestroles.recommend",
+    "RecommendationPolicy": "honestroles.recommend",
+    "RelevanceEvaluationResult": "honestroles.recommend",
+    "RetrievalIndexResult": "honestroles.recommend",
+    "SalaryTargets": "honestroles.recommend",
+    "VisaWorkAuth": "honestroles.recommend",
+    "build_retrieval_index": "honestroles.recommend",
+    "evaluate_relevance": "honestroles.recommend",
+    "load_eval_thresholds": "honestroles.recommend",
+    "load_recommendation_policy": "honestroles.recommend",
+    "match_jobs": "honestroles.recommend",
+    "parse_candidate_json_file": "honestroles.recommend",
+    "parse_candidate_profile_payload": "honestroles.recommend",
+    "parse_resume_text": "honestroles.recommend",
+    "parse_resume_text_file": "honestroles.recommend",
+    "record_feedback_event": "honestroles.recommend",
+    "summarize_feedback": "honestroles.recommend",
+    "HonestRolesRuntime": "honestroles.runtime",
+    "PipelineRun": "honestroles.objects",
+    "CANONICAL_SOURCE_FIELDS": "honestroles.schema",
+}
 
 __all__ = [
     "ConfigValidationError",
@@ -164,13 +305,16 @@ __all__ = [
     "HonestRolesRuntime",
     "InputAdapterFieldConfig",
     "InputAliasesConfig",
+    "IpcWriterConfig",
     "JobDataset",
     "LabelPlugin",
     "LabelStageContext",
+    "ParquetWriterConfig",
     "PipelineRun",
     "PipelineSpec",
     "PluginDefinition",
     "PluginExecutionError",
+    "PluginExpressions",
     "PluginKind",
     "PluginLoadError",
     "PluginManifestConfig",
@@ -195,9 +339,16 @@ __all__ = [
     "VisaWorkAuth",
     "RatePlugin",
     "RateStageContext",
+    "RuntimeCacheConfig",
     "RuntimeConfig",
+    "RuntimeHtmlCacheConfig",
+    "RuntimeIncrementalConfig",
+    "RuntimePartitionsConfig",
+    "RuntimeProjectionConfig",
     "RuntimeDiagnostics",
     "RuntimeQualityConfig",
+    "RuntimeShardingConfig",
+    "RuntimeStreamingConfig",
     "RuntimeInitializationError",
     "SourceAdapterSpec",
     "StageContext",
@@ -221,9 +372,11 @@ __all__ = [
     "apply_source_adapter",
     "infer_source_adapter",
     "read_parquet",
+    "read_table",
     "render_adapter_toml_fragment",
     "resolve_source_aliases",
     "validate_source_data_contract",
+    "write_ipc",
     "write_parquet",
     "sync_source",
     "sync_sources_from_manifest",
@@ -245,3 +398,18 @@ __all__ = [
     "parse_resume_text",
     "parse_resume_text_file",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: defer submodule imports (Polars, pydantic, ingest/publish
+    # clients) until a public name is first used.
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
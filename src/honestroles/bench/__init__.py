@@ -0,0 +1,19 @@
+from honestroles.bench.models import BenchComparison, BenchReport, BenchResult
+from honestroles.bench.suite import (
+    BENCH_CASES,
+    DEFAULT_SIZES,
+    BenchCase,
+    compare_bench,
+    run_bench,
+)
+
+__all__ = [
+    "BENCH_CASES",
+    "DEFAULT_SIZES",
+    "BenchCase",
+    "BenchComparison",
+    "BenchReport",
+    "BenchResult",
+    "compare_bench",
+    "run_bench",
+]
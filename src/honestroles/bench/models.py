@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from honestroles.server import _percentile
+
+BENCH_SCHEMA_VERSION = "1.0"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    """Timings of one benchmark case at one corpus size."""
+
+    case: str
+    rows: int
+    latencies_ms: tuple[float, ...]
+    peak_rss_bytes: int | None
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def percentile_ms(self, quantile: float) -> float:
+        return _percentile(sorted(self.latencies_ms), quantile)
+
+    @property
+    def throughput_rows_per_s(self) -> float:
+        p50_ms = self.percentile_ms(0.50)
+        return self.rows / (p50_ms / 1000) if p50_ms > 0 else 0.0
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "case": self.case,
+            "rows": self.rows,
+            "repeat": len(self.latencies_ms),
+            "latencies_ms": [round(value, 3) for value in self.latencies_ms],
+            "mean_ms": round(sum(self.latencies_ms) / len(self.latencies_ms), 3),
+            "p50_ms": round(self.percentile_ms(0.50), 3),
+            "p95_ms": round(self.percentile_ms(0.95), 3),
+            "p99_ms": round(self.percentile_ms(0.99), 3),
+            "throughput_rows_per_s": round(self.throughput_rows_per_s, 1),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "details": self.details,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchComparison:
+    """Per-result ratios against a baseline report and the regressions among them."""
+
+    status: str
+    baseline_file: str
+    max_regression: float
+    max_rss_regression: float
+    entries: tuple[dict[str, Any], ...]
+
+    @property
+    def regressions(self) -> tuple[dict[str, Any], ...]:
+        return tuple(entry for entry in self.entries if entry["status"] == "regressed")
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "baseline_file": self.baseline_file,
+            "max_regression": self.max_regression,
+            "max_rss_regression": self.max_rss_regression,
+            "regression_count": len(self.regressions),
+            "entries": list(self.entries),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchReport:
+    schema_version: str
+    created_at_utc: str
+    seed: int
+    warmup: int
+    isolated: bool
+    environment: dict[str, Any]
+    results: tuple[BenchResult, ...]
+    comparison: BenchComparison | None = None
+
+    @property
+    def status(self) -> str:
+        return "pass" if self.comparison is None else self.comparison.status
+
+    def to_payload(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "schema_version": self.schema_version,
+            "status": self.status,
+            "created_at_utc": self.created_at_utc,
+            "seed": self.seed,
+            "warmup": self.warmup,
+            "isolated": self.isolated,
+            "environment": self.environment,
+            "results": [result.to_payload() for result in self.results],
+        }
+        if self.comparison is not None:
+            payload["comparison"] = self.comparison.to_payload()
+        return payload
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import polars as pl
+
+from honestroles.__about__ import __version__
+from honestroles.bench.models import (
+    BENCH_SCHEMA_VERSION,
+    BenchComparison,
+    BenchReport,
+    BenchResult,
+)
+from honestroles.errors import ConfigValidationError
+from honestroles.resources import peak_rss_bytes
+from honestroles.synthetic import SYNTHETIC_SOURCES, generate_synthetic_corpus
+
+DEFAULT_SIZES: tuple[int, ...] = (10_000,)
+# Latency differences below this are treated as timer noise, whatever the ratio.
+NOISE_FLOOR_MS = 5.0
+_SEEN_AT = "2026-03-01T00:00:00+00:00"
+_RESEEN_AT = "2026-03-02T00:00:00+00:00"
+
+_Timed = Callable[[], "dict[str, Any] | None"]
+
+
+@dataclass(frozen=True, slots=True)
+class BenchCase:
+    """A hot path to time; ``prepare`` does untimed setup and returns the timed call."""
+
+    name: str
+    description: str
+    prepare: Callable[[Path, Path], _Timed]
+
+
+def _prepare_runtime(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.runtime import HonestRolesRuntime
+
+    config = workdir / "pipeline.toml"
+    config.write_text(
+        "\n".join(
+            [
+                "[input]",
+                'kind = "parquet"',
+                f'path = "{corpus}"',
+                "",
+                "[stages.clean]",
+                "enabled = true",
+                "",
+                "[stages.filter]",
+                "enabled = true",
+                "remote_only = false",
+                "",
+                "[stages.label]",
+                "enabled = true",
+                "",
+                "[stages.rate]",
+                "enabled = true",
+                "",
+                "[stages.match]",
+                "enabled = true",
+                "top_k = 50",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    runtime = HonestRolesRuntime.from_configs(config)
+
+    def run() -> dict[str, Any]:
+        result = runtime.run()
+        return {
+            "stage_wall_ms": {
+                entry.stage: round(entry.wall_ms, 3)
+                for entry in result.diagnostics.telemetry
+                if entry.plugin is None
+            }
+        }
+
+    return run
+
+
+def _raw_payloads(corpus: Path) -> dict[str, list[dict[str, Any]]]:
+    raw_dir = corpus.parent / "raw"
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for source in SYNTHETIC_SOURCES:
+        with (raw_dir / f"{source}.jsonl").open(encoding="utf-8") as handle:
+            grouped[source] = [json.loads(line) for line in handle if line.strip()]
+    return grouped
+
+
+def _normalize_raw(raw: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    from honestroles.ingest.normalize import normalize_records
+
+    records: list[dict[str, Any]] = []
+    for source, lines in raw.items():
+        for line in lines:
+            records.extend(
+                normalize_records(
+                    [line["payload"]],
+                    source=source,
+                    source_ref=line["source_ref"],
+                    ingested_at_utc=_SEEN_AT,
+                )
+            )
+    return records
+
+
+def _normalized_records(corpus: Path) -> list[dict[str, Any]]:
+    from honestroles.ingest.dedup import deduplicate_records
+
+    records, _ = deduplicate_records(_normalize_raw(_raw_payloads(corpus)))
+    return records
+
+
+def _prepare_ingest_normalize(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.ingest.dedup import deduplicate_records
+    from honestroles.ingest.normalize import normalized_dataframe
+
+    raw = _raw_payloads(corpus)
+
+    def run() -> dict[str, Any]:
+        deduped, dropped = deduplicate_records(_normalize_raw(raw))
+        normalized_dataframe(deduped)
+        return {"dedup_dropped": dropped}
+
+    return run
+
+
+def _prepare_ingest_catalog_merge(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.ingest.service import (
+        _apply_catalog_updates,
+        _load_catalog,
+        _write_catalog,
+    )
+
+    records = _normalized_records(corpus)
+    catalog_path = workdir / "catalog.parquet"
+    catalog, _ = _apply_catalog_updates(
+        catalog=[], records=records, seen_at_utc=_SEEN_AT, coverage_complete=True
+    )
+    _write_catalog(catalog_path, catalog)
+    # Every tenth posting changed since the previous sync.
+    incoming = [
+        record
+        if position % 10
+        else {
+            **record,
+            "source_payload_hash": f"changed-{position}",
+            "source_updated_at": _RESEEN_AT,
+        }
+        for position, record in enumerate(records)
+    ]
+    output_path = workdir / "catalog-merged.parquet"
+
+    def run() -> dict[str, Any]:
+        merged, summary = _apply_catalog_updates(
+            catalog=_load_catalog(catalog_path),
+            records=incoming,
+            seen_at_utc=_RESEEN_AT,
+            coverage_complete=True,
+        )
+        _write_catalog(output_path, merged)
+        return {"updated": summary.updated_count, "unchanged": summary.unchanged_count}
+
+    return run
+
+
+def _prepare_recommend_build_index(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.recommend import build_retrieval_index
+
+    def run() -> dict[str, Any]:
+        result = build_retrieval_index(input_parquet=corpus, output_dir=workdir / "index")
+        return {"token_count": result.token_count, "shard_count": result.shard_count}
+
+    return run
+
+
+def _built_index(corpus: Path, workdir: Path) -> Path:
+    from honestroles.recommend import build_retrieval_index
+
+    return Path(build_retrieval_index(input_parquet=corpus, output_dir=workdir / "index").index_dir)
+
+
+def _prepare_recommend_match(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.recommend import parse_candidate_profile_payload
+    from honestroles.recommend.matching import match_jobs_with_profile
+
+    index_dir = _built_index(corpus, workdir)
+    candidate = parse_candidate_profile_payload(
+        {
+            "profile_id": "bench",
+            "skills": ["python", "sql", "aws", "spark"],
+            "titles": ["data engineer"],
+            "locations": ["Remote"],
+            "work_mode_preferences": ["remote", "hybrid"],
+        }
+    )
+
+    def run() -> dict[str, Any]:
+        result = match_jobs_with_profile(index_dir=index_dir, candidate=candidate, top_k=25)
+        return {"eligible": result.eligible_count, "excluded": result.excluded_count}
+
+    return run
+
+
+def _prepare_eda_profile(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.eda import build_eda_profile
+
+    def run() -> None:
+        build_eda_profile(
+            input_parquet=corpus,
+            quality_profile="core_fields_weighted",
+            field_weights={},
+            top_k=10,
+            max_rows=None,
+        )
+
+    return run
+
+
+def _prepare_publish_payload(corpus: Path, workdir: Path) -> _Timed:
+    from honestroles.publish.neondb import _prepare_sync_payload
+
+    index_dir = _built_index(corpus, workdir)
+
+    def run() -> dict[str, Any]:
+        payload = _prepare_sync_payload(jobs_parquet=corpus, index_dir=index_dir)
+        return {"active_jobs": payload.active_jobs, "facets": len(payload.facets_rows)}
+
+    return run
+
+
+BENCH_CASES: dict[str, BenchCase] = {
+    case.name: case
+    for case in (
+        BenchCase("runtime", "Eager clean/filter/label/rate/match run", _prepare_runtime),
+        BenchCase(
+            "ingest_normalize",
+            "Multi-source ATS payload normalization, dedup and frame build",
+            _prepare_ingest_normalize,
+        ),
+        BenchCase(
+            "ingest_catalog_merge",
+            "Catalog load, merge of a 10% changed sync and write",
+            _prepare_ingest_catalog_merge,
+        ),
+        BenchCase(
+            "recommend_build_index",
+            "Retrieval index build",
+            _prepare_recommend_build_index,
+        ),
+        BenchCase("recommend_match", "Candidate match against the index", _prepare_recommend_match),
+        BenchCase("eda_profile", "EDA profile of the corpus", _prepare_eda_profile),
+        BenchCase(
+            "publish_payload",
+            "NeonDB publish row and facet preparation",
+            _prepare_publish_payload,
+        ),
+    )
+}
+
+
+def _measure_case(
+    case_name: str, corpus: Path, workdir: Path, repeat: int, warmup: int
+) -> tuple[tuple[float, ...], int | None, dict[str, Any]]:
+    run = BENCH_CASES[case_name].prepare(corpus, workdir)
+    for _ in range(warmup):
+        run()
+    latencies: list[float] = []
+    details: dict[str, Any] | None = None
+    for _ in range(repeat):
+        started = perf_counter()
+        details = run()
+        latencies.append((perf_counter() - started) * 1000)
+    return tuple(latencies), peak_rss_bytes(), details or {}
+
+
+def _measure_case_isolated(
+    case_name: str, corpus: Path, workdir: Path, repeat: int, warmup: int
+) -> tuple[tuple[float, ...], int | None, dict[str, Any]]:
+    # Runs in a fresh spawned process: the peak RSS covers only this case, and
+    # cwd-relative state (recommend feedback weights) resolves under the workdir.
+    os.chdir(workdir)
+    return _measure_case(case_name, corpus, workdir, repeat, warmup)
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "honestroles": __version__,
+        "polars": pl.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_bench(
+    *,
+    cases: Sequence[str] | None = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeat: int = 3,
+    warmup: int = 1,
+    seed: int = 0,
+    work_dir: str | Path = ".honestroles/bench",
+    isolated: bool = True,
+    baseline: str | Path | None = None,
+    max_regression: float = 0.2,
+    max_rss_regression: float = 0.2,
+) -> BenchReport:
+    """Time each case against a synthetic corpus of each size.
+
+    Corpora are generated once per ``(size, seed)`` and reused from
+    ``work_dir``. With ``isolated`` every case runs in its own spawned process
+    so its peak RSS is not inflated by earlier cases.
+    """
+    selected = tuple(cases) if cases else tuple(BENCH_CASES)
+    unknown = sorted(set(selected) - set(BENCH_CASES))
+    if unknown:
+        raise ConfigValidationError(
+            f"unknown benchmark case(s): {', '.join(unknown)}; "
+            f"expected one of: {', '.join(BENCH_CASES)}"
+        )
+    if repeat < 1:
+        raise ConfigValidationError("repeat must be >= 1")
+    if warmup < 0:
+        raise ConfigValidationError("warmup must be >= 0")
+    if any(rows < 1 for rows in sizes):
+        raise ConfigValidationError("benchmark sizes must be >= 1")
+
+    root = Path(work_dir).expanduser().resolve()
+    results: list[BenchResult] = []
+    for rows in sizes:
+        corpus_dir = root / "corpus" / f"jobs-{rows}-seed{seed}"
+        # The manifest is written last, so its presence marks a complete corpus.
+        if not (corpus_dir / "manifest.json").exists():
+            generate_synthetic_corpus(
+                output_dir=corpus_dir, rows=rows, seed=seed, formats=("parquet", "raw-jsonl")
+            )
+        corpus = corpus_dir / "jobs.parquet"
+        for case_name in selected:
+            workdir = root / "cases" / f"{case_name}-{rows}"
+            shutil.rmtree(workdir, ignore_errors=True)
+            workdir.mkdir(parents=True)
+            if isolated:
+                with ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    measured = executor.submit(
+                        _measure_case_isolated, case_name, corpus, workdir, repeat, warmup
+                    ).result()
+            else:
+                measured = _measure_case(case_name, corpus, workdir, repeat, warmup)
+            latencies, peak_rss, details = measured
+            results.append(
+                BenchResult(
+                    case=case_name,
+                    rows=rows,
+                    latencies_ms=latencies,
+                    peak_rss_bytes=peak_rss,
+                    details=details,
+                )
+            )
+
+    comparison = None
+    if baseline is not None:
+        comparison = compare_bench(
+            results,
+            baseline,
+            max_regression=max_regression,
+            max_rss_regression=max_rss_regression,
+        )
+    return BenchReport(
+        schema_version=BENCH_SCHEMA_VERSION,
+        created_at_utc=datetime.now(UTC).isoformat(),
+        seed=seed,
+        warmup=warmup,
+        isolated=isolated,
+        environment=_environment(),
+        results=tuple(results),
+        comparison=comparison,
+    )
+
+
+def _load_baseline(path: Path) -> dict[tuple[str, int], dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ConfigValidationError(f"benchmark baseline does not exist: '{path}'") from exc
+    except (OSError, ValueError) as exc:
+        raise ConfigValidationError(f"invalid benchmark baseline '{path}': {exc}") from exc
+    results = payload.get("results") if isinstance(payload, dict) else None
+    if not isinstance(results, list):
+        raise ConfigValidationError(
+            f"invalid benchmark baseline '{path}': expected a 'results' list"
+        )
+    baseline: dict[tuple[str, int], dict[str, Any]] = {}
+    for item in results:
+        if isinstance(item, dict) and "case" in item and "rows" in item:
+            baseline[(str(item["case"]), int(item["rows"]))] = item
+    return baseline
+
+
+def _ratio(current: float | None, previous: float | None) -> float | None:
+    if current is None or previous is None or previous <= 0:
+        return None
+    return round(current / previous, 4)
+
+
+def compare_bench(
+    results: Sequence[BenchResult],
+    baseline: str | Path,
+    *,
+    max_regression: float = 0.2,
+    max_rss_regression: float = 0.2,
+) -> BenchComparison:
+    """Compare p50 latency and peak RSS against a previously written report.
+
+    A result regresses when its p50 exceeds the baseline by more than
+    ``max_regression`` (and by more than the noise floor), or its peak RSS by
+    more than ``max_rss_regression``. Results missing from the baseline are
+    reported as ``new``.
+    """
+    if max_regression < 0 or max_rss_regression < 0:
+        raise ConfigValidationError("regression thresholds must be >= 0")
+    baseline_path = Path(baseline).expanduser().resolve()
+    previous = _load_baseline(baseline_path)
+    entries: list[dict[str, Any]] = []
+    for result in results:
+        p50_ms = round(result.percentile_ms(0.50), 3)
+        entry: dict[str, Any] = {
+            "case": result.case,
+            "rows": result.rows,
+            "p50_ms": p50_ms,
+            "peak_rss_bytes": result.peak_rss_bytes,
+        }
+        reference = previous.get((result.case, result.rows))
+        if reference is None:
+            entries.append({**entry, "status": "new"})
+            continue
+        baseline_p50 = float(reference.get("p50_ms") or 0.0)
+        baseline_rss = reference.get("peak_rss_bytes")
+        latency_ratio = _ratio(p50_ms, baseline_p50)
+        rss_ratio = _ratio(result.peak_rss_bytes, baseline_rss)
+        slower = (
+            latency_ratio is not None
+            and latency_ratio > 1 + max_regression
+            and p50_ms - baseline_p50 > NOISE_FLOOR_MS
+        )
+        larger = rss_ratio is not None and rss_ratio > 1 + max_rss_regression
+        entries.append(
+            {
+                **entry,
+                "baseline_p50_ms": baseline_p50,
+                "baseline_peak_rss_bytes": baseline_rss,
+                "latency_ratio": latency_ratio,
+                "rss_ratio": rss_ratio,
+                "status": "regressed" if slower or larger else "ok",
+            }
+        )
+    regressed = any(entry["status"] == "regressed" for entry in entries)
+    return BenchComparison(
+        status="fail" if regressed else "pass",
+        baseline_file=str(baseline_path),
+        max_regression=max_regression,
+        max_rss_regression=max_rss_regression,
+        entries=tuple(entries),
+    )
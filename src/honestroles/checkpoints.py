@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from honestroles.__about__ import __version__
+from honestroles.plugins.types import PluginDefinition
+
+_CHUNK_SIZE = 1024 * 1024
+_FRAME_FILE = "frame.arrow"
+_META_FILE = "meta.json"
+
+
+def _sha256_json(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while True:
+            chunk = handle.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def input_checkpoint_key(path: Path, input_options: Mapping[str, Any]) -> str:
+    """Key the loaded input by file content, adapter/alias options and library version."""
+    return _sha256_json(
+        {
+            "version": __version__,
+            "input_sha256": _hash_file(path),
+            "input": dict(input_options),
+        }
+    )
+
+
+def stage_checkpoint_key(
+    upstream_key: str,
+    stage: str,
+    options: Mapping[str, Any],
+    plugins: tuple[PluginDefinition, ...],
+    random_seed: int,
+) -> str:
+    """Chain a stage onto its upstream key so any upstream change invalidates it."""
+    return _sha256_json(
+        {
+            "upstream": upstream_key,
+            "stage": stage,
+            "options": dict(options),
+            "random_seed": int(random_seed),
+            "plugins": [
+                {
+                    "name": plugin.name,
+                    "callable_ref": plugin.callable_ref,
+                    "plugin_version": plugin.spec.plugin_version,
+                    "api_version": plugin.spec.api_version,
+                    "order": plugin.order,
+                    "settings": dict(plugin.settings),
+                }
+                for plugin in plugins
+            ],
+        }
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class StageCheckpoint:
+    frame: pl.DataFrame
+    metadata: dict[str, Any]
+
+
+class StageCheckpointCache:
+    """Directory of stage output frames keyed by content hash, evicted LRU by size/count.
+
+    Each entry is ``<root>/<key>/`` holding the frame as Arrow IPC and a JSON
+    metadata sidecar; the sidecar mtime is the recency used for eviction.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int, max_entries: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def load(self, key: str) -> StageCheckpoint | None:
+        entry = self.root / key
+        try:
+            metadata = json.loads((entry / _META_FILE).read_text(encoding="utf-8"))
+            frame = pl.read_ipc(entry / _FRAME_FILE, memory_map=False)
+            os.utime(entry / _META_FILE)
+        except (OSError, ValueError, pl.exceptions.PolarsError):
+            # Missing or partially written entries are plain cache misses.
+            return None
+        return StageCheckpoint(frame=frame, metadata=metadata)
+
+    def store(self, key: str, frame: pl.DataFrame, metadata: Mapping[str, Any]) -> int:
+        """Write one checkpoint and return how many entries eviction removed."""
+        staging = self.root / f".{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            staging.mkdir(parents=True)
+            frame.write_ipc(staging / _FRAME_FILE, compression="lz4")
+            (staging / _META_FILE).write_text(
+                json.dumps(dict(metadata), sort_keys=True), encoding="utf-8"
+            )
+            target = self.root / key
+            if target.exists():
+                shutil.rmtree(target)
+            os.replace(staging, target)
+        except OSError:
+            # The cache is an optimization; an unwritable cache must not fail the run.
+            return 0
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+        return self.evict()
+
+    def evict(self) -> int:
+        entries: list[tuple[int, str, int, Path]] = []
+        if not self.root.is_dir():
+            return 0
+        for child in self.root.iterdir():
+            meta = child / _META_FILE
+            if child.name.startswith(".") or not meta.is_file():
+                continue
+            size = sum(item.stat().st_size for item in child.iterdir() if item.is_file())
+            entries.append((meta.stat().st_mtime_ns, child.name, size, child))
+
+        evicted = 0
+        kept = 0
+        total = 0
+        over_budget = False
+        for _, _, size, path in sorted(entries, reverse=True):
+            over_budget = (
+                over_budget or kept >= self.max_entries or total + size > self.max_bytes
+            )
+            if over_budget:
+                shutil.rmtree(path, ignore_errors=True)
+                evicted += 1
+                continue
+            kept += 1
+            total += size
+        return evicted
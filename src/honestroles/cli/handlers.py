@@ -1,53 +1,20 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime
 import json
 from pathlib import Path
 import shutil
-from typing import Any
-
-from honestroles.config import load_pipeline_config
-from honestroles.eda import (
-    build_eda_diff,
-    evaluate_eda_gate,
-    generate_eda_artifacts,
-    generate_eda_diff_artifacts,
-    load_eda_artifacts,
-    load_eda_rules,
-    parse_quality_weight_overrides,
-)
-from honestroles.errors import ConfigValidationError
-from honestroles.io import (
-    validate_source_data_contract,
-    build_data_quality_report,
-    infer_source_adapter,
-    read_parquet,
-)
-from honestroles.ingest import (
-    sync_source,
-    sync_sources_from_manifest,
-    validate_ingestion_source,
-)
-from honestroles.plugins.registry import PluginRegistry
-from honestroles.publish import (
-    migrate_neondb,
-    publish_neondb_sync,
-    verify_neondb_contract,
-)
-from honestroles.recommend import (
-    build_retrieval_index,
-    evaluate_relevance,
-    match_jobs,
-    record_feedback_event,
-    summarize_feedback,
-)
-from honestroles.reliability import evaluate_reliability
-from honestroles.runtime import HonestRolesRuntime
+from typing import TYPE_CHECKING, Any
+
+from honestroles.errors import ConfigValidationError, HonestRolesError
 
 from .lineage import list_records, load_record
 
+if TYPE_CHECKING:
+    from honestroles.runtime import HonestRolesRuntime
+
 _EXIT_OK = 0
 _EXIT_GENERIC = 1
 _EXIT_CONFIG = 2
@@ -59,10 +26,17 @@ class CommandResult:
     exit_code: int = _EXIT_OK
 
 
-def _build_pipeline_toml(*, input_path: Path, output_path: Path, adapter_fragment: str | None) -> str:
+def _build_pipeline_toml(
+    *,
+    input_path: Path,
+    output_path: Path,
+    adapter_fragment: str | None,
+    input_kind: str = "parquet",
+    output_format: str = "parquet",
+) -> str:
     sections = [
         "[input]",
-        'kind = "parquet"',
+        f'kind = "{input_kind}"',
         f'path = "{input_path}"',
         "",
     ]
@@ -72,6 +46,7 @@ def _build_pipeline_toml(*, input_path: Path, output_path: Path, adapter_fragmen
         [
             "[output]",
             f'path = "{output_path}"',
+            *([f'format = "{output_format}"'] if output_format != "parquet" else []),
             "",
             "[stages.clean]",
             "enabled = true",
@@ -112,6 +87,8 @@ def _build_plugins_toml() -> str:
 
 
 def handle_init(args: argparse.Namespace) -> CommandResult:
+    from honestroles.io import infer_source_adapter, infer_table_format, read_table
+
     input_path = Path(args.input_parquet).expanduser().resolve()
     if not input_path.exists():
         raise ConfigValidationError(f"input parquet does not exist: '{input_path}'")
@@ -128,7 +105,7 @@ def handle_init(args: argparse.Namespace) -> CommandResult:
                 f"target file already exists: '{path}'. Re-run with --force to overwrite."
             )
 
-    sample = read_parquet(input_path).head(args.sample_rows)
+    sample = read_table(input_path).head(args.sample_rows)
     inferred = infer_source_adapter(sample, sample_rows=args.sample_rows)
     adapter_fragment = inferred.toml_fragment if inferred.field_suggestions > 0 else None
 
@@ -139,6 +116,8 @@ def handle_init(args: argparse.Namespace) -> CommandResult:
             input_path=input_path,
             output_path=output_path,
             adapter_fragment=adapter_fragment,
+            input_kind=infer_table_format(input_path),
+            output_format=infer_table_format(output_path),
         ),
         encoding="utf-8",
     )
@@ -220,6 +199,9 @@ def _reliability_payload(
 
 
 def handle_doctor(args: argparse.Namespace) -> CommandResult:
+    from honestroles.io import validate_source_data_contract
+    from honestroles.reliability import evaluate_reliability
+
     strict = bool(getattr(args, "strict", False))
     evaluation = evaluate_reliability(
         pipeline_config=args.pipeline_config,
@@ -246,6 +228,9 @@ def handle_doctor(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_reliability_check(args: argparse.Namespace) -> CommandResult:
+    from honestroles.io import validate_source_data_contract
+    from honestroles.reliability import evaluate_reliability
+
     strict = bool(getattr(args, "strict", False))
     output_file = Path(args.output_file).expanduser().resolve()
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -302,7 +287,21 @@ def handle_reliability_check(args: argparse.Namespace) -> CommandResult:
     return CommandResult(payload=payload, exit_code=exit_code)
 
 
+def _parquet_overrides(args: argparse.Namespace) -> dict[str, Any]:
+    statistics = getattr(args, "parquet_statistics", None)
+    return {
+        "compression": getattr(args, "parquet_compression", None),
+        "compression_level": getattr(args, "parquet_compression_level", None),
+        "row_group_size": getattr(args, "parquet_row_group_size", None),
+        "statistics": statistics if statistics in (None, "full") else statistics == "true",
+        "partition_by": getattr(args, "parquet_partition_by", None),
+    }
+
+
 def handle_ingest_sync(args: argparse.Namespace) -> CommandResult:
+    from honestroles.ingest import sync_source
+    from honestroles.io import resolve_parquet_options
+
     result = sync_source(
         source=args.source,
         source_ref=args.source_ref,
@@ -322,22 +321,29 @@ def handle_ingest_sync(args: argparse.Namespace) -> CommandResult:
         merge_policy=str(getattr(args, "merge_policy", "updated_hash")),
         retain_snapshots=int(getattr(args, "retain_snapshots", 30)),
         prune_inactive_days=int(getattr(args, "prune_inactive_days", 90)),
+        parquet=resolve_parquet_options(None, _parquet_overrides(args)),
+        categorical=bool(getattr(args, "categorical", False)),
     )
     exit_code = 0 if result.report.status in {"pass", "warn"} else 1
     return CommandResult(payload=result.to_payload(), exit_code=exit_code)
 
 
 def handle_ingest_sync_all(args: argparse.Namespace) -> CommandResult:
+    from honestroles.ingest import sync_sources_from_manifest
+
     result = sync_sources_from_manifest(
         manifest_path=args.manifest,
         report_file=args.report_file,
         fail_fast=bool(args.fail_fast),
+        parquet_overrides=_parquet_overrides(args),
     )
     exit_code = 0 if result.status == "pass" else 1
     return CommandResult(payload=result.to_payload(), exit_code=exit_code)
 
 
 def handle_ingest_validate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.ingest import validate_ingestion_source
+
     result = validate_ingestion_source(
         source=args.source,
         source_ref=args.source_ref,
@@ -357,6 +363,8 @@ def handle_ingest_validate(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_recommend_build_index(args: argparse.Namespace) -> CommandResult:
+    from honestroles.recommend import build_retrieval_index
+
     result = build_retrieval_index(
         input_parquet=args.input_parquet,
         output_dir=args.output_dir,
@@ -366,6 +374,8 @@ def handle_recommend_build_index(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_recommend_match(args: argparse.Namespace) -> CommandResult:
+    from honestroles.recommend import match_jobs
+
     result = match_jobs(
         index_dir=args.index_dir,
         candidate_json=getattr(args, "candidate_json", None),
@@ -379,6 +389,8 @@ def handle_recommend_match(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_recommend_evaluate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.recommend import evaluate_relevance
+
     result = evaluate_relevance(
         index_dir=args.index_dir,
         golden_set=args.golden_set,
@@ -392,6 +404,8 @@ def handle_recommend_evaluate(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_recommend_feedback_add(args: argparse.Namespace) -> CommandResult:
+    from honestroles.recommend import record_feedback_event
+
     result = record_feedback_event(
         profile_id=args.profile_id,
         job_id=args.job_id,
@@ -402,11 +416,15 @@ def handle_recommend_feedback_add(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_recommend_feedback_summarize(args: argparse.Namespace) -> CommandResult:
+    from honestroles.recommend import summarize_feedback
+
     result = summarize_feedback(profile_id=getattr(args, "profile_id", None))
     return CommandResult(payload=result.to_payload(), exit_code=0)
 
 
 def handle_publish_neondb_migrate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.publish import migrate_neondb
+
     result = migrate_neondb(
         database_url_env=args.database_url_env,
         schema=args.schema,
@@ -415,6 +433,8 @@ def handle_publish_neondb_migrate(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_publish_neondb_sync(args: argparse.Namespace) -> CommandResult:
+    from honestroles.publish import publish_neondb_sync
+
     result = publish_neondb_sync(
         database_url_env=args.database_url_env,
         schema=args.schema,
@@ -429,6 +449,8 @@ def handle_publish_neondb_sync(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_publish_neondb_verify(args: argparse.Namespace) -> CommandResult:
+    from honestroles.publish import verify_neondb_contract
+
     result = verify_neondb_contract(
         database_url_env=args.database_url_env,
         schema=args.schema,
@@ -439,13 +461,155 @@ def handle_publish_neondb_verify(args: argparse.Namespace) -> CommandResult:
     )
 
 
-def handle_run(args: argparse.Namespace) -> CommandResult:
+def _resource_overrides(args: argparse.Namespace) -> dict[str, int]:
+    overrides: dict[str, int] = {}
+    for name, flag in (("max_memory_mb", "--max-memory-mb"), ("max_threads", "--max-threads")):
+        value = getattr(args, name, None)
+        if value is None:
+            continue
+        if value < 1:
+            raise ConfigValidationError(f"{flag} must be >= 1")
+        overrides[name] = int(value)
+    return overrides
+
+
+def _limit_run_threads(args: argparse.Namespace, max_threads: int | None) -> None:
+    """Cap Polars threads before the runtime imports Polars, which sizes its pool once."""
+    from honestroles.config import load_pipeline_config
+    from honestroles.resources import limit_polars_threads
+
+    if max_threads is None:
+        try:
+            max_threads = load_pipeline_config(args.pipeline_config).runtime.max_threads
+        except HonestRolesError:
+            # HonestRolesRuntime.from_configs reports the same error below.
+            return
+    if max_threads is not None:
+        limit_polars_threads(max_threads)
+
+
+def _runtime_from_args(args: argparse.Namespace) -> HonestRolesRuntime:
+    resource_overrides = _resource_overrides(args)
+    _limit_run_threads(args, resource_overrides.get("max_threads"))
+    from honestroles.runtime import HonestRolesRuntime
+
     runtime = HonestRolesRuntime.from_configs(args.pipeline_config, args.plugin_manifest)
+    parquet_overrides = _parquet_overrides(args)
+    if any(value is not None for value in parquet_overrides.values()):
+        from honestroles.io import resolve_parquet_options
+
+        spec = runtime.pipeline_spec
+        if spec.output is None:
+            raise ConfigValidationError("--parquet-* options require [output] in the pipeline config")
+        output = spec.output.model_copy(
+            update={"parquet": resolve_parquet_options(spec.output.parquet, parquet_overrides)}
+        )
+        runtime = replace(runtime, pipeline_spec=spec.model_copy(update={"output": output}))
+    runtime_updates: dict[str, Any] = dict(resource_overrides)
+    if getattr(args, "trace_memory", False):
+        runtime_updates["trace_memory"] = True
+    sharding_updates: dict[str, Any] = {}
+    if getattr(args, "shard_key", None) is not None:
+        sharding_updates["key"] = args.shard_key
+    if getattr(args, "shard_dir", None) is not None:
+        sharding_updates["path"] = Path(args.shard_dir)
+    if sharding_updates:
+        runtime_updates["sharding"] = runtime.pipeline_spec.runtime.sharding.model_copy(
+            update=sharding_updates
+        )
+    if runtime_updates:
+        spec = runtime.pipeline_spec
+        runtime_config = spec.runtime.model_copy(update=runtime_updates)
+        runtime = replace(
+            runtime, pipeline_spec=spec.model_copy(update={"runtime": runtime_config})
+        )
+    return runtime
+
+
+def handle_run(args: argparse.Namespace) -> CommandResult:
+    if args.pipeline_config is None:
+        raise ConfigValidationError("run requires --pipeline-config")
+    runtime = _runtime_from_args(args)
+    if getattr(args, "shard", None) is not None:
+        from honestroles.sharding import ShardSpec
+
+        shard = runtime.run_shard(ShardSpec.parse(args.shard))
+        return CommandResult(
+            payload={
+                "shard": shard.to_dict(),
+                "shard_dir": str(runtime.pipeline_spec.runtime.sharding.path),
+            }
+        )
     result = runtime.run()
     return CommandResult(payload=result.diagnostics.to_dict())
 
 
+def handle_run_merge(args: argparse.Namespace) -> CommandResult:
+    runtime = _runtime_from_args(args)
+    result = runtime.merge_shards()
+    return CommandResult(payload=result.diagnostics.to_dict())
+
+
+def handle_bench(args: argparse.Namespace) -> CommandResult:
+    from honestroles.bench import run_bench
+    from honestroles.synthetic import parse_row_count
+
+    cases = [item.strip() for item in (args.cases or "").split(",") if item.strip()]
+    sizes = [parse_row_count(item) for item in args.sizes.split(",") if item.strip()]
+    if not sizes:
+        raise ConfigValidationError("sizes must list at least one corpus size")
+    report = run_bench(
+        cases=cases or None,
+        sizes=sizes,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        seed=args.seed,
+        work_dir=args.work_dir,
+        isolated=not bool(args.in_process),
+        baseline=args.baseline,
+        max_regression=args.max_regression,
+        max_rss_regression=args.max_rss_regression,
+    )
+    output_file = (
+        Path(args.output_file).expanduser().resolve()
+        if args.output_file
+        else Path(args.work_dir).expanduser().resolve() / "report.json"
+    )
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    payload = report.to_payload()
+    output_file.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    payload["report_file"] = str(output_file)
+    return CommandResult(
+        payload=payload,
+        exit_code=_EXIT_OK if report.status == "pass" else _EXIT_GENERIC,
+    )
+
+
+def handle_synthetic_generate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.synthetic import (
+        SYNTHETIC_AS_OF,
+        generate_synthetic_corpus,
+        parse_row_count,
+    )
+
+    try:
+        as_of = date.fromisoformat(args.as_of) if args.as_of else SYNTHETIC_AS_OF
+    except ValueError as exc:
+        raise ConfigValidationError(f"invalid as-of date '{args.as_of}'") from exc
+    result = generate_synthetic_corpus(
+        output_dir=args.output_dir,
+        rows=parse_row_count(args.rows),
+        seed=args.seed,
+        formats=[item.strip() for item in args.formats.split(",") if item.strip()],
+        chunk_rows=args.chunk_rows,
+        as_of=as_of,
+    )
+    return CommandResult(payload=result.to_payload())
+
+
 def handle_plugins_validate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.plugins.registry import PluginRegistry
+
     registry = PluginRegistry.from_manifest(args.manifest)
     payload = {
         "manifest": str(Path(args.manifest).expanduser().resolve()),
@@ -459,12 +623,16 @@ def handle_plugins_validate(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_config_validate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.config import load_pipeline_config
+
     cfg = load_pipeline_config(args.pipeline)
     return CommandResult(payload=cfg.model_dump(mode="json"))
 
 
 def handle_report_quality(args: argparse.Namespace) -> CommandResult:
-    runtime = HonestRolesRuntime.from_configs(args.pipeline_config, args.plugin_manifest)
+    from honestroles.io import build_data_quality_report
+
+    runtime = _runtime_from_args(args)
     result = runtime.run()
     report = build_data_quality_report(
         result.dataset,
@@ -478,11 +646,14 @@ def handle_report_quality(args: argparse.Namespace) -> CommandResult:
             "profile": report.profile,
             "weighted_null_percent": report.weighted_null_percent,
             "effective_weights": report.effective_weights,
+            "telemetry": [item.to_dict() for item in result.diagnostics.telemetry],
         }
     )
 
 
 def handle_eda_generate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.eda import generate_eda_artifacts, parse_quality_weight_overrides
+
     manifest = generate_eda_artifacts(
         input_parquet=args.input_parquet,
         output_dir=args.output_dir,
@@ -504,6 +675,8 @@ def handle_eda_generate(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_eda_diff(args: argparse.Namespace) -> CommandResult:
+    from honestroles.eda import generate_eda_diff_artifacts
+
     manifest = generate_eda_diff_artifacts(
         baseline_dir=args.baseline_dir,
         candidate_dir=args.candidate_dir,
@@ -521,6 +694,13 @@ def handle_eda_diff(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_eda_gate(args: argparse.Namespace) -> CommandResult:
+    from honestroles.eda import (
+        build_eda_diff,
+        evaluate_eda_gate,
+        load_eda_artifacts,
+        load_eda_rules,
+    )
+
     candidate_bundle = load_eda_artifacts(args.candidate_dir)
     if candidate_bundle.summary is None:
         raise ConfigValidationError(
@@ -553,6 +733,8 @@ def handle_eda_gate(args: argparse.Namespace) -> CommandResult:
 
 
 def handle_adapter_infer(args: argparse.Namespace) -> CommandResult:
+    from honestroles.io import infer_source_adapter, read_table
+
     input_path = Path(args.input_parquet).expanduser().resolve()
     if not input_path.exists():
         raise ConfigValidationError(f"input parquet does not exist: '{input_path}'")
@@ -567,7 +749,7 @@ def handle_adapter_infer(args: argparse.Namespace) -> CommandResult:
     output_file = Path(args.output_file).expanduser().resolve()
     report_file = output_file.with_suffix(".report.json")
 
-    df = read_parquet(input_path)
+    df = read_table(input_path)
     inferred = infer_source_adapter(
         df,
         sample_rows=args.sample_rows,
@@ -8,8 +8,6 @@ import re
 from typing import Any, Mapping
 import uuid
 
-from honestroles.config import load_pipeline_config
-
 _SCHEMA_VERSION = "1.0"
 _CHUNK_SIZE = 1024 * 1024
 
@@ -121,6 +119,8 @@ def _pipeline_related_hashes(args: Mapping[str, Any]) -> tuple[str | None, dict[
     if pipeline_path is not None:
         hash_sources.append(_hash_file(pipeline_path))
         try:
+            from honestroles.config import load_pipeline_config
+
             cfg = load_pipeline_config(pipeline_path)
             if cfg.input.path.exists():
                 input_hash = _hash_input_path(cfg.input.path)
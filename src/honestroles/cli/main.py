@@ -7,7 +7,6 @@ import subprocess
 import sys
 from typing import Any
 
-from honestroles.eda import load_eda_artifacts
 from honestroles.errors import ConfigValidationError, HonestRolesError, StageExecutionError
 from honestroles.plugins.errors import (
     PluginExecutionError,
@@ -18,6 +17,7 @@ from honestroles.plugins.errors import (
 from .handlers import (
     CommandResult,
     handle_adapter_infer,
+    handle_bench,
     handle_config_validate,
     handle_doctor,
     handle_eda_diff,
@@ -39,9 +39,11 @@ from .handlers import (
     handle_recommend_feedback_summarize,
     handle_recommend_match,
     handle_run,
+    handle_run_merge,
     handle_runs_list,
     handle_runs_show,
     handle_scaffold_plugin,
+    handle_synthetic_generate,
     resolve_plugin_template_root,
 )
 from .lineage import create_record, should_track, write_record
@@ -63,6 +65,18 @@ def _handle_run(args: argparse.Namespace) -> CommandResult:
     return handle_run(args)
 
 
+def _handle_run_merge(args: argparse.Namespace) -> CommandResult:
+    return handle_run_merge(args)
+
+
+def _handle_bench(args: argparse.Namespace) -> CommandResult:
+    return handle_bench(args)
+
+
+def _handle_synthetic_generate(args: argparse.Namespace) -> CommandResult:
+    return handle_synthetic_generate(args)
+
+
 def _handle_plugins_validate(args: argparse.Namespace) -> CommandResult:
     return handle_plugins_validate(args)
 
@@ -160,6 +174,8 @@ def _handle_recommend_feedback_summarize(args: argparse.Namespace) -> CommandRes
 
 
 def _handle_eda_dashboard(args: argparse.Namespace) -> int:
+    from honestroles.eda import load_eda_artifacts
+
     bundle = load_eda_artifacts(args.artifacts_dir)
     if bundle.summary is None:
         raise ConfigValidationError(
@@ -204,13 +220,45 @@ def _handle_eda_dashboard(args: argparse.Namespace) -> int:
     return _EXIT_OK if completed.returncode == 0 else _EXIT_GENERIC
 
 
+def _handle_serve(args: argparse.Namespace) -> int:
+    if args.max_runtimes < 1:
+        raise ConfigValidationError("max-runtimes must be >= 1")
+    if args.input_cache_bytes < 0:
+        raise ConfigValidationError("input-cache-bytes must be >= 0")
+
+    import logging
+    import os
+
+    from honestroles.server import TOKEN_ENV, serve
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    serve(
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket_path,
+        roots=args.roots,
+        token=os.environ.get(TOKEN_ENV) or None,
+        max_runtimes=args.max_runtimes,
+        input_cache_bytes=args.input_cache_bytes,
+    )
+    return _EXIT_OK
+
+
 def _handle_eda_gate(args: argparse.Namespace) -> CommandResult:
     return handle_eda_gate(args)
 
 
 def _dispatch(args: argparse.Namespace) -> CommandResult | int | None:
+    if args.command == "run" and args.run_command == "merge":
+        return _handle_run_merge(args)
     if args.command == "run":
         return _handle_run(args)
+    if args.command == "serve":
+        return _handle_serve(args)
+    if args.command == "bench":
+        return _handle_bench(args)
+    if args.command == "synthetic" and args.synthetic_command == "generate":
+        return _handle_synthetic_generate(args)
     if args.command == "plugins" and args.plugins_command == "validate":
         return _handle_plugins_validate(args)
     if args.command == "config" and args.config_command == "validate":
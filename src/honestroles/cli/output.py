@@ -261,6 +261,34 @@ def _print_publish_table(payload: Mapping[str, Any]) -> None:
             )
 
 
+def _print_bench_table(payload: Mapping[str, Any]) -> None:
+    comparison = payload.get("comparison")
+    statuses: dict[tuple[str, int], str] = {}
+    if isinstance(comparison, Mapping):
+        for entry in comparison.get("entries", []):
+            if isinstance(entry, Mapping):
+                statuses[(str(entry.get("case")), int(entry.get("rows", 0)))] = str(
+                    entry.get("status", "")
+                )
+    print("CASE                   ROWS        P50_MS     P95_MS     ROWS_PER_S   PEAK_RSS_MB  BASELINE")
+    for item in payload.get("results", []):
+        if not isinstance(item, Mapping):
+            continue
+        case = str(item.get("case", ""))
+        rows = int(item.get("rows", 0))
+        rss = item.get("peak_rss_bytes")
+        rss_mb = f"{int(rss) / 1024**2:.1f}" if isinstance(rss, int) else "-"
+        print(
+            f"{case[:22]:22} {rows:<11} {float(item.get('p50_ms', 0.0)):<10.1f} "
+            f"{float(item.get('p95_ms', 0.0)):<10.1f} "
+            f"{float(item.get('throughput_rows_per_s', 0.0)):<12.0f} {rss_mb:12} "
+            f"{statuses.get((case, rows), '-')}"
+        )
+    report_file = payload.get("report_file")
+    if isinstance(report_file, str) and report_file:
+        print(f"REPORT               {report_file}")
+
+
 def emit_payload(payload: Mapping[str, Any], output_format: str) -> None:
     if output_format == "json":
         print(json.dumps(payload, indent=2, sort_keys=True))
@@ -278,6 +306,9 @@ def emit_payload(payload: Mapping[str, Any], output_format: str) -> None:
     if isinstance(payload.get("runs"), list):
         _print_runs_table(payload)
         return
+    if isinstance(payload.get("results"), list) and isinstance(payload.get("environment"), Mapping):
+        _print_bench_table(payload)
+        return
     if isinstance(payload.get("sources"), list) and payload.get("total_sources") is not None:
         _print_ingest_batch_table(payload)
         return
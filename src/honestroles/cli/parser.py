@@ -12,14 +12,92 @@ def _add_format_arg(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_shard_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--shard-key", choices=["id", "apply_url"], default=None)
+    parser.add_argument("--shard-dir", default=None)
+
+
+def _add_parquet_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--parquet-compression",
+        choices=["zstd", "lz4", "snappy", "gzip", "brotli", "uncompressed"],
+        default=None,
+    )
+    parser.add_argument("--parquet-compression-level", type=int, default=None)
+    parser.add_argument("--parquet-row-group-size", type=int, default=None)
+    parser.add_argument("--parquet-statistics", choices=["true", "false", "full"], default=None)
+    parser.add_argument(
+        "--parquet-partition-by",
+        choices=["none", "source", "posted_month"],
+        default=None,
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="honestroles")
     sub = parser.add_subparsers(dest="command", required=True)
 
     run_parser = sub.add_parser("run", help="Run pipeline from TOML config")
-    run_parser.add_argument("--pipeline-config", required=True)
+    # Required by the handler rather than argparse so ``run merge`` can take its own.
+    run_parser.add_argument("--pipeline-config", default=None)
     run_parser.add_argument("--plugins", dest="plugin_manifest", required=False)
+    run_parser.add_argument("--trace-memory", action="store_true")
+    run_parser.add_argument("--max-memory-mb", type=int, default=None)
+    run_parser.add_argument("--max-threads", type=int, default=None)
+    run_parser.add_argument("--shard", default=None, help="Run shard i of N, written as i/N")
+    _add_shard_args(run_parser)
+    _add_parquet_args(run_parser)
     _add_format_arg(run_parser)
+    run_sub = run_parser.add_subparsers(dest="run_command")
+    run_merge = run_sub.add_parser("merge", help="Merge stored shards into the final output")
+    run_merge.add_argument("--pipeline-config", required=True)
+    run_merge.add_argument("--plugins", dest="plugin_manifest", required=False)
+    run_merge.add_argument("--trace-memory", action="store_true")
+    _add_shard_args(run_merge)
+    _add_parquet_args(run_merge)
+    _add_format_arg(run_merge)
+
+    serve_parser = sub.add_parser(
+        "serve",
+        help="Serve pipeline runs over HTTP with warm runtimes, plugins and inputs",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--socket", dest="socket_path", default=None)
+    serve_parser.add_argument("--root", dest="roots", action="append", default=[])
+    serve_parser.add_argument("--max-runtimes", type=int, default=16)
+    serve_parser.add_argument("--input-cache-bytes", type=int, default=1024**3)
+
+    bench_parser = sub.add_parser(
+        "bench",
+        help="Benchmark subsystem hot paths on synthetic corpora",
+    )
+    bench_parser.add_argument("--cases", default=None)
+    bench_parser.add_argument("--sizes", default="10k")
+    bench_parser.add_argument("--repeat", type=int, default=3)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--work-dir", default=".honestroles/bench")
+    bench_parser.add_argument("--output-file", default=None)
+    bench_parser.add_argument("--baseline", default=None)
+    bench_parser.add_argument("--max-regression", type=float, default=0.2)
+    bench_parser.add_argument("--max-rss-regression", type=float, default=0.2)
+    bench_parser.add_argument("--in-process", action="store_true")
+    _add_format_arg(bench_parser)
+
+    synthetic_parser = sub.add_parser("synthetic", help="Synthetic job corpus operations")
+    synthetic_sub = synthetic_parser.add_subparsers(dest="synthetic_command", required=True)
+    synthetic_generate = synthetic_sub.add_parser(
+        "generate",
+        help="Stream a multi-source synthetic job corpus to disk",
+    )
+    synthetic_generate.add_argument("--rows", required=True)
+    synthetic_generate.add_argument("--output-dir", default="dist/synthetic")
+    synthetic_generate.add_argument("--seed", type=int, default=0)
+    synthetic_generate.add_argument("--formats", default="parquet,ndjson,raw-jsonl")
+    synthetic_generate.add_argument("--chunk-rows", type=int, default=250_000)
+    synthetic_generate.add_argument("--as-of", default=None)
+    _add_format_arg(synthetic_generate)
 
     plugins_parser = sub.add_parser("plugins", help="Plugin manifest operations")
     plugins_sub = plugins_parser.add_subparsers(dest="plugins_command", required=True)
@@ -39,6 +117,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     report_parser.add_argument("--pipeline-config", required=True)
     report_parser.add_argument("--plugins", dest="plugin_manifest", required=False)
+    report_parser.add_argument("--trace-memory", action="store_true")
     _add_format_arg(report_parser)
 
     init_parser = sub.add_parser("init", help="Scaffold pipeline and plugin manifest")
@@ -163,6 +242,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ingest_sync.add_argument("--retain-snapshots", type=int, default=30)
     ingest_sync.add_argument("--prune-inactive-days", type=int, default=90)
+    ingest_sync.add_argument("--categorical", action="store_true")
+    _add_parquet_args(ingest_sync)
     _add_format_arg(ingest_sync)
 
     ingest_sync_all = ingest_sub.add_parser(
@@ -172,6 +253,7 @@ def build_parser() -> argparse.ArgumentParser:
     ingest_sync_all.add_argument("--manifest", required=True)
     ingest_sync_all.add_argument("--report-file", default=None)
     ingest_sync_all.add_argument("--fail-fast", action="store_true")
+    _add_parquet_args(ingest_sync_all)
     _add_format_arg(ingest_sync_all)
 
     ingest_validate = ingest_sub.add_parser(
@@ -225,7 +307,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     eda_generate = eda_sub.add_parser(
         "generate",
-        help="Generate deterministic EDA artifacts from a parquet input",
+        help="Generate deterministic EDA artifacts from a parquet or Arrow IPC input",
     )
     eda_generate.add_argument("--input-parquet", required=True)
     eda_generate.add_argument("--output-dir", default="dist/eda/latest")
@@ -292,7 +374,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     recommend_build = recommend_sub.add_parser(
         "build-index",
-        help="Build API-ready retrieval index artifacts from cleaned parquet jobs",
+        help="Build API-ready retrieval index artifacts from cleaned parquet or Arrow IPC jobs",
     )
     recommend_build.add_argument("--input-parquet", required=True)
     recommend_build.add_argument("--output-dir", default=None)
@@ -6,11 +6,20 @@ from honestroles.config.models import (
     AdapterOnError,
     InputAdapterFieldConfig,
     InputAliasesConfig,
+    IpcWriterConfig,
+    ParquetWriterConfig,
     PipelineSpec,
     PluginManifestConfig,
     PluginManifestItem,
+    RuntimeCacheConfig,
     RuntimeConfig,
+    RuntimeHtmlCacheConfig,
+    RuntimeIncrementalConfig,
+    RuntimePartitionsConfig,
+    RuntimeProjectionConfig,
     RuntimeQualityConfig,
+    RuntimeShardingConfig,
+    RuntimeStreamingConfig,
     SourceAdapterSpec,
 )
 from honestroles.schema import CANONICAL_SOURCE_FIELDS
@@ -21,11 +30,20 @@ __all__ = [
     "CANONICAL_SOURCE_FIELDS",
     "InputAdapterFieldConfig",
     "InputAliasesConfig",
+    "IpcWriterConfig",
+    "ParquetWriterConfig",
     "PipelineSpec",
     "PluginManifestConfig",
     "PluginManifestItem",
+    "RuntimeCacheConfig",
     "RuntimeConfig",
+    "RuntimeHtmlCacheConfig",
+    "RuntimeIncrementalConfig",
+    "RuntimePartitionsConfig",
+    "RuntimeProjectionConfig",
     "RuntimeQualityConfig",
+    "RuntimeShardingConfig",
+    "RuntimeStreamingConfig",
     "SourceAdapterSpec",
     "load_pipeline_config",
     "load_plugin_manifest",
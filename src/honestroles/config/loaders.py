@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -18,9 +19,25 @@ def _read_toml(path: Path) -> dict[str, Any]:
         raise ConfigValidationError(f"invalid TOML in '{path}': {exc}") from exc
 
 
-def load_pipeline_config(path: str | Path) -> PipelineSpec:
+def _merge_overrides(raw: dict[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
+    merged = dict(raw)
+    for key, value in overrides.items():
+        current = merged.get(key)
+        if isinstance(value, Mapping) and isinstance(current, dict):
+            merged[key] = _merge_overrides(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_pipeline_config(
+    path: str | Path, overrides: Mapping[str, Any] | None = None
+) -> PipelineSpec:
+    """Load a pipeline TOML file, deep-merging ``overrides`` tables before validation."""
     config_path = Path(path).expanduser().resolve()
     raw = _read_toml(config_path)
+    if overrides:
+        raw = _merge_overrides(raw, overrides)
     try:
         config = PipelineSpec.model_validate(raw)
     except Exception as exc:  # pydantic ValidationError
@@ -58,6 +75,51 @@ def _resolve_pipeline_paths(config: PipelineSpec, base_dir: Path) -> PipelineSpe
             output_path = (base_dir / output_path).resolve()
         resolved_output = output.model_copy(update={"path": output_path})
 
+    runtime = config.runtime
+    cache_path = runtime.cache.path
+    if not cache_path.is_absolute():
+        cache_path = (base_dir / cache_path).resolve()
+        runtime = runtime.model_copy(
+            update={"cache": runtime.cache.model_copy(update={"path": cache_path})}
+        )
+    html_cache_path = runtime.html_cache.path
+    if not html_cache_path.is_absolute():
+        html_cache_path = (base_dir / html_cache_path).resolve()
+        runtime = runtime.model_copy(
+            update={
+                "html_cache": runtime.html_cache.model_copy(update={"path": html_cache_path})
+            }
+        )
+    incremental_path = runtime.incremental.path
+    if not incremental_path.is_absolute():
+        incremental_path = (base_dir / incremental_path).resolve()
+        runtime = runtime.model_copy(
+            update={
+                "incremental": runtime.incremental.model_copy(
+                    update={"path": incremental_path}
+                )
+            }
+        )
+    sharding_path = runtime.sharding.path
+    if not sharding_path.is_absolute():
+        sharding_path = (base_dir / sharding_path).resolve()
+        runtime = runtime.model_copy(
+            update={"sharding": runtime.sharding.model_copy(update={"path": sharding_path})}
+        )
+
+    stages = config.stages
+    dictionary_path = stages.skills.dictionary
+    if dictionary_path is not None and not dictionary_path.is_absolute():
+        dictionary_path = (base_dir / dictionary_path).resolve()
+        stages = stages.model_copy(
+            update={"skills": stages.skills.model_copy(update={"dictionary": dictionary_path})}
+        )
+
     return config.model_copy(
-        update={"input": config.input.model_copy(update={"path": input_path}), "output": resolved_output}
+        update={
+            "input": config.input.model_copy(update={"path": input_path}),
+            "output": resolved_output,
+            "runtime": runtime,
+            "stages": stages,
+        }
     )
@@ -14,6 +14,21 @@ QUALITY_PROFILE_NAME = Literal[
 ]
 AdapterCastType = Literal["string", "bool", "float", "int", "date_string"]
 AdapterOnError = Literal["null_warn"]
+RuntimeExecutionMode = Literal["eager", "lazy", "streaming"]
+LabelTextSource = Literal["title", "description_text", "text"]
+LabelRuleResolution = Literal["first_match", "priority"]
+SkillMergeMode = Literal["merge", "replace"]
+ParquetCompression = Literal["zstd", "lz4", "snappy", "gzip", "brotli", "uncompressed"]
+ParquetPartitionKey = Literal["source", "posted_month"]
+TableFormat = Literal["parquet", "ipc"]
+ShardKey = Literal["id", "apply_url"]
+IpcCompression = Literal["uncompressed", "lz4", "zstd"]
+
+_PARQUET_COMPRESSION_LEVELS: dict[str, tuple[int, int]] = {
+    "zstd": (1, 22),
+    "gzip": (0, 9),
+    "brotli": (0, 11),
+}
 
 
 class StrictModel(BaseModel):
@@ -161,8 +176,9 @@ class SourceAdapterSpec(StrictModel):
 
 
 class InputConfig(StrictModel):
-    kind: Literal["parquet"] = "parquet"
+    kind: TableFormat = "parquet"
     path: Path
+    hive_partitioning: bool = False
     aliases: InputAliasesConfig = Field(default_factory=InputAliasesConfig)
     adapter: SourceAdapterSpec = Field(default_factory=SourceAdapterSpec)
 
@@ -176,8 +192,40 @@ class InputConfig(StrictModel):
         raise TypeError("input.path must be a path-like string")
 
 
+class ParquetWriterConfig(StrictModel):
+    compression: ParquetCompression = "zstd"
+    compression_level: int | None = None
+    row_group_size: int | None = Field(default=None, ge=1)
+    statistics: bool | Literal["full"] = True
+    partition_by: ParquetPartitionKey | None = None
+
+    @model_validator(mode="after")
+    def _validate_compression_level(self) -> "ParquetWriterConfig":
+        if self.compression_level is None:
+            return self
+        bounds = _PARQUET_COMPRESSION_LEVELS.get(self.compression)
+        if bounds is None:
+            raise ValueError(
+                f"parquet.compression_level is not supported for '{self.compression}'"
+            )
+        low, high = bounds
+        if not low <= self.compression_level <= high:
+            raise ValueError(
+                f"parquet.compression_level for '{self.compression}' must be in [{low}, {high}]"
+            )
+        return self
+
+
+class IpcWriterConfig(StrictModel):
+    # Only uncompressed IPC files can be memory-mapped without a decode pass.
+    compression: IpcCompression = "uncompressed"
+
+
 class OutputConfig(StrictModel):
     path: Path
+    format: TableFormat = "parquet"
+    parquet: ParquetWriterConfig = Field(default_factory=ParquetWriterConfig)
+    ipc: IpcWriterConfig = Field(default_factory=IpcWriterConfig)
 
     @field_validator("path", mode="before")
     @classmethod
@@ -193,6 +241,33 @@ class CleanStageOptions(StrictModel):
     enabled: bool = True
     drop_null_titles: bool = True
     strip_html: bool = True
+    # Canonical columns are nulled (the contract keeps them); others are dropped.
+    drop_columns: tuple[str, ...] = ()
+
+    @field_validator("drop_columns", mode="before")
+    @classmethod
+    def _coerce_drop_columns(cls, value: object) -> tuple[str, ...]:
+        return _coerce_string_tuple(value, field="stages.clean.drop_columns")
+
+
+class FilterKeywordGroup(StrictModel):
+    all_of: tuple[str, ...] = ()
+    any_of: tuple[str, ...] = ()
+    none_of: tuple[str, ...] = ()
+
+    @field_validator("all_of", "any_of", "none_of", mode="before")
+    @classmethod
+    def _coerce_terms(cls, value: object) -> object:
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @model_validator(mode="after")
+    def _require_terms(self) -> "FilterKeywordGroup":
+        terms = (*self.all_of, *self.any_of, *self.none_of)
+        if not any(term.strip() for term in terms):
+            raise ValueError("keyword group must define at least one non-empty keyword")
+        return self
 
 
 class FilterStageOptions(StrictModel):
@@ -200,8 +275,9 @@ class FilterStageOptions(StrictModel):
     remote_only: bool = False
     min_salary: float | None = None
     required_keywords: tuple[str, ...] = ()
+    keyword_groups: tuple[FilterKeywordGroup, ...] = ()
 
-    @field_validator("required_keywords", mode="before")
+    @field_validator("required_keywords", "keyword_groups", mode="before")
     @classmethod
     def _coerce_required_keywords(cls, value: object) -> object:
         if isinstance(value, list):
@@ -209,8 +285,116 @@ class FilterStageOptions(StrictModel):
         return value
 
 
+class SkillStageOptions(StrictModel):
+    enabled: bool = False
+    dictionary: Path | None = None
+    terms: dict[str, tuple[str, ...]] = Field(default_factory=dict)
+    mode: SkillMergeMode = "merge"
+
+    @field_validator("dictionary", mode="before")
+    @classmethod
+    def _coerce_dictionary(cls, value: object) -> Path | None:
+        if value is None or isinstance(value, Path):
+            return value
+        if isinstance(value, str):
+            return Path(value)
+        raise TypeError("stages.skills.dictionary must be a path-like string")
+
+    @field_validator("terms", mode="before")
+    @classmethod
+    def _coerce_terms(cls, value: object) -> object:
+        if isinstance(value, dict):
+            return {
+                key: tuple(aliases) if isinstance(aliases, list) else aliases
+                for key, aliases in value.items()
+            }
+        return value
+
+    @field_validator("terms")
+    @classmethod
+    def _validate_terms(cls, value: dict[str, tuple[str, ...]]) -> dict[str, tuple[str, ...]]:
+        for skill in value:
+            if not skill.strip():
+                raise ValueError("stages.skills.terms keys must be non-empty")
+        return value
+
+    @model_validator(mode="after")
+    def _require_vocabulary(self) -> "SkillStageOptions":
+        if self.enabled and self.dictionary is None and not self.terms:
+            raise ValueError("stages.skills requires 'dictionary' or 'terms' when enabled")
+        return self
+
+
+class LabelRuleConfig(StrictModel):
+    value: str
+    keywords: tuple[str, ...]
+    priority: int = 0
+
+    @field_validator("keywords", mode="before")
+    @classmethod
+    def _coerce_keywords(cls, value: object) -> object:
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @model_validator(mode="after")
+    def _require_value_and_keywords(self) -> "LabelRuleConfig":
+        if not self.value.strip():
+            raise ValueError("label rule value must be non-empty")
+        if not any(keyword.strip() for keyword in self.keywords):
+            raise ValueError("label rule must define at least one non-empty keyword")
+        return self
+
+
+class LabelTaxonomyConfig(StrictModel):
+    column: str
+    source: LabelTextSource = "title"
+    resolution: LabelRuleResolution = "first_match"
+    default: str | None = None
+    rules: tuple[LabelRuleConfig, ...]
+
+    @field_validator("rules", mode="before")
+    @classmethod
+    def _coerce_rules(cls, value: object) -> object:
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @field_validator("column")
+    @classmethod
+    def _validate_column(cls, value: str) -> str:
+        if not value.startswith("label_") or value == "label_":
+            raise ValueError("taxonomy column must be named 'label_<name>'")
+        if value == "label_tech_stack":
+            raise ValueError("'label_tech_stack' is a list column and cannot be a taxonomy")
+        return value
+
+    @model_validator(mode="after")
+    def _require_rules(self) -> "LabelTaxonomyConfig":
+        if not self.rules:
+            raise ValueError("taxonomy must define at least one rule")
+        return self
+
+
 class LabelStageOptions(StrictModel):
     enabled: bool = True
+    taxonomies: tuple[LabelTaxonomyConfig, ...] = ()
+
+    @field_validator("taxonomies", mode="before")
+    @classmethod
+    def _coerce_taxonomies(cls, value: object) -> object:
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @model_validator(mode="after")
+    def _unique_columns(self) -> "LabelStageOptions":
+        seen: set[str] = set()
+        for taxonomy in self.taxonomies:
+            if taxonomy.column in seen:
+                raise ValueError(f"duplicate taxonomy column '{taxonomy.column}'")
+            seen.add(taxonomy.column)
+        return self
 
 
 class RateStageOptions(StrictModel):
@@ -228,11 +412,29 @@ class RateStageOptions(StrictModel):
 class MatchStageOptions(StrictModel):
     enabled: bool = True
     top_k: int = Field(default=100, ge=1)
+    group_by: tuple[str, ...] = ()
+
+    @field_validator("group_by", mode="before")
+    @classmethod
+    def _coerce_group_by(cls, value: object) -> object:
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    @field_validator("group_by")
+    @classmethod
+    def _validate_group_by(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        if any(not name.strip() for name in value):
+            raise ValueError("stages.match.group_by entries must be non-empty")
+        if len(set(value)) != len(value):
+            raise ValueError("stages.match.group_by entries must be unique")
+        return value
 
 
 class StageConfig(StrictModel):
     clean: CleanStageOptions = Field(default_factory=CleanStageOptions)
     filter: FilterStageOptions = Field(default_factory=FilterStageOptions)
+    skills: SkillStageOptions = Field(default_factory=SkillStageOptions)
     label: LabelStageOptions = Field(default_factory=LabelStageOptions)
     rate: RateStageOptions = Field(default_factory=RateStageOptions)
     match: MatchStageOptions = Field(default_factory=MatchStageOptions)
@@ -262,10 +464,99 @@ class RuntimeQualityConfig(StrictModel):
         return self
 
 
+class RuntimeStreamingConfig(StrictModel):
+    batch_rows: int = Field(default=100_000, ge=1)
+
+
+class RuntimeCacheConfig(StrictModel):
+    enabled: bool = False
+    path: Path = Path(".honestroles/cache/stages")
+    max_bytes: int = Field(default=2 * 1024**3, ge=1)
+    max_entries: int = Field(default=64, ge=1)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _coerce_path(cls, value: object) -> Path:
+        if isinstance(value, Path):
+            return value
+        if isinstance(value, str):
+            return Path(value)
+        raise TypeError("runtime.cache.path must be a path-like string")
+
+
+class RuntimeHtmlCacheConfig(StrictModel):
+    enabled: bool = False
+    path: Path = Path(".honestroles/cache/html")
+    max_entries: int = Field(default=1_000_000, ge=1)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _coerce_path(cls, value: object) -> Path:
+        if isinstance(value, Path):
+            return value
+        if isinstance(value, str):
+            return Path(value)
+        raise TypeError("runtime.html_cache.path must be a path-like string")
+
+
+class RuntimeIncrementalConfig(StrictModel):
+    enabled: bool = False
+    path: Path = Path(".honestroles/incremental")
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _coerce_path(cls, value: object) -> Path:
+        if isinstance(value, Path):
+            return value
+        if isinstance(value, str):
+            return Path(value)
+        raise TypeError("runtime.incremental.path must be a path-like string")
+
+
+class RuntimePartitionsConfig(StrictModel):
+    workers: int | None = Field(default=None, ge=1)
+
+
+class RuntimeProjectionConfig(StrictModel):
+    enabled: bool = False
+    keep: tuple[str, ...] = ()
+
+    @field_validator("keep", mode="before")
+    @classmethod
+    def _coerce_keep(cls, value: object) -> tuple[str, ...]:
+        return _coerce_string_tuple(value, field="runtime.projection.keep")
+
+
+class RuntimeShardingConfig(StrictModel):
+    key: ShardKey = "id"
+    path: Path = Path(".honestroles/shards")
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _coerce_path(cls, value: object) -> Path:
+        if isinstance(value, Path):
+            return value
+        if isinstance(value, str):
+            return Path(value)
+        raise TypeError("runtime.sharding.path must be a path-like string")
+
+
 class RuntimeConfig(StrictModel):
     fail_fast: bool = True
     random_seed: int = 0
+    execution: RuntimeExecutionMode = "eager"
+    trace_memory: bool = False
+    categorical: bool = False
+    max_memory_mb: int | None = Field(default=None, ge=1)
+    max_threads: int | None = Field(default=None, ge=1)
     quality: RuntimeQualityConfig = Field(default_factory=RuntimeQualityConfig)
+    streaming: RuntimeStreamingConfig = Field(default_factory=RuntimeStreamingConfig)
+    cache: RuntimeCacheConfig = Field(default_factory=RuntimeCacheConfig)
+    html_cache: RuntimeHtmlCacheConfig = Field(default_factory=RuntimeHtmlCacheConfig)
+    partitions: RuntimePartitionsConfig = Field(default_factory=RuntimePartitionsConfig)
+    incremental: RuntimeIncrementalConfig = Field(default_factory=RuntimeIncrementalConfig)
+    projection: RuntimeProjectionConfig = Field(default_factory=RuntimeProjectionConfig)
+    sharding: RuntimeShardingConfig = Field(default_factory=RuntimeShardingConfig)
 
 
 class PipelineSpec(StrictModel):
@@ -274,6 +565,18 @@ class PipelineSpec(StrictModel):
     stages: StageConfig = Field(default_factory=StageConfig)
     runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
 
+    @model_validator(mode="after")
+    def _streaming_requires_sink(self) -> "PipelineSpec":
+        if (
+            self.runtime.execution == "streaming"
+            and not self.stages.match.enabled
+            and self.output is None
+        ):
+            raise ValueError(
+                "runtime.execution = 'streaming' requires [output] when stages.match is disabled"
+            )
+        return self
+
 
 class PluginSpecConfig(StrictModel):
     api_version: str = "1.0"
@@ -287,6 +590,18 @@ class PluginSpecConfig(StrictModel):
             return tuple(value)
         return value
 
+    @field_validator("capabilities")
+    @classmethod
+    def _validate_column_capabilities(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        for capability in value:
+            name, sep, columns = capability.partition(":")
+            if sep and name.strip() == "writes":
+                if not any(item.strip() for item in columns.split(",")):
+                    raise ValueError(
+                        f"capability '{capability}' must list at least one column"
+                    )
+        return value
+
 
 class PluginManifestItem(StrictModel):
     name: str
@@ -296,6 +611,8 @@ class PluginManifestItem(StrictModel):
     order: int = 0
     settings: dict[str, Any] = Field(default_factory=dict)
     spec: PluginSpecConfig = Field(default_factory=PluginSpecConfig)
+    isolated: bool = False
+    timeout_seconds: float | None = Field(default=None, gt=0)
 
     @field_validator("name")
     @classmethod
@@ -305,6 +622,15 @@ class PluginManifestItem(StrictModel):
             raise ValueError("plugin name must be non-empty")
         return cleaned
 
+    @model_validator(mode="after")
+    def _timeout_requires_isolation(self) -> "PluginManifestItem":
+        # Only a worker process can be stopped once a plugin call has started.
+        if self.timeout_seconds is not None and not self.isolated:
+            raise ValueError(
+                f"plugin '{self.name}' sets timeout_seconds without isolated = true"
+            )
+        return self
+
 
 class PluginManifestConfig(StrictModel):
     plugins: tuple[PluginManifestItem, ...] = ()
@@ -17,6 +17,12 @@ class StageRowCounts:
         updated[stage] = int(count)
         return StageRowCounts(counts=updated)
 
+    def merge(self, other: "StageRowCounts") -> "StageRowCounts":
+        updated = dict(self.counts)
+        for stage, count in other.counts.items():
+            updated[stage] = updated.get(stage, 0) + int(count)
+        return StageRowCounts(counts=updated)
+
     def to_dict(self) -> dict[str, int]:
         return {key: int(value) for key, value in _sorted_dict(self.counts).items()}
 
@@ -39,11 +45,13 @@ class PluginExecutionCounts:
 class RuntimeSettingsSnapshot:
     fail_fast: bool
     random_seed: int
+    execution: str = "eager"
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "fail_fast": self.fail_fast,
             "random_seed": int(self.random_seed),
+            "execution": self.execution,
         }
 
 
@@ -138,6 +146,14 @@ class NonFatalStageError:
     error_type: str
     detail: str
 
+    @classmethod
+    def from_mapping(cls, payload: Mapping[str, Any]) -> "NonFatalStageError":
+        return cls(
+            stage=str(payload.get("stage", "")),
+            error_type=str(payload.get("error_type", "")),
+            detail=str(payload.get("detail", "")),
+        )
+
     def to_dict(self) -> dict[str, str]:
         return {
             "stage": self.stage,
@@ -146,6 +162,207 @@ class NonFatalStageError:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class StageTelemetry:
+    stage: str
+    plugin: str | None = None
+    calls: int = 1
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    bytes_before: int | None = None
+    bytes_after: int | None = None
+    peak_traced_bytes: int | None = None
+    peak_rss_bytes: int | None = None
+
+    @classmethod
+    def from_mapping(cls, payload: Mapping[str, Any]) -> "StageTelemetry":
+        def _optional_int(key: str) -> int | None:
+            value = payload.get(key)
+            return None if value is None else int(value)
+
+        plugin = payload.get("plugin")
+        return cls(
+            stage=str(payload.get("stage", "")),
+            plugin=None if plugin is None else str(plugin),
+            calls=int(payload.get("calls", 1)),
+            wall_ms=float(payload.get("wall_ms", 0.0)),
+            cpu_ms=float(payload.get("cpu_ms", 0.0)),
+            bytes_before=_optional_int("bytes_before"),
+            bytes_after=_optional_int("bytes_after"),
+            peak_traced_bytes=_optional_int("peak_traced_bytes"),
+            peak_rss_bytes=_optional_int("peak_rss_bytes"),
+        )
+
+    def merge(self, other: "StageTelemetry") -> "StageTelemetry":
+        def _add(left: int | None, right: int | None) -> int | None:
+            if left is None or right is None:
+                return left if right is None else right
+            return left + right
+
+        def _max(left: int | None, right: int | None) -> int | None:
+            if left is None or right is None:
+                return left if right is None else right
+            return max(left, right)
+
+        return StageTelemetry(
+            stage=self.stage,
+            plugin=self.plugin,
+            calls=self.calls + other.calls,
+            wall_ms=self.wall_ms + other.wall_ms,
+            cpu_ms=self.cpu_ms + other.cpu_ms,
+            bytes_before=_add(self.bytes_before, other.bytes_before),
+            bytes_after=_add(self.bytes_after, other.bytes_after),
+            peak_traced_bytes=_max(self.peak_traced_bytes, other.peak_traced_bytes),
+            peak_rss_bytes=_max(self.peak_rss_bytes, other.peak_rss_bytes),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "stage": self.stage,
+            "calls": int(self.calls),
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+        }
+        if self.plugin is not None:
+            payload["plugin"] = self.plugin
+        if self.peak_traced_bytes is not None:
+            payload["peak_traced_bytes"] = int(self.peak_traced_bytes)
+        if self.peak_rss_bytes is not None:
+            payload["peak_rss_bytes"] = int(self.peak_rss_bytes)
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class StageCacheDiagnostics:
+    resumed_from: str | None = None
+    hits: tuple[str, ...] = ()
+    stored: tuple[str, ...] = ()
+    evicted: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "resumed_from": self.resumed_from,
+            "hits": list(self.hits),
+            "stored": list(self.stored),
+            "evicted": int(self.evicted),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalDiagnostics:
+    resumed: bool = False
+    input_rows: int = 0
+    processed_rows: int = 0
+    reused_rows: int = 0
+    dropped_rows: int = 0
+    stored: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "resumed": self.resumed,
+            "input_rows": int(self.input_rows),
+            "processed_rows": int(self.processed_rows),
+            "reused_rows": int(self.reused_rows),
+            "dropped_rows": int(self.dropped_rows),
+            "stored": self.stored,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceDiagnostics:
+    requested_execution: str
+    polars_threads: int
+    max_memory_bytes: int | None = None
+    max_threads: int | None = None
+    estimated_input_rows: int | None = None
+    estimated_input_bytes: int | None = None
+    estimated_peak_bytes: int | None = None
+    fallback: bool = False
+    fallback_blocked: str | None = None
+    batch_rows: int | None = None
+    peak_rss_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "requested_execution": self.requested_execution,
+            "polars_threads": int(self.polars_threads),
+            "max_memory_bytes": self.max_memory_bytes,
+            "max_threads": self.max_threads,
+            "estimated_input_rows": self.estimated_input_rows,
+            "estimated_input_bytes": self.estimated_input_bytes,
+            "estimated_peak_bytes": self.estimated_peak_bytes,
+            "fallback": self.fallback,
+            "batch_rows": self.batch_rows,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+        if self.fallback_blocked is not None:
+            payload["fallback_blocked"] = self.fallback_blocked
+        if self.max_memory_bytes is not None and self.peak_rss_bytes is not None:
+            payload["over_budget"] = self.peak_rss_bytes > self.max_memory_bytes
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class ShardDiagnostics:
+    index: int
+    count: int
+    key: str
+    stage_rows: StageRowCounts
+    non_fatal_errors: tuple[NonFatalStageError, ...] = ()
+    wall_ms: float = 0.0
+
+    @classmethod
+    def from_mapping(cls, payload: Mapping[str, Any]) -> "ShardDiagnostics":
+        return cls(
+            index=int(payload["index"]),
+            count=int(payload["count"]),
+            key=str(payload["key"]),
+            stage_rows=StageRowCounts(
+                counts={str(k): int(v) for k, v in dict(payload.get("stage_rows", {})).items()}
+            ),
+            non_fatal_errors=tuple(
+                NonFatalStageError.from_mapping(item)
+                for item in payload.get("non_fatal_errors", ())
+            ),
+            wall_ms=float(payload.get("wall_ms", 0.0)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "index": int(self.index),
+            "count": int(self.count),
+            "key": self.key,
+            "stage_rows": self.stage_rows.to_dict(),
+            "wall_ms": round(self.wall_ms, 3),
+        }
+        if self.non_fatal_errors:
+            payload["non_fatal_errors"] = [item.to_dict() for item in self.non_fatal_errors]
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionDiagnostics:
+    path: str
+    stage_rows: StageRowCounts
+    hive: dict[str, str] = field(default_factory=dict)
+    non_fatal_errors: tuple[NonFatalStageError, ...] = ()
+    wall_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "path": self.path,
+            "stage_rows": self.stage_rows.to_dict(),
+            "wall_ms": round(float(self.wall_ms), 3),
+        }
+        if self.hive:
+            payload["hive"] = _sorted_dict(self.hive)
+        if self.non_fatal_errors:
+            payload["non_fatal_errors"] = [item.to_dict() for item in self.non_fatal_errors]
+        return payload
+
+
 @dataclass(frozen=True, slots=True)
 class RuntimeDiagnostics:
     input_path: str
@@ -157,6 +374,13 @@ class RuntimeDiagnostics:
     output_path: str | None = None
     final_rows: int = 0
     non_fatal_errors: tuple[NonFatalStageError, ...] = ()
+    telemetry: tuple[StageTelemetry, ...] = ()
+    cache: StageCacheDiagnostics | None = None
+    partitions: tuple[PartitionDiagnostics, ...] = ()
+    shards: tuple[ShardDiagnostics, ...] = ()
+    incremental: IncrementalDiagnostics | None = None
+    input_columns: tuple[str, ...] | None = None
+    resources: ResourceDiagnostics | None = None
 
     def to_dict(self) -> dict[str, Any]:
         payload: dict[str, Any] = {
@@ -172,4 +396,18 @@ class RuntimeDiagnostics:
             payload["output_path"] = self.output_path
         if self.non_fatal_errors:
             payload["non_fatal_errors"] = [item.to_dict() for item in self.non_fatal_errors]
+        if self.telemetry:
+            payload["telemetry"] = [item.to_dict() for item in self.telemetry]
+        if self.cache is not None:
+            payload["cache"] = self.cache.to_dict()
+        if self.partitions:
+            payload["partitions"] = [item.to_dict() for item in self.partitions]
+        if self.shards:
+            payload["shards"] = [item.to_dict() for item in self.shards]
+        if self.incremental is not None:
+            payload["incremental"] = self.incremental.to_dict()
+        if self.input_columns is not None:
+            payload["input_columns"] = list(self.input_columns)
+        if self.resources is not None:
+            payload["resources"] = self.resources.to_dict()
         return payload
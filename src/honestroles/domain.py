@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from itertools import islice
+import threading
 from typing import Any
 
 import polars as pl
@@ -16,6 +18,43 @@ _CANONICAL_TUPLE_FIELDS = {"skills"}
 _CANONICAL_STRING_FIELDS = tuple(
     name for name, spec in CANONICAL_JOB_SCHEMA.items() if spec.logical_type == "string"
 )
+_VALIDATED_SCHEMA_LIMIT = 256
+
+
+class _ValidatedSchemaCache:
+    """Bounded LRU of canonical schema fingerprints that already passed validation."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._entries: OrderedDict[Hashable, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def contains(self, fingerprint: Hashable) -> bool:
+        with self._lock:
+            if fingerprint in self._entries:
+                self._entries.move_to_end(fingerprint)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, fingerprint: Hashable) -> None:
+        with self._lock:
+            self._entries[fingerprint] = None
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self._limit:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_VALIDATED_SCHEMAS = _ValidatedSchemaCache(_VALIDATED_SCHEMA_LIMIT)
 
 
 @dataclass(frozen=True, slots=True)
@@ -100,6 +139,12 @@ class JobDataset:
     def _from_polars_unchecked(cls, df: pl.DataFrame) -> "JobDataset":
         return cls(_frame=df)
 
+    def _with_trusted_frame(self, frame: pl.DataFrame) -> "JobDataset":
+        # Built-in stages only filter rows, append non-canonical columns, or
+        # rewrite a canonical column with its canonical dtype on an already
+        # validated dataset, so the canonical schema cannot change.
+        return JobDataset._from_polars_unchecked(frame)
+
     def to_polars(self, *, copy: bool = True) -> pl.DataFrame:
         return self._frame.clone() if copy else self._frame
 
@@ -117,7 +162,21 @@ class JobDataset:
         if missing:
             raise ValueError("dataset is missing canonical fields: " + ", ".join(missing))
 
+    def _canonical_fingerprint(self) -> tuple[tuple[str, str, pl.DataType | None], ...]:
+        schema = self._frame.schema
+        return tuple(
+            (name, spec.logical_type, schema.get(name))
+            for name, spec in CANONICAL_JOB_SCHEMA.items()
+        )
+
     def validate_canonical_types(self) -> None:
+        fingerprint = self._canonical_fingerprint()
+        if _VALIDATED_SCHEMAS.contains(fingerprint):
+            return
+        self._check_canonical_types()
+        _VALIDATED_SCHEMAS.add(fingerprint)
+
+    def _check_canonical_types(self) -> None:
         self.validate_canonical_schema()
         schema = self._frame.schema
         for name, spec in CANONICAL_JOB_SCHEMA.items():
@@ -7,6 +7,7 @@ from typing import Mapping
 
 from honestroles.config.models import RuntimeQualityConfig
 from honestroles.errors import ConfigValidationError
+from honestroles.io import write_parquet
 
 from .charts import write_chart_figures
 from .models import EDAArtifactsBundle, EDAArtifactsManifest
@@ -81,7 +82,7 @@ def generate_eda_artifacts(
         table = profile.tables.get(key)
         if table is None:
             continue
-        table.write_parquet(artifacts_dir / relative_path)
+        write_parquet(table, artifacts_dir / relative_path)
 
     figure_file_map = write_chart_figures(profile.summary, figures_dir)
 
@@ -147,7 +148,7 @@ def generate_eda_diff_artifacts(
         table = tables.get(key)
         if table is None:
             continue
-        table.write_parquet(artifacts_dir / relative_path)
+        write_parquet(table, artifacts_dir / relative_path)
 
     files: dict[str, str] = {"diff_json": "diff.json"}
     files.update(table_file_map)
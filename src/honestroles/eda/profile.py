@@ -6,6 +6,7 @@ from typing import Any, Mapping
 import polars as pl
 
 from honestroles.errors import ConfigValidationError
+from honestroles.io import read_table
 
 from .common import distribution_table, jsonable, round4
 from .models import EDAProfileResult
@@ -52,7 +53,7 @@ def build_eda_profile(
         field_weights=field_weights,
     )
 
-    raw_df = pl.read_parquet(input_parquet)
+    raw_df = read_table(input_parquet)
     if max_rows is not None:
         raw_df = raw_df.head(max_rows)
 
@@ -473,12 +473,16 @@ def build_temporal(runtime_df: pl.DataFrame) -> dict[str, Any]:
     if "posted_at" not in runtime_df.columns or runtime_df.height == 0:
         return {"posted_at_range": {"min": None, "max": None}, "monthly_counts": []}
 
-    parsed = runtime_df.with_columns(
-        pl.col("posted_at")
-        .cast(pl.String, strict=False)
-        .str.strptime(pl.Datetime, strict=False)
-        .alias("_posted_at_dt")
+    text = pl.col("posted_at").cast(pl.String, strict=False)
+    # Ingest writes offset timestamps; inferring one format for the whole column
+    # rejects them, so parse those explicitly (as UTC) and infer the rest.
+    aware = (
+        text.str.replace(r"Z$", "+00:00")
+        .str.to_datetime("%Y-%m-%dT%H:%M:%S%.f%:z", strict=False, time_zone="UTC")
+        .dt.replace_time_zone(None)
     )
+    naive = pl.when(aware.is_null()).then(text).str.strptime(pl.Datetime, strict=False)
+    parsed = runtime_df.with_columns(pl.coalesce(aware, naive).alias("_posted_at_dt"))
 
     range_payload = parsed.select(
         pl.col("_posted_at_dt").min().alias("min"),
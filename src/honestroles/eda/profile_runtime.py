@@ -8,7 +8,7 @@ import polars as pl
 
 from honestroles.config.models import RuntimeQualityConfig
 from honestroles.errors import ConfigValidationError
-from honestroles.io import build_data_quality_report
+from honestroles.io import build_data_quality_report, infer_table_format, write_ipc
 from honestroles.runtime import HonestRolesRuntime
 
 
@@ -74,10 +74,11 @@ def run_runtime_profile(
 ) -> tuple[pl.DataFrame, dict[str, Any], dict[str, Any]]:
     with TemporaryDirectory(prefix="honestroles_eda_") as tmp_dir:
         tmp_path = Path(tmp_dir)
-        runtime_input_path = tmp_path / "input.parquet"
+        # Uncompressed IPC: the runtime memory-maps it instead of decoding parquet.
+        runtime_input_path = tmp_path / "input.arrow"
         pipeline_path = tmp_path / "pipeline.toml"
 
-        input_df.write_parquet(runtime_input_path)
+        write_ipc(input_df, runtime_input_path)
         pipeline_path.write_text(
             render_pipeline_text(
                 input_parquet_path=runtime_input_path,
@@ -115,7 +116,7 @@ def render_pipeline_text(
 ) -> str:
     lines = [
         "[input]",
-        'kind = "parquet"',
+        f'kind = "{infer_table_format(input_parquet_path)}"',
         f'path = "{input_parquet_path}"',
         "",
     ]
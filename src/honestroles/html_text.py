@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import html
+import threading
+import time
+import uuid
+from functools import partial
+from html.entities import html5
+from pathlib import Path
+
+import polars as pl
+
+from honestroles.config.models import IpcWriterConfig
+from honestroles.io import write_ipc
+
+# Bump whenever conversion output changes so persisted caches are not reused.
+HTML_TEXT_VERSION = 2
+
+_DROPPED = (
+    r"(?is)<!--.*?-->"
+    r"|<(?:script|style|noscript|template)\b[^>]*>"
+    r".*?</(?:script|style|noscript|template)\s*>"
+)
+# A run of block-level tags becomes one break. Breaks are marked with a
+# control character during conversion so that whitespace collapsing, which
+# turns every source newline into a space, leaves them alone.
+_BLOCK_TAGS = (
+    r"(?:(?i)</?(?:address|article|aside|blockquote|br|dd|div|dl|dt|fieldset"
+    r"|figcaption|figure|footer|form|h[1-6]|header|hr|li|main|nav|ol|p|pre"
+    r"|section|table|tr|ul)\b[^>]*>\s*)+"
+)
+_BREAK = "\x1f"
+_TAGS = r"<[A-Za-z/!?][^>]*>"
+_NAMED_ENTITIES = {
+    f"&{name}": value for name, value in html5.items() if name.endswith(";")
+}
+# html.unescape also decodes numeric references and any reference that starts
+# with a legacy name, such as "&copy 2026" or "&notit;". Those are left intact
+# by the named entity pass, so only values still containing one after it take
+# the per-value path.
+_UNESCAPE_IN_PYTHON = "&(?:#|{})".format(
+    "|".join(name for name in html5 if not name.endswith(";"))
+)
+
+_KEY_SEEDS = ((0x5EED, 0x1, 0x2, 0x3), (0xC0FFEE, 0x4, 0x5, 0x6))
+_KEY_COLUMNS = ("key_a", "key_b")
+_SOURCE = "html"
+_TEXT = "text"
+_SEGMENT_GLOB = "segment-*.arrow"
+_SEGMENT_WRITER = IpcWriterConfig(compression="lz4")
+# Segments are folded into one file once this many have accumulated.
+_COMPACT_SEGMENTS = 16
+
+
+def html_to_text(values: pl.Series, cache: HtmlTextCache | None = None) -> pl.Series:
+    """Convert HTML strings to plain text.
+
+    Comments and script/style blocks are dropped, block-level tags become line
+    breaks, other tags become spaces, and entities are decoded as
+    :func:`html.unescape` does. Runs of spaces collapse to one and blank lines
+    are removed. Each distinct value is converted once per call, and with a
+    ``cache`` only values it has not seen before are converted at all. Nulls
+    stay null.
+    """
+    values = values.cast(pl.String, strict=False)
+    distinct = values.drop_nulls().unique(maintain_order=True).to_frame(_SOURCE)
+    if distinct.height == 0:
+        return values
+    if cache is None:
+        converted = distinct.with_columns(_convert(distinct[_SOURCE]).alias(_TEXT))
+    else:
+        converted = cache.convert(distinct)
+    return (
+        values.to_frame(_SOURCE)
+        .join(converted, on=_SOURCE, how="left", maintain_order="left")
+        .get_column(_TEXT)
+        .alias(values.name)
+    )
+
+
+def html_to_text_expr(expr: pl.Expr, cache: HtmlTextCache | None = None) -> pl.Expr:
+    """Expression form of :func:`html_to_text` for eager and lazy frames."""
+    return expr.cast(pl.String, strict=False).map_batches(
+        partial(html_to_text, cache=cache), return_dtype=pl.String
+    )
+
+
+def _convert(values: pl.Series) -> pl.Series:
+    stripped = (
+        values.str.replace_all(_DROPPED, " ")
+        .str.replace_all(_BLOCK_TAGS, _BREAK)
+        .str.replace_all(_TAGS, " ")
+    )
+    decoded = stripped.str.replace_many(_NAMED_ENTITIES)
+    fallback = decoded.str.contains(_UNESCAPE_IN_PYTHON).arg_true()
+    if fallback.len():
+        decoded = decoded.scatter(
+            fallback, [html.unescape(value) for value in stripped.gather(fallback)]
+        )
+    # Matching only runs that are not already a single space keeps the number
+    # of replacements, which dominates the cost of this pass, small.
+    return (
+        decoded.str.replace_all(r"[^\S ]\s*| \s+", " ")
+        .str.replace_all(rf" ?{_BREAK}[ {_BREAK}]*", "\n")
+        .str.strip_chars()
+    )
+
+
+def _content_keys(values: pl.Series) -> list[pl.Series]:
+    return [
+        values.hash(*seeds).alias(name) for seeds, name in zip(_KEY_SEEDS, _KEY_COLUMNS)
+    ]
+
+
+class HtmlTextCache:
+    """Converted descriptions keyed by a 128-bit hash of their HTML.
+
+    Entries live in memory and in lz4 Arrow IPC segment files under
+    ``root``, one segment per call that converted something new, so processes
+    sharing a directory only ever add files. Polars hashes are not stable
+    across releases, so each Polars version and conversion version gets its
+    own subdirectory. Beyond ``max_entries`` the oldest entries are evicted.
+    """
+
+    def __init__(self, root: str | Path, max_entries: int = 1_000_000) -> None:
+        self.root = (
+            Path(root).expanduser().resolve()
+            / f"v{HTML_TEXT_VERSION}-polars{pl.__version__}"
+        )
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = self._read(sorted(self.root.glob(_SEGMENT_GLOB)))
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return self._entries.height
+
+    def convert(self, distinct: pl.DataFrame) -> pl.DataFrame:
+        """Return ``distinct`` (one ``html`` column) with a converted ``text`` column."""
+        keyed = distinct.with_columns(_content_keys(distinct[_SOURCE]))
+        with self._lock:
+            entries = self._entries
+        looked_up = keyed.join(entries, on=list(_KEY_COLUMNS), how="left")
+        missing = looked_up.filter(pl.col(_TEXT).is_null())
+        self.hits += looked_up.height - missing.height
+        self.misses += missing.height
+        if missing.height == 0:
+            return looked_up.select(_SOURCE, _TEXT)
+        added = missing.with_columns(_convert(missing[_SOURCE]).alias(_TEXT))
+        self._add(added.select(*_KEY_COLUMNS, _TEXT))
+        return pl.concat(
+            [looked_up.filter(pl.col(_TEXT).is_not_null()), added]
+        ).select(_SOURCE, _TEXT)
+
+    def _add(self, added: pl.DataFrame) -> None:
+        with self._lock:
+            self._entries = self._bounded(pl.concat([self._entries, added]))
+            self.root.mkdir(parents=True, exist_ok=True)
+            write_ipc(added, self._segment_path(), _SEGMENT_WRITER)
+            segments = sorted(self.root.glob(_SEGMENT_GLOB))
+            if len(segments) > _COMPACT_SEGMENTS:
+                self._compact(segments)
+
+    def _read(self, segments: list[Path]) -> pl.DataFrame:
+        frames = []
+        for path in segments:
+            try:
+                frames.append(pl.read_ipc(path, memory_map=False))
+            except (OSError, pl.exceptions.ComputeError):
+                # Another process compacted this segment away mid-read.
+                continue
+        if not frames:
+            return pl.DataFrame(
+                schema={"key_a": pl.UInt64, "key_b": pl.UInt64, _TEXT: pl.String}
+            )
+        return self._bounded(pl.concat(frames))
+
+    def _compact(self, segments: list[Path]) -> None:
+        # Re-read from disk: other processes may have added segments since load.
+        write_ipc(self._read(segments), self._segment_path(), _SEGMENT_WRITER)
+        for path in segments:
+            path.unlink(missing_ok=True)
+
+    def _bounded(self, entries: pl.DataFrame) -> pl.DataFrame:
+        entries = entries.unique(
+            subset=list(_KEY_COLUMNS), keep="last", maintain_order=True
+        )
+        return entries.tail(self.max_entries)
+
+    def _segment_path(self) -> Path:
+        # Time-ordered names keep eviction oldest-first across processes.
+        name = f"segment-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.arrow"
+        return self.root / name
+
+
+_OPEN_CACHES: dict[tuple[Path, int], HtmlTextCache] = {}
+_OPEN_CACHES_LOCK = threading.Lock()
+
+
+def open_html_cache(root: str | Path, max_entries: int = 1_000_000) -> HtmlTextCache:
+    """Return the process-wide cache for ``root``, loading it on first use."""
+    key = (Path(root).expanduser().resolve(), max_entries)
+    with _OPEN_CACHES_LOCK:
+        cache = _OPEN_CACHES.get(key)
+        if cache is None:
+            cache = _OPEN_CACHES[key] = HtmlTextCache(*key)
+        return cache
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from honestroles.__about__ import __version__
+from honestroles.checkpoints import StageCheckpointCache, _sha256_json
+
+ROW_KEY = "__honestroles_row_key"
+_ROW_POSITION = "__honestroles_row_position"
+_ROW_KEPT = "__honestroles_row_kept"
+
+
+def incremental_input_key(input_options: Mapping[str, Any]) -> str:
+    """Key row fingerprints by how input rows are read, not by the input bytes.
+
+    Polars' row hash is only stable within one Polars release, so its version is
+    part of the key alongside the library version.
+    """
+    return _sha256_json(
+        {
+            "version": __version__,
+            "polars_version": pl.__version__,
+            "input": dict(input_options),
+        }
+    )
+
+
+def with_row_keys(frame: pl.DataFrame) -> pl.DataFrame:
+    """Add a ``UInt64`` content key to every row.
+
+    ``source_payload_hash`` is the fingerprint where present; other rows hash
+    every column. Repeated fingerprints are re-hashed with their occurrence
+    number so identical rows map one-to-one onto previous results.
+    """
+    row_hash = pl.struct(pl.all()).hash(seed=0)
+    if "source_payload_hash" in frame.columns:
+        fingerprint = pl.coalesce(
+            pl.col("source_payload_hash").cast(pl.String, strict=False).hash(seed=0),
+            row_hash,
+        )
+    else:
+        fingerprint = row_hash
+    keyed = frame.with_columns(fingerprint.alias(ROW_KEY))
+    # Numbering occurrences is a grouped window; skip it when every row is unique.
+    if keyed.get_column(ROW_KEY).is_unique().all():
+        return keyed
+    occurrence = pl.int_range(pl.len(), dtype=pl.UInt32).over(ROW_KEY)
+    return keyed.with_columns(
+        pl.when(occurrence == 0)
+        .then(pl.col(ROW_KEY))
+        .otherwise(pl.struct(pl.col(ROW_KEY), occurrence).hash(seed=0))
+        .alias(ROW_KEY)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalPlan:
+    """Split of the keyed input into rows to run and previous results to reuse."""
+
+    pending: pl.DataFrame
+    reused: pl.DataFrame
+    dropped_rows: int
+
+
+def plan_incremental(keyed: pl.DataFrame, previous: pl.DataFrame | None) -> IncrementalPlan:
+    """Compare keyed input rows against the previous run's state.
+
+    Rows seen before (including ones earlier stages filtered out) are not run
+    again; previous rows whose key no longer appears were deleted or changed.
+    """
+    if previous is None:
+        return IncrementalPlan(pending=keyed, reused=keyed.clear(), dropped_rows=0)
+    seen = pl.col(ROW_KEY).is_in(previous.get_column(ROW_KEY).implode())
+    current = pl.col(ROW_KEY).is_in(keyed.get_column(ROW_KEY).implode())
+    pending = keyed.filter(~seen)
+    return IncrementalPlan(
+        pending=pending,
+        reused=previous.filter(pl.col(_ROW_KEPT) & current).drop(_ROW_KEPT),
+        dropped_rows=previous.height - (keyed.height - pending.height),
+    )
+
+
+def merge_incremental(
+    keyed: pl.DataFrame, reused: pl.DataFrame, processed: pl.DataFrame
+) -> pl.DataFrame:
+    """Combine reused and freshly processed rows in input order."""
+    merged = pl.concat([reused, processed], how="diagonal_relaxed")
+    order = keyed.select(ROW_KEY).with_row_index(_ROW_POSITION)
+    position = (
+        merged.select(ROW_KEY)
+        .join(order, on=ROW_KEY, how="left", maintain_order="left")
+        .get_column(_ROW_POSITION)
+    )
+    return merged.with_columns(position).sort(_ROW_POSITION).drop(_ROW_POSITION)
+
+
+def incremental_state(keyed: pl.DataFrame, merged: pl.DataFrame) -> pl.DataFrame:
+    """Every current input key, with stage output for the rows that were kept."""
+    kept = pl.col(ROW_KEY).is_in(merged.get_column(ROW_KEY).implode())
+    return pl.concat(
+        [
+            merged.with_columns(pl.lit(True).alias(_ROW_KEPT)),
+            keyed.select(ROW_KEY).filter(~kept).with_columns(pl.lit(False).alias(_ROW_KEPT)),
+        ],
+        how="diagonal_relaxed",
+    )
+
+
+class IncrementalStateStore:
+    """Single-entry store for the previous run's keyed stage output.
+
+    Entries are keyed by the input and stage configuration, so a changed
+    option, plugin, or library version simply misses and is replaced.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._cache = StageCheckpointCache(root, max_bytes=sys.maxsize, max_entries=1)
+
+    def load(self, key: str) -> pl.DataFrame | None:
+        checkpoint = self._cache.load(key)
+        if checkpoint is None:
+            return None
+        if checkpoint.frame.schema.get(ROW_KEY) != pl.UInt64:
+            return None
+        return checkpoint.frame
+
+    def store(self, key: str, state: pl.DataFrame) -> None:
+        self._cache.store(key, state, {"rows": state.height})
@@ -5,6 +5,7 @@ from typing import Any
 
 import tomllib
 
+from honestroles.config.models import ParquetWriterConfig
 from honestroles.errors import ConfigValidationError
 from honestroles.ingest.models import (
     IngestionDefaults,
@@ -30,6 +31,8 @@ _DEFAULTS_ALLOWED_KEYS = {
     "merge_policy",
     "retain_snapshots",
     "prune_inactive_days",
+    "parquet",
+    "categorical",
 }
 
 _SOURCE_ALLOWED_KEYS = {
@@ -143,6 +146,10 @@ def _parse_defaults(
             default=IngestionDefaults().prune_inactive_days,
             minimum=0,
         ),
+        parquet=_parse_parquet(raw.get("parquet"), "defaults.parquet"),
+        categorical=_parse_bool(
+            raw.get("categorical"), "defaults.categorical", default=IngestionDefaults().categorical
+        ),
     )
 
 
@@ -291,6 +298,17 @@ def _parse_optional_float(value: object, field_name: str, minimum: float) -> flo
     return parsed
 
 
+def _parse_parquet(value: object, field_name: str) -> ParquetWriterConfig:
+    if value is None:
+        return ParquetWriterConfig()
+    if not isinstance(value, dict):
+        raise ConfigValidationError(f"{field_name} must be a table")
+    try:
+        return ParquetWriterConfig.model_validate(value)
+    except Exception as exc:  # pydantic ValidationError
+        raise ConfigValidationError(f"invalid {field_name}: {exc}") from exc
+
+
 def _parse_merge_policy(
     value: object,
     field_name: str,
@@ -5,6 +5,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
+from honestroles.config.models import ParquetWriterConfig
+
 IngestionSource = Literal["greenhouse", "lever", "ashby", "workable"]
 IngestionMergePolicy = Literal["updated_hash", "first_seen", "last_seen"]
 SUPPORTED_INGEST_SOURCES: tuple[IngestionSource, ...] = (
@@ -252,6 +254,8 @@ class IngestionDefaults:
     merge_policy: IngestionMergePolicy = "updated_hash"
     retain_snapshots: int = 30
     prune_inactive_days: int = 90
+    parquet: ParquetWriterConfig = field(default_factory=ParquetWriterConfig)
+    categorical: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-import html
 import hashlib
 import json
-import re
 from typing import Any, Mapping
 
 import polars as pl
 
+from honestroles.html_text import html_to_text
 from honestroles.io import normalize_source_data_contract
 from honestroles.schema import CANONICAL_JOB_SCHEMA
 
@@ -43,6 +42,7 @@ def normalize_records(
         normalized["ingested_at_utc"] = ingested_at_utc
         normalized["source_payload_hash"] = _payload_hash(raw)
         out.append(normalized)
+    _fill_description_text(out)
     return out
 
 
@@ -67,10 +67,7 @@ def _normalize_one(raw: Mapping[str, Any], *, source: str, source_ref: str) -> d
     base["source"] = source
     base["source_ref"] = source_ref
     base["company"] = _text_or_none(base.get("company")) or _text_or_none(source_ref)
-    base["description_text"] = _normalize_description_text(
-        base.get("description_text"),
-        base.get("description_html"),
-    )
+    base["description_text"] = _text_or_none(base.get("description_text"))
     base["posted_at"] = _resolve_posted_at(source=source, raw=raw, current=base.get("posted_at"))
     base["remote"] = _normalize_remote_flag(base.get("remote"), base.get("work_mode"), base.get("location"))
     base["source_job_id"] = _text_or_none(base.get("source_job_id"))
@@ -405,18 +402,22 @@ def _location_from_workable(raw: Mapping[str, Any]) -> str | None:
     return None
 
 
-def _normalize_description_text(text_value: object, html_value: object) -> str | None:
-    text = _text_or_none(text_value)
-    if text is not None:
-        return text
-    html_text = _text_or_none(html_value)
-    if html_text is None:
-        return None
-    # HTML snippets are common across connectors; stripping tags keeps deterministic plain text.
-    stripped = re.sub(r"<[^>]+>", " ", html_text)
-    unescaped = html.unescape(stripped)
-    cleaned = re.sub(r"\s+", " ", unescaped).strip()
-    return cleaned or None
+def _fill_description_text(records: list[dict[str, Any]]) -> None:
+    """Derive missing ``description_text`` from ``description_html`` in one batch."""
+    pending = [
+        record
+        for record in records
+        if record.get("description_text") is None
+        and _text_or_none(record.get("description_html")) is not None
+    ]
+    if not pending:
+        return
+    # Reposted jobs often share a description; html_to_text converts each once.
+    texts = html_to_text(
+        pl.Series([str(record["description_html"]) for record in pending], dtype=pl.String)
+    )
+    for record, text in zip(pending, texts):
+        record["description_text"] = text or None
 
 
 def _resolve_posted_at(
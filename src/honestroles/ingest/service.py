@@ -6,11 +6,13 @@ import json
 from pathlib import Path
 from time import perf_counter
 import re
+import shutil
 from typing import Any, Callable, Mapping, cast
 import uuid
 
 import polars as pl
 
+from honestroles.config.models import ParquetWriterConfig
 from honestroles.errors import ConfigValidationError, HonestRolesError
 from honestroles.ingest.dedup import dedup_key, deduplicate_records
 from honestroles.ingest.http import build_http_getter, fetch_json
@@ -48,7 +50,12 @@ from honestroles.ingest.state import (
     update_state_entry,
     write_state,
 )
-from honestroles.io import write_parquet
+from honestroles.io import (
+    encode_categorical_columns,
+    resolve_parquet_options,
+    write_parquet,
+)
+from honestroles.schema import WORK_MODES
 
 _SOURCE_FETCHERS: dict[str, Callable[..., tuple[list[dict[str, Any]], int, tuple[str, ...]]]] = {
     "greenhouse": fetch_greenhouse_jobs,
@@ -62,6 +69,11 @@ _VALID_MERGE_POLICIES: tuple[IngestionMergePolicy, ...] = (
     "first_seen",
     "last_seen",
 )
+# Normalization only ever emits these values, so ingest can fix the Enum vocabulary.
+_INGEST_VOCABULARIES: dict[str, tuple[str, ...]] = {
+    "source": SUPPORTED_INGEST_SOURCES,
+    "work_mode": WORK_MODES,
+}
 
 
 @dataclass(slots=True)
@@ -124,6 +136,8 @@ def sync_source(
     merge_policy: IngestionMergePolicy = "updated_hash",
     retain_snapshots: int = 30,
     prune_inactive_days: int = 90,
+    parquet: ParquetWriterConfig | None = None,
+    categorical: bool = False,
     http_get_json: Callable[[str], Any] = fetch_json,
 ) -> IngestionResult:
     _validate_inputs(
@@ -273,8 +287,8 @@ def sync_source(
 
         writes_started = perf_counter()
         snapshot_path = _snapshot_path_for(output_path, started_at)
-        snapshot_frame = normalized_dataframe(prepared.deduped_records)
-        write_parquet(snapshot_frame, snapshot_path)
+        snapshot_frame = _encode_frame(normalized_dataframe(prepared.deduped_records), categorical)
+        write_parquet(snapshot_frame, snapshot_path, parquet)
 
         catalog_merge_started = perf_counter()
         catalog = _load_catalog(catalog_path)
@@ -286,12 +300,12 @@ def sync_source(
             merge_policy=merge_policy,
             prune_inactive_days=prune_inactive_days,
         )
-        _write_catalog(catalog_path, catalog)
+        _write_catalog(catalog_path, catalog, parquet)
         stage_timings_ms["catalog_merge"] = _elapsed_ms(catalog_merge_started)
 
         active_records = _active_records_from_catalog(catalog)
-        latest_frame = normalized_dataframe(active_records)
-        write_parquet(latest_frame, output_path)
+        latest_frame = _encode_frame(normalized_dataframe(active_records), categorical)
+        write_parquet(latest_frame, output_path, _single_file(parquet))
 
         retained_snapshot_count, pruned_snapshot_count = _prune_snapshots(
             snapshot_path=snapshot_path,
@@ -709,7 +723,9 @@ def sync_sources_from_manifest(
     manifest_path: str | Path,
     report_file: str | Path | None = None,
     fail_fast: bool = False,
+    parquet_overrides: Mapping[str, Any] | None = None,
 ) -> BatchIngestionResult:
+    """Sync every enabled manifest source; ``parquet_overrides`` apply over ``[defaults.parquet]``."""
     manifest = load_ingest_manifest(manifest_path)
     started_at = datetime.now(UTC)
     total_started = perf_counter()
@@ -728,6 +744,8 @@ def sync_sources_from_manifest(
     enabled_sources = [item for item in manifest.sources if item.enabled]
     for source_cfg in enabled_sources:
         params = _resolve_source_params(source_cfg, manifest.defaults)
+        if parquet_overrides:
+            params["parquet"] = resolve_parquet_options(params["parquet"], parquet_overrides)
         try:
             result = sync_source(**params)
             payload = result.to_payload()
@@ -852,6 +870,8 @@ def _resolve_source_params(
         "prune_inactive_days": defaults.prune_inactive_days
         if source_cfg.prune_inactive_days is None
         else source_cfg.prune_inactive_days,
+        "parquet": defaults.parquet,
+        "categorical": defaults.categorical,
     }
 
 
@@ -977,10 +997,24 @@ def _load_catalog(path: Path) -> list[dict[str, Any]]:
     return frame.to_dicts()
 
 
-def _write_catalog(path: Path, rows: list[dict[str, Any]]) -> None:
+def _encode_frame(frame: pl.DataFrame, categorical: bool) -> pl.DataFrame:
+    if not categorical:
+        return frame
+    return encode_categorical_columns(frame, _INGEST_VOCABULARIES)
+
+
+def _single_file(parquet: ParquetWriterConfig | None) -> ParquetWriterConfig | None:
+    # The catalog and latest output are read back by path, so they are never partitioned.
+    if parquet is None or parquet.partition_by is None:
+        return parquet
+    return parquet.model_copy(update={"partition_by": None})
+
+
+def _write_catalog(
+    path: Path, rows: list[dict[str, Any]], parquet: ParquetWriterConfig | None = None
+) -> None:
     frame = pl.DataFrame(rows, infer_schema_length=None) if rows else _empty_catalog_frame()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    frame.write_parquet(path)
+    write_parquet(frame, path, _single_file(parquet))
 
 
 def _empty_catalog_frame() -> pl.DataFrame:
@@ -1163,7 +1197,11 @@ def _prune_snapshots(*, snapshot_path: Path, retain_snapshots: int) -> tuple[int
     prune = snapshots[retain_snapshots:]
     for path in prune:
         try:
-            path.unlink()
+            if path.is_dir():
+                # Partitioned snapshots are hive directories.
+                shutil.rmtree(path)
+            else:
+                path.unlink()
         except OSError:
             continue
     return len(keep), len(prune)
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
+import os
 import re
+import shutil
 from dataclasses import dataclass
+from itertools import takewhile
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Mapping, TypeVar
+from urllib.parse import quote
 
 import polars as pl
 
 from honestroles.config.models import (
+    IpcWriterConfig,
+    OutputConfig,
+    ParquetWriterConfig,
     RuntimeQualityConfig,
+    TableFormat,
 )
 from honestroles.domain import JobDataset
 from honestroles.errors import ConfigValidationError
 from honestroles.io.adapter import (
     AdapterInferenceResult,
+    _collect,
+    _frame_columns,
     apply_source_adapter,
     infer_source_adapter,
     render_adapter_toml_fragment,
 )
-from honestroles.schema import CANONICAL_SOURCE_FIELDS
+from honestroles.schema import CANONICAL_SOURCE_FIELDS, CATEGORICAL_JOB_COLUMNS
+
+_FrameT = TypeVar("_FrameT", pl.DataFrame, pl.LazyFrame)
 
 _BUILTIN_SOURCE_ALIASES: dict[str, tuple[str, ...]] = {
     "location": ("location_raw",),
@@ -56,10 +68,307 @@ def read_parquet(path: str | Path) -> pl.DataFrame:
     return pl.read_parquet(path)
 
 
-def write_parquet(df: pl.DataFrame, path: str | Path) -> None:
+def scan_parquet(path: str | Path) -> pl.LazyFrame:
+    return pl.scan_parquet(path)
+
+
+IPC_SUFFIXES = (".arrow", ".ipc", ".feather")
+
+
+def infer_table_format(path: str | Path) -> TableFormat:
+    """Arrow IPC for ``.arrow``/``.ipc``/``.feather`` paths, parquet otherwise."""
+    return "ipc" if Path(path).suffix.lower() in IPC_SUFFIXES else "parquet"
+
+
+def read_table(
+    path: str | Path,
+    kind: TableFormat | None = None,
+    columns: tuple[str, ...] | None = None,
+) -> pl.DataFrame:
+    """Read a parquet or Arrow IPC file; ``kind`` defaults to the path's format.
+
+    IPC files are memory-mapped, so uncompressed files are read without copying.
+    With ``columns``, only those present in the file are read, in file order.
+    """
+    if columns is not None:
+        return scan_table(path, kind, columns).collect()
+    if (kind or infer_table_format(path)) == "ipc":
+        return pl.read_ipc(path, memory_map=True)
+    return read_parquet(path)
+
+
+def scan_table(
+    path: str | Path,
+    kind: TableFormat | None = None,
+    columns: tuple[str, ...] | None = None,
+) -> pl.LazyFrame:
+    if (kind or infer_table_format(path)) == "ipc":
+        frame = pl.scan_ipc(path, memory_map=True)
+    else:
+        frame = scan_parquet(path)
+    if columns is None:
+        return frame
+    wanted = set(columns)
+    return frame.select(name for name in frame.collect_schema().names() if name in wanted)
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True, slots=True)
+class InputPartition:
+    """One parquet file of the configured input plus its hive ``key=value`` columns."""
+
+    path: Path
+    hive_values: tuple[tuple[str, str], ...] = ()
+
+
+def _glob_base(path: Path) -> Path:
+    parts = list(takewhile(lambda part: not _GLOB_CHARS.intersection(part), path.parts))
+    return Path(*parts) if parts else Path(".")
+
+
+def _hive_values(path: Path, base: Path) -> tuple[tuple[str, str], ...]:
+    values: list[tuple[str, str]] = []
+    for part in path.parent.relative_to(base).parts:
+        key, separator, value = part.partition("=")
+        if separator and key:
+            values.append((key, value))
+    return tuple(values)
+
+
+def _is_table_file(path: Path, kind: TableFormat) -> bool:
+    if kind == "ipc":
+        return path.suffix.lower() in IPC_SUFFIXES
+    return path.suffix == ".parquet"
+
+
+def resolve_input_partitions(
+    path: Path, *, hive_partitioning: bool = False, kind: TableFormat = "parquet"
+) -> tuple[InputPartition, ...]:
+    """Expand an input path, glob, or directory into sorted partitions of ``kind``.
+
+    A plain file path is returned as-is (even if missing, so reads fail as
+    before). Directories contribute every ``*.parquet`` file beneath them, or
+    every ``*.arrow``/``*.ipc``/``*.feather`` file for IPC input.
+    """
+    if _GLOB_CHARS.intersection(str(path)):
+        base = _glob_base(path)
+        pattern = str(path.relative_to(base)) if base != Path(".") else str(path)
+        files = sorted(item for item in base.glob(pattern) if item.is_file())
+    elif path.is_dir():
+        base = path
+        files = sorted(
+            item for item in path.rglob("*") if item.is_file() and _is_table_file(item, kind)
+        )
+    else:
+        return (InputPartition(path=path),)
+    if not files:
+        raise ConfigValidationError(f"input path matched no {kind} files: '{path}'")
+    return tuple(
+        InputPartition(
+            path=item,
+            hive_values=_hive_values(item, base) if hive_partitioning else (),
+        )
+        for item in files
+    )
+
+
+def with_partition_columns(df: _FrameT, partition: InputPartition) -> _FrameT:
+    """Add the partition's hive values as string columns the file does not already have."""
+    columns = set(_frame_columns(df))
+    missing = [(key, value) for key, value in partition.hive_values if key not in columns]
+    if not missing:
+        return df
+    return df.with_columns(pl.lit(value, dtype=pl.String).alias(key) for key, value in missing)
+
+
+def scan_input_partitions(
+    partitions: tuple[InputPartition, ...],
+    kind: TableFormat = "parquet",
+    columns: tuple[str, ...] | None = None,
+) -> pl.LazyFrame:
+    if len(partitions) == 1:
+        return with_partition_columns(
+            scan_table(partitions[0].path, kind, columns), partitions[0]
+        )
+    return pl.concat(
+        [
+            with_partition_columns(scan_table(partition.path, kind, columns), partition)
+            for partition in partitions
+        ],
+        how="diagonal_relaxed",
+    )
+
+
+_HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def resolve_parquet_options(
+    base: ParquetWriterConfig | None, overrides: Mapping[str, Any]
+) -> ParquetWriterConfig:
+    """Apply the non-null ``overrides`` (for example CLI flags) on top of ``base``.
+
+    ``partition_by="none"`` clears a partitioning configured in ``base``.
+    """
+    updates = {key: value for key, value in overrides.items() if value is not None}
+    if updates.get("partition_by") == "none":
+        updates["partition_by"] = None
+    if not updates:
+        return base or ParquetWriterConfig()
+    merged = {**(base or ParquetWriterConfig()).model_dump(), **updates}
+    try:
+        return ParquetWriterConfig.model_validate(merged)
+    except Exception as exc:  # pydantic ValidationError
+        raise ConfigValidationError(f"invalid parquet writer options: {exc}") from exc
+
+
+def _parquet_write_options(options: ParquetWriterConfig) -> dict[str, Any]:
+    return {
+        "compression": options.compression,
+        "compression_level": options.compression_level,
+        "statistics": options.statistics,
+        "row_group_size": options.row_group_size,
+    }
+
+
+def _with_partition_key(frame: pl.LazyFrame, key: str) -> pl.LazyFrame:
+    source_column = "posted_at" if key == "posted_month" else key
+    if source_column not in frame.collect_schema().names():
+        raise ConfigValidationError(
+            f"cannot partition parquet output by '{key}': missing column '{source_column}'"
+        )
+    if key == "posted_month":
+        # ISO dates and timestamps (and Datetime values cast to text) start with YYYY-MM.
+        return frame.with_columns(
+            pl.col("posted_at").cast(pl.String).str.slice(0, 7).alias("posted_month")
+        )
+    return frame.with_columns(pl.col(key).cast(pl.String))
+
+
+def _clear_target(target: Path) -> None:
+    if target.is_dir():
+        shutil.rmtree(target)
+    elif target.exists():
+        target.unlink()
+
+
+def _write_hive_partitions(
+    frame: pl.LazyFrame, target: Path, options: ParquetWriterConfig
+) -> None:
+    """Write ``target/<key>=<value>/part-00000.parquet`` in a single pass.
+
+    The partition key column stays in the files, so readers without hive
+    partitioning still see it.
+    """
+    key = str(options.partition_by)
+    keyed = _with_partition_key(frame, key)
+    _clear_target(target)
+    target.mkdir(parents=True)
+    write_options = _parquet_write_options(options)
+    partition_by = getattr(pl, "PartitionBy", None)
+    if partition_by is not None:
+        # One streaming sink routes each row to its partition's file.
+        keyed.sink_parquet(
+            partition_by(
+                target,
+                key=key,
+                include_key=True,
+                file_path_provider=lambda args: _hive_partition_file(
+                    key, args.partition_keys.item()
+                ),
+                approximate_bytes_per_file=None,
+            ),
+            mkdir=True,
+            **write_options,
+        )
+    else:
+        for (value,), partition in (
+            keyed.collect().partition_by(key, as_dict=True, maintain_order=True).items()
+        ):
+            path = target / _hive_partition_file(key, value)
+            path.parent.mkdir()
+            partition.write_parquet(path, **write_options)
+    if not any(target.iterdir()):
+        keyed.clear().collect().write_parquet(target / "part-00000.parquet", **write_options)
+
+
+def _hive_partition_file(key: str, value: object) -> str:
+    name = _HIVE_NULL_PARTITION if value is None else quote(str(value), safe="")
+    return f"{key}={name}/part-00000.parquet"
+
+
+def write_parquet(
+    df: pl.DataFrame, path: str | Path, options: ParquetWriterConfig | None = None
+) -> None:
+    """Write ``df`` with the shared parquet writer settings (Polars defaults when omitted).
+
+    With ``options.partition_by`` set, ``path`` becomes a hive-partitioned directory.
+    """
+    target = Path(path)
+    settings = options or ParquetWriterConfig()
+    if settings.partition_by is not None:
+        _write_hive_partitions(df.lazy(), target, settings)
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.is_dir():
+        shutil.rmtree(target)
+    df.write_parquet(target, **_parquet_write_options(settings))
+
+
+def sink_parquet(
+    frame: pl.LazyFrame, path: str | Path, options: ParquetWriterConfig | None = None
+) -> None:
+    """Streaming counterpart of :func:`write_parquet`."""
     target = Path(path)
+    settings = options or ParquetWriterConfig()
+    if settings.partition_by is not None:
+        _write_hive_partitions(frame, target, settings)
+        return
     target.parent.mkdir(parents=True, exist_ok=True)
-    df.write_parquet(target)
+    if target.is_dir():
+        shutil.rmtree(target)
+    frame.sink_parquet(target, **_parquet_write_options(settings))
+
+
+def _replace_atomically(target: Path, write: Any) -> None:
+    # Readers may still hold ``target`` memory-mapped; truncating it in place
+    # would invalidate their pages, so write beside it and rename over it.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.is_dir():
+        shutil.rmtree(target)
+    staging = target.with_name(f".{target.name}.tmp")
+    try:
+        write(staging)
+        os.replace(staging, target)
+    finally:
+        staging.unlink(missing_ok=True)
+
+
+def write_ipc(
+    df: pl.DataFrame, path: str | Path, options: IpcWriterConfig | None = None
+) -> None:
+    """Write ``df`` as an Arrow IPC (Feather v2) file, uncompressed unless configured."""
+    compression = (options or IpcWriterConfig()).compression
+    _replace_atomically(Path(path), lambda staging: df.write_ipc(staging, compression=compression))
+
+
+def sink_ipc(
+    frame: pl.LazyFrame, path: str | Path, options: IpcWriterConfig | None = None
+) -> None:
+    """Streaming counterpart of :func:`write_ipc`."""
+    compression = (options or IpcWriterConfig()).compression
+    _replace_atomically(
+        Path(path), lambda staging: frame.sink_ipc(staging, compression=compression)
+    )
+
+
+def write_output(df: pl.DataFrame, output: OutputConfig) -> None:
+    """Write ``df`` to ``output.path`` in the configured ``output.format``."""
+    if output.format == "ipc":
+        write_ipc(df, output.path, output.ipc)
+    else:
+        write_parquet(df, output.path, output.parquet)
 
 
 def _coerce_alias_mapping(value: object) -> dict[str, tuple[str, ...]]:
@@ -120,8 +429,8 @@ def _normalized_compare_expr(column: str, canonical: str) -> pl.Expr:
 
 
 def resolve_source_aliases(
-    df: pl.DataFrame, aliases: object = None
-) -> tuple[pl.DataFrame, dict[str, Any]]:
+    df: _FrameT, aliases: object = None
+) -> tuple[_FrameT, dict[str, Any]]:
     alias_mapping = _coerce_alias_mapping(aliases)
     resolved = df
 
@@ -131,36 +440,38 @@ def resolve_source_aliases(
     for canonical in CANONICAL_SOURCE_FIELDS:
         configured = alias_mapping.get(canonical, ())
         candidates = _ordered_candidates(canonical, configured)
-        present = [name for name in candidates if name in resolved.columns]
+        columns = _frame_columns(resolved)
+        present = [name for name in candidates if name in columns]
 
-        if canonical not in resolved.columns:
+        if canonical not in columns:
             selected = next((name for name in present if name != canonical), None)
-            if selected is not None:
-                resolved = resolved.with_columns(pl.col(selected).alias(canonical))
-                applied[canonical] = selected
-
-        if canonical not in resolved.columns:
-            continue
+            if selected is None:
+                continue
+            resolved = resolved.with_columns(pl.col(selected).alias(canonical))
+            applied[canonical] = selected
 
         canonical_expr = _normalized_compare_expr(canonical, canonical)
         for alias in present:
             if alias == canonical:
                 continue
             alias_expr = _normalized_compare_expr(alias, canonical)
-            mismatch = resolved.select(
-                (
-                    canonical_expr.is_not_null()
-                    & alias_expr.is_not_null()
-                    & (canonical_expr != alias_expr)
+            mismatch = _collect(
+                resolved.select(
+                    (
+                        canonical_expr.is_not_null()
+                        & alias_expr.is_not_null()
+                        & (canonical_expr != alias_expr)
+                    )
+                    .sum()
+                    .alias("mismatch")
                 )
-                .sum()
-                .alias("mismatch")
             ).item()
             mismatch_count = int(mismatch)
             if mismatch_count > 0:
                 conflict_counts[canonical] = conflict_counts.get(canonical, 0) + mismatch_count
 
-    unresolved = [name for name in CANONICAL_SOURCE_FIELDS if name not in resolved.columns]
+    resolved_columns = _frame_columns(resolved)
+    unresolved = [name for name in CANONICAL_SOURCE_FIELDS if name not in resolved_columns]
     diagnostics = {
         "applied": dict(sorted(applied.items())),
         "conflicts": dict(sorted(conflict_counts.items())),
@@ -169,20 +480,21 @@ def resolve_source_aliases(
     return resolved, diagnostics
 
 
-def normalize_source_data_contract(df: pl.DataFrame) -> pl.DataFrame:
+def normalize_source_data_contract(df: _FrameT) -> _FrameT:
     required = CANONICAL_SOURCE_FIELDS
-    missing = [name for name in required if name not in df.columns]
+    missing = [name for name in required if name not in _frame_columns(df)]
     if missing:
         df = df.with_columns(pl.lit(None).alias(name) for name in missing)
+    schema = df.collect_schema() if isinstance(df, pl.LazyFrame) else df.schema
     return df.with_columns(
         pl.col("id").cast(pl.String, strict=False).alias("id"),
         pl.col("title").cast(pl.String, strict=False).alias("title"),
         pl.col("company").cast(pl.String, strict=False).alias("company"),
         pl.col("location").cast(pl.String, strict=False).alias("location"),
-        _normalize_remote_expr(df.schema.get("remote")).alias("remote"),
+        _normalize_remote_expr(schema.get("remote")).alias("remote"),
         pl.col("description_text").cast(pl.String, strict=False).alias("description_text"),
         pl.col("description_html").cast(pl.String, strict=False).alias("description_html"),
-        _normalize_skills_expr(df.schema.get("skills")).alias("skills"),
+        _normalize_skills_expr(schema.get("skills")).alias("skills"),
         pl.col("salary_min").cast(pl.Float64, strict=False).alias("salary_min"),
         pl.col("salary_max").cast(pl.Float64, strict=False).alias("salary_max"),
         pl.col("apply_url").cast(pl.String, strict=False).alias("apply_url"),
@@ -190,6 +502,27 @@ def normalize_source_data_contract(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
+def encode_categorical_columns(
+    df: _FrameT, vocabularies: Mapping[str, tuple[str, ...]] | None = None
+) -> _FrameT:
+    """Store low-cardinality text columns as ``pl.Enum`` or ``pl.Categorical``.
+
+    Columns named in ``vocabularies`` become an Enum of that vocabulary (values
+    outside it fail the cast); other present ``CATEGORICAL_JOB_COLUMNS`` become
+    Categorical. Columns that are already encoded are left as they are.
+    """
+    enums: Mapping[str, tuple[str, ...]] = vocabularies or {}
+    schema = df.collect_schema() if isinstance(df, pl.LazyFrame) else df.schema
+    casts: list[pl.Expr] = []
+    for name in dict.fromkeys((*CATEGORICAL_JOB_COLUMNS, *enums)):
+        if schema.get(name) not in (pl.String, pl.Null):
+            continue
+        vocabulary = enums.get(name)
+        dtype = pl.Enum(vocabulary) if vocabulary is not None else pl.Categorical
+        casts.append(pl.col(name).cast(dtype))
+    return df.with_columns(casts) if casts else df
+
+
 def _normalize_remote_expr(dtype: pl.DataType | None) -> pl.Expr:
     if dtype == pl.Boolean:
         return pl.col("remote").cast(pl.Boolean, strict=False)
@@ -235,10 +568,11 @@ def _normalize_skills_expr(dtype: pl.DataType | None) -> pl.Expr:
     )
 
 
-def validate_source_data_contract(df: pl.DataFrame) -> pl.DataFrame:
-    if "title" not in df.columns:
+def validate_source_data_contract(df: _FrameT) -> _FrameT:
+    columns = _frame_columns(df)
+    if "title" not in columns:
         raise ConfigValidationError("source data missing required column 'title'")
-    if "description_text" not in df.columns and "description_html" not in df.columns:
+    if "description_text" not in columns and "description_html" not in columns:
         raise ConfigValidationError(
             "source data requires at least one of 'description_text' or 'description_html'"
         )
@@ -370,15 +704,30 @@ __all__ = [
     "AdapterInferenceResult",
     "DataQualityAccumulator",
     "DataQualityReport",
+    "IPC_SUFFIXES",
+    "InputPartition",
     "_validate_read_query",
     "_validate_table_name",
     "apply_source_adapter",
     "build_data_quality_report",
+    "encode_categorical_columns",
     "infer_source_adapter",
+    "infer_table_format",
     "normalize_source_data_contract",
     "read_parquet",
+    "read_table",
     "render_adapter_toml_fragment",
+    "resolve_input_partitions",
+    "resolve_parquet_options",
     "resolve_source_aliases",
+    "scan_input_partitions",
+    "scan_parquet",
+    "scan_table",
+    "sink_ipc",
+    "sink_parquet",
     "validate_source_data_contract",
+    "with_partition_columns",
+    "write_ipc",
+    "write_output",
     "write_parquet",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import re
-from typing import Any, Mapping
+from typing import Any, Mapping, TypeVar
 
 import polars as pl
 
@@ -33,6 +33,8 @@ _DEFAULT_DATETIME_FORMATS: tuple[str, ...] = (
 )
 _MAX_ERROR_SAMPLES = 20
 
+_FrameT = TypeVar("_FrameT", pl.DataFrame, pl.LazyFrame)
+
 
 @dataclass(frozen=True, slots=True)
 class AdapterInferenceResult:
@@ -55,6 +57,18 @@ def _coerce_adapter_config(value: object) -> SourceAdapterSpec:
     raise TypeError("input.adapter must be a mapping")
 
 
+def _frame_columns(frame: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    if isinstance(frame, pl.LazyFrame):
+        return frame.collect_schema().names()
+    return frame.columns
+
+
+def _collect(frame: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    if isinstance(frame, pl.LazyFrame):
+        return frame.collect()
+    return frame
+
+
 def _normalized_token_set(value: str) -> set[str]:
     return {part for part in re.split(r"[^a-z0-9]+", value.lower()) if part}
 
@@ -140,8 +154,8 @@ def _build_coercion_plan(
 
 
 def apply_source_adapter(
-    df: pl.DataFrame, adapter_cfg: object = None
-) -> tuple[pl.DataFrame, dict[str, Any]]:
+    df: _FrameT, adapter_cfg: object = None
+) -> tuple[_FrameT, dict[str, Any]]:
     cfg = _coerce_adapter_config(adapter_cfg)
     diagnostics: dict[str, Any] = {
         "enabled": cfg.enabled,
@@ -162,9 +176,10 @@ def apply_source_adapter(
         if canonical not in cfg.fields:
             continue
         field_cfg = cfg.fields[canonical]
-        present_sources = [name for name in field_cfg.from_ if name in result.columns]
+        columns = _frame_columns(result)
+        present_sources = [name for name in field_cfg.from_ if name in columns]
         if not present_sources:
-            if canonical not in result.columns:
+            if canonical not in columns:
                 diagnostics["unresolved"].append(canonical)
             continue
 
@@ -174,9 +189,11 @@ def apply_source_adapter(
             cfg=field_cfg,
         )
 
-        counts = result.select(
-            null_like_expr.sum().alias("null_like_hits"),
-            parse_error_expr.sum().alias("coercion_errors"),
+        counts = _collect(
+            result.select(
+                null_like_expr.sum().alias("null_like_hits"),
+                parse_error_expr.sum().alias("coercion_errors"),
+            )
         ).to_dicts()[0]
         null_like_hits = int(counts["null_like_hits"])
         coercion_errors = int(counts["coercion_errors"])
@@ -188,9 +205,11 @@ def apply_source_adapter(
 
         if error_budget > 0 and coercion_errors > 0:
             samples = (
-                result.filter(parse_error_expr)
-                .select(clean_expr.alias("value"))
-                .head(error_budget)
+                _collect(
+                    result.filter(parse_error_expr)
+                    .select(clean_expr.alias("value"))
+                    .head(error_budget)
+                )
                 .to_series()
                 .to_list()
             )
@@ -205,21 +224,23 @@ def apply_source_adapter(
                 )
             error_budget = max(0, error_budget - len(samples))
 
-        if canonical not in result.columns:
+        if canonical not in columns:
             result = result.with_columns(parsed_expr.alias(canonical))
             diagnostics["applied"][canonical] = selected_source
             continue
 
         canonical_expr, _, _, _, _ = _build_coercion_plan(column=canonical, cfg=field_cfg)
         conflict_count = int(
-            result.select(
-                (
-                    canonical_expr.is_not_null()
-                    & parsed_expr.is_not_null()
-                    & (canonical_expr != parsed_expr)
+            _collect(
+                result.select(
+                    (
+                        canonical_expr.is_not_null()
+                        & parsed_expr.is_not_null()
+                        & (canonical_expr != parsed_expr)
+                    )
+                    .sum()
+                    .alias("conflicts")
                 )
-                .sum()
-                .alias("conflicts")
             ).item()
         )
         if conflict_count > 0:
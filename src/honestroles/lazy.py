@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import polars as pl
+
+from honestroles.config.models import StageConfig
+from honestroles.diagnostics import NonFatalStageError, StageRowCounts
+from honestroles.domain import JobDataset
+from honestroles.errors import HonestRolesError, StageExecutionError
+from honestroles.html_text import HtmlTextCache
+from honestroles.io import encode_categorical_columns
+from honestroles.plugins import PluginRegistry
+from honestroles.plugins.types import (
+    FilterStageContext,
+    LabelStageContext,
+    PluginDefinition,
+    RateStageContext,
+    RuntimeExecutionContext,
+    StageContext,
+)
+from honestroles.stages import (
+    StageArtifacts,
+    _apply_filter_options,
+    _bound_rate_columns,
+    _build_application_plan,
+    _clean_frame,
+    _label_frame,
+    _rank_frame,
+    _rate_frame,
+    _run_expression_plugins,
+    _run_plugins,
+    _skills_frame,
+)
+from honestroles.telemetry import TelemetryRecorder, measure
+
+
+@dataclass(frozen=True, slots=True)
+class LazyExecutionResult:
+    dataset: JobDataset
+    artifacts: StageArtifacts
+    stage_rows: StageRowCounts
+    non_fatal_errors: tuple[NonFatalStageError, ...] = ()
+
+
+@dataclass(slots=True)
+class _LazyStagePlan:
+    """Fused stage plan that only materializes at plugin boundaries and at the end.
+
+    Without ``fail_fast`` every stage is materialized on its own, so a failing
+    stage can be skipped like in eager execution without re-running the stages
+    fused with it.
+    """
+
+    frame: pl.LazyFrame
+    telemetry: TelemetryRecorder | None = None
+    fail_fast: bool = True
+    stage_rows: StageRowCounts = field(default_factory=StageRowCounts)
+    non_fatal_errors: list[NonFatalStageError] = field(default_factory=list)
+    _pending: list[tuple[str, pl.LazyFrame]] = field(default_factory=list)
+    _stage: str | None = None
+    _collected: JobDataset | None = None
+
+    def record(self, stage: str) -> None:
+        self._pending.append((stage, self.frame))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        before = self.frame
+        self._stage = name
+        try:
+            try:
+                yield
+                self.record(name)
+                if not self.fail_fast:
+                    self.collect()
+            except HonestRolesError:
+                raise
+            except Exception as exc:
+                raise StageExecutionError(name, str(exc)) from exc
+        except HonestRolesError as exc:
+            if self.fail_fast:
+                raise
+            self.non_fatal_errors.append(
+                NonFatalStageError(
+                    stage=name, error_type=exc.__class__.__name__, detail=str(exc)
+                )
+            )
+            self._pending = [entry for entry in self._pending if entry[0] != name]
+            self.frame = before
+            self.record(name)
+        finally:
+            self._stage = None
+
+    def collect(self) -> JobDataset:
+        if not self._pending and self._collected is not None:
+            return self._collected
+        # Row counts for intermediate stages are collected together with the
+        # output so Polars can share the common sub-plans in a single pass.
+        counted = [(stage, plan) for stage, plan in self._pending if plan is not self.frame]
+        # Fused stages cannot be timed individually; the segment is reported
+        # under the joined names of the stages it covers.
+        segment = "+".join(stage for stage, _ in self._pending) or "collect"
+        with measure(self.telemetry, segment) as probe:
+            try:
+                frames = pl.collect_all(
+                    [self.frame, *(plan.select(pl.len()) for _, plan in counted)]
+                )
+            except HonestRolesError:
+                raise
+            except Exception as exc:
+                raise StageExecutionError(self._failed_stage(), str(exc)) from exc
+            probe.after = frames[0]
+        collected = frames[0]
+        counts = {stage: int(frame.item()) for (stage, _), frame in zip(counted, frames[1:])}
+        for stage, _ in self._pending:
+            self.stage_rows = self.stage_rows.record(
+                stage, counts.get(stage, collected.height)
+            )
+        self._pending.clear()
+        dataset = JobDataset.from_polars(collected)
+        self.frame = collected.lazy()
+        self._collected = dataset
+        return dataset
+
+    def reset(self, dataset: JobDataset) -> None:
+        self.frame = dataset.to_polars(copy=False).lazy()
+        self._collected = None
+
+    def _failed_stage(self) -> str:
+        # The fused plan fails as a whole; the first recorded stage whose own
+        # plan fails is the one to blame. Only built-in transforms and expression
+        # plugins are re-evaluated here, never dataset plugins.
+        for stage, plan in self._pending:
+            try:
+                plan.collect()
+            except Exception:  # noqa: BLE001 - expression plugins may raise anything
+                return stage
+        # Every recorded prefix evaluates, so the stage still being built failed.
+        return self._stage or "collect"
+
+
+def _apply_plugins(
+    plan: _LazyStagePlan,
+    plugins: tuple[PluginDefinition, ...],
+    runtime: RuntimeExecutionContext,
+    context_type: type[StageContext],
+    telemetry: TelemetryRecorder | None,
+) -> None:
+    if not plugins:
+        return
+    if all(plugin.contract == "expressions" for plugin in plugins):
+        # Expression plugins extend the fused plan instead of forcing a collect.
+        plan.frame = _run_expression_plugins(plan.frame, plugins, runtime, context_type)
+        return
+    dataset = plan.collect()
+    dataset.validate()
+    plan.reset(_run_plugins(dataset, plugins, runtime, context_type, telemetry))
+
+
+def execute_lazy(
+    frame: pl.LazyFrame,
+    stages: StageConfig,
+    runtime: RuntimeExecutionContext,
+    registry: PluginRegistry,
+    telemetry: TelemetryRecorder | None = None,
+    *,
+    categorical: bool = False,
+    html_cache: HtmlTextCache | None = None,
+    fail_fast: bool = True,
+) -> LazyExecutionResult:
+    plan = _LazyStagePlan(frame=frame, telemetry=telemetry, fail_fast=fail_fast)
+    plan.record("input")
+
+    if stages.clean.enabled:
+        with plan.stage("clean"):
+            plan.frame = _clean_frame(plan.frame, stages.clean, html_cache)
+
+    if stages.filter.enabled:
+        with plan.stage("filter"):
+            plan.frame = _apply_filter_options(plan.frame, stages.filter)
+            _apply_plugins(
+                plan, registry.plugins_for_kind("filter"), runtime, FilterStageContext, telemetry
+            )
+
+    if stages.skills.enabled:
+        with plan.stage("skills"):
+            plan.frame = _skills_frame(plan.frame, stages.skills)
+
+    if stages.label.enabled:
+        with plan.stage("label"):
+            plan.frame = _label_frame(plan.frame, stages.label, categorical=categorical)
+            _apply_plugins(
+                plan, registry.plugins_for_kind("label"), runtime, LabelStageContext, telemetry
+            )
+            if categorical:
+                plan.frame = encode_categorical_columns(plan.frame)
+
+    if stages.rate.enabled:
+        with plan.stage("rate"):
+            plan.frame = _rate_frame(plan.frame, stages.rate)
+            _apply_plugins(
+                plan, registry.plugins_for_kind("rate"), runtime, RateStageContext, telemetry
+            )
+            plan.frame = _bound_rate_columns(plan.frame)
+
+    if stages.match.enabled:
+        with plan.stage("match"):
+            plan.frame = _rank_frame(plan.frame, stages.match)
+
+    dataset = plan.collect()
+    artifacts = StageArtifacts()
+    match_failed = any(error.stage == "match" for error in plan.non_fatal_errors)
+    if stages.match.enabled and not match_failed and "fit_rank" in dataset.columns():
+        artifacts = StageArtifacts(
+            application_plan=_build_application_plan(dataset.to_polars(copy=False))
+        )
+    return LazyExecutionResult(
+        dataset=dataset,
+        artifacts=artifacts,
+        stage_rows=plan.stage_rows,
+        non_fatal_errors=tuple(plan.non_fatal_errors),
+    )
@@ -1,41 +1,91 @@
 from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from honestroles.plugins.errors import (
     PluginError,
     PluginExecutionError,
     PluginLoadError,
     PluginValidationError,
 )
-from honestroles.plugins.registry import PluginRegistry
-from honestroles.plugins.types import (
-    FilterPlugin,
-    FilterStageContext,
-    LabelPlugin,
-    LabelStageContext,
-    PluginKind,
-    PluginDefinition,
-    PluginSpec,
-    RatePlugin,
-    RateStageContext,
-    RuntimeExecutionContext,
-    StageContext,
-)
+
+if TYPE_CHECKING:
+    from honestroles.plugins.registry import PluginRegistry
+    from honestroles.plugins.types import (
+        FilterExpressionPlugin,
+        FilterPlugin,
+        FilterStageContext,
+        LabelExpressionPlugin,
+        LabelPlugin,
+        LabelStageContext,
+        PluginContract,
+        PluginKind,
+        PluginDefinition,
+        PluginExpressions,
+        PluginSpec,
+        RateExpressionPlugin,
+        RatePlugin,
+        RateStageContext,
+        RuntimeExecutionContext,
+        StageContext,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "PluginRegistry": "honestroles.plugins.registry",
+    "FilterExpressionPlugin": "honestroles.plugins.types",
+    "FilterPlugin": "honestroles.plugins.types",
+    "FilterStageContext": "honestroles.plugins.types",
+    "LabelExpressionPlugin": "honestroles.plugins.types",
+    "LabelPlugin": "honestroles.plugins.types",
+    "LabelStageContext": "honestroles.plugins.types",
+    "PluginContract": "honestroles.plugins.types",
+    "PluginKind": "honestroles.plugins.types",
+    "PluginDefinition": "honestroles.plugins.types",
+    "PluginExpressions": "honestroles.plugins.types",
+    "PluginSpec": "honestroles.plugins.types",
+    "RateExpressionPlugin": "honestroles.plugins.types",
+    "RatePlugin": "honestroles.plugins.types",
+    "RateStageContext": "honestroles.plugins.types",
+    "RuntimeExecutionContext": "honestroles.plugins.types",
+    "StageContext": "honestroles.plugins.types",
+}
 
 __all__ = [
+    "FilterExpressionPlugin",
     "FilterPlugin",
     "FilterStageContext",
+    "LabelExpressionPlugin",
     "LabelPlugin",
     "LabelStageContext",
+    "PluginContract",
     "PluginError",
     "PluginDefinition",
     "PluginExecutionError",
+    "PluginExpressions",
     "PluginKind",
     "PluginLoadError",
     "PluginRegistry",
     "PluginSpec",
     "PluginValidationError",
+    "RateExpressionPlugin",
     "RatePlugin",
     "RateStageContext",
     "RuntimeExecutionContext",
     "StageContext",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: defer submodule imports (Polars, pydantic, ingest/publish
+    # clients) until a public name is first used.
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
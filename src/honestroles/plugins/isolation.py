@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+import polars as pl
+
+from honestroles.domain import JobDataset
+from honestroles.io import write_ipc
+from honestroles.plugins.errors import PluginExecutionError
+from honestroles.plugins.loader import _freeze_value, _import_callable
+from honestroles.plugins.types import (
+    PluginDefinition,
+    RuntimeExecutionContext,
+    StageContext,
+)
+from honestroles.resources import worker_thread_limit
+
+# tmpfs keeps the chunk files in memory, so handing a chunk to a worker costs
+# one write and a memory-mapped read rather than a pickle round trip.
+_SHARED_MEMORY_DIR = Path("/dev/shm")
+
+_POOLS: dict[int | None, tuple[ProcessPoolExecutor, int]] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class _ChunkTask:
+    callable_ref: str
+    plugin_name: str
+    context_type: type[StageContext]
+    settings: dict[str, Any]
+    runtime: RuntimeExecutionContext
+    input_path: Path
+    output_path: Path
+
+
+def run_isolated_plugin(
+    dataset: JobDataset,
+    plugin: PluginDefinition,
+    runtime: RuntimeExecutionContext,
+    context_type: type[StageContext],
+) -> JobDataset:
+    """Run ``plugin`` on row chunks of ``dataset`` in worker processes.
+
+    The chunks are reassembled in row order, so the plugin must be row-local.
+    Workers import the plugin from its ``callable_ref`` and stay alive between
+    calls. There is one pool per ``runtime.max_threads`` setting; a small frame
+    is split into fewer chunks rather than getting a smaller pool. A plugin
+    that exceeds ``timeout_seconds`` has its pool terminated.
+    """
+    frame = dataset.to_polars(copy=False)
+    pool, workers = _worker_pool(runtime.max_threads)
+    chunk_rows = max(1, -(-frame.height // workers))
+    settings = _thaw_value(plugin.settings)
+    with tempfile.TemporaryDirectory(
+        prefix="honestroles-plugin-", dir=_transfer_root(), ignore_cleanup_errors=True
+    ) as transfer_dir:
+        tasks = []
+        for index, offset in enumerate(range(0, max(frame.height, 1), chunk_rows)):
+            chunk_path = Path(transfer_dir) / f"chunk-{index:05d}"
+            write_ipc(frame.slice(offset, chunk_rows), chunk_path.with_suffix(".in.arrow"))
+            tasks.append(
+                _ChunkTask(
+                    callable_ref=plugin.callable_ref,
+                    plugin_name=plugin.name,
+                    context_type=context_type,
+                    settings=settings,
+                    runtime=runtime,
+                    input_path=chunk_path.with_suffix(".in.arrow"),
+                    output_path=chunk_path.with_suffix(".out.arrow"),
+                )
+            )
+        pending = [pool.submit(_run_chunk, task) for task in tasks]
+        timeout = plugin.timeout_seconds
+        deadline = None if timeout is None else monotonic() + timeout
+        outputs = []
+        try:
+            for future in pending:
+                remaining = None if deadline is None else max(0.0, deadline - monotonic())
+                error, output_path = future.result(timeout=remaining)
+                if error is not None:
+                    raise PluginExecutionError(plugin.name, plugin.kind, error)
+                outputs.append(pl.read_ipc(output_path, memory_map=True))
+        except TimeoutError as exc:
+            _discard_pool(pool)
+            raise PluginExecutionError(
+                plugin.name, plugin.kind, f"timed out after {timeout:g}s"
+            ) from exc
+        except BrokenProcessPool as exc:
+            _discard_pool(pool)
+            raise PluginExecutionError(
+                plugin.name, plugin.kind, f"worker process exited unexpectedly: {exc}"
+            ) from exc
+        finally:
+            for future in pending:
+                future.cancel()
+        try:
+            # Rechunking copies the rows out of the mapped files before they go.
+            merged = pl.concat(outputs, how="vertical_relaxed", rechunk=True)
+        except pl.exceptions.PolarsError as exc:
+            raise PluginExecutionError(
+                plugin.name, plugin.kind, f"row chunks returned mismatched frames: {exc}"
+            ) from exc
+    return JobDataset._from_polars_unchecked(merged)
+
+
+def _run_chunk(task: _ChunkTask) -> tuple[str | None, str]:
+    """Worker side: returns ``(error, output_path)`` so nothing unpicklable crosses back."""
+    try:
+        func = _load_callable(task.callable_ref)
+        chunk = JobDataset._from_polars_unchecked(
+            pl.read_ipc(task.input_path, memory_map=True)
+        )
+        ctx = task.context_type(
+            plugin_name=task.plugin_name,
+            settings=_freeze_value(task.settings),
+            runtime=task.runtime,
+        )
+        candidate = func(chunk, ctx)
+        if not isinstance(candidate, JobDataset):
+            return (
+                f"returned invalid type '{type(candidate).__name__}', expected JobDataset",
+                "",
+            )
+        write_ipc(candidate.to_polars(copy=False), task.output_path)
+    except Exception as exc:  # noqa: BLE001 - plugin errors may not pickle
+        return str(exc), ""
+    return None, str(task.output_path)
+
+
+@lru_cache(maxsize=None)
+def _load_callable(callable_ref: str) -> Callable[..., Any]:
+    return _import_callable(callable_ref)
+
+
+def _thaw_value(value: Any) -> Any:
+    # Frozen settings hold mappingproxy objects, which do not pickle.
+    if isinstance(value, Mapping):
+        return {key: _thaw_value(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_thaw_value(item) for item in value)
+    return value
+
+
+def _transfer_root() -> str | None:
+    if _SHARED_MEMORY_DIR.is_dir() and os.access(_SHARED_MEMORY_DIR, os.W_OK):
+        return str(_SHARED_MEMORY_DIR)
+    return None
+
+
+def _worker_pool(max_threads: int | None) -> tuple[ProcessPoolExecutor, int]:
+    with _POOLS_LOCK:
+        entry = _POOLS.get(max_threads)
+        if entry is None:
+            workers = max_threads or os.cpu_count() or 1
+            # With a thread budget each worker gets one Polars thread of it.
+            polars_threads = 1 if max_threads else None
+            # Spawned workers start from a clean interpreter; forking a process
+            # that already runs Polars thread pools can deadlock.
+            with worker_thread_limit(polars_threads):
+                pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            entry = _POOLS[max_threads] = (pool, workers)
+        return entry
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    with _POOLS_LOCK:
+        for key in [key for key, (candidate, _) in _POOLS.items() if candidate is pool]:
+            del _POOLS[key]
+    _terminate(pool)
+
+
+def _terminate(pool: ProcessPoolExecutor) -> None:
+    # The executor cannot interrupt a running task, so a worker stuck past its
+    # deadline is killed directly; ``_processes`` is the only handle on it.
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def shutdown_isolated_pools() -> None:
+    """Shut down every plugin worker pool of this process."""
+    with _POOLS_LOCK:
+        pools = [pool for pool, _ in _POOLS.values()]
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -6,14 +6,18 @@ from collections.abc import Callable
 from types import MappingProxyType
 from typing import Any, get_origin, get_type_hints
 
+import polars as pl
+
 from honestroles.config.models import PluginManifestConfig, PluginManifestItem
 from honestroles.domain import JobDataset
 from honestroles.plugins.errors import PluginLoadError, PluginValidationError
 from honestroles.plugins.types import (
     FilterStageContext,
     LabelStageContext,
+    PluginContract,
     PluginKind,
     PluginDefinition,
+    PluginExpressions,
     PluginSpec,
     RateStageContext,
 )
@@ -63,7 +67,9 @@ def _freeze_value(value: Any) -> Any:
     return value
 
 
-def _validate_signature(name: str, kind: PluginKind, func: Callable[..., Any]) -> None:
+def _validate_signature(
+    name: str, kind: PluginKind, func: Callable[..., Any]
+) -> PluginContract:
     sig = inspect.signature(func)
     params = list(sig.parameters.values())
     try:
@@ -97,18 +103,25 @@ def _validate_signature(name: str, kind: PluginKind, func: Callable[..., Any]) -
     second_annotation = hints.get(second.name, second.annotation)
     return_annotation = hints.get("return", sig.return_annotation)
 
-    if not _annotation_matches(first_annotation, JobDataset):
+    if _annotation_matches(first_annotation, JobDataset):
+        contract: PluginContract = "dataset"
+        expected_return: Any = JobDataset
+    elif _annotation_matches(first_annotation, pl.Schema):
+        contract = "expressions"
+        expected_return = PluginExpressions
+    else:
         raise PluginValidationError(
-            f"plugin '{name}' ({kind}) first arg must be annotated as JobDataset"
+            f"plugin '{name}' ({kind}) first arg must be annotated as JobDataset or pl.Schema"
         )
     if not _annotation_matches(second_annotation, expected_ctx):
         raise PluginValidationError(
             f"plugin '{name}' ({kind}) second arg must be annotated as {expected_ctx.__name__}"
         )
-    if not _annotation_matches(return_annotation, JobDataset):
+    if not _annotation_matches(return_annotation, expected_return):
         raise PluginValidationError(
-            f"plugin '{name}' ({kind}) return annotation must be JobDataset"
+            f"plugin '{name}' ({kind}) return annotation must be {expected_return.__name__}"
         )
+    return contract
 
 
 def load_plugins(manifest: PluginManifestConfig) -> tuple[PluginDefinition, ...]:
@@ -120,7 +133,12 @@ def load_plugins(manifest: PluginManifestConfig) -> tuple[PluginDefinition, ...]
 
 def load_plugin_item(item: PluginManifestItem) -> PluginDefinition:
     func = _import_callable(item.callable)
-    _validate_signature(item.name, item.kind, func)
+    contract = _validate_signature(item.name, item.kind, func)
+    if item.isolated and contract != "dataset":
+        raise PluginValidationError(
+            f"plugin '{item.name}' ({item.kind}) uses the expression contract "
+            "and cannot be isolated"
+        )
     return PluginDefinition(
         name=item.name,
         kind=item.kind,
@@ -134,4 +152,7 @@ def load_plugin_item(item: PluginManifestItem) -> PluginDefinition:
             plugin_version=item.spec.plugin_version,
             capabilities=tuple(item.spec.capabilities),
         ),
+        contract=contract,
+        isolated=item.isolated,
+        timeout_seconds=item.timeout_seconds,
     )
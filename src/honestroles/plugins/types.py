@@ -5,27 +5,53 @@ from pathlib import Path
 from types import MappingProxyType
 from typing import Any, Callable, Literal, Mapping
 
+import polars as pl
+
 from honestroles.domain import JobDataset
 
 PluginKind = Literal["filter", "label", "rate"]
+PluginContract = Literal["dataset", "expressions"]
 
 
 def _empty_mapping() -> Mapping[str, Any]:
     return MappingProxyType({})
 
 
+def _capability_columns(capabilities: tuple[str, ...], prefix: str) -> frozenset[str] | None:
+    found = False
+    columns: set[str] = set()
+    for capability in capabilities:
+        name, sep, value = capability.partition(":")
+        if sep and name.strip() == prefix:
+            found = True
+            columns.update(item.strip() for item in value.split(",") if item.strip())
+    return frozenset(columns) if found else None
+
+
 @dataclass(frozen=True, slots=True)
 class PluginSpec:
     api_version: str = "1.0"
     plugin_version: str = "0.1.0"
     capabilities: tuple[str, ...] = ()
 
+    @property
+    def reads(self) -> frozenset[str] | None:
+        """Columns declared with a ``reads:<col>,<col>`` capability, if any."""
+        return _capability_columns(self.capabilities, "reads")
+
+    @property
+    def writes(self) -> frozenset[str] | None:
+        """Columns declared with a ``writes:<col>,<col>`` capability, if any."""
+        return _capability_columns(self.capabilities, "writes")
+
 
 @dataclass(frozen=True, slots=True)
 class RuntimeExecutionContext:
     pipeline_config_path: Path
     plugin_manifest_path: Path | None
     stage_options: dict[str, Any]
+    # Thread budget for plugin pools; ``None`` leaves pool sizes to the CPU count.
+    max_threads: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,10 +76,33 @@ class RateStageContext(StageContext):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class PluginExpressions:
+    """Result of an expression plugin: new columns (label/rate) or a predicate (filter).
+
+    ``reads`` lists the input columns the expressions depend on so the stage can
+    fuse consecutive expression plugins into one ``with_columns``/``filter`` pass.
+    """
+
+    columns: Mapping[str, pl.Expr] = field(default_factory=_empty_mapping)
+    predicate: pl.Expr | None = None
+    reads: tuple[str, ...] = ()
+
+
 FilterPlugin = Callable[[JobDataset, FilterStageContext], JobDataset]
 LabelPlugin = Callable[[JobDataset, LabelStageContext], JobDataset]
 RatePlugin = Callable[[JobDataset, RateStageContext], JobDataset]
-PluginCallable = FilterPlugin | LabelPlugin | RatePlugin
+FilterExpressionPlugin = Callable[[pl.Schema, FilterStageContext], PluginExpressions]
+LabelExpressionPlugin = Callable[[pl.Schema, LabelStageContext], PluginExpressions]
+RateExpressionPlugin = Callable[[pl.Schema, RateStageContext], PluginExpressions]
+PluginCallable = (
+    FilterPlugin
+    | LabelPlugin
+    | RatePlugin
+    | FilterExpressionPlugin
+    | LabelExpressionPlugin
+    | RateExpressionPlugin
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -66,3 +115,7 @@ class PluginDefinition:
     enabled: bool = True
     settings: Mapping[str, Any] = field(default_factory=_empty_mapping)
     spec: PluginSpec = field(default_factory=PluginSpec)
+    contract: PluginContract = "dataset"
+    # Run in worker processes on row chunks instead of in the calling process.
+    isolated: bool = False
+    timeout_seconds: float | None = None
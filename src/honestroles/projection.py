@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from honestroles.config.models import PipelineSpec
+from honestroles.io import _BUILTIN_SOURCE_ALIASES, _resolve_quality_weights
+from honestroles.plugins import PluginRegistry
+from honestroles.plugins.types import PluginKind
+from honestroles.schema import CANONICAL_SOURCE_FIELDS
+
+_PLUGIN_STAGES: tuple[PluginKind, ...] = ("filter", "label", "rate")
+
+
+def required_input_columns(
+    spec: PipelineSpec, registry: PluginRegistry
+) -> tuple[str, ...] | None:
+    """Return the sorted input columns a run of ``spec`` reads, or ``None`` for all.
+
+    The set covers the canonical fields, alias and adapter source columns,
+    columns named by stage and output options, plugin ``reads:`` capabilities
+    and ``runtime.projection.keep``. Every column is read when projection is
+    disabled or an enabled plugin does not declare what it reads.
+    """
+    projection = spec.runtime.projection
+    if not projection.enabled:
+        return None
+
+    plugin_reads: set[str] = set()
+    for kind in _PLUGIN_STAGES:
+        if not getattr(spec.stages, kind).enabled:
+            continue
+        for plugin in registry.plugins_for_kind(kind):
+            reads = plugin.spec.reads
+            if reads is None:
+                return None
+            plugin_reads.update(reads)
+
+    columns = set(CANONICAL_SOURCE_FIELDS) | plugin_reads | set(projection.keep)
+    for aliases in spec.input.aliases.model_dump(mode="python").values():
+        columns.update(aliases)
+    for aliases in _BUILTIN_SOURCE_ALIASES.values():
+        columns.update(aliases)
+    if spec.input.adapter.enabled:
+        for field in spec.input.adapter.fields.values():
+            columns.update(field.from_)
+    if spec.stages.match.enabled:
+        columns.update(spec.stages.match.group_by)
+    # Quality reports over the run's output weigh these fields.
+    columns.update(_resolve_quality_weights((), spec.runtime.quality))
+    if spec.output is not None and spec.output.parquet.partition_by == "source":
+        columns.add("source")
+    if spec.runtime.incremental.enabled:
+        columns.add("source_payload_hash")
+    return tuple(sorted(columns))
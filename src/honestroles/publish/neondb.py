@@ -13,7 +13,7 @@ from time import perf_counter
 from typing import Any, Iterator, Protocol
 
 from honestroles.errors import ConfigValidationError, HonestRolesError
-from honestroles.io import read_parquet
+from honestroles.io import read_table
 from honestroles.recommend.index import load_index
 from honestroles.recommend.scoring import normalize_job_record, tokenize_text
 
@@ -511,7 +511,7 @@ def _prepare_sync_payload(
     jobs_parquet: Path,
     index_dir: Path,
 ) -> _PreparedSyncPayload:
-    frame = read_parquet(jobs_parquet)
+    frame = read_table(jobs_parquet)
     rows: list[dict[str, Any]] = []
     for item in frame.to_dicts():
         raw = dict(item)
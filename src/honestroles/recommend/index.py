@@ -9,7 +9,7 @@ from time import perf_counter
 from typing import Any
 
 from honestroles.errors import ConfigValidationError
-from honestroles.io import read_parquet
+from honestroles.io import read_table
 
 from .models import RetrievalIndexResult, SCHEMA_VERSION
 from .policy import load_recommendation_policy
@@ -32,7 +32,7 @@ def build_retrieval_index(
     policy, policy_source, policy_hash = load_recommendation_policy(policy_file)
     _ = policy
 
-    frame = read_parquet(input_path)
+    frame = read_table(input_path)
     rows = [normalize_job_record(dict(row)) for row in frame.to_dicts()]
     rows_sorted = sorted(rows, key=lambda item: str(item.get("job_id", "")))
 
@@ -63,6 +63,7 @@ def normalize_job_record(raw: dict[str, Any]) -> dict[str, Any]:
         "job_url": _text_or_none(raw.get("job_url")) or apply_url,
     }
     payload["tokens"] = sorted(_job_tokens(payload))
+    payload["skill_tokens"] = sorted(_job_skill_tokens(payload))
     return payload
 
 
@@ -109,7 +110,14 @@ def score_job(
 
     capped_score = max(0.0, min(1.0, weighted_score))
     reasons_sorted = tuple(sorted(reasons, key=lambda item: item.contribution, reverse=True)[: policy.reason_limit])
-    missing_skills = tuple(sorted(set(candidate.skills) - _job_skill_tokens(job)))
+    # Indexed records carry precomputed skill tokens (the ``skills`` list plus
+    # title and description words), so free text is not re-tokenized per match.
+    # Company and location words in ``tokens`` do not count as skills.
+    if "skill_tokens" in job:
+        skill_tokens = set(str(item) for item in job["skill_tokens"])
+    else:
+        skill_tokens = _job_skill_tokens(job)
+    missing_skills = tuple(sorted(set(candidate.skills) - skill_tokens))
     quality_flags = _quality_flags(job)
     return round(capped_score, 6), reasons_sorted, missing_skills, quality_flags, signal_values
 
@@ -14,9 +14,11 @@ from honestroles.errors import ConfigValidationError
 from honestroles.io import (
     apply_source_adapter,
     normalize_source_data_contract,
-    read_parquet,
+    read_table,
+    resolve_input_partitions,
     resolve_source_aliases,
     validate_source_data_contract,
+    with_partition_columns,
 )
 
 from .policy import ReliabilityPolicy, load_reliability_policy
@@ -145,7 +147,15 @@ def evaluate_reliability(
 
     if cfg is not None:
         input_path = cfg.input.path
-        if not input_path.exists():
+        try:
+            partitions = resolve_input_partitions(
+                input_path,
+                hive_partitioning=cfg.input.hive_partitioning,
+                kind=cfg.input.kind,
+            )
+        except ConfigValidationError:
+            partitions = ()
+        if not partitions or not partitions[0].path.exists():
             _append_check(
                 checks,
                 check_id="input_exists",
@@ -165,7 +175,10 @@ def evaluate_reliability(
                 fix="-",
             )
             try:
-                sample = read_parquet(input_path).head(sample_rows)
+                sample = with_partition_columns(
+                    read_table(partitions[0].path, cfg.input.kind).head(sample_rows),
+                    partitions[0],
+                )
             except Exception as exc:
                 _append_check(
                     checks,
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# An eager run holds the input frame plus the columns and intermediate frames
+# that clean/label/rate derive from it, so its peak is a multiple of the input.
+EAGER_MEMORY_FACTOR = 3.0
+# Rows read from the head of the input to measure the average row width.
+ESTIMATE_SAMPLE_ROWS = 10_000
+_POLARS_THREADS_ENV = "POLARS_MAX_THREADS"
+
+
+@dataclass(frozen=True, slots=True)
+class InputEstimate:
+    """Estimated in-memory size of a scanned input."""
+
+    rows: int
+    bytes: int
+
+    @property
+    def bytes_per_row(self) -> float:
+        return self.bytes / self.rows if self.rows else 0.0
+
+
+def estimate_input(frame: pl.LazyFrame, *, sample_rows: int = ESTIMATE_SAMPLE_ROWS) -> InputEstimate:
+    """Estimate the decoded size of ``frame`` without reading all of it.
+
+    The row count of a parquet or IPC scan comes from file metadata. The row
+    width is measured on the first ``sample_rows`` rows and scaled to the count.
+    """
+    import polars as pl
+
+    rows = int(frame.select(pl.len()).collect().item())
+    sample = frame.head(sample_rows).collect()
+    if sample.height == 0:
+        return InputEstimate(rows=rows, bytes=0)
+    return InputEstimate(rows=rows, bytes=int(sample.estimated_size() / sample.height * rows))
+
+
+def budget_batch_rows(estimate: InputEstimate, max_memory_bytes: int, batch_rows: int) -> int:
+    """Shrink ``batch_rows`` so one batch's working set fits in ``max_memory_bytes``."""
+    if estimate.bytes_per_row <= 0:
+        return batch_rows
+    fitting = int(max_memory_bytes / (estimate.bytes_per_row * EAGER_MEMORY_FACTOR))
+    return max(1, min(batch_rows, fitting))
+
+
+def limit_polars_threads(max_threads: int) -> bool:
+    """Cap the Polars thread pool of this process at ``max_threads``.
+
+    Polars sizes its pool once, when it is imported, so this only takes effect
+    before the first ``import polars``. Returns whether the cap applies.
+    """
+    if "polars" in sys.modules:
+        return False
+    os.environ[_POLARS_THREADS_ENV] = str(max_threads)
+    return True
+
+
+@contextmanager
+def worker_thread_limit(threads: int | None) -> Iterator[None]:
+    """Give processes spawned inside the block a Polars pool of ``threads``."""
+    if threads is None:
+        yield
+        return
+    previous = os.environ.get(_POLARS_THREADS_ENV)
+    os.environ[_POLARS_THREADS_ENV] = str(threads)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(_POLARS_THREADS_ENV, None)
+        else:
+            os.environ[_POLARS_THREADS_ENV] = previous
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or ``None`` where ``/proc`` is unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes() -> int | None:
+    """High-water resident set size of this process."""
+    # ru_maxrss survives fork and exec on Linux, so a spawned worker would report
+    # its parent's peak; VmHWM belongs to the worker's own address space.
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
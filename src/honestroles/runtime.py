@@ -1,40 +1,151 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import repeat
+import multiprocessing
+import os
 from pathlib import Path
 import random
+from time import perf_counter
+from typing import Any, Callable, cast
 
+import polars as pl
+
+from honestroles.checkpoints import (
+    StageCheckpoint,
+    StageCheckpointCache,
+    _sha256_json,
+    input_checkpoint_key,
+    stage_checkpoint_key,
+)
 from honestroles.config import PipelineSpec, load_pipeline_config
+from honestroles.config.models import TableFormat
 from honestroles.diagnostics import (
     InputAdapterDiagnostics,
     InputAliasingDiagnostics,
+    IncrementalDiagnostics,
     NonFatalStageError,
+    PartitionDiagnostics,
     PluginExecutionCounts,
+    ResourceDiagnostics,
     RuntimeDiagnostics,
     RuntimeSettingsSnapshot,
+    ShardDiagnostics,
+    StageCacheDiagnostics,
     StageRowCounts,
+    StageTelemetry,
 )
 from honestroles.domain import JobDataset
-from honestroles.errors import HonestRolesError, RuntimeInitializationError
+from honestroles.errors import (
+    HonestRolesError,
+    RuntimeInitializationError,
+    StageExecutionError,
+)
+from honestroles.html_text import HtmlTextCache, open_html_cache
+from honestroles.incremental import (
+    ROW_KEY,
+    IncrementalStateStore,
+    incremental_input_key,
+    incremental_state,
+    merge_incremental,
+    plan_incremental,
+    with_row_keys,
+)
 from honestroles.io import (
+    InputPartition,
     apply_source_adapter,
+    encode_categorical_columns,
     normalize_source_data_contract,
-    read_parquet,
+    read_table,
+    resolve_input_partitions,
     resolve_source_aliases,
+    scan_input_partitions,
     validate_source_data_contract,
-    write_parquet,
+    with_partition_columns,
+    write_output,
 )
+from honestroles.lazy import execute_lazy
+from honestroles.streaming import ParquetPartWriter, iter_batches, merge_top_k
 from honestroles.objects import PipelineRun
 from honestroles.plugins import PluginRegistry
-from honestroles.plugins.types import RuntimeExecutionContext
+from honestroles.projection import required_input_columns
+from honestroles.resources import (
+    EAGER_MEMORY_FACTOR,
+    budget_batch_rows,
+    estimate_input,
+    worker_thread_limit,
+)
+from honestroles.plugins.types import PluginKind, RuntimeExecutionContext
 from honestroles.stages import (
     StageArtifacts,
+    _build_application_plan,
     clean_stage,
     filter_stage,
     label_stage,
     match_stage,
     rate_stage,
+    skills_stage,
 )
+from honestroles.sharding import SHARD_ROW, ShardManifest, ShardSpec, ShardStore, shard_of
+from honestroles.skills import load_skill_vocabulary
+from honestroles.telemetry import TelemetryRecorder
+
+_STAGE_ORDER: tuple[str, ...] = ("clean", "filter", "skills", "label", "rate", "match")
+_BATCH_STAGES: tuple[str, ...] = tuple(stage for stage in _STAGE_ORDER if stage != "match")
+
+
+@dataclass(frozen=True, slots=True)
+class _PartitionResult:
+    partition: InputPartition
+    frame: pl.DataFrame
+    stage_rows: StageRowCounts
+    non_fatal_errors: tuple[NonFatalStageError, ...]
+    adapter_payload: dict[str, Any]
+    aliasing_payload: dict[str, Any]
+    telemetry: tuple[StageTelemetry, ...]
+    wall_ms: float
+
+
+def _merge_input_payloads(payloads: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine per-partition adapter/aliasing payloads: counts add up, first mapping wins."""
+    merged: dict[str, Any] = {}
+    for payload in payloads:
+        for key, value in payload.items():
+            if isinstance(value, dict):
+                target = merged.setdefault(key, {})
+                for name, item in value.items():
+                    if isinstance(item, int) and not isinstance(item, bool):
+                        target[name] = target.get(name, 0) + item
+                    else:
+                        target.setdefault(name, item)
+            elif isinstance(value, list):
+                target = merged.setdefault(key, [])
+                target.extend(item for item in value if item not in target)
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+
+def _run_partition_worker(
+    pipeline_spec: PipelineSpec,
+    pipeline_config_path: Path,
+    plugin_manifest_path: Path | None,
+    partition: InputPartition,
+) -> _PartitionResult:
+    # Plugin callables and settings do not pickle, so each worker process loads
+    # its own registry from the manifest.
+    runtime = HonestRolesRuntime(
+        pipeline_spec=pipeline_spec,
+        plugin_registry=(
+            PluginRegistry.from_manifest(plugin_manifest_path)
+            if plugin_manifest_path
+            else PluginRegistry()
+        ),
+        pipeline_config_path=pipeline_config_path,
+        plugin_manifest_path=plugin_manifest_path,
+    )
+    return runtime._execute_partition(partition)
 
 
 @dataclass(frozen=True, slots=True)
@@ -43,6 +154,10 @@ class HonestRolesRuntime:
     plugin_registry: PluginRegistry
     pipeline_config_path: Path
     plugin_manifest_path: Path | None = None
+    # Reads one eager input file; a long-lived server swaps in a caching reader.
+    input_reader: Callable[
+        [Path, TableFormat, tuple[str, ...] | None], pl.DataFrame
+    ] = read_table
 
     @classmethod
     def from_configs(
@@ -76,35 +191,829 @@ class HonestRolesRuntime:
         )
 
     def run(self) -> PipelineRun:
+        runtime_config = self.pipeline_spec.runtime
+        runtime, resources = self._plan_resources()
+        with TelemetryRecorder(
+            trace_memory=runtime_config.trace_memory,
+            track_rss=runtime_config.max_memory_mb is not None,
+        ) as telemetry:
+            result = runtime._run_execution(telemetry)
+            peak_rss = telemetry.peak_rss_bytes
+        if resources is None:
+            return result
+        resources = replace(resources, peak_rss_bytes=peak_rss)
+        return replace(result, diagnostics=replace(result.diagnostics, resources=resources))
+
+    def _run_execution(self, telemetry: TelemetryRecorder) -> PipelineRun:
+        if self.pipeline_spec.runtime.execution == "streaming":
+            return self._run_streaming(telemetry)
+        if self.pipeline_spec.runtime.execution == "lazy":
+            return self._run_lazy(telemetry)
+        return self._run_eager(telemetry)
+
+    def _plan_resources(self) -> tuple["HonestRolesRuntime", ResourceDiagnostics | None]:
+        """Apply ``runtime.max_memory_mb`` before the run starts.
+
+        The input size is estimated from file metadata and a sample of rows. When
+        an in-memory run would exceed the budget, the run switches to streaming
+        with batches small enough to fit; streaming runs get the same batch cap.
+        """
+        runtime_config = self.pipeline_spec.runtime
+        if runtime_config.max_memory_mb is None and runtime_config.max_threads is None:
+            return self, None
+        resources = ResourceDiagnostics(
+            requested_execution=runtime_config.execution,
+            polars_threads=pl.thread_pool_size(),
+            max_threads=runtime_config.max_threads,
+        )
+        if runtime_config.max_memory_mb is None:
+            return self, resources
+
+        budget = runtime_config.max_memory_mb * 1024**2
+        estimate = estimate_input(
+            scan_input_partitions(
+                self._input_partitions(), self.pipeline_spec.input.kind, self._input_columns()
+            )
+        )
+        estimated_peak = int(estimate.bytes * EAGER_MEMORY_FACTOR)
+        resources = replace(
+            resources,
+            max_memory_bytes=budget,
+            estimated_input_rows=estimate.rows,
+            estimated_input_bytes=estimate.bytes,
+            estimated_peak_bytes=estimated_peak,
+        )
+        fallback = runtime_config.execution != "streaming"
+        if fallback:
+            if estimated_peak <= budget:
+                return self, resources
+            blocked = self._streaming_blocked()
+            if blocked is not None:
+                return self, replace(resources, fallback_blocked=blocked)
+
+        batch_rows = budget_batch_rows(estimate, budget, runtime_config.streaming.batch_rows)
+        streamed = runtime_config.model_copy(
+            update={
+                "execution": "streaming",
+                "streaming": runtime_config.streaming.model_copy(
+                    update={"batch_rows": batch_rows}
+                ),
+            }
+        )
+        runtime = replace(
+            self, pipeline_spec=self.pipeline_spec.model_copy(update={"runtime": streamed})
+        )
+        return runtime, replace(resources, fallback=fallback, batch_rows=batch_rows)
+
+    def _streaming_blocked(self) -> str | None:
+        """Return why this run cannot fall back to streaming, if it cannot."""
+        if self.pipeline_spec.runtime.incremental.enabled:
+            return "incremental runs cannot stream"
+        if not self.pipeline_spec.stages.match.enabled and self.pipeline_spec.output is None:
+            return "streaming without match requires [output]"
+        return None
+
+    def run_shard(self, shard: ShardSpec) -> ShardDiagnostics:
+        """Run clean through rate on one hash shard of the input and store it.
+
+        Rows are assigned by ``runtime.sharding.key``. The shard's rows after rate,
+        its match top-k candidates, and its diagnostics go to
+        ``runtime.sharding.path`` for :meth:`merge_shards`.
+        """
+        started = perf_counter()
+        random.seed(self.pipeline_spec.runtime.random_seed)
+        sharding = self.pipeline_spec.runtime.sharding
+        non_fatal_errors: list[NonFatalStageError] = []
+        with TelemetryRecorder(
+            trace_memory=self.pipeline_spec.runtime.trace_memory
+        ) as telemetry:
+            with telemetry.measure("input") as probe:
+                frame, adapter_payload, aliasing_payload = self._scan_input()
+                dataset = JobDataset.from_polars(
+                    frame.with_row_index(SHARD_ROW)
+                    .filter(shard_of(sharding.key, shard.count) == shard.index)
+                    .collect()
+                )
+                probe.after = dataset
+            dataset, _, stage_rows = self._execute_stages(
+                dataset,
+                self._runtime_context(),
+                StageRowCounts().record("input", dataset.row_count()),
+                non_fatal_errors,
+                telemetry,
+                stages=_BATCH_STAGES,
+            )
+            entries = telemetry.entries()
+        rated = dataset.to_polars(copy=False)
+        if SHARD_ROW not in rated.columns:
+            raise StageExecutionError(
+                "shard", f"shard row column '{SHARD_ROW}' was dropped during the run"
+            )
+        candidates = (
+            self._merge_match_candidates(None, rated)
+            if self.pipeline_spec.stages.match.enabled
+            else None
+        )
+        diagnostics = ShardDiagnostics(
+            index=shard.index,
+            count=shard.count,
+            key=sharding.key,
+            stage_rows=stage_rows,
+            non_fatal_errors=tuple(dict.fromkeys(non_fatal_errors)),
+            wall_ms=(perf_counter() - started) * 1000,
+        )
+        ShardStore(sharding.path).store(
+            shard,
+            ShardManifest(
+                run_key=self._shard_run_key(),
+                diagnostics=diagnostics,
+                telemetry=entries,
+                input_adapter=adapter_payload,
+                input_aliasing=aliasing_payload,
+                candidates=candidates is not None,
+            ),
+            rated,
+            candidates,
+        )
+        return diagnostics
+
+    def merge_shards(self) -> PipelineRun:
+        """Merge every stored shard into the result of a single-node eager run.
+
+        Each shard keeps its rows' global input positions, so concatenating the
+        shard top-k candidates in that order and running match gives the same
+        ranking, application plan and stage row counts as one eager run.
+        """
         random.seed(self.pipeline_spec.runtime.random_seed)
+        shards = ShardStore(self.pipeline_spec.runtime.sharding.path).load(
+            self._shard_run_key()
+        )
+        match_enabled = self.pipeline_spec.stages.match.enabled
         stage_rows = StageRowCounts()
-        plugin_counts = PluginExecutionCounts(
+        non_fatal_errors: list[NonFatalStageError] = []
+        with TelemetryRecorder(
+            trace_memory=self.pipeline_spec.runtime.trace_memory
+        ) as telemetry:
+            for shard in shards:
+                stage_rows = stage_rows.merge(shard.manifest.diagnostics.stage_rows)
+                non_fatal_errors.extend(shard.manifest.diagnostics.non_fatal_errors)
+                telemetry.extend(shard.manifest.telemetry)
+            with telemetry.measure("merge") as probe:
+                frame = (
+                    pl.concat(
+                        [
+                            shard.read_candidates() if match_enabled else shard.read_output()
+                            for shard in shards
+                        ],
+                        how="diagonal_relaxed",
+                    )
+                    .sort(SHARD_ROW)
+                    .drop(SHARD_ROW)
+                )
+                probe.after = frame
+            dataset, artifacts, stage_rows = self._execute_stages(
+                JobDataset.from_polars(frame),
+                self._runtime_context(),
+                stage_rows,
+                non_fatal_errors,
+                telemetry,
+                stages=("match",),
+            )
+            # Every shard scanned the whole input, so its adapter and aliasing
+            # counts already describe all rows.
+            first = shards[0].manifest
+            return self._finalize(
+                dataset=dataset,
+                artifacts=artifacts,
+                stage_rows=stage_rows,
+                execution="eager",
+                telemetry=telemetry,
+                adapter_payload=dict(first.input_adapter or {}),
+                aliasing_payload=dict(first.input_aliasing or {}),
+                non_fatal_errors=tuple(dict.fromkeys(non_fatal_errors)),
+                shards=tuple(shard.manifest.diagnostics for shard in shards),
+            )
+
+    def _shard_run_key(self) -> str:
+        """Key shards by input location, stage options, plugins and shard column."""
+        upstream = incremental_input_key(self._input_options())
+        stage_keys = self._stage_keys(upstream)
+        return _sha256_json(
+            {
+                "input_path": str(self.pipeline_spec.input.path),
+                "stages": list(stage_keys.values())[-1] if stage_keys else upstream,
+                "key": self.pipeline_spec.runtime.sharding.key,
+            }
+        )
+
+    def _plugin_counts(self) -> PluginExecutionCounts:
+        return PluginExecutionCounts(
             filter=len(self.plugin_registry.plugins_for_kind("filter")),
             label=len(self.plugin_registry.plugins_for_kind("label")),
             rate=len(self.plugin_registry.plugins_for_kind("rate")),
         )
-        runtime_snapshot = RuntimeSettingsSnapshot(
+
+    def _runtime_snapshot(self, execution: str) -> RuntimeSettingsSnapshot:
+        return RuntimeSettingsSnapshot(
             fail_fast=self.pipeline_spec.runtime.fail_fast,
             random_seed=self.pipeline_spec.runtime.random_seed,
+            execution=execution,
+        )
+
+    def _runtime_context(self) -> RuntimeExecutionContext:
+        return RuntimeExecutionContext(
+            pipeline_config_path=self.pipeline_config_path,
+            plugin_manifest_path=self.plugin_manifest_path,
+            stage_options=self.pipeline_spec.stages.model_dump(mode="python"),
+            max_threads=self.pipeline_spec.runtime.max_threads,
+        )
+
+    def _html_cache(self) -> HtmlTextCache | None:
+        config = self.pipeline_spec.runtime.html_cache
+        if not config.enabled:
+            return None
+        return open_html_cache(config.path, config.max_entries)
+
+    def _merge_match_candidates(
+        self, pool: pl.DataFrame | None, rated: pl.DataFrame
+    ) -> pl.DataFrame:
+        """Merge ``rated`` into the running match top-k pool.
+
+        A pool that cannot be ranked fails as the match stage. Without
+        ``fail_fast`` every row is kept instead, so the match stage records the
+        error and leaves the rows unranked exactly like an eager run.
+        """
+        options = self.pipeline_spec.stages.match
+        try:
+            return merge_top_k(pool, rated, options.top_k, options.group_by)
+        except pl.exceptions.PolarsError as exc:
+            if self.pipeline_spec.runtime.fail_fast:
+                raise StageExecutionError("match", str(exc)) from exc
+            if pool is None:
+                return rated
+            return pl.concat([pool, rated], how="vertical_relaxed")
+
+    def _finalize(
+        self,
+        *,
+        dataset: JobDataset,
+        artifacts: StageArtifacts,
+        stage_rows: StageRowCounts,
+        execution: str,
+        telemetry: TelemetryRecorder,
+        adapter_payload: dict[str, Any],
+        aliasing_payload: dict[str, Any],
+        non_fatal_errors: tuple[NonFatalStageError, ...] = (),
+        final_rows: int | None = None,
+        output_written: bool = False,
+        cache: StageCacheDiagnostics | None = None,
+        partitions: tuple[PartitionDiagnostics, ...] = (),
+        shards: tuple[ShardDiagnostics, ...] = (),
+        incremental: IncrementalDiagnostics | None = None,
+    ) -> PipelineRun:
+        output_path: str | None = None
+        if self.pipeline_spec.output is not None:
+            if not output_written:
+                write_output(dataset.to_polars(copy=False), self.pipeline_spec.output)
+            output_path = str(self.pipeline_spec.output.path)
+
+        diagnostics = RuntimeDiagnostics(
+            input_path=str(self.pipeline_spec.input.path),
+            stage_rows=stage_rows,
+            plugin_counts=self._plugin_counts(),
+            runtime=self._runtime_snapshot(execution),
+            input_adapter=InputAdapterDiagnostics.from_mapping(adapter_payload),
+            input_aliasing=InputAliasingDiagnostics.from_mapping(aliasing_payload),
+            output_path=output_path,
+            final_rows=dataset.row_count() if final_rows is None else final_rows,
+            non_fatal_errors=non_fatal_errors,
+            telemetry=telemetry.entries(),
+            cache=cache,
+            partitions=partitions,
+            shards=shards,
+            incremental=incremental,
+            input_columns=self._input_columns(),
+        )
+        return PipelineRun(
+            dataset=dataset,
+            diagnostics=diagnostics,
+            application_plan=artifacts.application_plan,
+        )
+
+    def _scan_input(self) -> tuple[pl.LazyFrame, dict[str, Any], dict[str, Any]]:
+        frame = scan_input_partitions(
+            self._input_partitions(), self.pipeline_spec.input.kind, self._input_columns()
+        )
+        frame, adapter_payload = apply_source_adapter(frame, self.pipeline_spec.input.adapter)
+        frame, aliasing_payload = resolve_source_aliases(frame, self.pipeline_spec.input.aliases)
+        frame = normalize_source_data_contract(frame)
+        frame = validate_source_data_contract(frame)
+        if self.pipeline_spec.runtime.categorical:
+            frame = encode_categorical_columns(frame)
+        JobDataset.from_polars(frame.clear().collect())
+        return frame, adapter_payload, aliasing_payload
+
+    def _run_lazy(self, telemetry: TelemetryRecorder) -> PipelineRun:
+        random.seed(self.pipeline_spec.runtime.random_seed)
+        frame, adapter_payload, aliasing_payload = self._scan_input()
+        result = execute_lazy(
+            frame,
+            self.pipeline_spec.stages,
+            self._runtime_context(),
+            self.plugin_registry,
+            telemetry,
+            categorical=self.pipeline_spec.runtime.categorical,
+            html_cache=self._html_cache(),
+            fail_fast=self.pipeline_spec.runtime.fail_fast,
+        )
+        return self._finalize(
+            dataset=result.dataset,
+            artifacts=result.artifacts,
+            stage_rows=result.stage_rows,
+            execution="lazy",
+            telemetry=telemetry,
+            adapter_payload=adapter_payload,
+            aliasing_payload=aliasing_payload,
+            non_fatal_errors=result.non_fatal_errors,
+        )
+
+    def _run_streaming(self, telemetry: TelemetryRecorder) -> PipelineRun:
+        random.seed(self.pipeline_spec.runtime.random_seed)
+        frame, adapter_payload, aliasing_payload = self._scan_input()
+        runtime_ctx = self._runtime_context()
+        match_options = self.pipeline_spec.stages.match
+        batch_stages = _BATCH_STAGES
+
+        stage_rows = StageRowCounts()
+        non_fatal_errors: list[NonFatalStageError] = []
+        top_k_pool: pl.DataFrame | None = None
+        writer: ParquetPartWriter | None = None
+        output = self.pipeline_spec.output
+        if not match_options.enabled and output is not None:
+            writer = ParquetPartWriter(
+                output.path,
+                output.parquet,
+                ipc=output.ipc if output.format == "ipc" else None,
+            )
+
+        try:
+            for batch in iter_batches(frame, self.pipeline_spec.runtime.streaming.batch_rows):
+                dataset = JobDataset.from_polars(batch)
+                batch_rows = StageRowCounts().record("input", dataset.row_count())
+                dataset, _, batch_rows = self._execute_stages(
+                    dataset,
+                    runtime_ctx,
+                    batch_rows,
+                    non_fatal_errors,
+                    telemetry,
+                    stages=batch_stages,
+                )
+                stage_rows = stage_rows.merge(batch_rows)
+                if writer is not None:
+                    writer.write(dataset.to_polars(copy=False))
+                else:
+                    top_k_pool = self._merge_match_candidates(
+                        top_k_pool, dataset.to_polars(copy=False)
+                    )
+            if writer is not None:
+                writer.finalize()
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+        if writer is not None:
+            return self._finalize(
+                dataset=JobDataset.from_polars(writer.empty_frame()),
+                artifacts=StageArtifacts(),
+                stage_rows=stage_rows,
+                execution="streaming",
+                telemetry=telemetry,
+                adapter_payload=adapter_payload,
+                aliasing_payload=aliasing_payload,
+                non_fatal_errors=tuple(dict.fromkeys(non_fatal_errors)),
+                final_rows=writer.rows_written,
+                output_written=True,
+            )
+
+        dataset = JobDataset.from_polars(
+            top_k_pool if top_k_pool is not None else frame.clear().collect()
+        )
+        dataset, artifacts, stage_rows = self._execute_stages(
+            dataset, runtime_ctx, stage_rows, non_fatal_errors, telemetry, stages=("match",)
+        )
+        return self._finalize(
+            dataset=dataset,
+            artifacts=artifacts,
+            stage_rows=stage_rows,
+            execution="streaming",
+            telemetry=telemetry,
+            adapter_payload=adapter_payload,
+            aliasing_payload=aliasing_payload,
+            non_fatal_errors=tuple(dict.fromkeys(non_fatal_errors)),
         )
 
-        df = read_parquet(self.pipeline_spec.input.path)
+    def _input_columns(self) -> tuple[str, ...] | None:
+        return required_input_columns(self.pipeline_spec, self.plugin_registry)
+
+    def _input_options(self) -> dict[str, Any]:
+        """Input settings that change the rows a run reads, for checkpoint keys."""
+        options = self.pipeline_spec.input.model_dump(mode="json", exclude={"path"})
+        columns = self._input_columns()
+        if columns is not None:
+            options["columns"] = list(columns)
+        if self.pipeline_spec.runtime.categorical:
+            options["categorical"] = True
+        return options
+
+    def _input_partitions(self) -> tuple[InputPartition, ...]:
+        return resolve_input_partitions(
+            self.pipeline_spec.input.path,
+            hive_partitioning=self.pipeline_spec.input.hive_partitioning,
+            kind=self.pipeline_spec.input.kind,
+        )
+
+    def _load_partition(
+        self, partition: InputPartition
+    ) -> tuple[JobDataset, dict[str, Any], dict[str, Any]]:
+        df = with_partition_columns(
+            self.input_reader(
+                partition.path, self.pipeline_spec.input.kind, self._input_columns()
+            ),
+            partition,
+        )
         df, adapter_payload = apply_source_adapter(df, self.pipeline_spec.input.adapter)
         df, aliasing_payload = resolve_source_aliases(df, self.pipeline_spec.input.aliases)
         df = normalize_source_data_contract(df)
         df = validate_source_data_contract(df)
+        if self.pipeline_spec.runtime.categorical:
+            df = encode_categorical_columns(df)
         dataset = JobDataset.from_polars(df)
         dataset.validate()
+        return dataset, adapter_payload, aliasing_payload
 
-        runtime_ctx = RuntimeExecutionContext(
-            pipeline_config_path=self.pipeline_config_path,
-            plugin_manifest_path=self.plugin_manifest_path,
-            stage_options=self.pipeline_spec.stages.model_dump(mode="python"),
+    def _execute_partition(self, partition: InputPartition) -> _PartitionResult:
+        """Load one partition and run every stage except match on it."""
+        started = perf_counter()
+        random.seed(self.pipeline_spec.runtime.random_seed)
+        non_fatal_errors: list[NonFatalStageError] = []
+        runtime_config = self.pipeline_spec.runtime
+        with TelemetryRecorder(
+            trace_memory=runtime_config.trace_memory,
+            track_rss=runtime_config.max_memory_mb is not None,
+        ) as telemetry:
+            with telemetry.measure("input") as probe:
+                dataset, adapter_payload, aliasing_payload = self._load_partition(partition)
+                probe.after = dataset
+            dataset, _, stage_rows = self._execute_stages(
+                dataset,
+                self._runtime_context(),
+                StageRowCounts().record("input", dataset.row_count()),
+                non_fatal_errors,
+                telemetry,
+                stages=_BATCH_STAGES,
+            )
+            entries = telemetry.entries()
+        return _PartitionResult(
+            partition=partition,
+            frame=dataset.to_polars(copy=False),
+            stage_rows=stage_rows,
+            non_fatal_errors=tuple(non_fatal_errors),
+            adapter_payload=adapter_payload,
+            aliasing_payload=aliasing_payload,
+            telemetry=entries,
+            wall_ms=(perf_counter() - started) * 1000,
+        )
+
+    def _run_partitioned(
+        self, partitions: tuple[InputPartition, ...], telemetry: TelemetryRecorder
+    ) -> PipelineRun:
+        configured = self.pipeline_spec.runtime.partitions.workers
+        max_threads = self.pipeline_spec.runtime.max_threads
+        workers = min(
+            len(partitions), configured or os.cpu_count() or 1, max_threads or len(partitions)
+        )
+        if self.plugin_manifest_path is None and self.plugin_registry.list():
+            # A registry built in-process cannot be reloaded by worker processes.
+            workers = 1
+        if workers > 1:
+            # Spawned workers start from a clean interpreter; forking a process
+            # that already runs Polars thread pools can deadlock. Each worker's
+            # Polars pool gets an even share of the thread budget.
+            with worker_thread_limit(
+                max(1, max_threads // workers) if max_threads else None
+            ), ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                results = list(
+                    pool.map(
+                        _run_partition_worker,
+                        repeat(self.pipeline_spec),
+                        repeat(self.pipeline_config_path),
+                        repeat(self.plugin_manifest_path),
+                        partitions,
+                    )
+                )
+        else:
+            results = [self._execute_partition(partition) for partition in partitions]
+
+        stage_rows = StageRowCounts()
+        non_fatal_errors: list[NonFatalStageError] = []
+        for result in results:
+            stage_rows = stage_rows.merge(result.stage_rows)
+            non_fatal_errors.extend(result.non_fatal_errors)
+            telemetry.extend(result.telemetry)
+        # Partitions are concatenated in path order, so the merged frame (and the
+        # match tie-break on input order) does not depend on worker scheduling.
+        dataset = JobDataset.from_polars(
+            pl.concat([result.frame for result in results], how="diagonal_relaxed")
+        )
+        dataset, artifacts, stage_rows = self._execute_stages(
+            dataset,
+            self._runtime_context(),
+            stage_rows,
+            non_fatal_errors,
+            telemetry,
+            stages=("match",),
+        )
+        return self._finalize(
+            dataset=dataset,
+            artifacts=artifacts,
+            stage_rows=stage_rows,
+            execution="eager",
+            telemetry=telemetry,
+            adapter_payload=_merge_input_payloads([r.adapter_payload for r in results]),
+            aliasing_payload=_merge_input_payloads([r.aliasing_payload for r in results]),
+            non_fatal_errors=tuple(non_fatal_errors),
+            partitions=tuple(
+                PartitionDiagnostics(
+                    path=str(result.partition.path),
+                    stage_rows=result.stage_rows,
+                    hive=dict(result.partition.hive_values),
+                    non_fatal_errors=result.non_fatal_errors,
+                    wall_ms=result.wall_ms,
+                )
+                for result in results
+            ),
         )
 
-        stage_rows = stage_rows.record("input", dataset.row_count())
+    def _run_incremental(
+        self, partitions: tuple[InputPartition, ...], telemetry: TelemetryRecorder
+    ) -> PipelineRun:
+        """Run clean through rate only on rows that are new or changed since the last run."""
+        spec = self.pipeline_spec
+        random.seed(spec.runtime.random_seed)
+        with telemetry.measure("input") as probe:
+            if len(partitions) == 1:
+                dataset, adapter_payload, aliasing_payload = self._load_partition(
+                    partitions[0]
+                )
+                frame = dataset.to_polars(copy=False)
+            else:
+                scanned, adapter_payload, aliasing_payload = self._scan_input()
+                frame = scanned.collect()
+            keyed = with_row_keys(frame)
+            probe.after = keyed
+
+        store = IncrementalStateStore(spec.runtime.incremental.path)
+        upstream = incremental_input_key(self._input_options())
+        batch_keys = [
+            key for stage, key in self._stage_keys(upstream).items() if stage != "match"
+        ]
+        state_key = batch_keys[-1] if batch_keys else upstream
+        with telemetry.measure("incremental") as probe:
+            previous = store.load(state_key)
+            plan = plan_incremental(keyed, previous)
+            probe.after = plan.pending
+
+        pending = JobDataset.from_polars(plan.pending)
+        pending.validate()
+        non_fatal_errors: list[NonFatalStageError] = []
+        runtime_ctx = self._runtime_context()
+        dataset, _, stage_rows = self._execute_stages(
+            pending,
+            runtime_ctx,
+            StageRowCounts().record("input", pending.row_count()),
+            non_fatal_errors,
+            telemetry,
+            stages=_BATCH_STAGES,
+        )
+        processed = dataset.to_polars(copy=False)
+        if ROW_KEY not in processed.columns:
+            raise StageExecutionError(
+                "incremental", f"row key column '{ROW_KEY}' was dropped during the run"
+            )
+        merged = merge_incremental(keyed, plan.reused, processed)
+        # A state stored after a non-fatal error would keep the affected rows
+        # from being reprocessed by later runs.
+        stored = not non_fatal_errors
+        if stored:
+            with telemetry.measure("incremental") as probe:
+                state = incremental_state(keyed, merged)
+                store.store(state_key, state)
+                probe.after = state
+
+        dataset, artifacts, stage_rows = self._execute_stages(
+            JobDataset.from_polars(merged.drop(ROW_KEY)),
+            runtime_ctx,
+            stage_rows,
+            non_fatal_errors,
+            telemetry,
+            stages=("match",),
+        )
+        return self._finalize(
+            dataset=dataset,
+            artifacts=artifacts,
+            stage_rows=stage_rows,
+            execution="eager",
+            telemetry=telemetry,
+            adapter_payload=adapter_payload,
+            aliasing_payload=aliasing_payload,
+            non_fatal_errors=tuple(non_fatal_errors),
+            incremental=IncrementalDiagnostics(
+                resumed=previous is not None,
+                input_rows=keyed.height,
+                processed_rows=plan.pending.height,
+                reused_rows=plan.reused.height,
+                dropped_rows=plan.dropped_rows,
+                stored=stored,
+            ),
+        )
+
+    def _run_eager(self, telemetry: TelemetryRecorder) -> PipelineRun:
+        partitions = self._input_partitions()
+        if self.pipeline_spec.runtime.incremental.enabled:
+            return self._run_incremental(partitions, telemetry)
+        if len(partitions) > 1:
+            return self._run_partitioned(partitions, telemetry)
+        random.seed(self.pipeline_spec.runtime.random_seed)
+        cache_config = self.pipeline_spec.runtime.cache
+        cache: StageCheckpointCache | None = None
+        checkpoint_keys: dict[str, str] = {}
+        if cache_config.enabled:
+            cache = StageCheckpointCache(
+                cache_config.path,
+                max_bytes=cache_config.max_bytes,
+                max_entries=cache_config.max_entries,
+            )
+            checkpoint_keys = self._checkpoint_keys(partitions[0])
+
+        resumed = self._resume_checkpoint(cache, checkpoint_keys, telemetry)
         artifacts = StageArtifacts()
+        if resumed is not None:
+            resumed_from, checkpoint = resumed
+            dataset = JobDataset.from_polars(checkpoint.frame)
+            dataset.validate()
+            stage_rows = StageRowCounts(counts=dict(checkpoint.metadata["stage_rows"]))
+            adapter_payload = dict(checkpoint.metadata["input_adapter"])
+            aliasing_payload = dict(checkpoint.metadata["input_aliasing"])
+            if resumed_from == "match":
+                artifacts = StageArtifacts(
+                    application_plan=_build_application_plan(checkpoint.frame)
+                )
+            enabled = tuple(checkpoint_keys)
+            remaining = enabled[enabled.index(resumed_from) + 1 :]
+        else:
+            with telemetry.measure("input") as probe:
+                dataset, adapter_payload, aliasing_payload = self._load_partition(
+                    partitions[0]
+                )
+                probe.after = dataset
+            stage_rows = StageRowCounts().record("input", dataset.row_count())
+            remaining = _STAGE_ORDER
+
+        runtime_ctx = self._runtime_context()
         non_fatal_errors: list[NonFatalStageError] = []
+        if cache is None:
+            dataset, artifacts, stage_rows = self._execute_stages(
+                dataset, runtime_ctx, stage_rows, non_fatal_errors, telemetry
+            )
+        else:
+            stored: list[str] = []
+            evicted = 0
+            for stage in remaining:
+                dataset, stage_artifacts, stage_rows = self._execute_stages(
+                    dataset,
+                    runtime_ctx,
+                    stage_rows,
+                    non_fatal_errors,
+                    telemetry,
+                    stages=(stage,),
+                )
+                if stage == "match":
+                    artifacts = stage_artifacts
+                # A checkpoint taken after a non-fatal error would hide that error
+                # from later runs that resume past it.
+                if non_fatal_errors or stage not in checkpoint_keys:
+                    continue
+                evicted += cache.store(
+                    checkpoint_keys[stage],
+                    dataset.to_polars(copy=False),
+                    {
+                        "stage": stage,
+                        "stage_rows": stage_rows.to_dict(),
+                        "input_adapter": adapter_payload,
+                        "input_aliasing": aliasing_payload,
+                    },
+                )
+                stored.append(stage)
+            cache_diagnostics = StageCacheDiagnostics(
+                resumed_from=resumed[0] if resumed is not None else None,
+                hits=self._checkpoint_hits(checkpoint_keys, resumed),
+                stored=tuple(stored),
+                evicted=evicted,
+            )
+
+        return self._finalize(
+            dataset=dataset,
+            artifacts=artifacts,
+            stage_rows=stage_rows,
+            execution="eager",
+            telemetry=telemetry,
+            adapter_payload=adapter_payload,
+            aliasing_payload=aliasing_payload,
+            non_fatal_errors=tuple(non_fatal_errors),
+            cache=cache_diagnostics if cache is not None else None,
+        )
+
+    def _checkpoint_keys(self, partition: InputPartition) -> dict[str, str]:
+        """Return content-addressed checkpoint keys for every enabled stage, in order."""
+        return self._stage_keys(
+            input_checkpoint_key(
+                partition.path,
+                {
+                    **self._input_options(),
+                    "hive_values": list(partition.hive_values),
+                },
+            )
+        )
+
+    def _stage_keys(self, key: str) -> dict[str, str]:
+        """Chain every enabled stage's options and plugins onto an upstream key."""
+        spec = self.pipeline_spec
+        keys: dict[str, str] = {}
+        for stage in _STAGE_ORDER:
+            options = getattr(spec.stages, stage)
+            if not options.enabled:
+                continue
+            plugins = (
+                self.plugin_registry.plugins_for_kind(cast(PluginKind, stage))
+                if stage in ("filter", "label", "rate")
+                else ()
+            )
+            payload = options.model_dump(mode="json")
+            if stage == "skills":
+                # The dictionary is keyed by content, not by its path.
+                payload["vocabulary"] = load_skill_vocabulary(
+                    options.dictionary, options.terms
+                ).fingerprint
+            key = stage_checkpoint_key(
+                key,
+                stage,
+                payload,
+                plugins,
+                spec.runtime.random_seed,
+            )
+            keys[stage] = key
+        return keys
+
+    @staticmethod
+    def _checkpoint_hits(
+        checkpoint_keys: dict[str, str],
+        resumed: tuple[str, StageCheckpoint] | None,
+    ) -> tuple[str, ...]:
+        if resumed is None:
+            return ()
+        enabled = tuple(checkpoint_keys)
+        return enabled[: enabled.index(resumed[0]) + 1]
+
+    def _resume_checkpoint(
+        self,
+        cache: StageCheckpointCache | None,
+        checkpoint_keys: dict[str, str],
+        telemetry: TelemetryRecorder,
+    ) -> tuple[str, StageCheckpoint] | None:
+        if cache is None:
+            return None
+        for stage in reversed(tuple(checkpoint_keys)):
+            with telemetry.measure("checkpoint") as probe:
+                checkpoint = cache.load(checkpoint_keys[stage])
+                probe.after = checkpoint.frame if checkpoint is not None else None
+            if checkpoint is not None:
+                return stage, checkpoint
+        return None
+
+    def _execute_stages(
+        self,
+        dataset: JobDataset,
+        runtime_ctx: RuntimeExecutionContext,
+        stage_rows: StageRowCounts,
+        non_fatal_errors: list[NonFatalStageError],
+        telemetry: TelemetryRecorder,
+        *,
+        stages: tuple[str, ...] = _STAGE_ORDER,
+    ) -> tuple[JobDataset, StageArtifacts, StageRowCounts]:
+        artifacts = StageArtifacts()
 
         def _record_non_fatal(stage: str, exc: HonestRolesError) -> None:
             non_fatal_errors.append(
@@ -115,88 +1024,102 @@ class HonestRolesRuntime:
                 )
             )
 
-        if self.pipeline_spec.stages.clean.enabled:
+        if "clean" in stages and self.pipeline_spec.stages.clean.enabled:
             try:
-                dataset = clean_stage(dataset, self.pipeline_spec.stages.clean, runtime_ctx)
+                with telemetry.measure("clean", dataset) as probe:
+                    dataset = clean_stage(
+                        dataset,
+                        self.pipeline_spec.stages.clean,
+                        runtime_ctx,
+                        html_cache=self._html_cache(),
+                    )
+                    probe.after = dataset
             except HonestRolesError as exc:
                 if self.pipeline_spec.runtime.fail_fast:
                     raise
                 _record_non_fatal("clean", exc)
             stage_rows = stage_rows.record("clean", dataset.row_count())
 
-        if self.pipeline_spec.stages.filter.enabled:
+        if "filter" in stages and self.pipeline_spec.stages.filter.enabled:
             try:
-                dataset = filter_stage(
-                    dataset,
-                    self.pipeline_spec.stages.filter,
-                    runtime_ctx,
-                    plugins=self.plugin_registry.plugins_for_kind("filter"),
-                )
+                with telemetry.measure("filter", dataset) as probe:
+                    dataset = filter_stage(
+                        dataset,
+                        self.pipeline_spec.stages.filter,
+                        runtime_ctx,
+                        plugins=self.plugin_registry.plugins_for_kind("filter"),
+                        telemetry=telemetry,
+                    )
+                    probe.after = dataset
             except HonestRolesError as exc:
                 if self.pipeline_spec.runtime.fail_fast:
                     raise
                 _record_non_fatal("filter", exc)
             stage_rows = stage_rows.record("filter", dataset.row_count())
 
-        if self.pipeline_spec.stages.label.enabled:
+        if "skills" in stages and self.pipeline_spec.stages.skills.enabled:
             try:
-                dataset = label_stage(
-                    dataset,
-                    self.pipeline_spec.stages.label,
-                    runtime_ctx,
-                    plugins=self.plugin_registry.plugins_for_kind("label"),
-                )
+                with telemetry.measure("skills", dataset) as probe:
+                    dataset = skills_stage(
+                        dataset, self.pipeline_spec.stages.skills, runtime_ctx
+                    )
+                    probe.after = dataset
+            except HonestRolesError as exc:
+                if self.pipeline_spec.runtime.fail_fast:
+                    raise
+                _record_non_fatal("skills", exc)
+            stage_rows = stage_rows.record("skills", dataset.row_count())
+
+        if "label" in stages and self.pipeline_spec.stages.label.enabled:
+            try:
+                with telemetry.measure("label", dataset) as probe:
+                    dataset = label_stage(
+                        dataset,
+                        self.pipeline_spec.stages.label,
+                        runtime_ctx,
+                        plugins=self.plugin_registry.plugins_for_kind("label"),
+                        telemetry=telemetry,
+                        categorical=self.pipeline_spec.runtime.categorical,
+                    )
+                    if self.pipeline_spec.runtime.categorical:
+                        # Label plugins may have written plain text columns.
+                        dataset = dataset.transform(encode_categorical_columns)
+                    probe.after = dataset
             except HonestRolesError as exc:
                 if self.pipeline_spec.runtime.fail_fast:
                     raise
                 _record_non_fatal("label", exc)
             stage_rows = stage_rows.record("label", dataset.row_count())
 
-        if self.pipeline_spec.stages.rate.enabled:
+        if "rate" in stages and self.pipeline_spec.stages.rate.enabled:
             try:
-                dataset = rate_stage(
-                    dataset,
-                    self.pipeline_spec.stages.rate,
-                    runtime_ctx,
-                    plugins=self.plugin_registry.plugins_for_kind("rate"),
-                )
+                with telemetry.measure("rate", dataset) as probe:
+                    dataset = rate_stage(
+                        dataset,
+                        self.pipeline_spec.stages.rate,
+                        runtime_ctx,
+                        plugins=self.plugin_registry.plugins_for_kind("rate"),
+                        telemetry=telemetry,
+                    )
+                    probe.after = dataset
             except HonestRolesError as exc:
                 if self.pipeline_spec.runtime.fail_fast:
                     raise
                 _record_non_fatal("rate", exc)
             stage_rows = stage_rows.record("rate", dataset.row_count())
 
-        if self.pipeline_spec.stages.match.enabled:
+        if "match" in stages and self.pipeline_spec.stages.match.enabled:
             try:
-                dataset, artifacts = match_stage(
-                    dataset,
-                    self.pipeline_spec.stages.match,
-                    runtime_ctx,
-                )
+                with telemetry.measure("match", dataset) as probe:
+                    dataset, artifacts = match_stage(
+                        dataset,
+                        self.pipeline_spec.stages.match,
+                        runtime_ctx,
+                    )
+                    probe.after = dataset
             except HonestRolesError as exc:
                 if self.pipeline_spec.runtime.fail_fast:
                     raise
                 _record_non_fatal("match", exc)
             stage_rows = stage_rows.record("match", dataset.row_count())
-
-        output_path: str | None = None
-        if self.pipeline_spec.output is not None:
-            write_parquet(dataset.to_polars(copy=False), self.pipeline_spec.output.path)
-            output_path = str(self.pipeline_spec.output.path)
-
-        diagnostics = RuntimeDiagnostics(
-            input_path=str(self.pipeline_spec.input.path),
-            stage_rows=stage_rows,
-            plugin_counts=plugin_counts,
-            runtime=runtime_snapshot,
-            input_adapter=InputAdapterDiagnostics.from_mapping(adapter_payload),
-            input_aliasing=InputAliasingDiagnostics.from_mapping(aliasing_payload),
-            output_path=output_path,
-            final_rows=dataset.row_count(),
-            non_fatal_errors=tuple(non_fatal_errors),
-        )
-        return PipelineRun(
-            dataset=dataset,
-            diagnostics=diagnostics,
-            application_plan=artifacts.application_plan,
-        )
+        return dataset, artifacts, stage_rows
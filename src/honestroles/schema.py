@@ -30,3 +30,17 @@ CANONICAL_JOB_SCHEMA: dict[str, CanonicalFieldSpec] = {
 }
 
 CANONICAL_SOURCE_FIELDS: tuple[str, ...] = tuple(CANONICAL_JOB_SCHEMA.keys())
+
+# Low-cardinality, non-canonical job columns that a categorical schema stores as
+# ``pl.Categorical`` (or ``pl.Enum`` where the vocabulary is fixed).
+CATEGORICAL_JOB_COLUMNS: tuple[str, ...] = (
+    "source",
+    "work_mode",
+    "employment_type",
+    "seniority",
+    "salary_currency",
+    "label_seniority",
+    "label_role_category",
+)
+
+WORK_MODES: tuple[str, ...] = ("hybrid", "onsite", "remote", "unknown")
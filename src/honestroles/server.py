@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+import hmac
+import ipaddress
+import json
+import logging
+import math
+import os
+import socketserver
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator, Mapping, Sequence
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, cast
+
+import polars as pl
+
+from honestroles.config import load_pipeline_config
+from honestroles.config.models import PipelineSpec, TableFormat
+from honestroles.errors import (
+    ConfigValidationError,
+    HonestRolesError,
+    RuntimeInitializationError,
+    StageExecutionError,
+)
+from honestroles.io import read_table
+from honestroles.plugins import PluginRegistry
+from honestroles.plugins.errors import (
+    PluginExecutionError,
+    PluginLoadError,
+    PluginValidationError,
+)
+from honestroles.runtime import HonestRolesRuntime
+
+logger = logging.getLogger(__name__)
+
+_FileKey = tuple[str, int, int]
+_FrameKey = tuple[str, int, int, tuple[str, ...] | None]
+_MAX_BODY_BYTES = 16 * 1024 * 1024
+TOKEN_ENV = "HONESTROLES_SERVE_TOKEN"
+
+
+def _file_key(path: Path) -> _FileKey:
+    try:
+        stat = path.stat()
+    except OSError as exc:
+        raise ConfigValidationError(f"cannot read config file '{path}': {exc}") from exc
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+class InputFrameCache:
+    """LRU cache of eager parquet/IPC inputs bounded by their estimated in-memory size.
+
+    Entries are keyed by path, mtime, size and projected columns, so a rewritten
+    file is read again. Frames larger than ``max_bytes`` are returned without
+    being cached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[_FrameKey, tuple[pl.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def read(
+        self,
+        path: Path,
+        kind: TableFormat = "parquet",
+        columns: tuple[str, ...] | None = None,
+    ) -> pl.DataFrame:
+        stat = Path(path).stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size, columns)
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return cached[0]
+            self.misses += 1
+        frame = read_table(path, kind, columns)
+        size = int(frame.estimated_size())
+        if size > self.max_bytes:
+            return frame
+        with self._lock:
+            # Another request may have read the same file meanwhile.
+            _, replaced = self._frames.get(key, (frame, 0))
+            self._frames[key] = (frame, size)
+            self._bytes += size - replaced
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._frames.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+        return frame
+
+    def to_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._frames),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class RuntimePool:
+    """LRU pool of warm runtimes keyed by config file state, manifest state and overrides.
+
+    Plugin registries are shared by every runtime built from the same manifest
+    file version, so plugin modules are imported once per server process.
+    """
+
+    def __init__(self, max_entries: int, inputs: InputFrameCache) -> None:
+        self.max_entries = max_entries
+        self.inputs = inputs
+        self._runtimes: OrderedDict[tuple[Any, ...], HonestRolesRuntime] = OrderedDict()
+        self._registries: OrderedDict[_FileKey, PluginRegistry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        pipeline_config: str | Path,
+        plugin_manifest: str | Path | None = None,
+        overrides: Mapping[str, Any] | None = None,
+    ) -> HonestRolesRuntime:
+        pipeline_path = Path(pipeline_config).expanduser().resolve()
+        manifest_path = (
+            Path(plugin_manifest).expanduser().resolve() if plugin_manifest else None
+        )
+        manifest_key = _file_key(manifest_path) if manifest_path is not None else None
+        key = (
+            _file_key(pipeline_path),
+            manifest_key,
+            json.dumps(dict(overrides or {}), sort_keys=True, default=str),
+        )
+        with self._lock:
+            runtime = self._runtimes.get(key)
+            if runtime is not None:
+                self._runtimes.move_to_end(key)
+                self.hits += 1
+                return runtime
+            self.misses += 1
+            try:
+                runtime = HonestRolesRuntime(
+                    pipeline_spec=load_pipeline_config(pipeline_path, overrides),
+                    plugin_registry=self._registry(manifest_path, manifest_key),
+                    pipeline_config_path=pipeline_path,
+                    plugin_manifest_path=manifest_path,
+                    input_reader=self.inputs.read,
+                )
+            except HonestRolesError:
+                raise
+            except Exception as exc:
+                raise RuntimeInitializationError(pipeline_path, str(exc)) from exc
+            self._runtimes[key] = runtime
+            while len(self._runtimes) > self.max_entries:
+                self._runtimes.popitem(last=False)
+                self.evictions += 1
+            return runtime
+
+    def _registry(self, path: Path | None, key: _FileKey | None) -> PluginRegistry:
+        if path is None or key is None:
+            return PluginRegistry()
+        registry = self._registries.get(key)
+        if registry is None:
+            registry = PluginRegistry.from_manifest(path)
+            self._registries[key] = registry
+            while len(self._registries) > self.max_entries:
+                self._registries.popitem(last=False)
+        else:
+            self._registries.move_to_end(key)
+        return registry
+
+    def to_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._runtimes),
+                "max_entries": self.max_entries,
+                "plugin_registries": len(self._registries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class LatencyMetrics:
+    """Per-route request counts and latency percentiles over a sliding window."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self.window = window
+        self._routes: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route: str, elapsed_ms: float, *, ok: bool) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(
+                route,
+                {"requests": 0, "errors": 0, "total_ms": 0.0, "recent": deque(maxlen=self.window)},
+            )
+            entry["requests"] += 1
+            entry["errors"] += 0 if ok else 1
+            entry["total_ms"] += elapsed_ms
+            entry["recent"].append(elapsed_ms)
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            payload: dict[str, dict[str, Any]] = {}
+            for route, entry in sorted(self._routes.items()):
+                recent = sorted(entry["recent"])
+                payload[route] = {
+                    "requests": entry["requests"],
+                    "errors": entry["errors"],
+                    "mean_ms": round(entry["total_ms"] / entry["requests"], 3),
+                    "p50_ms": round(_percentile(recent, 0.50), 3),
+                    "p95_ms": round(_percentile(recent, 0.95), 3),
+                    "p99_ms": round(_percentile(recent, 0.99), 3),
+                    "max_ms": round(recent[-1], 3),
+                }
+            return payload
+
+
+def _percentile(ordered: list[float], quantile: float) -> float:
+    # Nearest-rank percentile over an already sorted, non-empty window.
+    return ordered[max(0, math.ceil(quantile * len(ordered)) - 1)]
+
+
+class RuntimeService:
+    """Transport-independent core of ``honestroles serve``.
+
+    Every file a request names or configures, including the input, output,
+    caches and plugin manifest, must be inside one of ``roots`` (the current
+    directory by default). Runs execute one at a time: they seed the global
+    ``random`` module, may start ``tracemalloc`` and set thread limits for
+    worker processes through the environment, all of which are process-wide.
+    """
+
+    def __init__(
+        self,
+        *,
+        roots: Sequence[str | Path] = (),
+        max_runtimes: int = 16,
+        input_cache_bytes: int = 1024**3,
+        latency_window: int = 1024,
+    ) -> None:
+        self.roots = tuple(Path(root).expanduser().resolve() for root in roots) or (
+            Path.cwd().resolve(),
+        )
+        self.inputs = InputFrameCache(input_cache_bytes)
+        self.runtimes = RuntimePool(max_runtimes, self.inputs)
+        self.latency = LatencyMetrics(latency_window)
+        self.started = time.monotonic()
+        self._run_lock = threading.Lock()
+
+    def run(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        """Run one pipeline request and return its diagnostics and outputs.
+
+        ``request`` holds ``pipeline_config``, optional ``plugins``, optional
+        ``overrides`` (tables deep-merged into the pipeline TOML) and optional
+        ``rows`` (how many output rows to return inline).
+        """
+        pipeline_config = request.get("pipeline_config")
+        if not isinstance(pipeline_config, str) or not pipeline_config:
+            raise ConfigValidationError("run request requires a 'pipeline_config' path")
+        plugins = request.get("plugins")
+        if plugins is not None and not isinstance(plugins, str):
+            raise ConfigValidationError("run request 'plugins' must be a path")
+        overrides = request.get("overrides") or {}
+        if not isinstance(overrides, Mapping):
+            raise ConfigValidationError("run request 'overrides' must be an object")
+        rows = request.get("rows", 0)
+        if not isinstance(rows, int) or isinstance(rows, bool) or rows < 0:
+            raise ConfigValidationError("run request 'rows' must be an integer >= 0")
+
+        self._check_path(pipeline_config, "pipeline_config")
+        if plugins is not None:
+            self._check_path(plugins, "plugins")
+        runtime = self.runtimes.get(pipeline_config, plugins, overrides)
+        for field, path in _spec_paths(runtime.pipeline_spec):
+            self._check_path(path, field)
+        with self._run_lock:
+            result = runtime.run()
+        payload: dict[str, Any] = {
+            "diagnostics": result.diagnostics.to_dict(),
+            "application_plan": [entry.to_dict() for entry in result.application_plan],
+        }
+        if rows:
+            payload["rows"] = result.dataset.to_polars(copy=False).head(rows).to_dicts()
+        return payload
+
+    def _check_path(self, path: str | Path, field: str) -> None:
+        resolved = Path(path).expanduser().resolve()
+        if not any(resolved.is_relative_to(root) for root in self.roots):
+            raise ConfigValidationError(
+                f"run request {field} '{resolved}' is outside the served roots"
+            )
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+            "requests": self.latency.to_dict(),
+            "runtimes": self.runtimes.to_dict(),
+            "inputs": self.inputs.to_dict(),
+        }
+
+
+def _spec_paths(spec: PipelineSpec) -> Iterator[tuple[str, Path]]:
+    yield "input.path", spec.input.path
+    if spec.output is not None:
+        yield "output.path", spec.output.path
+    if spec.stages.skills.dictionary is not None:
+        yield "stages.skills.dictionary", spec.stages.skills.dictionary
+    runtime = spec.runtime
+    yield "runtime.cache.path", runtime.cache.path
+    yield "runtime.html_cache.path", runtime.html_cache.path
+    yield "runtime.incremental.path", runtime.incremental.path
+    yield "runtime.sharding.path", runtime.sharding.path
+
+
+def _error_status(exc: Exception) -> HTTPStatus:
+    if isinstance(exc, (ConfigValidationError, RuntimeInitializationError)):
+        return HTTPStatus.BAD_REQUEST
+    if isinstance(
+        exc,
+        (PluginLoadError, PluginValidationError, PluginExecutionError, StageExecutionError),
+    ):
+        return HTTPStatus.UNPROCESSABLE_ENTITY
+    return HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = "honestroles"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._respond("/health", lambda: {"status": "ok"})
+        elif self._authorized():
+            if self.path == "/metrics":
+                self._respond("/metrics", self._service.metrics)
+            else:
+                self._not_found()
+
+    def do_POST(self) -> None:
+        if self.path == "/run" and self._token_valid():
+            self._respond("/run", lambda: self._service.run(self._read_json()))
+            return
+        # A rejected body is never read, so the connection cannot be reused.
+        self.close_connection = True
+        if self._authorized():
+            self._not_found()
+
+    @property
+    def _server(self) -> _ServiceServer:
+        return cast(_ServiceServer, self.server)
+
+    @property
+    def _service(self) -> RuntimeService:
+        return self._server.service
+
+    def _token_valid(self) -> bool:
+        token = self._server.token
+        if token is None:
+            return True
+        header = self.headers.get("Authorization") or ""
+        return hmac.compare_digest(header.encode("utf-8"), f"Bearer {token}".encode())
+
+    def _authorized(self) -> bool:
+        if self._token_valid():
+            return True
+        self._send(
+            HTTPStatus.UNAUTHORIZED,
+            {"error": {"type": "Unauthorized", "message": "missing or invalid bearer token"}},
+        )
+        return False
+
+    def _not_found(self) -> None:
+        self._send(HTTPStatus.NOT_FOUND, {"error": {"type": "NotFound", "message": self.path}})
+
+    def _read_json(self) -> Mapping[str, Any]:
+        header = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            raise ConfigValidationError(f"invalid Content-Length header '{header}'")
+        if length > _MAX_BODY_BYTES:
+            self.close_connection = True
+            raise ConfigValidationError("request body is too large")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as exc:
+            raise ConfigValidationError(f"invalid JSON request body: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise ConfigValidationError("request body must be a JSON object")
+        return payload
+
+    def _respond(self, route: str, action: Any) -> None:
+        started = time.perf_counter()
+        try:
+            status, payload = HTTPStatus.OK, action()
+        except Exception as exc:  # noqa: BLE001 - unexpected errors become a 500 response
+            status = _error_status(exc)
+            payload = {"error": {"type": exc.__class__.__name__, "message": str(exc)}}
+        self._service.latency.observe(
+            route, (time.perf_counter() - started) * 1000, ok=status == HTTPStatus.OK
+        )
+        self._send(status, payload)
+
+    def _send(self, status: HTTPStatus, payload: Mapping[str, Any]) -> None:
+        body = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Request latency is reported through /metrics instead of stderr.
+        return
+
+
+class _ServiceServer(socketserver.BaseServer):
+    service: RuntimeService
+    token: str | None
+
+
+class _ThreadingTCPHTTPServer(ThreadingHTTPServer, _ServiceServer):
+    pass
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer, _ServiceServer
+):
+    daemon_threads = True
+
+    def get_request(self) -> tuple[Any, Any]:
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects an (address, port) client address.
+        return request, ("local", 0)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def create_server(
+    service: RuntimeService,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | Path | None = None,
+    token: str | None = None,
+) -> socketserver.BaseServer:
+    """Bind an HTTP server for ``service`` on a TCP port or a Unix socket path.
+
+    With ``token``, every route except ``/health`` requires an
+    ``Authorization: Bearer <token>`` header. A TCP host other than loopback
+    requires a token. A Unix socket is created readable by its owner only.
+    """
+    server: _ServiceServer
+    if socket_path is not None:
+        path = Path(socket_path).expanduser()
+        if path.exists():
+            path.unlink()
+        previous_umask = os.umask(0o177)
+        try:
+            server = _ThreadingUnixHTTPServer(str(path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+    else:
+        if token is None and not _is_loopback(host):
+            raise ConfigValidationError(
+                f"serving on non-loopback host '{host}' requires a token in {TOKEN_ENV}"
+            )
+        server = _ThreadingTCPHTTPServer((host, port), _RequestHandler)
+    server.service = service
+    server.token = token
+    return server
+
+
+def server_address(server: socketserver.BaseServer) -> str:
+    address = server.server_address
+    if isinstance(address, tuple):
+        host, port = address[:2]
+        return f"http://{host}:{port}"
+    # Unix socket addresses are the str or bytes path the server was bound to.
+    path = os.fsdecode(cast("str | bytes", address))
+    return f"unix:{path}"
+
+
+def serve(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | Path | None = None,
+    roots: Sequence[str | Path] = (),
+    token: str | None = None,
+    max_runtimes: int = 16,
+    input_cache_bytes: int = 1024**3,
+) -> None:
+    """Serve run requests until interrupted."""
+    service = RuntimeService(
+        roots=roots, max_runtimes=max_runtimes, input_cache_bytes=input_cache_bytes
+    )
+    server = create_server(
+        service, host=host, port=port, socket_path=socket_path, token=token
+    )
+    logger.info(json.dumps({"listening": server_address(server)}))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path is not None:
+            Path(socket_path).expanduser().unlink(missing_ok=True)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from honestroles.config.models import IpcWriterConfig
+from honestroles.diagnostics import ShardDiagnostics, StageTelemetry
+from honestroles.errors import ConfigValidationError
+from honestroles.io import write_ipc
+
+# Global input position of each row, kept through the batch stages so a merge
+# restores single-node input order (and with it the match tie-break).
+SHARD_ROW = "__honestroles_shard_row"
+_SHARD_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_MANIFEST_SUFFIX = ".json"
+_FRAME_WRITER = IpcWriterConfig(compression="lz4")
+
+
+@dataclass(frozen=True, slots=True)
+class ShardSpec:
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1:
+            raise ConfigValidationError("shard count must be >= 1")
+        if not 0 <= self.index < self.count:
+            raise ConfigValidationError(
+                f"shard index must be in [0, {self.count - 1}], got {self.index}"
+            )
+
+    @classmethod
+    def parse(cls, value: str) -> ShardSpec:
+        """Parse ``i/N`` (zero-based shard ``i`` of ``N``)."""
+        match = _SHARD_RE.match(value)
+        if match is None:
+            raise ConfigValidationError(
+                f"invalid shard '{value}', expected 'i/N' such as '0/4'"
+            )
+        return cls(index=int(match.group(1)), count=int(match.group(2)))
+
+    @property
+    def stem(self) -> str:
+        return f"shard-{self.index:05d}-of-{self.count:05d}"
+
+
+def shard_of(key: str, count: int) -> pl.Expr:
+    """Assign each row to a shard by the CRC-32 of its ``key`` column.
+
+    Polars' own hash is only stable within one release; CRC-32 gives every node
+    the same assignment whatever it runs. Null keys hash like the empty string.
+    """
+
+    def _assign(values: pl.Series) -> pl.Series:
+        return pl.Series(
+            [zlib.crc32(value.encode("utf-8")) % count for value in values],
+            dtype=pl.UInt32,
+        )
+
+    return (
+        pl.col(key)
+        .cast(pl.String)
+        .fill_null("")
+        .map_batches(_assign, return_dtype=pl.UInt32)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ShardManifest:
+    """Everything a merge needs from one shard besides its frames."""
+
+    run_key: str
+    diagnostics: ShardDiagnostics
+    telemetry: tuple[StageTelemetry, ...] = ()
+    input_adapter: dict[str, Any] | None = None
+    input_aliasing: dict[str, Any] | None = None
+    candidates: bool = False
+
+    @classmethod
+    def from_mapping(cls, payload: Mapping[str, Any]) -> ShardManifest:
+        return cls(
+            run_key=str(payload["run_key"]),
+            diagnostics=ShardDiagnostics.from_mapping(payload["shard"]),
+            telemetry=tuple(
+                StageTelemetry.from_mapping(item) for item in payload.get("telemetry", ())
+            ),
+            input_adapter=dict(payload.get("input_adapter") or {}),
+            input_aliasing=dict(payload.get("input_aliasing") or {}),
+            candidates=bool(payload.get("candidates", False)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "run_key": self.run_key,
+            "shard": self.diagnostics.to_dict(),
+            "telemetry": [item.to_dict() for item in self.telemetry],
+            "input_adapter": dict(self.input_adapter or {}),
+            "input_aliasing": dict(self.input_aliasing or {}),
+            "candidates": self.candidates,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class StoredShard:
+    manifest: ShardManifest
+    output_path: Path
+    candidates_path: Path | None = None
+
+    def read_output(self) -> pl.DataFrame:
+        return pl.read_ipc(self.output_path, memory_map=False)
+
+    def read_candidates(self) -> pl.DataFrame:
+        if self.candidates_path is None:
+            raise ConfigValidationError(
+                f"shard {self.manifest.diagnostics.index} stored no match candidates"
+            )
+        return pl.read_ipc(self.candidates_path, memory_map=False)
+
+
+class ShardStore:
+    """Shard outputs in a directory every node can reach.
+
+    Each shard writes ``<stem>.output.arrow`` (its rows after rate), optionally
+    ``<stem>.candidates.arrow`` (its match top-k), and then ``<stem>.json``. The
+    manifest is renamed into place last, so a shard is complete once it exists.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root).expanduser().resolve()
+
+    def store(
+        self,
+        spec: ShardSpec,
+        manifest: ShardManifest,
+        output: pl.DataFrame,
+        candidates: pl.DataFrame | None = None,
+    ) -> Path:
+        self.root.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.root / f"{spec.stem}{_MANIFEST_SUFFIX}"
+        # Retract an older manifest first so a merge never pairs it with new frames.
+        manifest_path.unlink(missing_ok=True)
+        write_ipc(output, self.root / f"{spec.stem}.output.arrow", _FRAME_WRITER)
+        candidates_path = self.root / f"{spec.stem}.candidates.arrow"
+        if candidates is not None:
+            write_ipc(candidates, candidates_path, _FRAME_WRITER)
+        else:
+            candidates_path.unlink(missing_ok=True)
+        staging = manifest_path.with_name(f".{manifest_path.name}.tmp")
+        staging.write_text(
+            json.dumps(manifest.to_dict(), sort_keys=True), encoding="utf-8"
+        )
+        os.replace(staging, manifest_path)
+        return manifest_path
+
+    def load(self, run_key: str) -> tuple[StoredShard, ...]:
+        """Return the complete shard set for ``run_key`` in shard order."""
+        shards: dict[int, StoredShard] = {}
+        counts: set[int] = set()
+        for path in sorted(self.root.glob(f"shard-*{_MANIFEST_SUFFIX}")):
+            try:
+                manifest = ShardManifest.from_mapping(
+                    json.loads(path.read_text(encoding="utf-8"))
+                )
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                raise ConfigValidationError(
+                    f"invalid shard manifest '{path}': {exc}"
+                ) from exc
+            if manifest.run_key != run_key:
+                continue
+            stem = path.name.removesuffix(_MANIFEST_SUFFIX)
+            counts.add(manifest.diagnostics.count)
+            shards[manifest.diagnostics.index] = StoredShard(
+                manifest=manifest,
+                output_path=self.root / f"{stem}.output.arrow",
+                candidates_path=(
+                    self.root / f"{stem}.candidates.arrow" if manifest.candidates else None
+                ),
+            )
+        if not shards:
+            raise ConfigValidationError(
+                f"no shards for this pipeline config in '{self.root}'"
+            )
+        if len(counts) > 1:
+            raise ConfigValidationError(
+                f"shards in '{self.root}' come from runs with different shard counts "
+                f"{sorted(counts)}; remove the stale shard files"
+            )
+        (count,) = counts
+        missing = sorted(set(range(count)) - set(shards))
+        if missing:
+            raise ConfigValidationError(
+                f"missing shards {', '.join(str(index) for index in missing)} of {count} "
+                f"in '{self.root}'"
+            )
+        return tuple(shards[index] for index in range(count))
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import polars as pl
+
+from honestroles.errors import ConfigValidationError
+
+# Separators are folded to single spaces so aliases can be matched as whole,
+# space-bounded tokens; ``+``, ``#`` and inner dots stay significant (c++, c#,
+# node.js) while sentence-ending dots do not.
+_SEPARATORS = r"\.+\s|[^\w +#.]"
+_SEPARATORS_RE = re.compile(_SEPARATORS)
+
+
+def normalize_skill_text(text: str) -> str:
+    """Normalize an alias exactly as :func:`skill_text_expr` normalizes job text."""
+    return " ".join(_SEPARATORS_RE.sub(" ", f"{text.lower()} ").split())
+
+
+def skill_text_expr() -> pl.Expr:
+    """Space-padded, lowercased ``title + description_text`` used for skill matching."""
+    return (
+        pl.concat_str(
+            [
+                pl.lit(" "),
+                pl.col("title").cast(pl.String, strict=False).fill_null(""),
+                pl.lit(" "),
+                pl.col("description_text").cast(pl.String, strict=False).fill_null(""),
+                pl.lit(" "),
+            ],
+            separator="",
+        )
+        .str.to_lowercase()
+        .str.replace_all(_SEPARATORS, " ")
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SkillVocabulary:
+    """Normalized alias to canonical skill mapping compiled from a skill dictionary."""
+
+    aliases: dict[str, str]
+
+    @property
+    def fingerprint(self) -> str:
+        encoded = json.dumps(self.aliases, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def extract_expr(self) -> pl.Expr:
+        """Canonical skills found in :func:`skill_text_expr`, unique and sorted.
+
+        All aliases run through one overlapping Aho-Corasick ``extract_many`` pass,
+        so cost grows with text length rather than with vocabulary size.
+        """
+        if not self.aliases:
+            return pl.lit([], dtype=pl.List(pl.String))
+        patterns = {f" {alias} ": skill for alias, skill in self.aliases.items()}
+        return (
+            skill_text_expr()
+            .str.extract_many(list(patterns), overlapping=True)
+            .list.eval(
+                pl.element().replace_strict(patterns, default=None, return_dtype=pl.String)
+            )
+            .list.unique()
+            .list.sort()
+        )
+
+
+def _read_dictionary(path: Path) -> Mapping[str, object]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ConfigValidationError(f"invalid skill dictionary '{path}': {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ConfigValidationError(
+            f"invalid skill dictionary '{path}': expected an object of skill -> aliases"
+        )
+    return payload
+
+
+def _add_skill(aliases: dict[str, str], skill: object, raw_aliases: object, source: str) -> None:
+    if not isinstance(skill, str) or not skill.strip():
+        raise ConfigValidationError(
+            f"invalid skill entry in {source}: skill names must be non-empty strings"
+        )
+    if not isinstance(raw_aliases, Sequence) or isinstance(raw_aliases, str):
+        raise ConfigValidationError(
+            f"invalid skill entry '{skill}' in {source}: aliases must be a list"
+        )
+    canonical = skill.strip()
+    for alias in (canonical, *raw_aliases):
+        if not isinstance(alias, str):
+            raise ConfigValidationError(
+                f"invalid skill entry '{skill}' in {source}: aliases must be strings"
+            )
+        normalized = normalize_skill_text(alias)
+        if normalized:
+            # The first skill to claim an alias keeps it.
+            aliases.setdefault(normalized, canonical)
+
+
+@lru_cache(maxsize=8)
+def _compile_vocabulary(
+    dictionary: str | None,
+    dictionary_mtime_ns: int,
+    dictionary_size: int,
+    terms_json: str,
+) -> SkillVocabulary:
+    _ = (dictionary_mtime_ns, dictionary_size)
+    aliases: dict[str, str] = {}
+    for skill, raw_aliases in json.loads(terms_json):
+        _add_skill(aliases, skill, raw_aliases, "stages.skills.terms")
+    if dictionary is not None:
+        for skill, raw_aliases in _read_dictionary(Path(dictionary)).items():
+            _add_skill(aliases, skill, raw_aliases, f"'{dictionary}'")
+    return SkillVocabulary(aliases=aliases)
+
+
+def load_skill_vocabulary(
+    dictionary: Path | None,
+    terms: Mapping[str, Sequence[str]] | None = None,
+) -> SkillVocabulary:
+    """Compile inline ``terms`` and a JSON ``{"skill": ["alias", ...]}`` dictionary.
+
+    Inline terms win alias conflicts over the dictionary file. Compiled
+    vocabularies are cached in-process and invalidated when the file changes.
+    """
+    mtime_ns = size = 0
+    if dictionary is not None:
+        try:
+            stat = dictionary.stat()
+        except OSError as exc:
+            raise ConfigValidationError(f"skill dictionary does not exist: '{dictionary}'") from exc
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    terms_json = json.dumps([[skill, list(aliases)] for skill, aliases in (terms or {}).items()])
+    return _compile_vocabulary(
+        str(dictionary) if dictionary is not None else None, mtime_ns, size, terms_json
+    )
@@ -1,88 +1,164 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from html import unescape
+from functools import lru_cache
+from itertools import groupby
+import json
+import os
+from typing import Callable, TypeVar, cast
 
 import polars as pl
 
 from honestroles.config.models import (
     CleanStageOptions,
     FilterStageOptions,
+    LabelRuleConfig,
     LabelStageOptions,
+    LabelTaxonomyConfig,
     MatchStageOptions,
     RateStageOptions,
+    SkillStageOptions,
 )
 from honestroles.domain import ApplicationPlanEntry, JobDataset
 from honestroles.errors import StageExecutionError
+from honestroles.html_text import HtmlTextCache, html_to_text_expr
 from honestroles.plugins.errors import PluginExecutionError
+from honestroles.plugins.isolation import run_isolated_plugin
 from honestroles.plugins.types import (
     FilterStageContext,
     LabelStageContext,
     PluginDefinition,
+    PluginExpressions,
     RateStageContext,
     RuntimeExecutionContext,
+    StageContext,
 )
+from honestroles.schema import CANONICAL_JOB_SCHEMA
+from honestroles.skills import load_skill_vocabulary
+from honestroles.telemetry import TelemetryRecorder, measure
+
+_FrameT = TypeVar("_FrameT", pl.DataFrame, pl.LazyFrame)
+# Runners build the context from the stage's context type and check what the
+# plugin returned, so they call ``PluginDefinition.func`` through these.
+_DatasetPluginCall = Callable[[JobDataset, StageContext], object]
+_ExpressionPluginCall = Callable[[pl.Schema, StageContext], object]
+_KEYWORD_TEXT = "__honestroles_keyword_text"
+_RANK_INDEX = "__honestroles_rank_index"
+_LABEL_MATCHES = "__honestroles_label_matches_{source}"
+_BUILTIN_TAXONOMIES = (
+    LabelTaxonomyConfig(
+        column="label_seniority",
+        default="mid",
+        rules=(
+            LabelRuleConfig(value="junior", keywords=("intern", "junior", "entry")),
+            LabelRuleConfig(value="senior", keywords=("senior", "staff", "principal")),
+        ),
+    ),
+    LabelTaxonomyConfig(
+        column="label_role_category",
+        default="other",
+        rules=(
+            LabelRuleConfig(value="data", keywords=("data",)),
+            LabelRuleConfig(value="ml", keywords=("machine learning", "ml", "ai")),
+            LabelRuleConfig(value="backend", keywords=("backend", "platform", "infra")),
+        ),
+    ),
+)
+
 
 @dataclass(frozen=True, slots=True)
 class StageArtifacts:
     application_plan: tuple[ApplicationPlanEntry, ...] = ()
 
 
-def _clean_text_expr(column: str) -> pl.Expr:
-    return (
-        pl.col(column)
-        .cast(pl.String, strict=False)
-        .str.replace_all(r"(?is)<[^>]*>", " ")
-        .str.replace_all(r"\\s+", " ")
-        .str.strip_chars()
+def _frame_columns(frame: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    if isinstance(frame, pl.LazyFrame):
+        return frame.collect_schema().names()
+    return frame.columns
+
+
+def _clean_text_expr(column: str, html_cache: HtmlTextCache | None = None) -> pl.Expr:
+    return html_to_text_expr(pl.col(column), html_cache)
+
+
+def _clean_frame(
+    frame: _FrameT, options: CleanStageOptions, html_cache: HtmlTextCache | None = None
+) -> _FrameT:
+    text_expr = pl.col("description_text").cast(pl.String, strict=False).str.strip_chars()
+    if options.strip_html:
+        html_raw = pl.col("description_html").cast(pl.String, strict=False)
+        frame = frame.with_columns(
+            pl.when(html_raw.is_not_null() & (html_raw.str.strip_chars() != ""))
+            .then(_clean_text_expr("description_html", html_cache))
+            .otherwise(text_expr)
+            .alias("description_text")
+        )
+    else:
+        frame = frame.with_columns(text_expr.alias("description_text"))
+
+    frame = frame.with_columns(
+        pl.col("title").cast(pl.String, strict=False).str.strip_chars().alias("title"),
+        pl.col("company").cast(pl.String, strict=False).str.strip_chars().alias("company"),
+        pl.col("location").cast(pl.String, strict=False).alias("location"),
+        pl.col("apply_url").cast(pl.String, strict=False).alias("apply_url"),
+        pl.col("description_text").cast(pl.String, strict=False).alias("description_text"),
     )
 
+    if options.drop_null_titles:
+        frame = frame.filter(pl.col("title").is_not_null() & (pl.col("title") != ""))
+    if options.drop_columns:
+        frame = _drop_cleaned_columns(frame, options.drop_columns)
+    return frame
+
+
+def _drop_cleaned_columns(frame: _FrameT, columns: tuple[str, ...]) -> _FrameT:
+    """Release ``columns`` once clean has read them; canonical ones become typed nulls."""
+    schema = frame.collect_schema()
+    canonical = [name for name in columns if name in CANONICAL_JOB_SCHEMA and name in schema]
+    extra = [name for name in columns if name not in CANONICAL_JOB_SCHEMA and name in schema]
+    if canonical:
+        frame = frame.with_columns(
+            pl.lit(None, dtype=schema[name]).alias(name) for name in canonical
+        )
+    return frame.drop(extra) if extra else frame
+
 
 def clean_stage(
     dataset: JobDataset,
     options: CleanStageOptions,
     runtime: RuntimeExecutionContext,
+    *,
+    html_cache: HtmlTextCache | None = None,
 ) -> JobDataset:
     _ = runtime
     try:
         dataset.validate()
-        frame = dataset.to_polars(copy=False)
-        text_expr = pl.col("description_text").cast(pl.String, strict=False).str.strip_chars()
-        if options.strip_html:
-            html_raw = pl.col("description_html").cast(pl.String, strict=False)
-            frame = frame.with_columns(
-                pl.when(html_raw.is_not_null() & (html_raw.str.strip_chars() != ""))
-                .then(_clean_text_expr("description_html"))
-                .otherwise(text_expr)
-                .alias("description_text")
-            )
-        else:
-            frame = frame.with_columns(text_expr.alias("description_text"))
-
-        frame = frame.with_columns(
-            pl.col("title").cast(pl.String, strict=False).str.strip_chars().alias("title"),
-            pl.col("company").cast(pl.String, strict=False).str.strip_chars().alias("company"),
-            pl.col("location").cast(pl.String, strict=False).alias("location"),
-            pl.col("apply_url").cast(pl.String, strict=False).alias("apply_url"),
-            pl.col("description_text").cast(pl.String, strict=False).alias("description_text"),
+        return dataset._with_trusted_frame(
+            _clean_frame(dataset.to_polars(copy=False), options, html_cache)
         )
-
-        if options.drop_null_titles:
-            frame = frame.filter(pl.col("title").is_not_null() & (pl.col("title") != ""))
-        return dataset.with_frame(frame)
     except Exception as exc:
         raise StageExecutionError("clean", str(exc)) from exc
 
 
-def _apply_filter_options(df: pl.DataFrame, options: FilterStageOptions) -> pl.DataFrame:
+def _apply_filter_options(df: _FrameT, options: FilterStageOptions) -> _FrameT:
     frame = df
     if options.remote_only:
         frame = frame.filter(pl.col("remote") == pl.lit(True))
     if options.min_salary is not None:
         salary_expr = pl.coalesce([pl.col("salary_min"), pl.col("salary_max")])
         frame = frame.filter(salary_expr >= pl.lit(options.min_salary))
-    if options.required_keywords:
-        text = pl.concat_str(
+    return _apply_keyword_filter(frame, options)
+
+
+def _normalize_terms(terms: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(term.strip().lower() for term in terms if term.strip()))
+
+
+def _search_text_expr(source: str) -> pl.Expr:
+    """Lowercased text for keyword matching; ``text`` joins title and description."""
+    if source == "text":
+        return pl.concat_str(
             [
                 pl.col("title").fill_null(""),
                 pl.lit(" "),
@@ -90,30 +166,198 @@ def _apply_filter_options(df: pl.DataFrame, options: FilterStageOptions) -> pl.D
             ],
             separator="",
         ).str.to_lowercase()
-        for keyword in options.required_keywords:
-            term = keyword.strip().lower()
-            if term:
-                frame = frame.filter(text.str.contains(term, literal=True))
+    return pl.col(source).cast(pl.String, strict=False).fill_null("").str.to_lowercase()
+
+
+def _apply_keyword_filter(frame: _FrameT, options: FilterStageOptions) -> _FrameT:
+    """Evaluate every keyword condition against one normalized text column.
+
+    ``required_keywords`` must all match. Each keyword group must match all of
+    ``all_of``, at least one of ``any_of`` (when set), and none of ``none_of``.
+    The text is lowercased once; ``any_of``/``none_of`` sets run as a single
+    Aho-Corasick ``contains_any`` pass each and all conditions share one filter.
+    """
+    groups: list[tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = [
+        (_normalize_terms(options.required_keywords), (), ())
+    ]
+    groups.extend(
+        (
+            _normalize_terms(group.all_of),
+            _normalize_terms(group.any_of),
+            _normalize_terms(group.none_of),
+        )
+        for group in options.keyword_groups
+    )
+    text = pl.col(_KEYWORD_TEXT)
+    conditions: list[pl.Expr] = []
+    for all_of, any_of, none_of in groups:
+        conditions.extend(text.str.contains(term, literal=True) for term in all_of)
+        if any_of:
+            conditions.append(text.str.contains_any(list(any_of)))
+        if none_of:
+            conditions.append(~text.str.contains_any(list(none_of)))
+    if not conditions:
+        return frame
+
+    return (
+        frame.with_columns(_search_text_expr("text").alias(_KEYWORD_TEXT))
+        .filter(pl.all_horizontal(conditions))
+        .drop(_KEYWORD_TEXT)
+    )
+
+
+def _call_expression_plugin(
+    plugin: PluginDefinition, schema: pl.Schema, ctx: StageContext
+) -> PluginExpressions:
+    try:
+        result = cast(_ExpressionPluginCall, plugin.func)(schema, ctx)
+    except Exception as exc:
+        raise PluginExecutionError(plugin.name, plugin.kind, str(exc)) from exc
+    if not isinstance(result, PluginExpressions):
+        raise PluginExecutionError(
+            plugin.name,
+            plugin.kind,
+            f"returned invalid type '{type(result).__name__}', expected PluginExpressions",
+        )
+    if plugin.kind == "filter":
+        if result.predicate is None or result.columns:
+            raise PluginExecutionError(
+                plugin.name, plugin.kind, "filter expressions must set only a predicate"
+            )
+    elif result.predicate is not None or not result.columns:
+        raise PluginExecutionError(
+            plugin.name, plugin.kind, f"{plugin.kind} expressions must set only columns"
+        )
+    missing = sorted(set(result.reads) - set(schema.names()))
+    if missing:
+        raise PluginExecutionError(
+            plugin.name, plugin.kind, f"reads unknown columns: {', '.join(missing)}"
+        )
+    return result
+
+
+def _fuse_expressions(
+    frame: _FrameT, batch: list[tuple[PluginDefinition, PluginExpressions]]
+) -> _FrameT:
+    columns = [
+        expr.alias(name) for _, result in batch for name, expr in result.columns.items()
+    ]
+    predicates = [result.predicate for _, result in batch if result.predicate is not None]
+    if columns:
+        frame = frame.with_columns(columns)
+    if predicates:
+        frame = frame.filter(pl.all_horizontal(predicates))
     return frame
 
 
-def _run_filter_plugins(
-    dataset: JobDataset,
+def _apply_expression_batch(
+    frame: _FrameT, batch: list[tuple[PluginDefinition, PluginExpressions]]
+) -> _FrameT:
+    try:
+        return _fuse_expressions(frame, batch)
+    except Exception as exc:
+        # Attribute the failure to the first plugin that also fails on its own.
+        for plugin, result in batch:
+            try:
+                _fuse_expressions(frame, [(plugin, result)])
+            except Exception as plugin_exc:
+                raise PluginExecutionError(
+                    plugin.name, plugin.kind, str(plugin_exc)
+                ) from plugin_exc
+        plugin = batch[0][0]
+        names = ", ".join(item.name for item, _ in batch)
+        raise PluginExecutionError(names, plugin.kind, str(exc)) from exc
+
+
+def _run_expression_plugins(
+    frame: _FrameT,
     plugins: tuple[PluginDefinition, ...],
     runtime: RuntimeExecutionContext,
-) -> JobDataset:
-    dataset.validate()
-    result = dataset
+    context_type: type[StageContext],
+) -> _FrameT:
+    """Apply consecutive expression plugins in as few fused passes as possible.
+
+    A plugin starts a new pass only when it reads or rewrites a column written
+    earlier in the current pass, so independent plugins share one pass.
+    """
+    batch: list[tuple[PluginDefinition, PluginExpressions]] = []
+    written: set[str] = set()
     for plugin in plugins:
-        ctx = FilterStageContext(
+        ctx = context_type(
             plugin_name=plugin.name,
             settings=plugin.settings,
             runtime=runtime,
         )
-        try:
-            candidate = plugin.func(result, ctx)
-        except Exception as exc:
-            raise PluginExecutionError(plugin.name, plugin.kind, str(exc)) from exc
+        schema = _fuse_expressions(frame.lazy(), batch).collect_schema()
+        result = _call_expression_plugin(plugin, schema, ctx)
+        if written & (set(result.reads) | set(result.columns)):
+            frame = _apply_expression_batch(frame, batch)
+            batch = []
+            written = set()
+        batch.append((plugin, result))
+        written.update(result.columns)
+    return _apply_expression_batch(frame, batch)
+
+
+def _run_plugins(
+    dataset: JobDataset,
+    plugins: tuple[PluginDefinition, ...],
+    runtime: RuntimeExecutionContext,
+    context_type: type[StageContext],
+    telemetry: TelemetryRecorder | None = None,
+) -> JobDataset:
+    result = dataset
+    for contract, group in groupby(plugins, key=lambda plugin: plugin.contract):
+        group_plugins = tuple(group)
+        if contract == "expressions":
+            kind = group_plugins[0].kind
+            names = [plugin.name for plugin in group_plugins]
+            with measure(telemetry, kind, result, plugin="+".join(names)) as probe:
+                candidate = JobDataset._from_polars_unchecked(
+                    _run_expression_plugins(
+                        result.to_polars(copy=False), group_plugins, runtime, context_type
+                    )
+                )
+                try:
+                    candidate.validate()
+                except (TypeError, ValueError) as exc:
+                    raise PluginExecutionError(
+                        ", ".join(names),
+                        kind,
+                        f"returned invalid expressions: {exc}",
+                    ) from exc
+                probe.after = candidate
+            result = candidate
+            continue
+        for wave in _concurrent_waves(group_plugins):
+            if len(wave) == 1:
+                result = _run_dataset_plugin(result, wave[0], runtime, context_type, telemetry)
+            else:
+                result = _run_concurrent_plugins(result, wave, runtime, context_type, telemetry)
+    return result
+
+
+def _run_dataset_plugin(
+    dataset: JobDataset,
+    plugin: PluginDefinition,
+    runtime: RuntimeExecutionContext,
+    context_type: type[StageContext],
+    telemetry: TelemetryRecorder | None,
+) -> JobDataset:
+    ctx = context_type(
+        plugin_name=plugin.name,
+        settings=plugin.settings,
+        runtime=runtime,
+    )
+    with measure(telemetry, plugin.kind, dataset, plugin=plugin.name) as probe:
+        candidate: object
+        if plugin.isolated:
+            candidate = run_isolated_plugin(dataset, plugin, runtime, context_type)
+        else:
+            try:
+                candidate = cast(_DatasetPluginCall, plugin.func)(dataset, ctx)
+            except Exception as exc:
+                raise PluginExecutionError(plugin.name, plugin.kind, str(exc)) from exc
         if not isinstance(candidate, JobDataset):
             raise PluginExecutionError(
                 plugin.name,
@@ -121,8 +365,87 @@ def _run_filter_plugins(
                 f"returned invalid type '{type(candidate).__name__}', expected JobDataset",
             )
         _validate_plugin_dataset(plugin, candidate)
-        result = candidate
-    return result
+        probe.after = candidate
+    return candidate
+
+
+def _concurrent_waves(
+    plugins: tuple[PluginDefinition, ...],
+) -> list[tuple[PluginDefinition, ...]]:
+    """Group consecutive label/rate plugins whose declared columns do not conflict.
+
+    A plugin joins the current wave unless it reads or writes a column that an
+    earlier plugin in the wave writes. Plugins without both ``reads:`` and
+    ``writes:`` capabilities (and all filter plugins) run alone.
+    """
+    waves: list[tuple[PluginDefinition, ...]] = []
+    current: list[PluginDefinition] = []
+    written: set[str] = set()
+    for plugin in plugins:
+        reads, writes = plugin.spec.reads, plugin.spec.writes
+        if plugin.kind == "filter" or reads is None or writes is None:
+            if current:
+                waves.append(tuple(current))
+            waves.append((plugin,))
+            current, written = [], set()
+            continue
+        if current and written & (reads | writes):
+            waves.append(tuple(current))
+            current, written = [], set()
+        current.append(plugin)
+        written.update(writes)
+    if current:
+        waves.append(tuple(current))
+    return waves
+
+
+def _run_concurrent_plugins(
+    dataset: JobDataset,
+    plugins: tuple[PluginDefinition, ...],
+    runtime: RuntimeExecutionContext,
+    context_type: type[StageContext],
+    telemetry: TelemetryRecorder | None,
+) -> JobDataset:
+    """Run one wave on the same input and merge declared writes in ``(order, name)`` order."""
+    workers = min(len(plugins), runtime.max_threads or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_dataset_plugin, dataset, plugin, runtime, context_type, telemetry)
+            for plugin in plugins
+        ]
+        candidates = [future.result() for future in futures]
+
+    frame = dataset.to_polars(copy=False)
+    for plugin, candidate in zip(plugins, candidates):
+        output = candidate.to_polars(copy=False)
+        if output.height != frame.height or not output["id"].equals(frame["id"]):
+            raise PluginExecutionError(
+                plugin.name,
+                plugin.kind,
+                "concurrent plugins must preserve row count and order",
+            )
+        writes = sorted(plugin.spec.writes or ())
+        missing = [column for column in writes if column not in output.columns]
+        if missing:
+            raise PluginExecutionError(
+                plugin.name,
+                plugin.kind,
+                f"did not write declared columns: {', '.join(missing)}",
+            )
+        frame = frame.with_columns([output[column] for column in writes])
+    # Every candidate passed canonical validation, so the merged frame keeps
+    # canonical dtypes for any canonical column a plugin wrote.
+    return dataset._with_trusted_frame(frame)
+
+
+def _run_filter_plugins(
+    dataset: JobDataset,
+    plugins: tuple[PluginDefinition, ...],
+    runtime: RuntimeExecutionContext,
+    telemetry: TelemetryRecorder | None = None,
+) -> JobDataset:
+    dataset.validate()
+    return _run_plugins(dataset, plugins, runtime, FilterStageContext, telemetry)
 
 
 def filter_stage(
@@ -130,74 +453,188 @@ def filter_stage(
     options: FilterStageOptions,
     runtime: RuntimeExecutionContext,
     plugins: tuple[PluginDefinition, ...] = (),
+    telemetry: TelemetryRecorder | None = None,
 ) -> JobDataset:
     try:
         dataset.validate()
-        base = dataset.with_frame(_apply_filter_options(dataset.to_polars(copy=False), options))
-        return _run_filter_plugins(base, plugins, runtime)
+        base = dataset._with_trusted_frame(
+            _apply_filter_options(dataset.to_polars(copy=False), options)
+        )
+        return _run_filter_plugins(base, plugins, runtime, telemetry)
     except PluginExecutionError:
         raise
     except Exception as exc:
         raise StageExecutionError("filter", str(exc)) from exc
 
 
-def label_stage(
+def _skills_frame(frame: _FrameT, options: SkillStageOptions) -> _FrameT:
+    extracted = load_skill_vocabulary(options.dictionary, options.terms).extract_expr()
+    if options.mode == "merge":
+        extracted = pl.concat_list(
+            [pl.col("skills").fill_null(pl.lit([], dtype=pl.List(pl.String))), extracted]
+        ).list.unique(maintain_order=True)
+    return frame.with_columns(extracted.alias("skills"))
+
+
+def skills_stage(
     dataset: JobDataset,
-    options: LabelStageOptions,
+    options: SkillStageOptions,
     runtime: RuntimeExecutionContext,
-    plugins: tuple[PluginDefinition, ...] = (),
 ) -> JobDataset:
-    _ = options
+    _ = runtime
     try:
         dataset.validate()
-        frame = dataset.to_polars(copy=False).with_columns(
-            pl.when(pl.col("title").str.contains("(?i)intern|junior|entry"))
-            .then(pl.lit("junior"))
-            .when(pl.col("title").str.contains("(?i)senior|staff|principal"))
-            .then(pl.lit("senior"))
-            .otherwise(pl.lit("mid"))
-            .alias("label_seniority"),
-            pl.when(pl.col("title").str.contains("(?i)data"))
-            .then(pl.lit("data"))
-            .when(pl.col("title").str.contains("(?i)machine learning|ml|ai"))
-            .then(pl.lit("ml"))
-            .when(pl.col("title").str.contains("(?i)backend|platform|infra"))
-            .then(pl.lit("backend"))
-            .otherwise(pl.lit("other"))
-            .alias("label_role_category"),
+        return dataset._with_trusted_frame(
+            _skills_frame(dataset.to_polars(copy=False), options)
         )
+    except Exception as exc:
+        raise StageExecutionError("skills", str(exc)) from exc
 
-        stack_expr = (
-            pl.concat_str(
-                [pl.col("title").fill_null(""), pl.lit(" "), pl.col("description_text").fill_null("")],
-                separator="",
-            )
-            .str.to_lowercase()
-            .str.extract_all(r"python|sql|aws|gcp|java|rust|typescript|docker")
-            .list.unique()
-            .list.sort()
+
+@dataclass(frozen=True, slots=True)
+class _CompiledTaxonomy:
+    column: str
+    source: str
+    keyword_ranks: dict[str, int]
+    values: tuple[str, ...]
+    default: str | None
+
+    @property
+    def vocabulary(self) -> tuple[str, ...]:
+        """Every value the taxonomy can emit, sorted."""
+        return tuple(sorted({*self.values, *(() if self.default is None else (self.default,))}))
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledLabelRules:
+    source_keywords: dict[str, tuple[str, ...]]
+    taxonomies: tuple[_CompiledTaxonomy, ...]
+
+
+def _compile_taxonomy(taxonomy: LabelTaxonomyConfig) -> _CompiledTaxonomy:
+    indexed = list(enumerate(taxonomy.rules))
+    if taxonomy.resolution == "priority":
+        # Higher priority wins; declaration order breaks ties.
+        indexed.sort(key=lambda item: (-item[1].priority, item[0]))
+    keyword_ranks: dict[str, int] = {}
+    for rank, (_, rule) in enumerate(indexed):
+        for keyword in _normalize_terms(rule.keywords):
+            keyword_ranks.setdefault(keyword, rank)
+    return _CompiledTaxonomy(
+        column=taxonomy.column,
+        source=taxonomy.source,
+        keyword_ranks=keyword_ranks,
+        values=tuple(rule.value for _, rule in indexed),
+        default=taxonomy.default,
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_label_rules(taxonomies_json: str) -> _CompiledLabelRules:
+    configured = tuple(
+        LabelTaxonomyConfig.model_validate_json(json.dumps(item))
+        for item in json.loads(taxonomies_json)
+    )
+    # Configured taxonomies replace built-in ones that target the same column.
+    overridden = {taxonomy.column for taxonomy in configured}
+    taxonomies = tuple(
+        _compile_taxonomy(taxonomy)
+        for taxonomy in (
+            *(item for item in _BUILTIN_TAXONOMIES if item.column not in overridden),
+            *configured,
+        )
+    )
+    source_keywords: dict[str, dict[str, None]] = {}
+    for taxonomy in taxonomies:
+        source_keywords.setdefault(taxonomy.source, {}).update(
+            dict.fromkeys(taxonomy.keyword_ranks)
+        )
+    return _CompiledLabelRules(
+        source_keywords={source: tuple(keywords) for source, keywords in source_keywords.items()},
+        taxonomies=taxonomies,
+    )
+
+
+def _label_rules(options: LabelStageOptions) -> _CompiledLabelRules:
+    # Keyed on the canonical JSON of the taxonomies so equal configs loaded by
+    # separate runs (or streaming batches) share one compiled rule set.
+    return _compile_label_rules(
+        json.dumps(
+            [taxonomy.model_dump(mode="json") for taxonomy in options.taxonomies],
+            sort_keys=True,
         )
-        result = dataset.with_frame(frame.with_columns(stack_expr.alias("label_tech_stack")))
+    )
 
-        for plugin in plugins:
-            ctx = LabelStageContext(
-                plugin_name=plugin.name,
-                settings=plugin.settings,
-                runtime=runtime,
-            )
-            try:
-                candidate = plugin.func(result, ctx)
-            except Exception as exc:
-                raise PluginExecutionError(plugin.name, plugin.kind, str(exc)) from exc
-            if not isinstance(candidate, JobDataset):
-                raise PluginExecutionError(
-                    plugin.name,
-                plugin.kind,
-                f"returned invalid type '{type(candidate).__name__}', expected JobDataset",
+
+def _taxonomy_expr(taxonomy: _CompiledTaxonomy) -> pl.Expr:
+    rank = (
+        pl.col(_LABEL_MATCHES.format(source=taxonomy.source))
+        .list.eval(
+            pl.element().replace_strict(
+                taxonomy.keyword_ranks, default=None, return_dtype=pl.Int32
             )
-            _validate_plugin_dataset(plugin, candidate)
-            result = candidate
-        return result
+        )
+        .list.min()
+    )
+    return rank.replace_strict(
+        dict(enumerate(taxonomy.values)),
+        default=pl.lit(taxonomy.default, dtype=pl.String),
+        return_dtype=pl.String,
+    ).alias(taxonomy.column)
+
+
+def _label_frame(
+    frame: _FrameT, options: LabelStageOptions, *, categorical: bool = False
+) -> _FrameT:
+    """Classify every taxonomy with one multi-keyword pass per source column.
+
+    Each source is lowercased once and scanned with a single overlapping
+    Aho-Corasick ``extract_many``; every taxonomy then resolves its best-ranked
+    matching rule from those matches instead of rescanning the text per branch.
+    With ``categorical``, taxonomy columns are ``pl.Enum`` of their vocabulary.
+    """
+    rules = _label_rules(options)
+    match_columns = {
+        source: _LABEL_MATCHES.format(source=source) for source in rules.source_keywords
+    }
+    frame = frame.with_columns(
+        _search_text_expr(source)
+        .str.extract_many(list(keywords), overlapping=True)
+        .alias(match_columns[source])
+        for source, keywords in rules.source_keywords.items()
+    )
+    tech_stack = (
+        _search_text_expr("text")
+        .str.extract_all(r"python|sql|aws|gcp|java|rust|typescript|docker")
+        .list.unique()
+        .list.sort()
+    )
+    return frame.with_columns(
+        *(
+            _taxonomy_expr(taxonomy).cast(pl.Enum(taxonomy.vocabulary))
+            if categorical
+            else _taxonomy_expr(taxonomy)
+            for taxonomy in rules.taxonomies
+        ),
+        tech_stack.alias("label_tech_stack"),
+    ).drop(list(match_columns.values()))
+
+
+def label_stage(
+    dataset: JobDataset,
+    options: LabelStageOptions,
+    runtime: RuntimeExecutionContext,
+    plugins: tuple[PluginDefinition, ...] = (),
+    telemetry: TelemetryRecorder | None = None,
+    *,
+    categorical: bool = False,
+) -> JobDataset:
+    try:
+        dataset.validate()
+        result = dataset._with_trusted_frame(
+            _label_frame(dataset.to_polars(copy=False), options, categorical=categorical)
+        )
+        return _run_plugins(result, plugins, runtime, LabelStageContext, telemetry)
     except PluginExecutionError:
         raise
     except Exception as exc:
@@ -208,72 +645,64 @@ def _bounded(expr: pl.Expr) -> pl.Expr:
     return pl.when(expr.is_finite()).then(expr.clip(0.0, 1.0)).otherwise(pl.lit(0.0))
 
 
+def _rate_frame(frame: _FrameT, options: RateStageOptions) -> _FrameT:
+    required = ["title", "company", "description_text", "apply_url"]
+    completeness = sum(
+        pl.when(pl.col(name).is_not_null() & (pl.col(name).cast(pl.String, strict=False) != ""))
+        .then(1.0)
+        .otherwise(0.0)
+        for name in required
+    ) / float(len(required))
+
+    quality = (
+        pl.col("description_text")
+        .cast(pl.String, strict=False)
+        .fill_null("")
+        .str.len_chars()
+        .cast(pl.Float64)
+        / pl.lit(1500.0)
+    )
+
+    frame = frame.with_columns(
+        _bounded(completeness).alias("rate_completeness"),
+        _bounded(quality).alias("rate_quality"),
+    )
+
+    weight_sum = options.completeness_weight + options.quality_weight
+    if weight_sum <= 0:
+        composite = pl.lit(0.0)
+    else:
+        composite = (
+            pl.col("rate_completeness") * options.completeness_weight
+            + pl.col("rate_quality") * options.quality_weight
+        ) / weight_sum
+
+    return frame.with_columns(_bounded(composite).alias("rate_composite"))
+
+
+def _bound_rate_columns(frame: _FrameT) -> _FrameT:
+    return frame.with_columns(
+        _bounded(pl.col("rate_completeness")).alias("rate_completeness"),
+        _bounded(pl.col("rate_quality")).alias("rate_quality"),
+        _bounded(pl.col("rate_composite")).alias("rate_composite"),
+    )
+
+
 def rate_stage(
     dataset: JobDataset,
     options: RateStageOptions,
     runtime: RuntimeExecutionContext,
     plugins: tuple[PluginDefinition, ...] = (),
+    telemetry: TelemetryRecorder | None = None,
 ) -> JobDataset:
     try:
         dataset.validate()
-        df = dataset.to_polars(copy=False)
-        required = ["title", "company", "description_text", "apply_url"]
-        completeness = sum(
-            pl.when(pl.col(name).is_not_null() & (pl.col(name).cast(pl.String, strict=False) != ""))
-            .then(1.0)
-            .otherwise(0.0)
-            for name in required
-        ) / float(len(required))
-
-        quality = (
-            pl.col("description_text")
-            .cast(pl.String, strict=False)
-            .fill_null("")
-            .str.len_chars()
-            .cast(pl.Float64)
-            / pl.lit(1500.0)
+        result = dataset._with_trusted_frame(
+            _rate_frame(dataset.to_polars(copy=False), options)
         )
-
-        frame = df.with_columns(
-            _bounded(completeness).alias("rate_completeness"),
-            _bounded(quality).alias("rate_quality"),
-        )
-
-        weight_sum = options.completeness_weight + options.quality_weight
-        if weight_sum <= 0:
-            composite = pl.lit(0.0)
-        else:
-            composite = (
-                pl.col("rate_completeness") * options.completeness_weight
-                + pl.col("rate_quality") * options.quality_weight
-            ) / weight_sum
-
-        result = dataset.with_frame(frame.with_columns(_bounded(composite).alias("rate_composite")))
-
-        for plugin in plugins:
-            ctx = RateStageContext(
-                plugin_name=plugin.name,
-                settings=plugin.settings,
-                runtime=runtime,
-            )
-            try:
-                candidate = plugin.func(result, ctx)
-            except Exception as exc:
-                raise PluginExecutionError(plugin.name, plugin.kind, str(exc)) from exc
-            if not isinstance(candidate, JobDataset):
-                raise PluginExecutionError(
-                    plugin.name,
-                plugin.kind,
-                f"returned invalid type '{type(candidate).__name__}', expected JobDataset",
-            )
-            _validate_plugin_dataset(plugin, candidate)
-            result = candidate
-        return result.with_frame(
-            result.to_polars(copy=False).with_columns(
-                _bounded(pl.col("rate_completeness")).alias("rate_completeness"),
-                _bounded(pl.col("rate_quality")).alias("rate_quality"),
-                _bounded(pl.col("rate_composite")).alias("rate_composite"),
-            )
+        result = _run_plugins(result, plugins, runtime, RateStageContext, telemetry)
+        return result._with_trusted_frame(
+            _bound_rate_columns(result.to_polars(copy=False))
         )
     except PluginExecutionError:
         raise
@@ -281,8 +710,95 @@ def rate_stage(
         raise StageExecutionError("rate", str(exc)) from exc
 
 
-def _normalize_text(value: str | None) -> str:
-    return unescape((value or "").strip().lower())
+def _fit_score_expr() -> pl.Expr:
+    return pl.col("rate_composite").cast(pl.Float64, strict=False).fill_null(0.0).clip(0.0, 1.0)
+
+
+def _score_frame(frame: _FrameT) -> _FrameT:
+    columns = _frame_columns(frame)
+    if "rate_composite" not in columns:
+        frame = frame.with_columns(pl.lit(0.0).alias("rate_composite"))
+    if "label_seniority" not in columns:
+        frame = frame.with_columns(pl.lit(None).alias("label_seniority"))
+    return frame.with_columns(_fit_score_expr().alias("fit_score"))
+
+
+def _top_k_rows(
+    frame: _FrameT,
+    score: pl.Expr | None,
+    top_k: int,
+    group_by: tuple[str, ...] = (),
+) -> _FrameT:
+    """Keep the ``top_k`` highest-``score`` rows overall or per ``group_by`` group.
+
+    Uses partial selection (``top_k``/``top_k_by``) instead of a full sort, then
+    orders only the kept rows by descending score. Equal scores keep input
+    order, so results match a stable descending sort followed by ``head``.
+    """
+    if score is None:
+        by, descending = [pl.col(_RANK_INDEX)], [False]
+    else:
+        by, descending = [score, pl.col(_RANK_INDEX)], [True, False]
+    # ``top_k`` keeps the largest keys; ``reverse`` flips that per key.
+    reverse = [not item for item in descending]
+    indexed = frame.with_row_index(_RANK_INDEX)
+    if group_by:
+        keep = indexed.select(
+            pl.col(_RANK_INDEX)
+            .top_k_by(by, top_k, reverse=reverse)
+            .over(list(group_by), mapping_strategy="explode")
+        )
+        selected = indexed.join(keep, on=_RANK_INDEX, how="semi")
+    else:
+        selected = indexed.top_k(top_k, by=by, reverse=reverse)
+    return selected.sort(by, descending=descending).drop(_RANK_INDEX)
+
+
+def _rank_frame(frame: _FrameT, options: MatchStageOptions) -> _FrameT:
+    return _top_k_rows(
+        _score_frame(frame), pl.col("fit_score"), options.top_k, options.group_by
+    ).with_row_index("fit_rank", offset=1)
+
+
+def _effort_minutes_expr() -> pl.Expr:
+    seniority = (
+        pl.col("label_seniority")
+        .cast(pl.String, strict=False)
+        .str.strip_chars()
+        .str.to_lowercase()
+    )
+    return (
+        pl.when(seniority == "senior")
+        .then(pl.lit(25))
+        .when(seniority == "junior")
+        .then(pl.lit(12))
+        .otherwise(pl.lit(15))
+    )
+
+
+def _build_application_plan(ranked: pl.DataFrame) -> tuple[ApplicationPlanEntry, ...]:
+    # ``_score_frame`` guarantees ``label_seniority`` on every ranked frame.
+    columns = ranked.select(
+        pl.col("fit_rank").cast(pl.Int64),
+        pl.col("title").cast(pl.String, strict=False),
+        pl.col("company").cast(pl.String, strict=False),
+        pl.col("apply_url").cast(pl.String, strict=False),
+        pl.col("fit_score").cast(pl.Float64, strict=False).fill_null(0.0),
+        _effort_minutes_expr(),
+    ).get_columns()
+    return tuple(
+        ApplicationPlanEntry(
+            fit_rank=fit_rank,
+            title=title,
+            company=company,
+            apply_url=apply_url,
+            fit_score=fit_score,
+            estimated_effort_minutes=effort,
+        )
+        for fit_rank, title, company, apply_url, fit_score, effort in zip(
+            *(column.to_list() for column in columns)
+        )
+    )
 
 
 def match_stage(
@@ -293,47 +809,10 @@ def match_stage(
     _ = runtime
     try:
         dataset.validate()
-        df = dataset.to_polars(copy=False)
-        if "rate_composite" not in df.columns:
-            frame = df.with_columns(pl.lit(0.0).alias("rate_composite"))
-        else:
-            frame = df
-        if "label_seniority" not in frame.columns:
-            frame = frame.with_columns(pl.lit(None).alias("label_seniority"))
-        ranked = (
-            frame.with_columns(
-                pl.col("rate_composite")
-                .cast(pl.Float64, strict=False)
-                .fill_null(0.0)
-                .clip(0.0, 1.0)
-                .alias("fit_score")
-            )
-            .sort("fit_score", descending=True)
-            .head(options.top_k)
-            .with_row_index("fit_rank", offset=1)
+        ranked = _rank_frame(dataset.to_polars(copy=False), options)
+        return dataset._with_trusted_frame(ranked), StageArtifacts(
+            application_plan=_build_application_plan(ranked)
         )
-
-        plan: list[ApplicationPlanEntry] = []
-        for row in ranked.select(
-            "fit_rank", "title", "company", "apply_url", "fit_score", "label_seniority"
-        ).iter_rows(named=True):
-            effort = 15
-            seniority = _normalize_text(row.get("label_seniority"))
-            if seniority == "senior":
-                effort = 25
-            elif seniority == "junior":
-                effort = 12
-            plan.append(
-                ApplicationPlanEntry(
-                    fit_rank=int(row["fit_rank"]),
-                    title=row.get("title"),
-                    company=row.get("company"),
-                    apply_url=row.get("apply_url"),
-                    fit_score=float(row.get("fit_score") or 0.0),
-                    estimated_effort_minutes=effort,
-                )
-            )
-        return dataset.with_frame(ranked), StageArtifacts(application_plan=tuple(plan))
     except Exception as exc:
         raise StageExecutionError("match", str(exc)) from exc
 
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import polars as pl
+
+from honestroles.config.models import IpcWriterConfig, ParquetWriterConfig
+from honestroles.io import (
+    TableFormat,
+    scan_table,
+    sink_ipc,
+    sink_parquet,
+    write_ipc,
+    write_parquet,
+)
+from honestroles.stages import _fit_score_expr, _top_k_rows
+
+
+def iter_batches(frame: pl.LazyFrame, batch_rows: int) -> Iterator[pl.DataFrame]:
+    """Yield row slices of a lazy input; always yields at least one (possibly empty) batch."""
+    if batch_rows < 1:
+        raise ValueError("batch_rows must be >= 1")
+    total = int(frame.select(pl.len()).collect().item())
+    for offset in range(0, max(total, 1), batch_rows):
+        yield frame.slice(offset, batch_rows).collect()
+
+
+def merge_top_k(
+    pool: pl.DataFrame | None,
+    batch: pl.DataFrame,
+    top_k: int,
+    group_by: tuple[str, ...] = (),
+) -> pl.DataFrame:
+    """Keep the running top-k candidates (per group) in input order for equal scores."""
+    candidates = batch if pool is None else pl.concat([pool, batch], how="vertical_relaxed")
+    score = _fit_score_expr() if "rate_composite" in candidates.columns else None
+    return _top_k_rows(candidates, score, top_k, group_by)
+
+
+class ParquetPartWriter:
+    """Write batches as part files and sink them into one parquet file on finalize.
+
+    With ``ipc`` set, the finalized file is Arrow IPC instead of parquet.
+    """
+
+    def __init__(
+        self,
+        target: str | Path,
+        options: ParquetWriterConfig | None = None,
+        *,
+        ipc: IpcWriterConfig | None = None,
+    ) -> None:
+        self.target = Path(target)
+        self.options = options
+        self.ipc = ipc
+        self.parts_dir = self.target.parent / f".{self.target.name}.parts"
+        self.rows_written = 0
+        self._parts: list[Path] = []
+        self._empty: pl.DataFrame | None = None
+
+    def write(self, frame: pl.DataFrame) -> None:
+        if frame.height == 0:
+            if self._empty is None:
+                self._empty = frame.clear()
+            return
+        if not self._parts:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+        part = self.parts_dir / f"part-{len(self._parts):05d}.parquet"
+        write_parquet(frame, part)
+        self._parts.append(part)
+        self.rows_written += frame.height
+
+    def finalize(self) -> None:
+        if not self._parts:
+            empty = self._empty if self._empty is not None else pl.DataFrame()
+            if self.ipc is not None:
+                write_ipc(empty, self.target, self.ipc)
+            else:
+                write_parquet(empty, self.target, self.options)
+            return
+        merged = pl.concat(
+            [pl.scan_parquet(part) for part in self._parts],
+            how="vertical_relaxed",
+        )
+        if self.ipc is not None:
+            sink_ipc(merged, self.target, self.ipc)
+        else:
+            sink_parquet(merged, self.target, self.options)
+        self.abort()
+
+    def abort(self) -> None:
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+
+    def empty_frame(self) -> pl.DataFrame:
+        """Return a zero-row frame with the finalized output schema."""
+        kind: TableFormat = "ipc" if self.ipc is not None else "parquet"
+        return scan_table(self.target, kind).clear().collect()
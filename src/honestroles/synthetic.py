@@ -0,0 +1,637 @@
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from honestroles.errors import ConfigValidationError
+
+SYNTHETIC_SOURCES: tuple[str, ...] = ("greenhouse", "lever", "ashby", "workable")
+SYNTHETIC_FORMATS: tuple[str, ...] = ("parquet", "ndjson", "raw-jsonl")
+SYNTHETIC_AS_OF = date(2026, 1, 1)
+SYNTHETIC_JOB_COLUMNS: tuple[str, ...] = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "remote",
+    "description_text",
+    "description_html",
+    "skills",
+    "salary_min",
+    "salary_max",
+    "apply_url",
+    "posted_at",
+    "source",
+    "source_ref",
+    "source_job_id",
+    "job_url",
+    "source_updated_at",
+    "work_mode",
+    "employment_type",
+    "seniority",
+    "salary_currency",
+)
+
+_ROW = "__honestroles_synthetic_row"
+_POSTING = "__honestroles_synthetic_posting"
+_VARIANT = "__honestroles_synthetic_variant"
+_SOURCE_INDEX = "__honestroles_synthetic_source_index"
+_LOCATION_INDEX = "__honestroles_synthetic_location_index"
+_POSTED = "__honestroles_synthetic_posted"
+_UPDATED = "__honestroles_synthetic_updated"
+_ROW_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+# Every 16th row is an original posting; duplicates only point back at these,
+# so a duplicate always copies a row that appears verbatim in the corpus.
+_ANCHOR_STRIDE = 16
+_DUPLICATE_LOOKBACK = 64
+# Out of 1000 non-anchor rows: exact re-fetches, re-listings with tracking
+# query parameters, and cross-posts of the same job on another ATS.
+_VARIANT_CUTOFFS = (("exact", 30), ("relisted", 60), ("crosspost", 100))
+
+_SOURCE_WEIGHTS = (0.40, 0.25, 0.20, 0.15)
+_SOURCE_URLS = {
+    "greenhouse": ("https://boards.greenhouse.io/", "/jobs/", ""),
+    "lever": ("https://jobs.lever.co/", "/", ""),
+    "ashby": ("https://jobs.ashbyhq.com/", "/", ""),
+    "workable": ("https://apply.workable.com/", "/j/", "/"),
+}
+# (title prefix, seniority, weight, base salary)
+_LEVELS: tuple[tuple[str, str, float, int], ...] = (
+    ("Intern ", "intern", 0.03, 45_000),
+    ("Junior ", "junior", 0.12, 75_000),
+    ("", "mid", 0.35, 115_000),
+    ("Senior ", "senior", 0.30, 150_000),
+    ("Staff ", "staff", 0.08, 190_000),
+    ("Lead ", "lead", 0.07, 170_000),
+    ("Principal ", "principal", 0.05, 215_000),
+)
+# Ordered by popularity; picks are skewed towards the front.
+_ROLES = (
+    "Software Engineer",
+    "Data Engineer",
+    "Backend Engineer",
+    "Frontend Engineer",
+    "Data Scientist",
+    "Machine Learning Engineer",
+    "Product Manager",
+    "Data Analyst",
+    "DevOps Engineer",
+    "Site Reliability Engineer",
+    "Security Engineer",
+    "QA Engineer",
+    "Engineering Manager",
+    "Solutions Architect",
+    "Technical Writer",
+)
+_COMPANY_PREFIXES = (
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka",
+    "Soylent", "Tyrell", "Cyberdyne", "Aperture", "Vandelay", "Pied Piper",
+    "Massive", "Oscorp", "Prestige", "Gringotts", "Monarch", "Nakatomi",
+)
+_COMPANY_SUFFIXES = (
+    "Labs", "Systems", "Analytics", "Health", "Robotics", "AI", "Cloud", "Bank",
+    "Logistics", "Energy",
+)
+_COMPANY_TAIL = 20_000
+# (label, city, country, weight)
+_LOCATIONS: tuple[tuple[str | None, str | None, str | None, float], ...] = (
+    ("Remote", None, None, 0.22),
+    ("Remote - US", None, "United States", 0.08),
+    ("New York, NY", "New York", "United States", 0.12),
+    ("San Francisco, CA", "San Francisco", "United States", 0.10),
+    ("Seattle, WA", "Seattle", "United States", 0.06),
+    ("Austin, TX", "Austin", "United States", 0.05),
+    ("Boston, MA", "Boston", "United States", 0.05),
+    ("Chicago, IL", "Chicago", "United States", 0.04),
+    ("London, UK", "London", "United Kingdom", 0.07),
+    ("Berlin, Germany", "Berlin", "Germany", 0.04),
+    ("Toronto, Canada", "Toronto", "Canada", 0.04),
+    ("Bangalore, India", "Bangalore", "India", 0.04),
+    ("Singapore", "Singapore", "Singapore", 0.03),
+    (None, None, None, 0.06),
+)
+_CURRENCIES = {"London, UK": "GBP", "Berlin, Germany": "EUR", "Toronto, Canada": "CAD"}
+_EMPLOYMENT_TYPES = (("full_time", 0.85), ("contract", 0.08), ("part_time", 0.04), ("internship", 0.03))
+_SKILLS = (
+    "python", "sql", "aws", "kubernetes", "docker", "typescript", "react", "java",
+    "go", "spark", "airflow", "terraform", "gcp", "pytorch", "dbt", "rust", "kafka",
+    "snowflake", "scala", "c++",
+)
+_INTROS = (
+    "We are hiring to help scale the platform that powers our core product.",
+    "Join a small, senior team that owns its roadmap end to end.",
+    "You will work on systems used by millions of customers every day.",
+    "Our mission is to make financial services accessible to everyone.",
+    "We are a remote-first company with teammates across many time zones.",
+    "This team builds the data foundation for every product decision.",
+)
+_RESPONSIBILITIES = (
+    "Design, build and operate reliable services in production.",
+    "Partner with product and design to ship customer-facing features.",
+    "Own data pipelines from ingestion through modelling and reporting.",
+    "Improve observability, performance and cost of our infrastructure.",
+    "Mentor engineers and raise the bar for code review and testing.",
+    "Lead technical design for new initiatives and write clear RFCs.",
+    "Run experiments and turn the results into product improvements.",
+)
+_REQUIREMENTS = (
+    "Strong written and verbal communication skills.",
+    "Experience working in an agile, cross-functional team.",
+    "A degree in computer science or equivalent practical experience.",
+    "Comfort with ambiguity and a bias for action.",
+    "Visa sponsorship is not available for this role.",
+    "Must be authorized to work in the listed country.",
+)
+_BENEFITS = (
+    "We offer competitive salary, equity and comprehensive health benefits.",
+    "Benefits include a learning budget, flexible hours and generous leave.",
+    "We provide a home office stipend and an annual team offsite.",
+)
+
+
+def _hash_seed(seed: int, salt: int) -> int:
+    return seed * 1_000_003 + salt
+
+
+def _uniform(key: str, salt: int, seed: int) -> pl.Expr:
+    """Deterministic value in ``[0, 1)`` per row of ``key``."""
+    return (pl.col(key).hash(seed=_hash_seed(seed, salt)) % 1_000_000) / 1_000_000
+
+
+def _weighted_index(key: str, salt: int, seed: int, weights: Sequence[float]) -> pl.Expr:
+    draw = _uniform(key, salt, seed)
+    total = sum(weights)
+    expr: pl.Expr = pl.lit(len(weights) - 1, dtype=pl.UInt32)
+    cumulative = [sum(weights[: position + 1]) / total for position in range(len(weights))]
+    for position in reversed(range(len(weights) - 1)):
+        expr = (
+            pl.when(draw < cumulative[position])
+            .then(pl.lit(position, dtype=pl.UInt32))
+            .otherwise(expr)
+        )
+    return expr
+
+
+def _skewed_index(key: str, salt: int, seed: int, size: int, exponent: float) -> pl.Expr:
+    """Index in ``[0, size)`` with a power-law lean towards the front."""
+    return (_uniform(key, salt, seed).pow(exponent) * size).floor().cast(pl.UInt32)
+
+
+def _lookup(index: pl.Expr, values: Sequence[Any], dtype: pl.DataType) -> pl.Expr:
+    return index.replace_strict(list(range(len(values))), list(values), return_dtype=dtype)
+
+
+def _rows_plan(rows: int, *, seed: int, offset: int) -> pl.LazyFrame:
+    row = pl.col(_ROW)
+    bucket = pl.col(_ROW).hash(seed=_hash_seed(seed, 1)) % 1000
+    variant: pl.Expr = pl.lit("original")
+    for name, cutoff in reversed(_VARIANT_CUTOFFS):
+        variant = pl.when(bucket < cutoff).then(pl.lit(name)).otherwise(variant)
+    variant = pl.when(row % _ANCHOR_STRIDE == 0).then(pl.lit("original")).otherwise(variant)
+    lookback = (pl.col(_ROW).hash(seed=_hash_seed(seed, 2)) % _DUPLICATE_LOOKBACK).cast(pl.Int64)
+    anchor = ((row // _ANCHOR_STRIDE).cast(pl.Int64) - lookback).clip(lower_bound=0)
+    return (
+        pl.LazyFrame()
+        .select(pl.int_range(offset, offset + rows, dtype=pl.UInt64).alias(_ROW))
+        .with_columns(variant.alias(_VARIANT))
+        .with_columns(
+            pl.when(pl.col(_VARIANT) == "original")
+            .then(row)
+            .otherwise((anchor * _ANCHOR_STRIDE).cast(pl.UInt64))
+            .alias(_POSTING)
+        )
+    )
+
+
+def _posting_columns(seed: int, as_of: date) -> list[pl.Expr]:
+    """Job content shared by every copy of a posting."""
+    level = _weighted_index(_POSTING, 10, seed, [weight for _, _, weight, _ in _LEVELS])
+    role = _lookup(_skewed_index(_POSTING, 11, seed, len(_ROLES), 1.8), _ROLES, pl.String())
+    company_rank = _skewed_index(_POSTING, 12, seed, _COMPANY_TAIL, 3.0)
+    names = [f"{prefix} {suffix}" for prefix in _COMPANY_PREFIXES for suffix in _COMPANY_SUFFIXES]
+    company = pl.concat_str(
+        [
+            _lookup(company_rank % len(names), names, pl.String()),
+            pl.when(company_rank >= len(names))
+            .then(pl.concat_str([pl.lit(" "), (company_rank // len(names)).cast(pl.String)]))
+            .otherwise(pl.lit("")),
+        ]
+    )
+    location = pl.col(_LOCATION_INDEX)
+    skills = [
+        _lookup(_skewed_index(_POSTING, salt, seed, len(_SKILLS), 1.6), _SKILLS, pl.String())
+        for salt in (13, 14, 15)
+    ]
+    has_third_skill = _uniform(_POSTING, 16, seed) < 0.5
+    years = (_uniform(_POSTING, 17, seed) * 8 + 1).floor().cast(pl.Int64).cast(pl.String)
+    intro = _lookup(_skewed_index(_POSTING, 18, seed, len(_INTROS), 1.0), _INTROS, pl.String())
+    first = _lookup(
+        _skewed_index(_POSTING, 19, seed, len(_RESPONSIBILITIES), 1.0), _RESPONSIBILITIES, pl.String()
+    )
+    second = _lookup(
+        _skewed_index(_POSTING, 20, seed, len(_RESPONSIBILITIES), 1.0), _RESPONSIBILITIES, pl.String()
+    )
+    requirement = _lookup(
+        _skewed_index(_POSTING, 21, seed, len(_REQUIREMENTS), 1.0), _REQUIREMENTS, pl.String()
+    )
+    benefit = _lookup(_skewed_index(_POSTING, 22, seed, len(_BENEFITS), 1.0), _BENEFITS, pl.String())
+    # Roughly half the postings carry a benefits paragraph, skewing text length.
+    has_benefit = _uniform(_POSTING, 23, seed) < 0.5
+    base_salary = _lookup(level, [salary for _, _, _, salary in _LEVELS], pl.Float64())
+    salary_min = (base_salary * (0.8 + _uniform(_POSTING, 24, seed) * 0.4) / 1000).round(0) * 1000
+    salary_max = (salary_min * (1.15 + _uniform(_POSTING, 25, seed) * 0.3) / 1000).round(0) * 1000
+    has_salary = _uniform(_POSTING, 26, seed) >= 0.55
+    days_ago = (_uniform(_POSTING, 27, seed).pow(2.0) * 180).floor().cast(pl.Int64)
+    seconds_ago = (pl.col(_POSTING).hash(seed=_hash_seed(seed, 28)) % 86_400).cast(pl.Int64)
+    posted = pl.lit(datetime.combine(as_of, time())) - pl.duration(days=days_ago, seconds=seconds_ago)
+    updated_hours = (_uniform(_POSTING, 29, seed) * 96).floor().cast(pl.Int64)
+    skill_text = pl.concat_str(
+        [
+            skills[0],
+            pl.lit(" & "),
+            skills[1],
+            pl.when(has_third_skill).then(pl.concat_str([pl.lit(" & "), skills[2]])).otherwise(pl.lit("")),
+        ]
+    )
+    return [
+        _lookup(level, [prefix for prefix, _, _, _ in _LEVELS], pl.String()).alias("level_prefix"),
+        _lookup(level, [seniority for _, seniority, _, _ in _LEVELS], pl.String()).alias("seniority"),
+        role.alias("role"),
+        company.alias("company"),
+        _lookup(location, [label for label, _, _, _ in _LOCATIONS], pl.String()).alias("location"),
+        _lookup(location, [city for _, city, _, _ in _LOCATIONS], pl.String()).alias("city"),
+        _lookup(location, [country for _, _, country, _ in _LOCATIONS], pl.String()).alias("country"),
+        _lookup(
+            _weighted_index(_POSTING, 30, seed, [weight for _, weight in _EMPLOYMENT_TYPES]),
+            [name for name, _ in _EMPLOYMENT_TYPES],
+            pl.String(),
+        ).alias("employment_type"),
+        pl.concat_str(
+            [
+                skills[0],
+                pl.lit(","),
+                skills[1],
+                pl.when(has_third_skill)
+                .then(pl.concat_str([pl.lit(","), skills[2]]))
+                .otherwise(pl.lit("")),
+            ]
+        ).alias("skills"),
+        pl.concat_str(
+            [
+                pl.lit("<div><h3>About the role</h3><p>"),
+                intro,
+                pl.lit("</p><h3>Responsibilities</h3><ul><li>"),
+                first,
+                pl.lit("</li><li>"),
+                second,
+                pl.lit("</li></ul><h3>Requirements</h3><ul><li>"),
+                years,
+                pl.lit("+ years of experience with "),
+                skill_text.str.replace_all("&", "&amp;", literal=True),
+                pl.lit("</li><li>"),
+                requirement,
+                pl.lit("</li></ul>"),
+                pl.when(has_benefit)
+                .then(pl.concat_str([pl.lit("<p>"), benefit, pl.lit("</p>")]))
+                .otherwise(pl.lit("")),
+                pl.lit("</div>"),
+            ]
+        ).alias("description_html"),
+        pl.concat_str(
+            [
+                pl.lit("About the role\n"),
+                intro,
+                pl.lit("\nResponsibilities\n"),
+                first,
+                pl.lit("\n"),
+                second,
+                pl.lit("\nRequirements\n"),
+                years,
+                pl.lit("+ years of experience with "),
+                skill_text,
+                pl.lit("\n"),
+                requirement,
+                pl.when(has_benefit).then(pl.concat_str([pl.lit("\n"), benefit])).otherwise(pl.lit("")),
+            ]
+        ).alias("plain_description"),
+        # Some boards publish HTML only.
+        (_uniform(_POSTING, 31, seed) < 0.05).alias("html_only"),
+        pl.when(has_salary).then(salary_min).otherwise(None).alias("salary_min"),
+        pl.when(has_salary).then(salary_max).otherwise(None).alias("salary_max"),
+        pl.when(_uniform(_POSTING, 32, seed) < 0.02).then(None).otherwise(posted).alias(_POSTED),
+        pl.when(_uniform(_POSTING, 33, seed) < 0.4)
+        .then(posted + pl.duration(hours=updated_hours))
+        .otherwise(posted)
+        .alias(_UPDATED),
+        (_uniform(_POSTING, 34, seed) < 0.3).alias("hybrid"),
+    ]
+
+
+def _synthetic_plan(rows: int, *, seed: int, offset: int, as_of: date) -> pl.LazyFrame:
+    variant = pl.col(_VARIANT)
+    base_source = _weighted_index(_POSTING, 3, seed, _SOURCE_WEIGHTS)
+    crosspost_shift = (pl.col(_ROW).hash(seed=_hash_seed(seed, 4)) % 3 + 1).cast(pl.UInt32)
+    is_remote = pl.col("location").str.starts_with("Remote").fill_null(False)
+    # Re-fetches and re-listings keep the original posting's identifiers.
+    id_key = pl.when(variant == "crosspost").then(pl.col(_ROW)).otherwise(pl.col(_POSTING))
+    source_job_id = (id_key + 4_000_000).cast(pl.String)
+    slug = pl.col("company").str.to_lowercase().str.replace_all(" ", "-", literal=True)
+    url = pl.concat_str(
+        [
+            _lookup(pl.col(_SOURCE_INDEX), [_SOURCE_URLS[name][0] for name in SYNTHETIC_SOURCES], pl.String()),
+            slug,
+            _lookup(pl.col(_SOURCE_INDEX), [_SOURCE_URLS[name][1] for name in SYNTHETIC_SOURCES], pl.String()),
+            source_job_id,
+            _lookup(pl.col(_SOURCE_INDEX), [_SOURCE_URLS[name][2] for name in SYNTHETIC_SOURCES], pl.String()),
+        ]
+    )
+    title = pl.concat_str([pl.col("level_prefix"), pl.col("role")])
+    return (
+        _rows_plan(rows, seed=seed, offset=offset)
+        .with_columns(
+            pl.when(variant == "crosspost")
+            .then((base_source + crosspost_shift) % len(SYNTHETIC_SOURCES))
+            .otherwise(base_source)
+            .alias(_SOURCE_INDEX),
+            _weighted_index(_POSTING, 5, seed, [weight for _, _, _, weight in _LOCATIONS]).alias(
+                _LOCATION_INDEX
+            ),
+        )
+        .with_columns(_posting_columns(seed, as_of))
+        .with_columns(
+            source_job_id.alias("id"),
+            source_job_id.alias("source_job_id"),
+            # Cross-posts abbreviate the level the way other boards often do.
+            pl.when(variant == "crosspost")
+            .then(title.str.replace("Senior ", "Sr. ", literal=True))
+            .otherwise(title)
+            .alias("title"),
+            _lookup(pl.col(_SOURCE_INDEX), SYNTHETIC_SOURCES, pl.String()).alias("source"),
+            slug.alias("source_ref"),
+            pl.when(variant == "relisted")
+            .then(pl.concat_str([url, pl.lit("?utm_source=jobboard&utm_medium=listing")]))
+            .otherwise(url)
+            .alias("apply_url"),
+            url.alias("job_url"),
+            pl.when(is_remote)
+            .then(pl.lit("remote"))
+            .when(pl.col("hybrid"))
+            .then(pl.lit("hybrid"))
+            .otherwise(pl.lit("onsite"))
+            .alias("work_mode"),
+            is_remote.alias("remote"),
+            pl.when(pl.col("html_only"))
+            .then(None)
+            .otherwise(pl.col("plain_description"))
+            .alias("description_text"),
+            pl.col(_POSTED).dt.strftime("%Y-%m-%dT%H:%M:%SZ").alias("posted_at"),
+            pl.col(_UPDATED).dt.strftime("%Y-%m-%dT%H:%M:%SZ").alias("source_updated_at"),
+            pl.when(pl.col("salary_min").is_null())
+            .then(None)
+            .otherwise(
+                pl.col("location").replace_strict(_CURRENCIES, default="USD", return_dtype=pl.String)
+            )
+            .alias("salary_currency"),
+        )
+    )
+
+
+def synthetic_jobs(
+    rows: int,
+    *,
+    seed: int = 0,
+    offset: int = 0,
+    as_of: date = SYNTHETIC_AS_OF,
+) -> pl.LazyFrame:
+    """Normalized job rows ``offset .. offset + rows`` of the synthetic corpus.
+
+    Every value is a hash of the row number and ``seed``, so any slice is
+    reproducible on its own. The corpus includes exact duplicates, re-listings
+    with tracking query parameters, and cross-posts on other sources.
+    """
+    return _synthetic_plan(rows, seed=seed, offset=offset, as_of=as_of).select(
+        SYNTHETIC_JOB_COLUMNS
+    )
+
+
+def _raw_payload(source: str) -> pl.Expr:
+    posted = pl.col("posted_at")
+    updated = pl.col("source_updated_at")
+    if source == "greenhouse":
+        return pl.struct(
+            pl.col("source_job_id").cast(pl.Int64).alias("id"),
+            pl.col("title"),
+            pl.col("company").alias("company_name"),
+            pl.struct(pl.col("location").alias("name")).alias("location"),
+            pl.col("description_html").alias("content"),
+            pl.col("apply_url").alias("absolute_url"),
+            posted.alias("first_published"),
+            updated.alias("updated_at"),
+        )
+    if source == "lever":
+        return pl.struct(
+            pl.col("source_job_id").alias("id"),
+            pl.col("title").alias("text"),
+            pl.struct(
+                pl.col("location"),
+                pl.col("employment_type").alias("commitment"),
+                pl.col("seniority").alias("level"),
+            ).alias("categories"),
+            pl.col("description_html").alias("description"),
+            pl.col("description_text").alias("descriptionPlain"),
+            pl.col("apply_url").alias("hostedUrl"),
+            pl.col(_POSTED).dt.epoch("ms").alias("createdAt"),
+            pl.col(_UPDATED).dt.epoch("ms").alias("updatedAt"),
+            pl.col("work_mode").alias("workplaceType"),
+        )
+    if source == "ashby":
+        return pl.struct(
+            pl.col("source_job_id").alias("id"),
+            pl.col("title"),
+            pl.col("location"),
+            pl.col("remote").alias("isRemote"),
+            pl.col("work_mode").alias("workplaceType"),
+            pl.col("description_html").alias("descriptionHtml"),
+            pl.col("description_text").alias("descriptionPlain"),
+            pl.col("apply_url").alias("jobUrl"),
+            posted.alias("publishedAt"),
+            updated.alias("updatedAt"),
+            pl.col("employment_type").alias("employmentType"),
+            pl.col("salary_min").alias("salaryMin"),
+            pl.col("salary_max").alias("salaryMax"),
+            pl.col("salary_currency").alias("salaryCurrency"),
+        )
+    if source == "workable":
+        return pl.struct(
+            pl.col("source_job_id").alias("shortcode"),
+            pl.col("title"),
+            pl.when(pl.col("location").is_not_null())
+            .then(
+                pl.struct(
+                    pl.col("location").alias("location_str"),
+                    pl.col("city"),
+                    pl.col("country"),
+                )
+            )
+            .alias("location"),
+            pl.col("remote").alias("telecommuting"),
+            pl.col("description_html").alias("description"),
+            pl.col("job_url").alias("url"),
+            pl.col("apply_url").alias("application_url"),
+            posted.alias("published_on"),
+            updated.alias("updated_at"),
+            pl.col("employment_type"),
+            pl.col("seniority").alias("experience_level"),
+        )
+    raise ConfigValidationError(
+        f"unsupported synthetic source '{source}'; expected one of: {', '.join(SYNTHETIC_SOURCES)}"
+    )
+
+
+def _raw_records(plan: pl.LazyFrame, source: str) -> pl.LazyFrame:
+    return plan.filter(pl.col("source") == source).select(
+        pl.col("source_ref"), _raw_payload(source).alias("payload")
+    )
+
+
+def synthetic_raw_records(
+    rows: int,
+    source: str,
+    *,
+    seed: int = 0,
+    offset: int = 0,
+    as_of: date = SYNTHETIC_AS_OF,
+) -> pl.LazyFrame:
+    """ATS-shaped ``payload`` structs (with their ``source_ref``) for one source's rows."""
+    plan = _synthetic_plan(rows, seed=seed, offset=offset, as_of=as_of)
+    return _raw_records(plan, source)
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticCorpusResult:
+    output_dir: str
+    rows: int
+    seed: int
+    as_of: str
+    files: dict[str, str]
+    source_counts: dict[str, int]
+    variant_counts: dict[str, int]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "output_dir": self.output_dir,
+            "rows": self.rows,
+            "seed": self.seed,
+            "as_of": self.as_of,
+            "files": self.files,
+            "source_counts": self.source_counts,
+            "variant_counts": self.variant_counts,
+        }
+
+
+def parse_row_count(value: str) -> int:
+    """Parse a row count such as ``10000``, ``100k`` or ``10M``."""
+    text = value.strip().lower().replace("_", "")
+    multiplier = _ROW_SUFFIXES.get(text[-1:], 1)
+    digits = text[:-1] if multiplier > 1 else text
+    try:
+        rows = int(float(digits) * multiplier)
+    except ValueError as exc:
+        raise ConfigValidationError(f"invalid row count '{value}'") from exc
+    if rows < 1:
+        raise ConfigValidationError(f"row count must be >= 1: '{value}'")
+    return rows
+
+
+def generate_synthetic_corpus(
+    *,
+    output_dir: str | Path,
+    rows: int,
+    seed: int = 0,
+    formats: Sequence[str] = SYNTHETIC_FORMATS,
+    chunk_rows: int = 250_000,
+    as_of: date = SYNTHETIC_AS_OF,
+) -> SyntheticCorpusResult:
+    """Stream a synthetic corpus to ``output_dir`` in ``chunk_rows`` slices.
+
+    Writes ``jobs.parquet`` and ``jobs.ndjson`` (normalized rows) and
+    ``raw/<source>.jsonl`` (one ``{"source_ref", "payload"}`` object per line,
+    shaped like that ATS's API). Memory stays bounded by the chunk size rather
+    than by ``rows``.
+    """
+    if rows < 1:
+        raise ConfigValidationError("rows must be >= 1")
+    if chunk_rows < 1:
+        raise ConfigValidationError("chunk-rows must be >= 1")
+    unknown = sorted(set(formats) - set(SYNTHETIC_FORMATS))
+    if unknown or not formats:
+        raise ConfigValidationError(
+            f"invalid synthetic format(s): {', '.join(unknown) or '<none>'}; "
+            f"expected any of: {', '.join(SYNTHETIC_FORMATS)}"
+        )
+
+    root = Path(output_dir).expanduser().resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    files: dict[str, str] = {}
+    if "parquet" in formats:
+        files["parquet"] = str(root / "jobs.parquet")
+    if "ndjson" in formats:
+        files["ndjson"] = str(root / "jobs.ndjson")
+    if "raw-jsonl" in formats:
+        (root / "raw").mkdir(exist_ok=True)
+        for source in SYNTHETIC_SOURCES:
+            files[f"raw_{source}"] = str(root / "raw" / f"{source}.jsonl")
+    parts_dir = root / ".jobs.parquet.parts"
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    text_paths = {key: Path(path) for key, path in files.items() if key != "parquet"}
+    for path in text_paths.values():
+        path.write_bytes(b"")
+
+    source_counts = {source: 0 for source in SYNTHETIC_SOURCES}
+    variant_counts = {"original": 0, **{name: 0 for name, _ in _VARIANT_CUTOFFS}}
+    # One chunk is materialized at a time and appended to every output, so peak
+    # memory follows ``chunk_rows`` rather than ``rows``.
+    for part, start in enumerate(range(0, rows, chunk_rows)):
+        chunk = _synthetic_plan(
+            min(chunk_rows, rows - start), seed=seed, offset=start, as_of=as_of
+        ).collect()
+        jobs = chunk.select(SYNTHETIC_JOB_COLUMNS)
+        if "parquet" in files:
+            parts_dir.mkdir(exist_ok=True)
+            jobs.write_parquet(parts_dir / f"part-{part:05d}.parquet")
+        if "ndjson" in files:
+            with text_paths["ndjson"].open("ab") as handle:
+                jobs.write_ndjson(handle)
+        for source in SYNTHETIC_SOURCES if "raw-jsonl" in formats else ():
+            with text_paths[f"raw_{source}"].open("ab") as handle:
+                _raw_records(chunk.lazy(), source).collect().write_ndjson(handle)
+        for source, count in chunk.get_column("source").value_counts().iter_rows():
+            source_counts[source] += count
+        for variant, count in chunk.get_column(_VARIANT).value_counts().iter_rows():
+            variant_counts[variant] += count
+        del chunk, jobs
+    if "parquet" in files:
+        pl.scan_parquet(parts_dir / "*.parquet").sink_parquet(root / "jobs.parquet")
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+    result = SyntheticCorpusResult(
+        output_dir=str(root),
+        rows=rows,
+        seed=seed,
+        as_of=as_of.isoformat(),
+        files=files,
+        source_counts=source_counts,
+        variant_counts=variant_counts,
+    )
+    (root / "manifest.json").write_text(
+        json.dumps(result.to_payload(), indent=2, sort_keys=True), encoding="utf-8"
+    )
+    return result
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import polars as pl
+
+from honestroles.diagnostics import StageTelemetry
+from honestroles.domain import JobDataset
+from honestroles.resources import current_rss_bytes
+
+# How often the RSS sampler polls the resident set size while a run is open.
+RSS_SAMPLE_INTERVAL_S = 0.005
+
+
+def estimated_bytes(value: Any) -> int | None:
+    """Return Polars' estimated in-memory size for eager frames, ``None`` otherwise."""
+    if isinstance(value, JobDataset):
+        value = value.to_polars(copy=False)
+    if isinstance(value, pl.DataFrame):
+        return int(value.estimated_size())
+    return None
+
+
+@dataclass(slots=True)
+class TelemetryProbe:
+    """Handle yielded by :meth:`TelemetryRecorder.measure` to report the output frame."""
+
+    after: Any = None
+
+
+class _PeakStack:
+    """Attribute a process-wide running peak to nested measurements.
+
+    The peak source can only be reset globally, so opening a nested measurement
+    (a plugin inside a stage) first folds the running peak into the enclosing
+    measurement before resetting it.
+    """
+
+    def __init__(self, read_peak: Callable[[], int], reset_peak: Callable[[], None]) -> None:
+        self._read_peak = read_peak
+        self._reset_peak = reset_peak
+        self._stack: list[int] = []
+
+    def open(self) -> None:
+        if self._stack:
+            self._stack[-1] = max(self._stack[-1], self._read_peak())
+        self._reset_peak()
+        self._stack.append(0)
+
+    def close(self) -> int | None:
+        if not self._stack:
+            return None
+        peak = max(self._stack.pop(), self._read_peak())
+        if self._stack:
+            self._stack[-1] = max(self._stack[-1], peak)
+        self._reset_peak()
+        return peak
+
+    def clear(self) -> None:
+        self._stack.clear()
+
+
+class _RssSampler:
+    """Poll the resident set size on a daemon thread and keep its running peak."""
+
+    def __init__(self, interval_s: float = RSS_SAMPLE_INTERVAL_S) -> None:
+        self._interval_s = interval_s
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._peak = 0
+        self.run_peak = 0
+
+    def start(self) -> bool:
+        if current_rss_bytes() is None:
+            return False
+        self._stop.clear()
+        self.reset_peak()
+        self._thread = threading.Thread(
+            target=self._poll, name="honestroles-rss-sampler", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._observe()
+
+    def peak(self) -> int:
+        self._observe()
+        with self._lock:
+            return self._peak
+
+    def reset_peak(self) -> None:
+        rss = current_rss_bytes() or 0
+        with self._lock:
+            self._peak = rss
+            self.run_peak = max(self.run_peak, rss)
+
+    def _observe(self) -> None:
+        rss = current_rss_bytes()
+        if rss is None:
+            return
+        with self._lock:
+            self._peak = max(self._peak, rss)
+            self.run_peak = max(self.run_peak, rss)
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            self._observe()
+
+
+class TelemetryRecorder:
+    """Accumulate wall/CPU time and frame sizes per stage and per plugin for one run.
+
+    Repeated measurements of the same ``(stage, plugin)`` pair (for example one per
+    streaming batch) are merged, so ``calls`` counts invocations. With
+    ``trace_memory`` the recorder also reports the tracemalloc peak observed while
+    each measurement was open; this covers Python-heap allocations only, Polars
+    buffers are reflected in the ``bytes_*`` estimates instead. With ``track_rss``
+    a sampler thread polls the resident set size, which does cover Polars
+    buffers, and each measurement reports the peak RSS seen while it was open.
+    """
+
+    def __init__(self, *, trace_memory: bool = False, track_rss: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.track_rss = track_rss
+        self._entries: dict[tuple[str, str | None], StageTelemetry] = {}
+        # Entries are reported in the order measurements started, so a stage
+        # precedes the plugins it ran even though those finish first.
+        self._order: dict[tuple[str, str | None], None] = {}
+        self._peaks = _PeakStack(
+            lambda: tracemalloc.get_traced_memory()[1], tracemalloc.reset_peak
+        )
+        self._rss = _RssSampler()
+        self._rss_peaks = _PeakStack(self._rss.peak, self._rss.reset_peak)
+        self._sampling_rss = False
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._tracing_thread = threading.get_ident()
+
+    def __enter__(self) -> TelemetryRecorder:
+        self._tracing_thread = threading.get_ident()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.track_rss:
+            self._sampling_rss = self._rss.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if self._sampling_rss:
+            self._rss.stop()
+            self._sampling_rss = False
+        self._peaks.clear()
+        self._rss_peaks.clear()
+
+    @property
+    def peak_rss_bytes(self) -> int | None:
+        """Highest resident set size sampled while the recorder was open."""
+        if self._sampling_rss:
+            self._rss.peak()
+        return self._rss.run_peak or None
+
+    def extend(self, entries: tuple[StageTelemetry, ...]) -> None:
+        """Merge entries recorded elsewhere (for example in a partition worker)."""
+        for entry in entries:
+            with self._lock:
+                self._order.setdefault((entry.stage, entry.plugin))
+            self._add(entry)
+
+    def entries(self) -> tuple[StageTelemetry, ...]:
+        with self._lock:
+            return tuple(
+                self._entries[key] for key in self._order if key in self._entries
+            )
+
+    @contextmanager
+    def measure(
+        self,
+        stage: str,
+        before: Any = None,
+        *,
+        plugin: str | None = None,
+    ) -> Iterator[TelemetryProbe]:
+        probe = TelemetryProbe()
+        with self._lock:
+            self._order.setdefault((stage, plugin))
+        # Both peaks are process-wide, so only measurements on the owning
+        # thread track them; concurrent plugin measurements report none and
+        # their allocations count toward the enclosing stage.
+        owning_thread = threading.get_ident() == self._tracing_thread
+        tracing = self.trace_memory and tracemalloc.is_tracing() and owning_thread
+        sampling = self._sampling_rss and owning_thread
+        if tracing:
+            self._peaks.open()
+        if sampling:
+            self._rss_peaks.open()
+        bytes_before = estimated_bytes(before)
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield probe
+        finally:
+            wall_ms = (time.perf_counter() - wall_started) * 1000
+            cpu_ms = (time.process_time() - cpu_started) * 1000
+            peak = self._peaks.close() if tracing else None
+            rss_peak = self._rss_peaks.close() if sampling else None
+            self._add(
+                StageTelemetry(
+                    stage=stage,
+                    plugin=plugin,
+                    wall_ms=wall_ms,
+                    cpu_ms=cpu_ms,
+                    bytes_before=bytes_before,
+                    bytes_after=estimated_bytes(probe.after),
+                    peak_traced_bytes=peak,
+                    peak_rss_bytes=rss_peak,
+                )
+            )
+
+    def _add(self, entry: StageTelemetry) -> None:
+        key = (entry.stage, entry.plugin)
+        with self._lock:
+            existing = self._entries.get(key)
+            self._entries[key] = entry if existing is None else existing.merge(entry)
+
+
+@contextmanager
+def measure(
+    telemetry: TelemetryRecorder | None,
+    stage: str,
+    before: Any = None,
+    *,
+    plugin: str | None = None,
+) -> Iterator[TelemetryProbe]:
+    """Measure with ``telemetry`` when given; otherwise yield a probe that records nothing."""
+    if telemetry is None:
+        yield TelemetryProbe()
+        return
+    with telemetry.measure(stage, before, plugin=plugin) as probe:
+        yield probe
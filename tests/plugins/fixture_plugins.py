@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from typing import ForwardRef
 
 import polars as pl
@@ -8,6 +10,7 @@ from honestroles import JobDataset
 from honestroles.plugins.types import (
     FilterStageContext,
     LabelStageContext,
+    PluginExpressions,
     RateStageContext,
 )
 
@@ -35,11 +38,52 @@ def rate_bonus(dataset: JobDataset, ctx: RateStageContext) -> JobDataset:
     )
 
 
+FAIL_FILTER_CALLS: list[str] = []
+
+
 def fail_filter(dataset: JobDataset, ctx: FilterStageContext) -> JobDataset:
-    _ = (dataset, ctx)
+    _ = dataset
+    FAIL_FILTER_CALLS.append(ctx.plugin_name)
     raise RuntimeError("intentional plugin failure")
 
 
+def label_title_words(dataset: JobDataset, ctx: LabelStageContext) -> JobDataset:
+    _ = ctx
+    return dataset.transform(
+        lambda frame: frame.with_columns(
+            pl.col("title").str.split(" ").list.len().alias("plugin_title_words"),
+            pl.lit(os.getpid()).alias("plugin_worker_pid"),
+        )
+    )
+
+
+def label_sleep(dataset: JobDataset, ctx: LabelStageContext) -> JobDataset:
+    time.sleep(float(ctx.settings.get("seconds", 0.0)))
+    return dataset
+
+
+def label_worker_exit(dataset: JobDataset, ctx: LabelStageContext) -> JobDataset:
+    _ = (dataset, ctx)
+    os._exit(3)
+
+
+def label_chunk_column(dataset: JobDataset, ctx: LabelStageContext) -> JobDataset:
+    _ = ctx
+    name = f"plugin_chunk_{dataset.to_polars()['id'][0]}"
+    return dataset.transform(lambda frame: frame.with_columns(pl.lit(1).alias(name)))
+
+
+def label_settings_echo(dataset: JobDataset, ctx: LabelStageContext) -> JobDataset:
+    return dataset.transform(
+        lambda frame: frame.with_columns(pl.lit(repr(ctx.settings["tags"])).alias("plugin_tags"))
+    )
+
+
+def label_returns_frame(dataset: JobDataset, ctx: LabelStageContext) -> JobDataset:
+    _ = ctx
+    return dataset.to_polars()  # type: ignore[return-value]
+
+
 def untyped_plugin(dataset, ctx):
     _ = ctx
     return dataset
@@ -80,3 +124,53 @@ def wrong_context_annotation(
 ) -> JobDataset:
     _ = ctx
     return dataset
+
+
+def filter_has_company_expr(schema: pl.Schema, ctx: FilterStageContext) -> PluginExpressions:
+    _ = (schema, ctx)
+    return PluginExpressions(predicate=pl.col("company").is_not_null(), reads=("company",))
+
+
+def label_title_length_expr(schema: pl.Schema, ctx: LabelStageContext) -> PluginExpressions:
+    _ = (schema, ctx)
+    return PluginExpressions(
+        columns={"title_length": pl.col("title").str.len_chars()},
+        reads=("title",),
+    )
+
+
+def label_note_expr(schema: pl.Schema, ctx: LabelStageContext) -> PluginExpressions:
+    _ = schema
+    return PluginExpressions(columns={"plugin_label_note": pl.lit(f"plugin:{ctx.plugin_name}")})
+
+
+def label_long_title_expr(schema: pl.Schema, ctx: LabelStageContext) -> PluginExpressions:
+    _ = (schema, ctx)
+    return PluginExpressions(
+        columns={"long_title": pl.col("title_length") > 12},
+        reads=("title_length",),
+    )
+
+
+def label_title_number_expr(schema: pl.Schema, ctx: LabelStageContext) -> PluginExpressions:
+    _ = (schema, ctx)
+    return PluginExpressions(
+        columns={"title_number": pl.col("title").cast(pl.Int64)},
+        reads=("title",),
+    )
+
+
+def rate_bonus_expr(schema: pl.Schema, ctx: RateStageContext) -> PluginExpressions:
+    _ = schema
+    bonus = float(ctx.settings.get("bonus", 0.0))
+    return PluginExpressions(
+        columns={
+            "rate_composite": (pl.col("rate_composite").fill_null(0.0) + bonus).clip(0.0, 1.0)
+        },
+        reads=("rate_composite",),
+    )
+
+
+def schema_returning_dataset(schema: pl.Schema, ctx: LabelStageContext) -> JobDataset:
+    _ = ctx
+    return schema  # type: ignore[return-value]
@@ -101,6 +101,34 @@ def test_apply_source_adapter_date_parsing_and_numeric_errors() -> None:
     }
 
 
+def test_apply_source_adapter_lazy_matches_eager() -> None:
+    df = pl.DataFrame(
+        {
+            "remote": [True, None, True],
+            "remote_flag": ["no", "yes", "maybe"],
+            "date_posted": ["2026-01-10", "bad-date", None],
+        }
+    )
+    cfg = SourceAdapterSpec(
+        enabled=True,
+        fields={
+            "remote": InputAdapterFieldConfig.model_validate(
+                {"from": ["remote_flag"], "cast": "bool"}
+            ),
+            "posted_at": InputAdapterFieldConfig.model_validate(
+                {"from": ["date_posted"], "cast": "date_string"}
+            ),
+        },
+    )
+    eager, eager_diagnostics = apply_source_adapter(df, cfg)
+    lazy, lazy_diagnostics = apply_source_adapter(df.lazy(), cfg)
+
+    assert isinstance(lazy, pl.LazyFrame)
+    assert lazy.collect().equals(eager)
+    assert lazy_diagnostics == eager_diagnostics
+    assert lazy_diagnostics["conflicts"] == {"remote": 1}
+
+
 def test_apply_source_adapter_multi_source_deterministic_order() -> None:
     df = pl.DataFrame({"loc_b": ["B"], "loc_a": ["A"]})
     cfg = SourceAdapterSpec(
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from honestroles.bench import BENCH_CASES, BenchCase, BenchResult, compare_bench, run_bench
+from honestroles.bench import suite as suite_module
+from honestroles.cli import output
+from honestroles.cli.main import main
+from honestroles.errors import ConfigValidationError
+
+
+def test_run_bench_covers_every_case_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    report = run_bench(sizes=[60], repeat=2, warmup=0, work_dir=tmp_path, isolated=False)
+
+    assert [result.case for result in report.results] == list(BENCH_CASES)
+    payload = report.to_payload()
+    assert payload["status"] == "pass"
+    assert payload["environment"]["polars"] == pl.__version__
+    for item in payload["results"]:
+        assert item["rows"] == 60
+        assert item["repeat"] == 2
+        assert item["p50_ms"] <= item["p95_ms"] <= item["p99_ms"]
+        assert item["throughput_rows_per_s"] > 0
+    runtime = payload["results"][0]
+    assert set(runtime["details"]["stage_wall_ms"]) >= {"clean", "filter", "match"}
+    assert (tmp_path / "corpus" / "jobs-60-seed0" / "manifest.json").exists()
+    assert (tmp_path / "corpus" / "jobs-60-seed0" / "raw" / "lever.jsonl").exists()
+
+    with pytest.raises(ConfigValidationError, match="unknown benchmark case"):
+        run_bench(cases=["nope"], work_dir=tmp_path, isolated=False)
+
+
+def test_run_bench_isolated_reports_worker_peak_rss(tmp_path: Path) -> None:
+    report = run_bench(cases=["runtime"], sizes=[50], repeat=1, warmup=0, work_dir=tmp_path)
+
+    (result,) = report.results
+    assert report.isolated
+    assert result.peak_rss_bytes is None or result.peak_rss_bytes > 0
+
+
+def test_compare_bench_flags_latency_and_rss_regressions(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {"case": "runtime", "rows": 10, "p50_ms": 100.0, "peak_rss_bytes": 1000},
+                    {"case": "eda_profile", "rows": 10, "p50_ms": 1.0, "peak_rss_bytes": 1000},
+                    {"case": "recommend_match", "rows": 10, "p50_ms": 100.0, "peak_rss_bytes": 1000},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    results = [
+        BenchResult("runtime", 10, (130.0, 150.0, 140.0), 1000),
+        # 4x slower but within the noise floor.
+        BenchResult("eda_profile", 10, (4.0,), 1000),
+        BenchResult("recommend_match", 10, (90.0,), 2000),
+        BenchResult("publish_payload", 10, (5.0,), 1000),
+    ]
+
+    comparison = compare_bench(results, baseline, max_regression=0.2, max_rss_regression=0.5)
+
+    statuses = {entry["case"]: entry["status"] for entry in comparison.entries}
+    assert statuses == {
+        "runtime": "regressed",
+        "eda_profile": "ok",
+        "recommend_match": "regressed",
+        "publish_payload": "new",
+    }
+    assert comparison.status == "fail"
+    assert comparison.entries[0]["latency_ratio"] == 1.4
+    assert compare_bench(results[1:2], baseline).status == "pass"
+
+    baseline.write_text("{}", encoding="utf-8")
+    with pytest.raises(ConfigValidationError, match="expected a 'results' list"):
+        compare_bench(results, baseline)
+
+
+def test_compare_bench_rejects_bad_baselines_and_skips_unmeasured_entries(
+    tmp_path: Path,
+) -> None:
+    results = [BenchResult("runtime", 10, (5.0,), None), BenchResult("eda_profile", 10, (5.0,), 9)]
+    baseline = tmp_path / "baseline.json"
+
+    with pytest.raises(ConfigValidationError, match="baseline does not exist"):
+        compare_bench(results, baseline)
+    baseline.write_text("{", encoding="utf-8")
+    with pytest.raises(ConfigValidationError, match="invalid benchmark baseline"):
+        compare_bench(results, baseline)
+    with pytest.raises(ConfigValidationError, match="regression thresholds must be >= 0"):
+        compare_bench(results, baseline, max_rss_regression=-0.1)
+
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": [
+                    "garbage",
+                    {"case": "runtime"},
+                    {"case": "runtime", "rows": 10, "p50_ms": 0.0, "peak_rss_bytes": 1},
+                    {"case": "eda_profile", "rows": 10, "p50_ms": 5.0},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    comparison = compare_bench(results, baseline)
+
+    assert comparison.status == "pass"
+    assert [entry["latency_ratio"] for entry in comparison.entries] == [None, 1.0]
+    assert [entry["rss_ratio"] for entry in comparison.entries] == [None, None]
+
+
+@pytest.mark.parametrize(
+    ("options", "error"),
+    [
+        ({"repeat": 0}, "repeat must be >= 1"),
+        ({"warmup": -1}, "warmup must be >= 0"),
+        ({"sizes": [10, 0]}, "benchmark sizes must be >= 1"),
+    ],
+)
+def test_run_bench_validates_options(
+    tmp_path: Path, options: dict[str, object], error: str
+) -> None:
+    with pytest.raises(ConfigValidationError, match=error):
+        run_bench(work_dir=tmp_path, isolated=False, **options)
+
+
+def test_isolated_case_runs_in_its_workdir_with_warmup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    calls: list[Path] = []
+
+    def prepare(corpus: Path, workdir: Path):
+        def run() -> dict[str, object]:
+            calls.append(Path.cwd())
+            return {"corpus": corpus.name}
+
+        return run
+
+    monkeypatch.setitem(
+        suite_module.BENCH_CASES, "runtime", BenchCase("runtime", "stub", prepare)
+    )
+    workdir = tmp_path / "case"
+    workdir.mkdir()
+
+    latencies, _, details = suite_module._measure_case_isolated(
+        "runtime", tmp_path / "jobs.parquet", workdir, 2, 1
+    )
+
+    assert len(latencies) == 2
+    assert details == {"corpus": "jobs.parquet"}
+    assert calls == [workdir] * 3
+
+
+def test_bench_table_tolerates_partial_payloads(capsys: pytest.CaptureFixture[str]) -> None:
+    output._print_bench_table(
+        {
+            "results": ["skip", {"case": "runtime", "rows": 10, "peak_rss_bytes": 2 * 1024**2}],
+            "comparison": {"entries": ["skip", {"case": "runtime", "rows": 10, "status": "ok"}]},
+        }
+    )
+    rendered = capsys.readouterr().out
+    assert "2.0" in rendered and rendered.rstrip().endswith("ok")
+    assert "REPORT" not in rendered
+
+    output._print_bench_table({"results": [{"case": "runtime", "rows": 10}]})
+    assert capsys.readouterr().out.rstrip().endswith("-")
+
+
+def test_cli_bench_rejects_empty_sizes(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["bench", "--sizes", ",", "--in-process"]) == 2
+    assert "sizes must list at least one corpus size" in capsys.readouterr().err
+
+
+def test_cli_bench_writes_report_and_fails_on_regression(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    work_dir = tmp_path / "bench"
+    args = [
+        "bench",
+        "--cases",
+        "runtime",
+        "--sizes",
+        "40",
+        "--repeat",
+        "1",
+        "--warmup",
+        "0",
+        "--work-dir",
+        str(work_dir),
+        "--in-process",
+    ]
+    assert main(args) == 0
+    report = json.loads((work_dir / "report.json").read_text(encoding="utf-8"))
+    assert report["results"][0]["case"] == "runtime"
+    capsys.readouterr()
+
+    baseline = tmp_path / "baseline.json"
+    report["results"][0]["peak_rss_bytes"] = 1
+    baseline.write_text(json.dumps(report), encoding="utf-8")
+    output_file = tmp_path / "current.json"
+    code = main(
+        [*args, "--baseline", str(baseline), "--output-file", str(output_file), "--format", "table"]
+    )
+    assert code == 1
+    assert "regressed" in capsys.readouterr().out
+    assert json.loads(output_file.read_text(encoding="utf-8"))["status"] == "fail"
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 import importlib
+import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -32,6 +34,46 @@ def test_cli_run(pipeline_config_path: Path, plugin_manifest_path: Path) -> None
     assert code == 0
 
 
+def test_cli_run_parquet_flags_override_output_writer(
+    pipeline_config_path: Path, tmp_path: Path
+) -> None:
+    code = main(
+        [
+            "run",
+            "--pipeline-config",
+            str(pipeline_config_path),
+            "--parquet-compression-level",
+            "9",
+            "--parquet-statistics",
+            "full",
+            "--parquet-partition-by",
+            "posted_month",
+        ]
+    )
+    assert code == 0
+    output_dir = tmp_path / "output.parquet"
+    assert output_dir.is_dir()
+    assert [path.name for path in output_dir.iterdir()] == ["posted_month=2026-01"]
+
+    code = main(
+        [
+            "run",
+            "--pipeline-config",
+            str(pipeline_config_path),
+            "--parquet-compression",
+            "lz4",
+            "--parquet-compression-level",
+            "3",
+        ]
+    )
+    assert code == 2
+
+    no_output = tmp_path / "no_output.toml"
+    input_path = tmp_path / "jobs.parquet"
+    no_output.write_text(f'[input]\nkind = "parquet"\npath = "{input_path}"\n', encoding="utf-8")
+    assert main(["run", "--pipeline-config", str(no_output), "--parquet-row-group-size", "10"]) == 2
+
+
 def test_cli_plugins_validate(plugin_manifest_path: Path) -> None:
     code = main(["plugins", "validate", "--manifest", str(plugin_manifest_path)])
     assert code == 0
@@ -480,7 +522,7 @@ def test_cli_eda_dashboard_launches_streamlit(tmp_path: Path, monkeypatch) -> No
     )
     bundle = EDAArtifactsBundle(artifacts_dir=tmp_path, manifest=manifest, summary={})
 
-    monkeypatch.setattr(cli_main, "load_eda_artifacts", lambda _path: bundle)
+    monkeypatch.setattr("honestroles.eda.load_eda_artifacts", lambda _path: bundle)
     monkeypatch.setattr(cli_main.importlib.util, "find_spec", lambda _name: object())
 
     calls: dict[str, list[str]] = {}
@@ -536,7 +578,7 @@ def test_cli_eda_dashboard_launches_streamlit_with_diff(tmp_path: Path, monkeypa
     def fake_load(path):
         return diff_bundle if Path(path) == diff_bundle.artifacts_dir else profile_bundle
 
-    monkeypatch.setattr(cli_main, "load_eda_artifacts", fake_load)
+    monkeypatch.setattr("honestroles.eda.load_eda_artifacts", fake_load)
     monkeypatch.setattr(cli_main.importlib.util, "find_spec", lambda _name: object())
 
     calls: dict[str, list[str]] = {}
@@ -588,7 +630,7 @@ def test_cli_eda_dashboard_profile_and_diff_validation_errors(tmp_path: Path, mo
     monkeypatch.setattr(cli_main.importlib.util, "find_spec", lambda _name: object())
     monkeypatch.setattr(cli_main.subprocess, "run", lambda cmd, check=False: subprocess.CompletedProcess(args=cmd, returncode=0))
 
-    monkeypatch.setattr(cli_main, "load_eda_artifacts", lambda _p: bad_profile)
+    monkeypatch.setattr("honestroles.eda.load_eda_artifacts", lambda _p: bad_profile)
     code = cli_main.main(["eda", "dashboard", "--artifacts-dir", str(tmp_path / "profile")])
     assert code == 2
 
@@ -601,7 +643,7 @@ def test_cli_eda_dashboard_profile_and_diff_validation_errors(tmp_path: Path, mo
             summary={},
         )
 
-    monkeypatch.setattr(cli_main, "load_eda_artifacts", fake_load)
+    monkeypatch.setattr("honestroles.eda.load_eda_artifacts", fake_load)
     code = cli_main.main(
         [
             "eda",
@@ -1042,3 +1084,111 @@ def test_cli_runs_show_missing_returns_config_error(
     monkeypatch.chdir(tmp_path)
     code = main(["runs", "show", "--run-id", "missing"])
     assert code == 2
+
+
+def test_cli_run_and_report_quality_emit_telemetry(
+    pipeline_config_path: Path,
+    plugin_manifest_path: Path,
+    capsys,
+) -> None:
+    for command in ("run", "report-quality"):
+        code = main(
+            [
+                command,
+                "--pipeline-config",
+                str(pipeline_config_path),
+                "--plugins",
+                str(plugin_manifest_path),
+                "--trace-memory",
+            ]
+        )
+        assert code == 0
+        telemetry = json.loads(capsys.readouterr().out)["telemetry"]
+        assert telemetry[0]["stage"] == "input"
+        assert {"plugin": "label_note", "stage": "label"}.items() <= telemetry[5].items()
+        assert all("peak_traced_bytes" in item for item in telemetry)
+
+
+def test_cli_run_resource_limits(
+    pipeline_config_path: Path, tmp_path: Path, capsys
+) -> None:
+    code = main(
+        [
+            "run",
+            "--pipeline-config",
+            str(pipeline_config_path),
+            "--max-memory-mb",
+            "512",
+            "--max-threads",
+            "2",
+        ]
+    )
+    assert code == 0
+    resources = json.loads(capsys.readouterr().out)["resources"]
+    assert resources["max_memory_bytes"] == 512 * 1024**2
+    assert resources["max_threads"] == 2
+    assert resources["fallback"] is False
+    assert main(["run", "--pipeline-config", str(pipeline_config_path), "--max-threads", "0"]) == 2
+
+    # Polars sizes its thread pool on import, so the cap only holds in a fresh process.
+    config = tmp_path / "limited.toml"
+    config.write_text(
+        pipeline_config_path.read_text(encoding="utf-8") + "\nmax_threads = 1\n",
+        encoding="utf-8",
+    )
+    env = dict(os.environ)
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    env.pop("POLARS_MAX_THREADS", None)
+    completed = subprocess.run(
+        [sys.executable, "-m", "honestroles.cli.main", "run", "--pipeline-config", str(config)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    assert json.loads(completed.stdout)["resources"]["polars_threads"] == 1
+
+
+def test_cli_run_shards_and_merge(pipeline_config_path: Path, tmp_path: Path, capsys) -> None:
+    config = str(pipeline_config_path)
+    assert main(["run", "--pipeline-config", config]) == 0
+    expected = pl.read_parquet(tmp_path / "output.parquet")
+    capsys.readouterr()
+
+    shard_dir = str(tmp_path / "shards")
+    for shard in ("0/2", "1/2"):
+        code = main(
+            ["run", "--pipeline-config", config, "--shard", shard, "--shard-dir", shard_dir]
+        )
+        assert code == 0
+        assert json.loads(capsys.readouterr().out)["shard"]["count"] == 2
+    (tmp_path / "output.parquet").unlink()
+
+    assert main(["run", "merge", "--pipeline-config", config, "--shard-dir", shard_dir]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert len(payload["shards"]) == 2
+    assert pl.read_parquet(tmp_path / "output.parquet").equals(expected)
+
+    merge = ["run", "merge", "--pipeline-config", config, "--shard-dir", shard_dir]
+    assert main([*merge, "--shard-key", "apply_url"]) == 2
+    assert main(["run", "--pipeline-config", config, "--shard", "2/2"]) == 2
+    assert main(["run"]) == 2
+
+
+def test_cli_serve_starts_server(monkeypatch) -> None:
+    import honestroles.server as server_module
+
+    calls: dict[str, object] = {}
+    monkeypatch.setattr(server_module, "serve", lambda **kwargs: calls.update(kwargs))
+    monkeypatch.setenv(server_module.TOKEN_ENV, "secret")
+    code = main(
+        ["serve", "--socket", "/tmp/hr.sock", "--max-runtimes", "4", "--root", "/data"]
+    )
+    assert code == 0
+    assert calls["socket_path"] == "/tmp/hr.sock"
+    assert calls["max_runtimes"] == 4
+    assert calls["roots"] == ["/data"]
+    assert calls["token"] == "secret"
+    assert main(["serve", "--max-runtimes", "0"]) == 2
+    assert main(["serve", "--input-cache-bytes", "-1"]) == 2
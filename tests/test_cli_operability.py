@@ -209,7 +209,9 @@ def test_handle_doctor_missing_input_and_no_output_warn(tmp_path: Path) -> None:
     assert output_check["status"] == "warn"
 
 
-def test_handle_doctor_canonical_contract_failure(tmp_path: Path) -> None:
+def test_handle_doctor_canonical_contract_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     input_parquet = tmp_path / "jobs_bad_schema.parquet"
     pl.DataFrame({"id": ["1"], "title": ["x"], "company": ["y"], "description_text": ["z"]}).write_parquet(
         input_parquet
@@ -220,22 +222,17 @@ def test_handle_doctor_canonical_contract_failure(tmp_path: Path) -> None:
         output_path=tmp_path / "out.parquet",
         filename="doctor_bad_contract.toml",
     )
-    original_validate = handlers.validate_source_data_contract
-
     def fail_validate(_df: pl.DataFrame) -> pl.DataFrame:
         raise ConfigValidationError("bad canonical")
 
-    handlers.validate_source_data_contract = fail_validate
-    try:
-        result = handlers.handle_doctor(
-            argparse.Namespace(
-                pipeline_config=str(pipeline),
-                plugin_manifest=None,
-                sample_rows=10,
-            )
+    monkeypatch.setattr("honestroles.io.validate_source_data_contract", fail_validate)
+    result = handlers.handle_doctor(
+        argparse.Namespace(
+            pipeline_config=str(pipeline),
+            plugin_manifest=None,
+            sample_rows=10,
         )
-    finally:
-        handlers.validate_source_data_contract = original_validate
+    )
 
     canonical = _check_by_id(result.payload, "canonical_contract")
     assert canonical["status"] == "fail"
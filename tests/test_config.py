@@ -11,10 +11,20 @@ from honestroles.config.models import (
     InputAdapterFieldConfig,
     InputAliasesConfig,
     InputConfig,
+    LabelStageOptions,
+    MatchStageOptions,
     OutputConfig,
+    PipelineSpec,
     PluginManifestConfig,
     PluginSpecConfig,
+    RuntimeCacheConfig,
+    RuntimeHtmlCacheConfig,
+    RuntimeIncrementalConfig,
+    RuntimePartitionsConfig,
     RuntimeQualityConfig,
+    RuntimeShardingConfig,
+    SkillStageOptions,
+    StrictModel,
 )
 from honestroles.errors import ConfigValidationError
 
@@ -309,3 +319,213 @@ def test_config_model_coercion_and_validation_branches() -> None:
 
     assert isinstance(FilterStageOptions.model_validate({"required_keywords": ["python"]}), FilterStageOptions)
     assert PluginSpecConfig.model_validate({"capabilities": ["a"]}).capabilities == ("a",)
+
+
+@pytest.mark.parametrize(
+    ("model", "field"),
+    [
+        (RuntimeCacheConfig, "runtime.cache.path"),
+        (RuntimeHtmlCacheConfig, "runtime.html_cache.path"),
+        (RuntimeIncrementalConfig, "runtime.incremental.path"),
+        (RuntimeShardingConfig, "runtime.sharding.path"),
+    ],
+)
+def test_runtime_path_configs_coerce_paths(model: type[StrictModel], field: str) -> None:
+    assert model.model_validate({"path": Path("a")}).path == Path("a")
+    assert model.model_validate({"path": "a"}).path == Path("a")
+    with pytest.raises((ValidationError, TypeError), match=f"{field} must be a path-like string"):
+        model.model_validate({"path": 123})
+
+
+def test_streaming_execution_requires_output_without_match() -> None:
+    with pytest.raises(ValidationError):
+        PipelineSpec.model_validate(
+            {
+                "input": {"path": "jobs.parquet"},
+                "stages": {"match": {"enabled": False}},
+                "runtime": {"execution": "streaming"},
+            }
+        )
+    spec = PipelineSpec.model_validate(
+        {
+            "input": {"path": "jobs.parquet"},
+            "runtime": {"execution": "streaming", "streaming": {"batch_rows": 10}},
+        }
+    )
+    assert spec.runtime.streaming.batch_rows == 10
+    with pytest.raises(ValidationError):
+        PipelineSpec.model_validate(
+            {
+                "input": {"path": "jobs.parquet"},
+                "runtime": {"streaming": {"batch_rows": 0}},
+            }
+        )
+
+
+def test_plugin_spec_rejects_empty_writes_capability() -> None:
+    with pytest.raises(ValueError, match="must list at least one column"):
+        PluginSpecConfig.model_validate({"capabilities": ["reads:title", "writes: "]})
+    spec = PluginSpecConfig.model_validate({"capabilities": ["reads:", "writes:a,b"]})
+    assert spec.capabilities == ("reads:", "writes:a,b")
+
+
+def test_load_pipeline_config_with_label_taxonomies(tmp_path: Path) -> None:
+    parquet_path = tmp_path / "jobs.parquet"
+    parquet_path.write_bytes(b"PAR1")
+    path = tmp_path / "pipeline_taxonomies.toml"
+    path.write_text(
+        f"""
+[input]
+kind = "parquet"
+path = "{parquet_path}"
+
+[[stages.label.taxonomies]]
+column = "label_domain"
+source = "text"
+resolution = "priority"
+default = "general"
+
+[[stages.label.taxonomies.rules]]
+value = "fintech"
+keywords = ["payments", "banking"]
+priority = 5
+""".strip(),
+        encoding="utf-8",
+    )
+    taxonomy = load_pipeline_config(path).stages.label.taxonomies[0]
+    assert taxonomy.column == "label_domain"
+    assert taxonomy.rules[0].keywords == ("payments", "banking")
+    assert taxonomy.rules[0].priority == 5
+
+
+@pytest.mark.parametrize(
+    ("taxonomies", "message"),
+    [
+        ([{"column": "domain", "rules": [{"value": "x", "keywords": ["x"]}]}], "label_<name>"),
+        (
+            [{"column": "label_tech_stack", "rules": [{"value": "x", "keywords": ["x"]}]}],
+            "list column",
+        ),
+        ([{"column": "label_domain", "rules": []}], "at least one rule"),
+        (
+            [{"column": "label_domain", "rules": [{"value": "x", "keywords": [" "]}]}],
+            "non-empty keyword",
+        ),
+        (
+            [{"column": "label_domain", "rules": [{"value": " ", "keywords": ["x"]}]}],
+            "value must be non-empty",
+        ),
+        (
+            [
+                {"column": "label_domain", "rules": [{"value": "x", "keywords": ["x"]}]},
+                {"column": "label_domain", "rules": [{"value": "y", "keywords": ["y"]}]},
+            ],
+            "duplicate taxonomy column",
+        ),
+        (
+            (
+                {"column": "label_domain", "rules": [{"value": "x", "keywords": ["x"]}]},
+                {"column": "label_domain", "rules": [{"value": "y", "keywords": ["y"]}]},
+            ),
+            "duplicate taxonomy column",
+        ),
+    ],
+)
+def test_label_taxonomy_validation(taxonomies: object, message: str) -> None:
+    with pytest.raises(ValidationError, match=message):
+        LabelStageOptions.model_validate({"taxonomies": taxonomies})
+
+
+def test_skill_stage_options_require_vocabulary_when_enabled(tmp_path: Path) -> None:
+    assert SkillStageOptions().enabled is False
+    with pytest.raises(ValidationError, match="requires 'dictionary' or 'terms'"):
+        SkillStageOptions.model_validate({"enabled": True})
+    with pytest.raises(ValidationError, match="keys must be non-empty"):
+        SkillStageOptions.model_validate({"terms": {" ": ["x"]}})
+    with pytest.raises((ValidationError, TypeError), match="path-like string"):
+        SkillStageOptions.model_validate({"dictionary": 123})
+    with pytest.raises(ValidationError):
+        SkillStageOptions.model_validate({"terms": ["python"]})
+
+    parquet_path = tmp_path / "jobs.parquet"
+    parquet_path.write_bytes(b"PAR1")
+    path = tmp_path / "pipeline_skills.toml"
+    path.write_text(
+        f"""
+[input]
+kind = "parquet"
+path = "{parquet_path}"
+
+[stages.skills]
+enabled = true
+dictionary = "vocab/skills.json"
+
+[stages.skills.terms]
+Kubernetes = ["k8s"]
+""".strip(),
+        encoding="utf-8",
+    )
+    skills = load_pipeline_config(path).stages.skills
+    assert skills.dictionary == (tmp_path / "vocab" / "skills.json").resolve()
+    assert skills.terms == {"Kubernetes": ("k8s",)}
+
+
+def test_match_stage_group_by_validation() -> None:
+    assert MatchStageOptions.model_validate({"group_by": ["company"]}).group_by == ("company",)
+    assert MatchStageOptions(group_by=("company", "title")).group_by == ("company", "title")
+    with pytest.raises(ValidationError, match="must be non-empty"):
+        MatchStageOptions.model_validate({"group_by": [" "]})
+    with pytest.raises(ValidationError, match="must be unique"):
+        MatchStageOptions.model_validate({"group_by": ["company", "company"]})
+
+
+def test_absolute_runtime_paths_are_kept(tmp_path: Path) -> None:
+    cache_root = tmp_path / "shared" / "stage-cache"
+    path = tmp_path / "configs" / "pipeline.toml"
+    path.parent.mkdir()
+    path.write_text(
+        f"""
+[input]
+kind = "parquet"
+path = "jobs.parquet"
+
+[runtime.cache]
+enabled = true
+path = "{cache_root}"
+""".strip(),
+        encoding="utf-8",
+    )
+    spec = load_pipeline_config(path)
+    assert spec.runtime.cache.path == cache_root
+    assert spec.runtime.html_cache.path == (path.parent / ".honestroles/cache/html").resolve()
+
+
+def test_partitioned_input_config(tmp_path: Path) -> None:
+    path = tmp_path / "pipeline.toml"
+    path.write_text(
+        """
+[input]
+kind = "parquet"
+path = "jobs/date=*/*.parquet"
+hive_partitioning = true
+
+[output]
+path = "out.parquet"
+
+[runtime.partitions]
+workers = 4
+
+[runtime.incremental]
+enabled = true
+""".strip(),
+        encoding="utf-8",
+    )
+    spec = load_pipeline_config(path)
+    assert spec.input.path == (tmp_path / "jobs" / "date=*" / "*.parquet").resolve()
+    assert spec.input.hive_partitioning is True
+    assert spec.runtime.partitions.workers == 4
+    assert spec.runtime.incremental.path == (tmp_path / ".honestroles" / "incremental").resolve()
+    assert spec.runtime.sharding.path == (tmp_path / ".honestroles" / "shards").resolve()
+    assert RuntimePartitionsConfig().workers is None
+    with pytest.raises(ValidationError):
+        RuntimePartitionsConfig.model_validate({"workers": 0})
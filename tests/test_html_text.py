@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import html
+from pathlib import Path
+
+import polars as pl
+
+from honestroles.html_text import HtmlTextCache, html_to_text, html_to_text_expr
+
+
+def test_html_to_text_converts_tags_entities_and_blocks() -> None:
+    values = pl.Series(
+        "description_html",
+        [
+            "<div><h3>About</h3>\n  <p>Build <b>data</b>&nbsp;tools</p></div>",
+            "<ul><li>Python &amp; SQL</li><li>AT&T &#39;quoted&#x27; &copy 2026</li></ul>",
+            "<style>p { color: red }</style><p>x</p><!-- hidden --><script>a<b</script>",
+            "a < b and c > d",
+            "&amp;lt;p&amp;gt;",
+            "<p></p>",
+            None,
+        ],
+    )
+
+    assert html_to_text(values).to_list() == [
+        "About\nBuild data tools",
+        "Python & SQL\nAT&T 'quoted' © 2026",
+        "x",
+        "a < b and c > d",
+        "&lt;p&gt;",
+        "",
+        None,
+    ]
+    assert html_to_text(values).name == "description_html"
+
+
+def test_html_to_text_decodes_entities_like_html_unescape() -> None:
+    samples = [
+        "&lt;&gt;&quot;&apos;",
+        "&notin; &hellip;",
+        "&#8217;&#x2014;",
+        "R&D &amp",
+        "&bogus;",
+        "&notit;",
+        "&ampfoo; &amp&lt;",
+        "&copy2026 &Aacutex; &amp;notit;",
+        "AT&T; &unknown;",
+    ]
+
+    converted = html_to_text(pl.Series(samples)).to_list()
+
+    assert converted == [html.unescape(value) for value in samples]
+
+
+def test_html_to_text_expr_matches_series_on_lazy_frames() -> None:
+    frame = pl.LazyFrame({"body": ["<p>one</p><p>two</p>", "<br>three", None]})
+
+    out = frame.select(html_to_text_expr(pl.col("body"))).collect()
+
+    assert out["body"].to_list() == ["one\ntwo", "three", None]
+
+
+def test_html_text_cache_converts_each_description_once(tmp_path: Path) -> None:
+    values = pl.Series(["<p>a</p>", "<p>b</p>", "<p>a</p>", None])
+    cache = HtmlTextCache(tmp_path, max_entries=10)
+
+    assert html_to_text(values, cache).to_list() == ["a", "b", "a", None]
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert html_to_text(values, cache).to_list() == ["a", "b", "a", None]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    reopened = HtmlTextCache(tmp_path, max_entries=10)
+    assert len(reopened) == 2
+    assert html_to_text(pl.Series(["<p>b</p>", "<p>c</p>"]), reopened).to_list() == ["b", "c"]
+    assert (reopened.hits, reopened.misses) == (1, 1)
+
+    bounded = HtmlTextCache(tmp_path, max_entries=2)
+    assert len(bounded) == 2
+    assert html_to_text(pl.Series(["<p>a</p>"]), bounded).to_list() == ["a"]
+    assert bounded.misses == 1
+
+
+def test_html_text_cache_skips_unreadable_segments(tmp_path: Path) -> None:
+    cache = HtmlTextCache(tmp_path)
+    html_to_text(pl.Series(["<p>a</p>"]), cache)
+    (cache.root / "segment-00000000000000000000-bad.arrow").write_bytes(b"not arrow")
+
+    reopened = HtmlTextCache(tmp_path)
+    assert len(reopened) == 1
+    assert html_to_text(pl.Series(["<p>a</p>"]), reopened).to_list() == ["a"]
+    assert reopened.hits == 1
+
+
+def test_html_text_cache_compacts_segments(tmp_path: Path) -> None:
+    cache = HtmlTextCache(tmp_path)
+    for index in range(17):
+        html_to_text(pl.Series([f"<p>{index}</p>"]), cache)
+
+    assert len(list(cache.root.glob("segment-*.arrow"))) == 1
+    assert len(HtmlTextCache(tmp_path)) == 17
+
+
+def test_html_to_text_passes_through_all_null_values(tmp_path: Path) -> None:
+    values = pl.Series("body", [None, None], dtype=pl.String)
+
+    assert html_to_text(values, HtmlTextCache(tmp_path)).to_list() == [None, None]
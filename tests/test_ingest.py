@@ -555,7 +555,6 @@ def test_normalize_records_and_dataframe_paths() -> None:
     assert ingest_normalize._coerce_bool("yes") is True
     assert ingest_normalize._coerce_bool("no") is False
     assert ingest_normalize._coerce_bool("maybe") is None
-    assert ingest_normalize._normalize_description_text(None, "<p>A&nbsp;B</p>") == "A B"
     assert ingest_normalize._infer_remote("onsite") is False
     assert ingest_normalize._infer_remote("unknown") is None
     assert ingest_normalize._infer_remote(True) is True
@@ -595,6 +594,22 @@ def test_normalize_records_and_dataframe_paths() -> None:
     assert generic_rows[0]["company"] == "fallback-company"
     assert generic_rows[0]["description_text"] == "hello world"
 
+    # Block-level tags become line breaks; the old tag strip joined them with spaces.
+    html_rows = ingest_normalize.normalize_records(
+        [
+            {
+                "id": "h-1",
+                "description_html": "<p>A&nbsp;B</p><ul><li>one</li><li>two  <b>x</b></li></ul>",
+            },
+            {"id": "h-2", "description_html": "<p> </p>"},
+            {"id": "h-3", "description_text": " kept ", "description_html": "<p>x</p>"},
+        ],
+        source="unknown",
+        source_ref="fallback-company",
+        ingested_at_utc=now,
+    )
+    assert [row["description_text"] for row in html_rows] == ["A B\none\ntwo x", None, "kept"]
+
     frame = ingest_normalize.normalized_dataframe(
         ingest_normalize.normalize_records(
             [lever, ashby, workable],
@@ -958,7 +973,7 @@ def test_service_helpers_and_cli_handler(monkeypatch: pytest.MonkeyPatch, tmp_pa
         report_file=tmp_path / "r.json",
         rows_written=1,
     )
-    monkeypatch.setattr(handlers, "sync_source", lambda **_kwargs: dummy_result)
+    monkeypatch.setattr("honestroles.ingest.sync_source", lambda **_kwargs: dummy_result)
     result = handlers.handle_ingest_sync(
         argparse.Namespace(
             source="lever",
@@ -1996,9 +2011,9 @@ source_ref = "netflix"
         report_file=tmp_path / "batch_fail_report.json",
         check_codes=(),
     )
-    monkeypatch.setattr(handlers, "sync_sources_from_manifest", lambda **_kwargs: pass_result)
+    monkeypatch.setattr("honestroles.ingest.sync_sources_from_manifest", lambda **_kwargs: pass_result)
     assert handlers.handle_ingest_sync_all(parsed).exit_code == 0
-    monkeypatch.setattr(handlers, "sync_sources_from_manifest", lambda **_kwargs: fail_result)
+    monkeypatch.setattr("honestroles.ingest.sync_sources_from_manifest", lambda **_kwargs: fail_result)
     assert handlers.handle_ingest_sync_all(parsed).exit_code == 1
 
     assert lineage.should_track({"command": "ingest", "ingest_command": "sync-all"})
@@ -8,9 +8,11 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any
 
+import polars as pl
 import pytest
 
 from honestroles.cli import handlers, lineage, output
+from honestroles.config import ParquetWriterConfig
 from honestroles.errors import ConfigValidationError, HonestRolesError
 from honestroles.ingest import manifest as ingest_manifest
 from honestroles.ingest import quality as ingest_quality
@@ -20,6 +22,7 @@ from honestroles.ingest.models import (
     IngestionReport,
     IngestionResult,
     IngestionValidationResult,
+    SUPPORTED_INGEST_SOURCES,
 )
 
 
@@ -765,6 +768,145 @@ merge_policy = "bad"
         ingest_manifest.load_ingest_manifest(source_bad)
 
 
+def test_manifest_parquet_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest = tmp_path / "manifest.toml"
+    manifest.write_text(
+        """
+[defaults.parquet]
+compression_level = 12
+row_group_size = 50000
+partition_by = "posted_month"
+[[sources]]
+source = "greenhouse"
+source_ref = "stripe"
+""".strip(),
+        encoding="utf-8",
+    )
+    loaded = ingest_manifest.load_ingest_manifest(manifest)
+    assert loaded.defaults.parquet.compression == "zstd"
+    assert loaded.defaults.parquet.compression_level == 12
+    assert loaded.defaults.parquet.partition_by == "posted_month"
+    params = ingest_service._resolve_source_params(loaded.sources[0], loaded.defaults)
+    assert params["parquet"] == loaded.defaults.parquet
+
+    seen: list[ParquetWriterConfig] = []
+
+    def record_parquet(**kwargs):
+        seen.append(kwargs["parquet"])
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(ingest_service, "sync_source", record_parquet)
+    batch = ingest_service.sync_sources_from_manifest(
+        manifest_path=manifest,
+        report_file=tmp_path / "report.json",
+        parquet_overrides={"partition_by": "none"},
+    )
+    assert batch.fail_count == 1
+    assert seen == [loaded.defaults.parquet.model_copy(update={"partition_by": None})]
+
+    manifest.write_text(
+        manifest.read_text(encoding="utf-8").replace("partition_by", "partition"),
+        encoding="utf-8",
+    )
+    with pytest.raises(ConfigValidationError, match="invalid defaults.parquet"):
+        ingest_manifest.load_ingest_manifest(manifest)
+    manifest.write_text('defaults = { parquet = 1 }\n', encoding="utf-8")
+    with pytest.raises(ConfigValidationError, match="defaults.parquet must be a table"):
+        ingest_manifest.load_ingest_manifest(manifest)
+
+
+def test_sync_source_partitions_snapshots_but_not_catalog_or_latest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_fetcher(source_ref: str, *, max_pages: int, max_jobs: int, http_get_json):
+        return (
+            [
+                {
+                    "id": str(index),
+                    "title": f"Role {index}",
+                    "absolute_url": f"https://x/jobs/{index}",
+                    "first_published": f"2026-0{index}-01T00:00:00Z",
+                }
+                for index in (1, 2)
+            ],
+            1,
+        )
+
+    monkeypatch.setitem(ingest_service._SOURCE_FETCHERS, "greenhouse", fake_fetcher)
+    parquet = ParquetWriterConfig(compression_level=5, partition_by="posted_month")
+    for _ in range(3):
+        result = ingest_service.sync_source(
+            source="greenhouse",
+            source_ref="acme",
+            output_parquet=tmp_path / "jobs.parquet",
+            state_file=tmp_path / "state.json",
+            full_refresh=True,
+            retain_snapshots=2,
+            parquet=parquet,
+            http_get_json=lambda _url: {},
+        )
+        assert result.rows_written == 2
+
+    assert (tmp_path / "jobs.parquet").is_file()
+    assert (tmp_path / "catalog.parquet").is_file()
+    snapshots = sorted((tmp_path / "snapshots").iterdir())
+    assert len(snapshots) == 2
+    assert sorted(path.name for path in snapshots[0].iterdir()) == [
+        "posted_month=2026-01",
+        "posted_month=2026-02",
+    ]
+
+
+def test_sync_source_categorical_encodes_snapshot_and_latest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest = tmp_path / "manifest.toml"
+    manifest.write_text(
+        """
+[defaults]
+categorical = true
+[[sources]]
+source = "greenhouse"
+source_ref = "acme"
+""".strip(),
+        encoding="utf-8",
+    )
+    loaded = ingest_manifest.load_ingest_manifest(manifest)
+    params = ingest_service._resolve_source_params(loaded.sources[0], loaded.defaults)
+    assert params["categorical"] is True
+
+    def fake_fetcher(source_ref: str, *, max_pages: int, max_jobs: int, http_get_json):
+        return (
+            [
+                {
+                    "id": "1",
+                    "title": "Engineer",
+                    "absolute_url": "https://x/jobs/1",
+                    "location": {"name": "Remote"},
+                }
+            ],
+            1,
+        )
+
+    monkeypatch.setitem(ingest_service._SOURCE_FETCHERS, "greenhouse", fake_fetcher)
+    ingest_service.sync_source(
+        source="greenhouse",
+        source_ref="acme",
+        output_parquet=tmp_path / "jobs.parquet",
+        state_file=tmp_path / "state.json",
+        categorical=True,
+        http_get_json=lambda _url: {},
+    )
+
+    latest = pl.read_parquet(tmp_path / "jobs.parquet")
+    (snapshot,) = (tmp_path / "snapshots").iterdir()
+    for frame in (latest, pl.read_parquet(snapshot)):
+        assert frame.schema["source"] == pl.Enum(SUPPORTED_INGEST_SOURCES)
+        assert frame.schema["work_mode"] == pl.Enum(("hybrid", "onsite", "remote", "unknown"))
+        assert frame.schema["title"] == pl.String
+        assert frame["work_mode"].cast(pl.String).to_list() == ["remote"]
+
+
 def test_http_and_model_and_output_and_lineage_v3(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     assert ingest_service._duration_ms(datetime.now(UTC), datetime.now(UTC)) >= 0
     assert ingest_service._utc_now_iso().endswith("+00:00")
@@ -960,7 +1102,7 @@ def test_cli_validate_dispatch_and_handler(monkeypatch: pytest.MonkeyPatch, tmp_
         report_file=tmp_path / "validate.json",
         rows_evaluated=1,
     )
-    monkeypatch.setattr(handlers, "validate_ingestion_source", lambda **_k: validate_result)
+    monkeypatch.setattr("honestroles.ingest.validate_ingestion_source", lambda **_k: validate_result)
     cmd = handlers.handle_ingest_validate(
         argparse.Namespace(
             source="greenhouse",
@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
 import honestroles as hr
 
 
@@ -26,3 +34,47 @@ def test_old_global_plugin_api_not_exported() -> None:
         "apply_rate_plugins",
     }
     assert forbidden.isdisjoint(set(hr.__all__))
+
+
+def test_public_names_resolve_lazily() -> None:
+    for name in hr.__all__:
+        assert getattr(hr, name) is not None
+    assert hr.PluginRegistry is hr.plugins.PluginRegistry
+    assert set(hr.__all__).issubset(dir(hr))
+    with pytest.raises(AttributeError, match="no attribute 'missing_name'"):
+        getattr(hr, "missing_name")
+    for name in hr.plugins.__all__:
+        assert getattr(hr.plugins, name) is not None
+    assert set(hr.plugins.__all__).issubset(dir(hr.plugins))
+    with pytest.raises(AttributeError, match="no attribute 'missing_name'"):
+        getattr(hr.plugins, "missing_name")
+
+
+def test_cold_start_stays_light_and_within_budget() -> None:
+    # The CLI entry point must not pull in Polars, pydantic, or any subcommand
+    # backend before a handler runs.
+    script = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        "import honestroles\n"
+        "import honestroles.cli.main\n"
+        "elapsed_ms = (time.perf_counter() - started) * 1000\n"
+        "heavy = sorted(m for m in sys.modules if m.split('.')[0] in {'polars', 'pydantic'}\n"
+        "    or m.startswith(('honestroles.eda', 'honestroles.ingest', 'honestroles.publish',\n"
+        "                     'honestroles.recommend', 'honestroles.runtime', 'honestroles.config')))\n"
+        "print(json.dumps({'elapsed_ms': elapsed_ms, 'heavy': heavy}))\n"
+    )
+    env = dict(os.environ)
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    result = json.loads(completed.stdout)
+    assert result["heavy"] == []
+    budget_ms = float(os.environ.get("HONESTROLES_IMPORT_BUDGET_MS", "300"))
+    assert result["elapsed_ms"] < budget_ms
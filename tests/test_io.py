@@ -5,17 +5,27 @@ from pathlib import Path
 import polars as pl
 import pytest
 
-from honestroles.config import RuntimeQualityConfig
+from honestroles.config import IpcWriterConfig, ParquetWriterConfig, RuntimeQualityConfig
 from honestroles.errors import ConfigValidationError
 from honestroles.io import (
     DataQualityAccumulator,
+    InputPartition,
     _validate_read_query,
     _validate_table_name,
     build_data_quality_report,
+    infer_table_format,
     normalize_source_data_contract,
     read_parquet,
+    read_table,
+    resolve_input_partitions,
+    resolve_parquet_options,
     resolve_source_aliases,
+    scan_input_partitions,
+    scan_table,
+    sink_parquet,
     validate_source_data_contract,
+    with_partition_columns,
+    write_ipc,
     write_parquet,
 )
 
@@ -230,3 +240,161 @@ def test_quality_report_strict_profile_and_zero_total_weight_error() -> None:
     acc.update(no_columns)
     with pytest.raises(ConfigValidationError, match="total weight must be positive"):
         acc.finalize(quality=RuntimeQualityConfig(profile="equal_weight_all"))
+
+
+def test_resolve_input_partitions_globs_directories_and_hive_values(
+    sample_jobs_df: pl.DataFrame, tmp_path: Path
+) -> None:
+    root = tmp_path / "jobs"
+    for day, offset in (("2026-01-02", 1), ("2026-01-01", 0)):
+        target = root / f"date={day}" / "part-0.parquet"
+        target.parent.mkdir(parents=True)
+        sample_jobs_df.slice(offset, 1).write_parquet(target)
+
+    single = tmp_path / "single.parquet"
+    assert resolve_input_partitions(single) == (InputPartition(path=single),)
+
+    by_glob = resolve_input_partitions(root / "date=*" / "*.parquet", hive_partitioning=True)
+    by_dir = resolve_input_partitions(root, hive_partitioning=True)
+    assert by_glob == by_dir
+    assert [partition.hive_values for partition in by_glob] == [
+        (("date", "2026-01-01"),),
+        (("date", "2026-01-02"),),
+    ]
+    assert resolve_input_partitions(root)[0].hive_values == ()
+
+    first = with_partition_columns(read_parquet(by_glob[0].path), by_glob[0])
+    assert first["date"].to_list() == ["2026-01-01"]
+    # Columns stored in the file win over the directory value.
+    assert with_partition_columns(
+        pl.DataFrame({"date": ["x"]}), by_glob[0]
+    )["date"].to_list() == ["x"]
+    scanned = scan_input_partitions(by_glob).collect()
+    assert scanned["id"].to_list() == ["1", "2"]
+    assert scanned["date"].to_list() == ["2026-01-01", "2026-01-02"]
+
+    with pytest.raises(ConfigValidationError, match="matched no parquet files"):
+        resolve_input_partitions(root / "date=*" / "*.csv")
+
+    nested = tmp_path / "flat" / "date=2026-01-03" / "raw" / "part-0.parquet"
+    nested.parent.mkdir(parents=True)
+    sample_jobs_df.write_parquet(nested)
+    assert resolve_input_partitions(tmp_path / "flat", hive_partitioning=True)[0].hive_values == (
+        ("date", "2026-01-03"),
+    )
+
+
+def test_write_parquet_applies_writer_options_and_hive_partitions(tmp_path: Path) -> None:
+    frame = pl.DataFrame(
+        {
+            "id": [str(i) for i in range(2_000)],
+            "source": [("greenhouse", "lever", None)[i % 3] for i in range(2_000)],
+            "posted_at": [
+                (f"2026-0{1 + i % 2}-05T00:00:00+00:00" if i % 5 else None) for i in range(2_000)
+            ],
+        }
+    )
+    plain = tmp_path / "plain.parquet"
+    write_parquet(frame, plain, ParquetWriterConfig(compression="uncompressed"))
+    compact = tmp_path / "compact.parquet"
+    write_parquet(frame, compact, ParquetWriterConfig(compression_level=19, row_group_size=500))
+    assert compact.stat().st_size < plain.stat().st_size
+    assert read_parquet(compact).equals(frame)
+
+    target = tmp_path / "by_month"
+    (target / "posted_month=stale").mkdir(parents=True)
+    write_parquet(frame, target, ParquetWriterConfig(partition_by="posted_month"))
+    assert sorted(path.name for path in target.iterdir()) == [
+        "posted_month=2026-01",
+        "posted_month=2026-02",
+        "posted_month=__HIVE_DEFAULT_PARTITION__",
+    ]
+    assert read_parquet(target).height == frame.height
+
+    by_source = tmp_path / "by_source.parquet"
+    sink_parquet(frame.lazy(), by_source, ParquetWriterConfig(partition_by="source"))
+    greenhouse = read_parquet(by_source / "source=greenhouse" / "part-00000.parquet")
+    assert greenhouse["source"].unique().to_list() == ["greenhouse"]
+    write_parquet(frame, by_source)
+    assert by_source.is_file()
+
+    with pytest.raises(ConfigValidationError, match="missing column 'posted_at'"):
+        write_parquet(frame.drop("posted_at"), target, ParquetWriterConfig(partition_by="posted_month"))
+
+
+@pytest.mark.parametrize("partition_sink", [True, False])
+def test_hive_partitions_single_pass_layout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, partition_sink: bool
+) -> None:
+    if not partition_sink:
+        monkeypatch.delattr(pl, "PartitionBy", raising=False)
+    frame = pl.DataFrame(
+        {"id": [str(i) for i in range(6)], "source": ["a b", "a/b", None, "a b", "c", "a b"]}
+    )
+    options = ParquetWriterConfig(partition_by="source")
+    target = tmp_path / "jobs.parquet"
+    target.write_text("stale file", encoding="utf-8")
+
+    write_parquet(frame, target, options)
+    assert sorted(path.relative_to(target).as_posix() for path in target.rglob("*.parquet")) == [
+        "source=__HIVE_DEFAULT_PARTITION__/part-00000.parquet",
+        "source=a%20b/part-00000.parquet",
+        "source=a%2Fb/part-00000.parquet",
+        "source=c/part-00000.parquet",
+    ]
+    spaced = read_parquet(target / "source=a%20b" / "part-00000.parquet")
+    assert spaced["id"].to_list() == ["0", "3", "5"]
+    assert spaced["source"].to_list() == ["a b"] * 3
+
+    sink_parquet(frame.lazy().clear(), target, options)
+    assert [path.name for path in target.iterdir()] == ["part-00000.parquet"]
+    assert read_parquet(target).schema == frame.schema
+
+    sink_parquet(frame.lazy(), target)
+    assert target.is_file()
+    assert read_parquet(target).equals(frame)
+
+
+def test_resolve_parquet_options_merges_overrides() -> None:
+    base = ParquetWriterConfig(compression_level=12, partition_by="source")
+    assert resolve_parquet_options(base, {"compression_level": None}) is base
+    merged = resolve_parquet_options(base, {"row_group_size": 1_000, "partition_by": "none"})
+    assert merged == ParquetWriterConfig(compression_level=12, row_group_size=1_000)
+    with pytest.raises(ConfigValidationError, match="compression_level is not supported"):
+        resolve_parquet_options(base, {"compression": "snappy"})
+    with pytest.raises(ConfigValidationError, match=r"must be in \[1, 22\]"):
+        resolve_parquet_options(None, {"compression_level": 40})
+
+
+def test_arrow_ipc_tables_are_read_memory_mapped_and_replaced_atomically(
+    tmp_path: Path,
+) -> None:
+    frame = pl.DataFrame({"id": ["1", "2", "3"], "title": ["a", "b", None]})
+    root = tmp_path / "ipc"
+    write_ipc(frame, root / "date=2026-01" / "part.arrow")
+    write_ipc(frame.head(1), root / "date=2026-02" / "part.feather")
+    write_parquet(frame, root / "date=2026-03" / "ignored.parquet")
+
+    assert infer_table_format(root / "x.ipc") == "ipc"
+    assert infer_table_format(root / "x.parquet") == "parquet"
+    partitions = resolve_input_partitions(root, hive_partitioning=True, kind="ipc")
+    assert [item.path.name for item in partitions] == ["part.arrow", "part.feather"]
+    scanned = scan_input_partitions(partitions, "ipc").collect()
+    assert scanned["date"].to_list() == ["2026-01"] * 3 + ["2026-02"]
+    with pytest.raises(ConfigValidationError, match="matched no ipc files"):
+        resolve_input_partitions(root / "date=2026-03", kind="ipc")
+
+    target = root / "date=2026-01" / "part.arrow"
+    mapped = read_table(target)
+    assert mapped.equals(frame)
+    assert scan_table(target).collect().equals(frame)
+    # The mapped frame stays valid while the file is rewritten underneath it.
+    write_ipc(frame.reverse(), target, IpcWriterConfig(compression="zstd"))
+    assert mapped.equals(frame)
+    assert read_table(target).equals(frame.reverse())
+    assert not list(target.parent.glob(".*.tmp"))
+
+    # A directory left at the target (say, earlier hive output) is replaced.
+    (tmp_path / "out.arrow" / "source=lever").mkdir(parents=True)
+    write_ipc(frame, tmp_path / "out.arrow")
+    assert read_table(tmp_path / "out.arrow").equals(frame)
@@ -39,6 +39,16 @@ def test_filter_required_keywords_passthrough_tuple() -> None:
     assert options.required_keywords == ("python", "sql")
 
 
+def test_filter_keyword_group_requires_terms() -> None:
+    options = FilterStageOptions.model_validate(
+        {"keyword_groups": [{"any_of": ["aws", "gcp"], "none_of": ["unpaid"]}]}
+    )
+    assert options.keyword_groups[0].any_of == ("aws", "gcp")
+
+    with pytest.raises(ValidationError, match="at least one non-empty keyword"):
+        FilterStageOptions.model_validate({"keyword_groups": [{"all_of": [" "]}]})
+
+
 def test_rate_stage_negative_weights_raise() -> None:
     with pytest.raises(ValidationError):
         RateStageOptions(completeness_weight=-1.0)
@@ -292,3 +292,44 @@ def test_application_plan_entry_and_runtime_diagnostics_to_dict() -> None:
             fit_score=0.0,
             estimated_effort_minutes=0,
         )
+
+
+def test_job_dataset_validation_cache_skips_repeated_schema_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from honestroles import domain
+
+    domain._VALIDATED_SCHEMAS.clear()
+    checks: list[int] = []
+    original = JobDataset._check_canonical_types
+
+    def counting_check(self: JobDataset) -> None:
+        checks.append(1)
+        original(self)
+
+    monkeypatch.setattr(JobDataset, "_check_canonical_types", counting_check)
+    dataset = JobDataset.from_polars(_canonical_frame())
+    dataset.validate()
+    dataset.with_frame(_canonical_frame().with_columns(pl.lit(1).alias("extra")))
+    assert len(checks) == 1
+    assert domain._VALIDATED_SCHEMAS.hits == 2
+
+    with pytest.raises(TypeError):
+        JobDataset.from_polars(_canonical_frame().with_columns(pl.lit(1).alias("title")))
+    with pytest.raises(TypeError):
+        JobDataset.from_polars(_canonical_frame().with_columns(pl.lit(1).alias("title")))
+    assert len(checks) == 3
+
+
+def test_validated_schema_cache_evicts_least_recently_used() -> None:
+    from honestroles.domain import _ValidatedSchemaCache
+
+    cache = _ValidatedSchemaCache(2)
+    cache.add("a")
+    cache.add("b")
+    assert cache.contains("a")
+    cache.add("c")
+
+    assert not cache.contains("b")
+    assert cache.contains("a") and cache.contains("c")
+    assert (cache.hits, cache.misses) == (3, 1)
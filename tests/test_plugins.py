@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from honestroles.config.models import FilterStageOptions, PluginManifestItem
+from honestroles.config.models import FilterStageOptions, LabelStageOptions, PluginManifestItem
 from honestroles import JobDataset
+from honestroles.plugins import isolation
 from honestroles.plugins.errors import PluginExecutionError, PluginValidationError
 from honestroles.plugins.loader import load_plugin_item
 from honestroles.plugins.registry import PluginRegistry
-from honestroles.plugins.types import FilterStageContext, PluginDefinition, RuntimeExecutionContext
-from honestroles.stages import filter_stage
+from honestroles.plugins.types import (
+    FilterStageContext,
+    LabelStageContext,
+    PluginDefinition,
+    RuntimeExecutionContext,
+)
+from honestroles.stages import filter_stage, label_stage
 
 
 def _dataset() -> JobDataset:
@@ -255,3 +262,204 @@ def test_loader_freezes_list_and_set_settings() -> None:
     loaded = load_plugin_item(item)
     assert loaded.settings["values"] == (1, 2)
     assert loaded.settings["flags"] == frozenset({3, 4})
+
+
+def test_loader_detects_expression_plugin_contract() -> None:
+    item = PluginManifestItem(
+        name="title_length",
+        kind="label",
+        callable="tests.plugins.fixture_plugins:label_title_length_expr",
+    )
+    assert load_plugin_item(item).contract == "expressions"
+    dataset_item = PluginManifestItem(
+        name="label_note",
+        kind="label",
+        callable="tests.plugins.fixture_plugins:label_note",
+    )
+    assert load_plugin_item(dataset_item).contract == "dataset"
+
+
+def test_loader_rejects_schema_plugin_returning_dataset() -> None:
+    item = PluginManifestItem(
+        name="mixed",
+        kind="label",
+        callable="tests.plugins.fixture_plugins:schema_returning_dataset",
+    )
+    with pytest.raises(PluginValidationError, match="must be PluginExpressions"):
+        load_plugin_item(item)
+
+
+def _isolated_runtime(max_threads: int | None = 2) -> RuntimeExecutionContext:
+    return RuntimeExecutionContext(
+        pipeline_config_path=Path("pipeline.toml"),
+        plugin_manifest_path=None,
+        stage_options={},
+        max_threads=max_threads,
+    )
+
+
+def test_isolated_plugin_matches_in_process_result() -> None:
+    frame = _dataset().to_polars()
+    dataset = JobDataset.from_polars(
+        pl.concat([frame] * 5).with_columns(
+            pl.int_range(5).cast(pl.String).alias("id"),
+            pl.Series("title", ["a", "b c", "d e f", "g", "h i"]),
+        )
+    )
+    results = []
+    for isolated in (False, True):
+        plugin = load_plugin_item(
+            PluginManifestItem(
+                name="title_words",
+                kind="label",
+                callable="tests.plugins.fixture_plugins:label_title_words",
+                isolated=isolated,
+            )
+        )
+        out = label_stage(dataset, LabelStageOptions(), _isolated_runtime(), plugins=(plugin,))
+        results.append(out.to_polars())
+
+    in_process, isolated_out = results
+    assert isolated_out.drop("plugin_worker_pid").equals(in_process.drop("plugin_worker_pid"))
+    assert isolated_out["plugin_title_words"].to_list() == [1, 2, 3, 1, 2]
+    assert os.getpid() not in isolated_out["plugin_worker_pid"].to_list()
+
+
+def _rows(count: int) -> JobDataset:
+    frame = _dataset().to_polars()
+    return JobDataset.from_polars(
+        pl.concat([frame] * count).with_columns(pl.int_range(count).cast(pl.String).alias("id"))
+    )
+
+
+def _isolated_label(callable_name: str, **fields: object) -> PluginDefinition:
+    return load_plugin_item(
+        PluginManifestItem(
+            name=callable_name,
+            kind="label",
+            callable=f"tests.plugins.fixture_plugins:{callable_name}",
+            isolated=True,
+            **fields,
+        )
+    )
+
+
+def test_isolated_plugin_reuses_one_pool_per_thread_budget(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # Without a writable /dev/shm the chunks go through the default temp dir.
+    monkeypatch.setattr(isolation, "_SHARED_MEMORY_DIR", tmp_path / "missing")
+    isolation.shutdown_isolated_pools()
+    plugin = _isolated_label("label_settings_echo", settings={"tags": ["a", {"b": [1]}]})
+
+    pools = set()
+    for height in (1, 2, 3):
+        out = label_stage(_rows(height), LabelStageOptions(), _isolated_runtime(2), plugins=(plugin,))
+        assert out.to_polars()["plugin_tags"].to_list() == ["('a', {'b': (1,)})"] * height
+        pools.add(id(isolation._POOLS[2][0]))
+
+    assert len(pools) == 1
+    assert list(isolation._POOLS) == [2]
+    isolation.shutdown_isolated_pools()
+    assert isolation._POOLS == {}
+
+
+def test_isolated_plugin_reports_worker_exit() -> None:
+    plugin = _isolated_label("label_worker_exit")
+
+    with pytest.raises(PluginExecutionError, match="worker process exited unexpectedly"):
+        label_stage(_dataset(), LabelStageOptions(), _isolated_runtime(1), plugins=(plugin,))
+    assert 1 not in isolation._POOLS
+
+
+def test_isolated_plugin_rejects_mismatched_chunks() -> None:
+    plugin = _isolated_label("label_chunk_column")
+
+    with pytest.raises(PluginExecutionError, match="row chunks returned mismatched frames"):
+        label_stage(_rows(2), LabelStageOptions(), _isolated_runtime(2), plugins=(plugin,))
+
+
+def _chunk_task(tmp_path: Path, callable_name: str) -> isolation._ChunkTask:
+    input_path = tmp_path / "chunk.in.arrow"
+    _dataset().to_polars().write_ipc(input_path)
+    return isolation._ChunkTask(
+        callable_ref=f"tests.plugins.fixture_plugins:{callable_name}",
+        plugin_name=callable_name,
+        context_type=LabelStageContext,
+        settings={},
+        runtime=_isolated_runtime(),
+        input_path=input_path,
+        output_path=tmp_path / "chunk.out.arrow",
+    )
+
+
+def test_isolated_chunk_writes_plugin_output(tmp_path: Path) -> None:
+    task = _chunk_task(tmp_path, "label_title_words")
+
+    assert isolation._run_chunk(task) == (None, str(task.output_path))
+    assert pl.read_ipc(task.output_path)["plugin_title_words"].to_list() == [1]
+
+
+@pytest.mark.parametrize(
+    ("callable_name", "error"),
+    [
+        ("label_returns_frame", "returned invalid type 'DataFrame', expected JobDataset"),
+        ("fail_filter", "intentional plugin failure"),
+    ],
+)
+def test_isolated_chunk_reports_plugin_errors(
+    tmp_path: Path, callable_name: str, error: str
+) -> None:
+    task = _chunk_task(tmp_path, callable_name)
+
+    assert isolation._run_chunk(task) == (error, "")
+    assert not task.output_path.exists()
+
+
+def test_isolated_plugin_reports_worker_failure() -> None:
+    plugin = load_plugin_item(
+        PluginManifestItem(
+            name="always_fail",
+            kind="filter",
+            callable="tests.plugins.fixture_plugins:fail_filter",
+            isolated=True,
+        )
+    )
+
+    with pytest.raises(PluginExecutionError, match="intentional plugin failure"):
+        filter_stage(_dataset(), FilterStageOptions(), _isolated_runtime(), plugins=(plugin,))
+
+
+def test_isolated_plugin_times_out() -> None:
+    plugin = load_plugin_item(
+        PluginManifestItem(
+            name="slow",
+            kind="label",
+            callable="tests.plugins.fixture_plugins:label_sleep",
+            isolated=True,
+            timeout_seconds=0.5,
+            settings={"seconds": 30},
+        )
+    )
+
+    with pytest.raises(PluginExecutionError, match="timed out after 0.5s"):
+        label_stage(_dataset(), LabelStageOptions(), _isolated_runtime(1), plugins=(plugin,))
+    assert 1 not in isolation._POOLS
+
+
+def test_isolation_rejects_timeout_without_isolation_and_expression_plugins() -> None:
+    with pytest.raises(ValueError, match="without isolated = true"):
+        PluginManifestItem(
+            name="slow",
+            kind="label",
+            callable="tests.plugins.fixture_plugins:label_sleep",
+            timeout_seconds=1,
+        )
+    item = PluginManifestItem(
+        name="title_length",
+        kind="label",
+        callable="tests.plugins.fixture_plugins:label_title_length_expr",
+        isolated=True,
+    )
+    with pytest.raises(PluginValidationError, match="cannot be isolated"):
+        load_plugin_item(item)
@@ -725,9 +725,9 @@ def test_publish_cli_main_commands(tmp_path: Path, capsys: pytest.CaptureFixture
         "check_codes": [],
     }
 
-    monkeypatch.setattr("honestroles.cli.handlers.migrate_neondb", lambda **_kwargs: types.SimpleNamespace(to_payload=lambda: migration_payload))
-    monkeypatch.setattr("honestroles.cli.handlers.publish_neondb_sync", lambda **_kwargs: types.SimpleNamespace(to_payload=lambda: sync_payload))
-    monkeypatch.setattr("honestroles.cli.handlers.verify_neondb_contract", lambda **_kwargs: types.SimpleNamespace(to_payload=lambda: verify_payload, status="fail"))
+    monkeypatch.setattr("honestroles.publish.migrate_neondb", lambda **_kwargs: types.SimpleNamespace(to_payload=lambda: migration_payload))
+    monkeypatch.setattr("honestroles.publish.publish_neondb_sync", lambda **_kwargs: types.SimpleNamespace(to_payload=lambda: sync_payload))
+    monkeypatch.setattr("honestroles.publish.verify_neondb_contract", lambda **_kwargs: types.SimpleNamespace(to_payload=lambda: verify_payload, status="fail"))
 
     code_migrate = main(["publish", "neondb", "migrate"])
     assert code_migrate == 0
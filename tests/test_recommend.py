@@ -247,6 +247,19 @@ def test_scoring_and_filter_paths() -> None:
     assert "MISSING_COMPANY" not in quality_flags
     assert "python" not in missing
 
+    # Company and location words are not skills, with or without the
+    # precomputed skill tokens of an indexed record.
+    acme_candidate = CandidateProfile(profile_id="acme", skills=("acme", "python", "remote"))
+    legacy_job = {key: value for key, value in job.items() if key != "skill_tokens"}
+    for record in (job, legacy_job):
+        _, _, missing, _, _ = scoring_mod.score_job(
+            candidate=acme_candidate,
+            job=record,
+            policy=RecommendationPolicy(),
+            multipliers={key: 1.0 for key in scoring_mod.SIGNAL_KEYS},
+        )
+        assert missing == ("acme", "remote")
+
     blocked_job = dict(job)
     blocked_job["description_text"] = "No sponsorship offered."
     assert "FILTER_VISA" in scoring_mod.filter_job(candidate, blocked_job)
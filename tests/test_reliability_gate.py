@@ -152,10 +152,10 @@ def test_evaluate_reliability_read_parquet_failure(
         filename="read_fail.toml",
     )
 
-    def fail_read(_path: Path) -> pl.DataFrame:
+    def fail_read(_path: Path, _kind: str | None = None) -> pl.DataFrame:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(evaluator_mod, "read_parquet", fail_read)
+    monkeypatch.setattr(evaluator_mod, "read_table", fail_read)
     evaluation = evaluator_mod.evaluate_reliability(
         pipeline_config=str(pipeline),
         plugin_manifest=None,
@@ -166,6 +166,22 @@ def test_evaluate_reliability_read_parquet_failure(
     assert sample_check["status"] == "fail"
 
 
+def test_evaluate_reliability_fails_input_glob_without_matches(tmp_path: Path) -> None:
+    pipeline = _write_pipeline(
+        tmp_path,
+        input_path=tmp_path / "missing" / "*.parquet",
+        output_path=tmp_path / "out.parquet",
+        filename="glob_missing.toml",
+    )
+    evaluation = evaluator_mod.evaluate_reliability(
+        pipeline_config=str(pipeline),
+        plugin_manifest=None,
+        sample_rows=10,
+        policy_file=None,
+    )
+    assert _check_by_code(evaluation.checks, "INPUT_EXISTS")["status"] == "fail"
+
+
 def test_policy_check_variants_cover_warn_and_missing_fields() -> None:
     checks: list[dict[str, object]] = []
     now_text = datetime.now(UTC).isoformat()
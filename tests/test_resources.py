@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import polars as pl
+import pytest
+
+import honestroles.resources as resources_module
+import honestroles.telemetry as telemetry_module
+from honestroles.resources import (
+    InputEstimate,
+    budget_batch_rows,
+    current_rss_bytes,
+    estimate_input,
+    limit_polars_threads,
+    peak_rss_bytes,
+    worker_thread_limit,
+)
+
+
+def test_estimate_input_scales_sample_width_to_row_count() -> None:
+    frame = pl.DataFrame({"text": ["x" * 100] * 50}).lazy()
+
+    estimate = estimate_input(frame, sample_rows=10)
+    assert estimate.rows == 50
+    assert estimate.bytes_per_row == pytest.approx(estimate.bytes / 50)
+    assert estimate.bytes >= 50 * 100
+
+    empty = estimate_input(frame.head(0))
+    assert empty == InputEstimate(rows=0, bytes=0)
+    assert empty.bytes_per_row == 0.0
+
+
+def test_budget_batch_rows_fits_batches_in_budget() -> None:
+    estimate = InputEstimate(rows=1_000, bytes=1_000_000)
+
+    assert budget_batch_rows(estimate, 30_000, 500) == 10
+    assert budget_batch_rows(estimate, 10**9, 500) == 500
+    assert budget_batch_rows(estimate, 1, 500) == 1
+    assert budget_batch_rows(InputEstimate(rows=0, bytes=0), 1, 500) == 500
+
+
+def test_limit_polars_threads_only_applies_before_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("POLARS_MAX_THREADS", "8")
+    assert limit_polars_threads(2) is False
+    assert os.environ["POLARS_MAX_THREADS"] == "8"
+
+    monkeypatch.delitem(sys.modules, "polars")
+    assert limit_polars_threads(2) is True
+    assert os.environ["POLARS_MAX_THREADS"] == "2"
+
+
+@pytest.mark.parametrize("previous", [None, "8"])
+def test_worker_thread_limit_restores_environment(
+    monkeypatch: pytest.MonkeyPatch, previous: str | None
+) -> None:
+    if previous is None:
+        monkeypatch.delenv("POLARS_MAX_THREADS", raising=False)
+    else:
+        monkeypatch.setenv("POLARS_MAX_THREADS", previous)
+
+    with worker_thread_limit(None):
+        assert os.environ.get("POLARS_MAX_THREADS") == previous
+    with worker_thread_limit(3):
+        assert os.environ["POLARS_MAX_THREADS"] == "3"
+    assert os.environ.get("POLARS_MAX_THREADS") == previous
+
+
+def test_rss_helpers_without_proc(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_proc(*_args: object, **_kwargs: object) -> None:
+        raise OSError("no /proc")
+
+    monkeypatch.setattr(resources_module, "open", no_proc, raising=False)
+    assert current_rss_bytes() is None
+    # The peak falls back to getrusage.
+    peak = peak_rss_bytes()
+    assert peak is not None and peak > 0
+
+    monkeypatch.setattr(resources_module.sys, "platform", "darwin")
+    assert peak_rss_bytes() == resources_module.resource.getrusage(
+        resources_module.resource.RUSAGE_SELF
+    ).ru_maxrss
+
+
+def test_rss_sampler_is_inert_without_rss(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(telemetry_module, "current_rss_bytes", lambda: None)
+    sampler = telemetry_module._RssSampler()
+
+    assert sampler.start() is False
+    sampler.stop()
+    assert sampler.peak() == 0
+    assert sampler.run_peak == 0
+
+    with telemetry_module.TelemetryRecorder(track_rss=True) as telemetry:
+        with telemetry.measure("clean"):
+            pass
+    assert telemetry.peak_rss_bytes is None
+    assert telemetry.entries()[0].peak_rss_bytes is None
+
+
+def test_peak_stack_close_without_open_reports_nothing() -> None:
+    stack = telemetry_module._PeakStack(lambda: 5, lambda: None)
+
+    assert stack.close() is None
+    stack.open()
+    assert stack.close() == 5
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
+import json
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from honestroles.errors import RuntimeInitializationError, StageExecutionError
+from honestroles.checkpoints import StageCheckpointCache
+from honestroles.config import load_pipeline_config
+from honestroles.config.models import PluginManifestItem
+from honestroles.errors import (
+    ConfigValidationError,
+    RuntimeInitializationError,
+    StageExecutionError,
+)
+from honestroles.incremental import ROW_KEY, IncrementalStateStore, with_row_keys
+from honestroles.plugins import PluginRegistry
 from honestroles.plugins.errors import PluginExecutionError
+from honestroles.plugins.loader import load_plugin_item
+from honestroles.plugins.types import PluginDefinition
+from honestroles.projection import required_input_columns
 from honestroles.runtime import HonestRolesRuntime
+from honestroles.sharding import SHARD_ROW, ShardSpec
 
 
 def test_runtime_run_end_to_end(
@@ -374,3 +388,1331 @@ enabled = false
     assert frame.schema["remote"] == pl.Boolean
     assert isinstance(frame.schema["skills"], pl.List)
     assert frame["skills"].to_list() == [["python", "sql"]]
+
+
+def _with_execution(pipeline_path: Path, execution: str) -> Path:
+    text = pipeline_path.read_text(encoding="utf-8")
+    target = pipeline_path.with_name(f"pipeline_{execution}.toml")
+    target.write_text(
+        text.replace("[runtime]", f'[runtime]\nexecution = "{execution}"'),
+        encoding="utf-8",
+    )
+    return target
+
+
+def test_runtime_lazy_execution_matches_eager(
+    pipeline_config_path: Path, plugin_manifest_path: Path
+) -> None:
+    eager = HonestRolesRuntime.from_configs(pipeline_config_path, plugin_manifest_path).run()
+    lazy = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_path, "lazy"), plugin_manifest_path
+    ).run()
+
+    assert lazy.dataset.to_polars().equals(eager.dataset.to_polars())
+    assert lazy.application_plan == eager.application_plan
+    lazy_diagnostics = lazy.diagnostics.to_dict()
+    assert lazy_diagnostics["stage_rows"] == eager.diagnostics.to_dict()["stage_rows"]
+    assert lazy_diagnostics["runtime"]["execution"] == "lazy"
+
+
+def test_runtime_lazy_execution_without_plugins_collects_once(
+    pipeline_config_path: Path, monkeypatch
+) -> None:
+    import honestroles.lazy as lazy_module
+
+    calls: list[int] = []
+    original = lazy_module.pl.collect_all
+
+    def counting_collect_all(frames, *args, **kwargs):
+        calls.append(len(frames))
+        return original(frames, *args, **kwargs)
+
+    monkeypatch.setattr(lazy_module.pl, "collect_all", counting_collect_all)
+    result = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_path, "lazy")
+    ).run()
+
+    assert len(calls) == 1
+    assert result.diagnostics.to_dict()["stage_rows"]["input"] == 3
+    assert result.application_plan
+
+
+def test_runtime_lazy_execution_records_plugin_failure_once(
+    pipeline_config_non_fail_fast_path: Path,
+    fail_plugin_manifest_path: Path,
+) -> None:
+    from tests.plugins import fixture_plugins
+
+    fixture_plugins.FAIL_FILTER_CALLS.clear()
+    eager = HonestRolesRuntime.from_configs(
+        pipeline_config_non_fail_fast_path, fail_plugin_manifest_path
+    ).run()
+    fixture_plugins.FAIL_FILTER_CALLS.clear()
+    lazy = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_non_fail_fast_path, "lazy"),
+        fail_plugin_manifest_path,
+    ).run()
+
+    assert fixture_plugins.FAIL_FILTER_CALLS == ["failing_filter"]
+    diagnostics = lazy.diagnostics.to_dict()
+    assert diagnostics["runtime"]["execution"] == "lazy"
+    assert diagnostics["non_fatal_errors"] == eager.diagnostics.to_dict()["non_fatal_errors"]
+    assert diagnostics["stage_rows"] == eager.diagnostics.to_dict()["stage_rows"]
+    assert lazy.dataset.to_polars().equals(eager.dataset.to_polars())
+
+
+def test_runtime_lazy_execution_records_match_failure_like_eager(
+    pipeline_config_non_fail_fast_path: Path,
+) -> None:
+    bad_group = pipeline_config_non_fail_fast_path.with_name("pipeline_bad_group.toml")
+    bad_group.write_text(
+        pipeline_config_non_fail_fast_path.read_text(encoding="utf-8").replace(
+            "top_k = 5", 'top_k = 5\ngroup_by = ["nonexistent"]'
+        ),
+        encoding="utf-8",
+    )
+    eager = HonestRolesRuntime.from_configs(bad_group).run()
+    lazy = HonestRolesRuntime.from_configs(_with_execution(bad_group, "lazy")).run()
+
+    eager_errors = eager.diagnostics.to_dict()["non_fatal_errors"]
+    assert [error["stage"] for error in eager_errors] == ["match"]
+    assert [error["stage"] for error in lazy.diagnostics.to_dict()["non_fatal_errors"]] == [
+        "match"
+    ]
+    assert lazy.application_plan == eager.application_plan == ()
+    assert lazy.dataset.to_polars().equals(eager.dataset.to_polars())
+    assert "fit_rank" not in lazy.dataset.columns()
+
+
+def test_runtime_lazy_execution_raises_plugin_failure_without_rerun(
+    pipeline_config_path: Path, fail_plugin_manifest_path: Path
+) -> None:
+    from tests.plugins import fixture_plugins
+
+    fixture_plugins.FAIL_FILTER_CALLS.clear()
+    runtime = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_path, "lazy"), fail_plugin_manifest_path
+    )
+
+    with pytest.raises(PluginExecutionError, match="intentional plugin failure"):
+        runtime.run()
+    assert fixture_plugins.FAIL_FILTER_CALLS == ["failing_filter"]
+
+
+def _expression_manifest(tmp_path: Path, callable_ref: str) -> Path:
+    path = tmp_path / "plugins_expr.toml"
+    path.write_text(
+        f'[[plugins]]\nname = "title_number"\nkind = "label"\ncallable = "{callable_ref}"\n',
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_runtime_lazy_execution_attributes_fused_plan_failure(
+    pipeline_config_path: Path,
+    pipeline_config_non_fail_fast_path: Path,
+    tmp_path: Path,
+) -> None:
+    manifest = _expression_manifest(
+        tmp_path, "tests.plugins.fixture_plugins:label_title_number_expr"
+    )
+    runtime = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_path, "lazy"), manifest
+    )
+    with pytest.raises(StageExecutionError, match="stage 'label' failed"):
+        runtime.run()
+
+    result = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_non_fail_fast_path, "lazy"), manifest
+    ).run()
+    diagnostics = result.diagnostics.to_dict()
+    assert [error["stage"] for error in diagnostics["non_fatal_errors"]] == ["label"]
+    assert diagnostics["stage_rows"]["label"] == diagnostics["stage_rows"]["filter"]
+    assert "title_number" not in result.dataset.columns()
+    assert "rate_composite" in result.dataset.columns()
+def _write_streaming_corpus(path: Path, rows: int) -> None:
+    titles = ["Data Engineer", "Senior ML Engineer", "Intern Analyst", "", None]
+    texts = ["Python SQL pipelines", "Python and AWS", "Excel reporting"]
+    pl.DataFrame(
+        {
+            "id": [str(i) for i in range(rows)],
+            "title": [titles[i % len(titles)] for i in range(rows)],
+            "company": ["Co"] * rows,
+            "location": ["Remote"] * rows,
+            "remote": [bool(i % 2) for i in range(rows)],
+            "description_text": [texts[i % len(texts)] for i in range(rows)],
+            "description_html": [None] * rows,
+            "apply_url": [None if i % 7 == 0 else f"https://x/{i}" for i in range(rows)],
+            "posted_at": ["2026-01-01"] * rows,
+        }
+    ).write_parquet(path)
+
+
+def _write_streaming_pipeline(
+    tmp_path: Path, input_path: Path, *, execution: str, match: bool, match_extra: str = ""
+) -> Path:
+    path = tmp_path / f"pipeline_{execution}_{match}.toml"
+    path.write_text(
+        f"""
+[input]
+kind = "parquet"
+path = "{input_path}"
+
+[output]
+path = "{tmp_path / f'out_{execution}_{match}.parquet'}"
+
+[stages.filter]
+required_keywords = ["python"]
+
+[stages.match]
+enabled = {str(match).lower()}
+top_k = 7
+{match_extra}
+
+[runtime]
+execution = "{execution}"
+
+[runtime.streaming]
+batch_rows = 16
+""".strip(),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("match", [True, False])
+def test_runtime_streaming_execution_matches_eager(
+    tmp_path: Path, plugin_manifest_path: Path, match: bool
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 100)
+    eager = HonestRolesRuntime.from_configs(
+        _write_streaming_pipeline(tmp_path, input_path, execution="eager", match=match),
+        plugin_manifest_path,
+    ).run()
+    streaming = HonestRolesRuntime.from_configs(
+        _write_streaming_pipeline(tmp_path, input_path, execution="streaming", match=match),
+        plugin_manifest_path,
+    ).run()
+
+    eager_diagnostics = eager.diagnostics.to_dict()
+    streaming_diagnostics = streaming.diagnostics.to_dict()
+    assert streaming_diagnostics["stage_rows"] == eager_diagnostics["stage_rows"]
+    assert streaming_diagnostics["final_rows"] == eager_diagnostics["final_rows"]
+    assert streaming_diagnostics["runtime"]["execution"] == "streaming"
+    assert streaming.application_plan == eager.application_plan
+    assert pl.read_parquet(streaming_diagnostics["output_path"]).equals(
+        pl.read_parquet(eager_diagnostics["output_path"])
+    )
+    assert not list(tmp_path.glob(".*.parts"))
+    if not match:
+        assert streaming.dataset.row_count() == 0
+        assert streaming.dataset.columns() == eager.dataset.columns()
+
+
+def test_runtime_streaming_and_eager_outputs_share_parquet_writer(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 100)
+    outputs = {}
+    for execution in ("eager", "streaming"):
+        path = _write_streaming_pipeline(tmp_path, input_path, execution=execution, match=False)
+        path.write_text(
+            path.read_text(encoding="utf-8").replace(
+                "[stages.filter]",
+                '[output.parquet]\ncompression_level = 10\npartition_by = "posted_month"\n\n[stages.filter]',
+            ),
+            encoding="utf-8",
+        )
+        result = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+        output_dir = Path(result.diagnostics.to_dict()["output_path"])
+        assert [item.name for item in output_dir.iterdir()] == ["posted_month=2026-01"]
+        outputs[execution] = pl.read_parquet(output_dir)
+    assert outputs["streaming"].equals(outputs["eager"])
+
+
+def test_runtime_reads_and_writes_arrow_ipc(tmp_path: Path, plugin_manifest_path: Path) -> None:
+    parquet_input = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(parquet_input, 100)
+    ipc_input = tmp_path / "jobs.arrow"
+    pl.read_parquet(parquet_input).write_ipc(ipc_input)
+
+    baseline = HonestRolesRuntime.from_configs(
+        _write_streaming_pipeline(tmp_path, parquet_input, execution="eager", match=False),
+        plugin_manifest_path,
+    ).run()
+    expected = baseline.dataset.to_polars()
+    for execution in ("eager", "lazy", "streaming"):
+        path = _write_streaming_pipeline(tmp_path, ipc_input, execution=execution, match=False)
+        path.write_text(
+            path.read_text(encoding="utf-8")
+            .replace('kind = "parquet"', 'kind = "ipc"')
+            .replace("[stages.filter]", 'format = "ipc"\n\n[stages.filter]'),
+            encoding="utf-8",
+        )
+        result = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+        output = pl.read_ipc(result.diagnostics.to_dict()["output_path"])
+        assert output.equals(expected), execution
+
+    # Writing over the memory-mapped input replaces the file instead of truncating it.
+    in_place = tmp_path / "in_place.toml"
+    in_place.write_text(
+        path.read_text(encoding="utf-8")
+        .replace(str(tmp_path / "out_streaming_False.parquet"), str(ipc_input))
+        .replace('execution = "streaming"', 'execution = "eager"'),
+        encoding="utf-8",
+    )
+    result = HonestRolesRuntime.from_configs(in_place, plugin_manifest_path).run()
+    assert result.dataset.to_polars().equals(expected)
+    assert pl.read_ipc(ipc_input).equals(expected)
+
+
+def test_runtime_streaming_match_pool_failure_matches_eager(tmp_path: Path) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 40)
+    paths = {
+        execution: _write_streaming_pipeline(
+            tmp_path,
+            input_path,
+            execution=execution,
+            match=True,
+            match_extra='group_by = ["nonexistent"]',
+        )
+        for execution in ("eager", "streaming")
+    }
+    for path in paths.values():
+        with pytest.raises(StageExecutionError, match="stage 'match' failed"):
+            HonestRolesRuntime.from_configs(path).run()
+        path.write_text(
+            path.read_text(encoding="utf-8").replace(
+                "[runtime]", "[runtime]\nfail_fast = false"
+            ),
+            encoding="utf-8",
+        )
+
+    eager = HonestRolesRuntime.from_configs(paths["eager"]).run()
+    streaming = HonestRolesRuntime.from_configs(paths["streaming"]).run()
+    errors = streaming.diagnostics.to_dict()["non_fatal_errors"]
+    assert [error["stage"] for error in errors] == ["match"]
+    assert errors == eager.diagnostics.to_dict()["non_fatal_errors"]
+    assert streaming.application_plan == eager.application_plan == ()
+    assert streaming.dataset.to_polars().equals(eager.dataset.to_polars())
+
+
+@pytest.mark.parametrize("match", [True, False])
+def test_runtime_streaming_failure_removes_part_files(
+    tmp_path: Path, fail_plugin_manifest_path: Path, match: bool
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 40)
+    path = _write_streaming_pipeline(tmp_path, input_path, execution="streaming", match=match)
+    output_path = tmp_path / f"out_streaming_{match}.parquet"
+
+    with pytest.raises(PluginExecutionError):
+        HonestRolesRuntime.from_configs(path, fail_plugin_manifest_path).run()
+
+    assert not output_path.exists()
+    assert not (tmp_path / f".{output_path.name}.parts").exists()
+
+
+def test_runtime_projection_reads_only_required_columns(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 40)
+    pl.read_parquet(input_path).with_columns(
+        pl.format("<p>{}</p>", pl.col("description_text")).alias("description_html"),
+        pl.lit("x" * 200).alias("raw_payload"),
+        pl.lit("eng").alias("department"),
+        pl.lit("lever").alias("source"),
+    ).write_parquet(input_path)
+
+    outputs = {}
+    for execution in ("eager", "lazy", "streaming"):
+        path = _write_streaming_pipeline(tmp_path, input_path, execution=execution, match=False)
+        path.write_text(
+            path.read_text(encoding="utf-8")
+            .replace(
+                "[stages.filter]",
+                '[stages.clean]\ndrop_columns = ["description_html"]\n\n[stages.filter]',
+            )
+            .replace(
+                "[runtime.streaming]",
+                '[runtime.projection]\nenabled = true\nkeep = ["department"]\n\n'
+                "[runtime.streaming]",
+            ),
+            encoding="utf-8",
+        )
+        result = HonestRolesRuntime.from_configs(path).run()
+        diagnostics = result.diagnostics.to_dict()
+        assert "department" in diagnostics["input_columns"]
+        assert "raw_payload" not in diagnostics["input_columns"]
+        outputs[execution] = pl.read_parquet(diagnostics["output_path"])
+
+        # Plugins without a ``reads:`` capability may use any column.
+        with_plugins = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+        assert "input_columns" not in with_plugins.diagnostics.to_dict()
+
+    eager = outputs["eager"]
+    assert "raw_payload" not in eager.columns
+    assert {"department", "source"} <= set(eager.columns)
+    assert eager["description_html"].null_count() == eager.height
+    assert eager["description_text"].str.contains("<p>").any() is False
+    for execution in ("lazy", "streaming"):
+        assert outputs[execution].equals(eager), execution
+
+
+def test_required_input_columns_follow_config_and_plugin_reads(tmp_path: Path) -> None:
+    path = tmp_path / "pipeline.toml"
+    path.write_text(
+        f"""
+[input]
+kind = "parquet"
+path = "{tmp_path / 'jobs.parquet'}"
+
+[input.adapter]
+enabled = true
+
+[input.adapter.fields.remote]
+from = ["remote_yn"]
+cast = "bool"
+
+[output]
+path = "{tmp_path / 'out'}"
+
+[output.parquet]
+partition_by = "source"
+
+[stages.filter]
+enabled = false
+
+[stages.match]
+group_by = ["team"]
+
+[runtime.projection]
+enabled = true
+
+[runtime.incremental]
+enabled = true
+""".strip(),
+        encoding="utf-8",
+    )
+    spec = load_pipeline_config(path)
+
+    def plugin(name: str, kind: str, capabilities: list[str]) -> PluginDefinition:
+        return load_plugin_item(
+            PluginManifestItem(
+                name=name,
+                kind=kind,
+                callable=f"tests.plugins.fixture_plugins:{name}",
+                spec={"capabilities": capabilities},
+            )
+        )
+
+    registry = PluginRegistry.from_plugins(
+        (
+            # The filter stage is disabled, so its undeclared reads do not matter.
+            plugin("fail_filter", "filter", []),
+            plugin("label_note", "label", ["reads:title,team_size"]),
+        )
+    )
+    columns = required_input_columns(spec, registry)
+
+    assert columns is not None
+    assert {"remote_yn", "source", "source_payload_hash", "team", "team_size"} <= set(columns)
+    assert "raw_payload" not in columns
+
+    undeclared = PluginRegistry.from_plugins((plugin("rate_bonus", "rate", []),))
+    assert required_input_columns(spec, undeclared) is None
+
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            "[input.adapter]\nenabled = true", "[input.adapter]\nenabled = false"
+        ),
+        encoding="utf-8",
+    )
+    without_adapter = required_input_columns(load_pipeline_config(path), registry)
+    assert without_adapter is not None
+    assert "remote_yn" not in without_adapter
+
+
+def test_runtime_categorical_encodes_low_cardinality_columns(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 60)
+    pl.read_parquet(input_path).with_columns(pl.lit("lever").alias("source")).write_parquet(
+        input_path
+    )
+
+    for execution in ("eager", "lazy", "streaming"):
+        path = _write_streaming_pipeline(tmp_path, input_path, execution=execution, match=True)
+        plain = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+        path.write_text(
+            path.read_text(encoding="utf-8").replace(
+                "[runtime.streaming]", "categorical = true\n\n[runtime.streaming]"
+            ),
+            encoding="utf-8",
+        )
+        encoded = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+        if execution != "streaming":
+            encoded.dataset.validate()
+
+        frame = pl.read_parquet(encoded.diagnostics.to_dict()["output_path"])
+        assert frame.schema["source"] == pl.Categorical
+        assert frame.schema["label_seniority"] == pl.Enum(["junior", "mid", "senior"])
+        assert isinstance(frame.schema["label_role_category"], pl.Enum)
+        assert frame.schema["title"] == pl.String
+        decoded = frame.with_columns(
+            pl.col(name).cast(pl.String)
+            for name, dtype in frame.schema.items()
+            if dtype == pl.Categorical or isinstance(dtype, pl.Enum)
+        )
+        expected = pl.read_parquet(plain.diagnostics.to_dict()["output_path"])
+        assert decoded.equals(expected), execution
+
+
+def test_runtime_html_cache_reuses_converted_descriptions(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 40)
+    bodies = ["<p>Python &amp; SQL</p><ul><li>AWS</li></ul>", "<div>Python<br>Excel</div>"]
+    pl.read_parquet(input_path).with_columns(
+        pl.Series("description_html", [bodies[i % 2] for i in range(40)])
+    ).write_parquet(input_path)
+    cache_dir = tmp_path / "html-cache"
+
+    for execution in ("eager", "lazy", "streaming"):
+        path = _write_streaming_pipeline(tmp_path, input_path, execution=execution, match=False)
+        plain = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+        path.write_text(
+            path.read_text(encoding="utf-8").replace(
+                "[runtime.streaming]",
+                f'[runtime.html_cache]\nenabled = true\npath = "{cache_dir}"\n\n'
+                "[runtime.streaming]",
+            ),
+            encoding="utf-8",
+        )
+        cached = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+
+        frame = pl.read_parquet(cached.diagnostics.to_dict()["output_path"])
+        assert set(frame["description_text"]) == {"Python & SQL\nAWS", "Python\nExcel"}
+        expected = pl.read_parquet(plain.diagnostics.to_dict()["output_path"])
+        assert frame.equals(expected), execution
+
+    (cache_root,) = cache_dir.iterdir()
+    assert len(list(cache_root.glob("segment-*.arrow"))) == 1
+
+
+def test_runtime_memory_budget_falls_back_to_streaming(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 3000)
+    pl.read_parquet(input_path).with_columns(
+        pl.col("description_text") + pl.lit(" python" * 150)
+    ).write_parquet(input_path)
+    path = _write_streaming_pipeline(tmp_path, input_path, execution="eager", match=True)
+    eager = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+    assert "resources" not in eager.diagnostics.to_dict()
+
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            "[runtime.streaming]", "max_memory_mb = 1\nmax_threads = 2\n\n[runtime.streaming]"
+        ),
+        encoding="utf-8",
+    )
+    budgeted = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+
+    diagnostics = budgeted.diagnostics.to_dict()
+    resources = diagnostics["resources"]
+    assert diagnostics["runtime"]["execution"] == "streaming"
+    assert resources["requested_execution"] == "eager"
+    assert resources["fallback"] is True
+    assert resources["estimated_input_rows"] == 3000
+    assert resources["estimated_peak_bytes"] > resources["max_memory_bytes"] == 1024**2
+    assert 1 <= resources["batch_rows"] < 3000
+    assert resources["max_threads"] == 2
+    assert resources["polars_threads"] == pl.thread_pool_size()
+    if resources["peak_rss_bytes"] is not None:
+        assert resources["over_budget"] is True
+        assert all(item["peak_rss_bytes"] > 0 for item in diagnostics["telemetry"])
+    assert budgeted.diagnostics.stage_rows == eager.diagnostics.stage_rows
+    assert budgeted.application_plan == eager.application_plan
+    assert budgeted.dataset.to_polars().equals(eager.dataset.to_polars())
+
+    # Incremental runs keep their execution mode and report why.
+    state = tmp_path / "state"
+    path.write_text(
+        path.read_text(encoding="utf-8")
+        + f'\n\n[runtime.incremental]\nenabled = true\npath = "{state}"\n',
+        encoding="utf-8",
+    )
+    blocked = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+    resources = blocked.diagnostics.to_dict()["resources"]
+    assert blocked.diagnostics.runtime.execution == "eager"
+    assert resources["fallback"] is False
+    assert resources["fallback_blocked"] == "incremental runs cannot stream"
+
+
+def test_runtime_resource_limits_without_fallback(tmp_path: Path) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 1000)
+    pl.read_parquet(input_path).with_columns(
+        pl.col("description_text") + pl.lit(" python" * 150)
+    ).write_parquet(input_path)
+
+    def run(execution: str, limits: str, *, match: bool = True, output: bool = True) -> dict:
+        path = _write_streaming_pipeline(tmp_path, input_path, execution=execution, match=match)
+        text = path.read_text(encoding="utf-8").replace(
+            "[runtime.streaming]", f"{limits}\n\n[runtime.streaming]"
+        )
+        if not output:
+            text = text.replace(text[text.index("[output]") : text.index("[stages.filter]")], "")
+        path.write_text(text, encoding="utf-8")
+        return HonestRolesRuntime.from_configs(path).run().diagnostics.to_dict()
+
+    threads_only = run("eager", "max_threads = 1")
+    assert threads_only["resources"]["estimated_input_rows"] is None
+    assert "over_budget" not in threads_only["resources"]
+
+    fits = run("eager", "max_memory_mb = 1024")
+    assert fits["runtime"]["execution"] == "eager"
+    assert fits["resources"]["fallback"] is False
+    assert fits["resources"]["batch_rows"] is None
+
+    # A streaming run only has its batch size budgeted.
+    streamed = run("streaming", "max_memory_mb = 1")
+    assert streamed["resources"]["fallback"] is False
+    assert 1 <= streamed["resources"]["batch_rows"] <= 16
+
+    blocked = run("eager", "max_memory_mb = 1", match=False, output=False)
+    assert blocked["runtime"]["execution"] == "eager"
+    assert blocked["resources"]["fallback_blocked"] == (
+        "streaming without match requires [output]"
+    )
+
+
+@pytest.mark.parametrize(
+    ("match", "match_extra", "key"),
+    [(True, "", "id"), (True, 'group_by = ["title"]', "apply_url"), (False, "", "id")],
+)
+def test_runtime_shards_merge_to_single_node_result(
+    tmp_path: Path, plugin_manifest_path: Path, match: bool, match_extra: str, key: str
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 200)
+    path = _write_streaming_pipeline(
+        tmp_path, input_path, execution="eager", match=match, match_extra=match_extra
+    )
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            "[runtime.streaming]",
+            f'[runtime.sharding]\nkey = "{key}"\npath = "{tmp_path / "shards"}"\n\n'
+            "[runtime.streaming]",
+        ),
+        encoding="utf-8",
+    )
+    single = HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+    output = pl.read_parquet(single.diagnostics.to_dict()["output_path"])
+
+    runtime = HonestRolesRuntime.from_configs(path, plugin_manifest_path)
+    shards = [runtime.run_shard(ShardSpec(index, 3)) for index in (2, 0)]
+    assert sum(shard.stage_rows.counts["input"] for shard in shards) < 200
+    with pytest.raises(ConfigValidationError, match="missing shards 1 of 3"):
+        runtime.merge_shards()
+    runtime.run_shard(ShardSpec.parse("1/3"))
+
+    merged = runtime.merge_shards()
+    assert merged.dataset.to_polars().equals(single.dataset.to_polars())
+    assert merged.application_plan == single.application_plan
+    assert pl.read_parquet(merged.diagnostics.to_dict()["output_path"]).equals(output)
+    single_payload = single.diagnostics.to_dict()
+    merged_payload = merged.diagnostics.to_dict()
+    assert [item["index"] for item in merged_payload.pop("shards")] == [0, 1, 2]
+    single_payload.pop("telemetry")
+    merged_payload.pop("telemetry")
+    assert merged_payload == single_payload
+
+    # Changing stage options orphans the stored shards instead of mixing them in.
+    path.write_text(
+        path.read_text(encoding="utf-8").replace('["python"]', '["sql"]'), encoding="utf-8"
+    )
+    with pytest.raises(ConfigValidationError, match="no shards for this pipeline config"):
+        HonestRolesRuntime.from_configs(path, plugin_manifest_path).merge_shards()
+    with pytest.raises(ConfigValidationError, match="expected 'i/N'"):
+        ShardSpec.parse("3")
+    with pytest.raises(ConfigValidationError, match="shard index must be in"):
+        ShardSpec.parse("3/3")
+
+
+def test_runtime_shard_requires_shard_row_column(tmp_path: Path, monkeypatch) -> None:
+    import honestroles.runtime as runtime_module
+
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 10)
+    path = _write_streaming_pipeline(tmp_path, input_path, execution="eager", match=True)
+
+    def drop_shard_row(dataset, *_args, **_kwargs):
+        return dataset.transform(lambda frame: frame.drop(SHARD_ROW))
+
+    monkeypatch.setattr(runtime_module, "rate_stage", drop_shard_row)
+    with pytest.raises(StageExecutionError, match="shard row column"):
+        HonestRolesRuntime.from_configs(path).run_shard(ShardSpec(0, 1))
+
+
+def test_runtime_shard_match_candidate_failure_matches_eager(tmp_path: Path) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 40)
+    path = _write_streaming_pipeline(
+        tmp_path,
+        input_path,
+        execution="eager",
+        match=True,
+        match_extra='group_by = ["nonexistent"]',
+    )
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            "[runtime.streaming]",
+            f'[runtime.sharding]\npath = "{tmp_path / "shards"}"\n\n'
+            "[runtime.streaming]",
+        ),
+        encoding="utf-8",
+    )
+    with pytest.raises(StageExecutionError, match="stage 'match' failed"):
+        HonestRolesRuntime.from_configs(path).run_shard(ShardSpec(0, 2))
+
+    path.write_text(
+        path.read_text(encoding="utf-8").replace("[runtime]", "[runtime]\nfail_fast = false"),
+        encoding="utf-8",
+    )
+    single = HonestRolesRuntime.from_configs(path).run()
+    runtime = HonestRolesRuntime.from_configs(path)
+    for index in (0, 1):
+        runtime.run_shard(ShardSpec(index, 2))
+    merged = runtime.merge_shards()
+
+    errors = merged.diagnostics.to_dict()["non_fatal_errors"]
+    assert [error["stage"] for error in errors] == ["match"]
+    assert errors == single.diagnostics.to_dict()["non_fatal_errors"]
+    assert merged.application_plan == single.application_plan == ()
+    assert merged.dataset.to_polars().equals(single.dataset.to_polars())
+
+
+def test_runtime_group_top_k_matches_across_execution_modes(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 100)
+    runs = {
+        execution: HonestRolesRuntime.from_configs(
+            _write_streaming_pipeline(
+                tmp_path,
+                input_path,
+                execution=execution,
+                match=True,
+                match_extra='group_by = ["title"]',
+            ),
+            plugin_manifest_path,
+        ).run()
+        for execution in ("eager", "lazy", "streaming")
+    }
+
+    eager = runs["eager"].dataset.to_polars()
+    # Up to top_k rows per distinct title, ranked globally by fit_score.
+    assert eager.group_by("title").len()["len"].max() == 7
+    assert eager["fit_rank"].to_list() == list(range(1, eager.height + 1))
+    assert eager["fit_score"].is_sorted(descending=True)
+    for execution in ("lazy", "streaming"):
+        assert runs[execution].dataset.to_polars().equals(eager)
+        assert runs[execution].application_plan == runs["eager"].application_plan
+
+
+def test_runtime_records_stage_and_plugin_telemetry(
+    pipeline_config_path: Path, plugin_manifest_path: Path
+) -> None:
+    result = HonestRolesRuntime.from_configs(pipeline_config_path, plugin_manifest_path).run()
+    telemetry = result.diagnostics.to_dict()["telemetry"]
+
+    assert [(item["stage"], item.get("plugin")) for item in telemetry] == [
+        ("input", None),
+        ("clean", None),
+        ("filter", None),
+        ("filter", "high_quality_gate"),
+        ("label", None),
+        ("label", "label_note"),
+        ("rate", None),
+        ("rate", "rate_bonus"),
+        ("match", None),
+    ]
+    for item in telemetry:
+        assert item["calls"] == 1
+        assert item["wall_ms"] >= 0.0
+        assert item["cpu_ms"] >= 0.0
+        assert item["bytes_after"] > 0
+        assert "peak_traced_bytes" not in item
+    assert telemetry[0]["bytes_before"] is None
+    assert all(item["bytes_before"] > 0 for item in telemetry[1:])
+
+
+def test_runtime_telemetry_traces_memory_and_merges_batches(tmp_path: Path) -> None:
+    import tracemalloc
+
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 100)
+    pipeline_path = _write_streaming_pipeline(
+        tmp_path, input_path, execution="streaming", match=True
+    )
+    pipeline_path.write_text(
+        pipeline_path.read_text(encoding="utf-8").replace(
+            "[runtime]", "[runtime]\ntrace_memory = true"
+        ),
+        encoding="utf-8",
+    )
+
+    result = HonestRolesRuntime.from_configs(pipeline_path).run()
+    telemetry = {item.stage: item for item in result.diagnostics.telemetry}
+
+    assert not tracemalloc.is_tracing()
+    assert telemetry["clean"].calls == 7
+    assert telemetry["match"].calls == 1
+    assert all(item.peak_traced_bytes is not None for item in telemetry.values())
+
+
+def _with_stage_cache(pipeline_path: Path, extra: str = "") -> Path:
+    text = pipeline_path.read_text(encoding="utf-8")
+    pipeline_path.write_text(
+        text + '\n\n[runtime.cache]\nenabled = true\npath = "stage-cache"\n' + extra,
+        encoding="utf-8",
+    )
+    return pipeline_path
+
+
+def test_runtime_stage_cache_resumes_from_deepest_checkpoint(
+    pipeline_config_path: Path, plugin_manifest_path: Path, monkeypatch
+) -> None:
+    import honestroles.runtime as runtime_module
+
+    uncached = HonestRolesRuntime.from_configs(pipeline_config_path, plugin_manifest_path).run()
+    pipeline_path = _with_stage_cache(pipeline_config_path)
+
+    first = HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+    assert first.diagnostics.to_dict()["cache"] == {
+        "resumed_from": None,
+        "hits": [],
+        "stored": ["clean", "filter", "label", "rate", "match"],
+        "evicted": 0,
+    }
+    assert (pipeline_path.parent / "stage-cache").is_dir()
+
+    def no_read(*_args, **_kwargs):
+        raise AssertionError("input should not be re-read")
+
+    monkeypatch.setattr(runtime_module, "read_table", no_read)
+    second = HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+    second_diagnostics = second.diagnostics.to_dict()
+    assert second_diagnostics["cache"]["resumed_from"] == "match"
+    assert second_diagnostics["cache"]["stored"] == []
+    assert second.dataset.to_polars().equals(uncached.dataset.to_polars())
+    assert second.application_plan == uncached.application_plan
+    assert second_diagnostics["stage_rows"] == uncached.diagnostics.to_dict()["stage_rows"]
+    assert second_diagnostics["input_adapter"] == uncached.diagnostics.to_dict()["input_adapter"]
+
+    pipeline_path.write_text(
+        pipeline_path.read_text(encoding="utf-8").replace("top_k = 10", "top_k = 1"),
+        encoding="utf-8",
+    )
+    third = HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+    assert third.diagnostics.to_dict()["cache"] == {
+        "resumed_from": "rate",
+        "hits": ["clean", "filter", "label", "rate"],
+        "stored": ["match"],
+        "evicted": 0,
+    }
+    assert third.dataset.row_count() == 1
+
+    plugin_manifest_path.write_text(
+        plugin_manifest_path.read_text(encoding="utf-8").replace(
+            "bonus = 0.05", "bonus = 0.1"
+        ),
+        encoding="utf-8",
+    )
+    fourth = HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+    assert fourth.diagnostics.to_dict()["cache"]["resumed_from"] == "label"
+
+
+def test_runtime_stage_cache_keys_projected_input_columns(
+    pipeline_config_path: Path,
+) -> None:
+    pipeline_path = _with_stage_cache(
+        pipeline_config_path, '\n[runtime.projection]\nenabled = true\nkeep = ["team"]\n'
+    )
+    HonestRolesRuntime.from_configs(pipeline_path).run()
+    cached = HonestRolesRuntime.from_configs(pipeline_path).run()
+    assert cached.diagnostics.to_dict()["cache"]["resumed_from"] == "match"
+
+    pipeline_path.write_text(
+        pipeline_path.read_text(encoding="utf-8").replace('keep = ["team"]', 'keep = ["org"]'),
+        encoding="utf-8",
+    )
+    reprojected = HonestRolesRuntime.from_configs(pipeline_path).run()
+    assert reprojected.diagnostics.to_dict()["cache"]["resumed_from"] is None
+
+
+def test_runtime_stage_cache_keys_categorical_input(pipeline_config_path: Path) -> None:
+    pipeline_path = _with_stage_cache(pipeline_config_path)
+    HonestRolesRuntime.from_configs(pipeline_path).run()
+
+    pipeline_path.write_text(
+        pipeline_path.read_text(encoding="utf-8").replace(
+            "[runtime]\n", "[runtime]\ncategorical = true\n", 1
+        ),
+        encoding="utf-8",
+    )
+    encoded = HonestRolesRuntime.from_configs(pipeline_path).run()
+    assert encoded.diagnostics.to_dict()["cache"]["resumed_from"] is None
+    assert isinstance(encoded.dataset.to_polars().schema["label_seniority"], pl.Enum)
+
+
+def test_runtime_stage_cache_evicts_least_recently_used(
+    pipeline_config_path: Path,
+) -> None:
+    pipeline_path = _with_stage_cache(pipeline_config_path, "max_entries = 2\n")
+
+    result = HonestRolesRuntime.from_configs(pipeline_path).run()
+    cache = result.diagnostics.to_dict()["cache"]
+    assert cache["evicted"] == 3
+    assert len(list((pipeline_path.parent / "stage-cache").iterdir())) == 2
+
+    resumed = HonestRolesRuntime.from_configs(pipeline_path).run()
+    assert resumed.diagnostics.to_dict()["cache"]["resumed_from"] == "match"
+
+
+def test_runtime_stage_cache_recomputes_corrupt_checkpoints(
+    pipeline_config_path: Path,
+) -> None:
+    pipeline_path = _with_stage_cache(pipeline_config_path)
+    first = HonestRolesRuntime.from_configs(pipeline_path).run()
+    frames = sorted((pipeline_path.parent / "stage-cache").glob("*/frame.arrow"))
+    assert len(frames) == 5
+    for frame_file in frames:
+        frame_file.write_bytes(frame_file.read_bytes()[:16])
+
+    rerun = HonestRolesRuntime.from_configs(pipeline_path).run()
+
+    cache = rerun.diagnostics.to_dict()["cache"]
+    assert cache["resumed_from"] is None
+    assert cache["stored"] == ["clean", "filter", "label", "rate", "match"]
+    assert rerun.dataset.to_polars().equals(first.dataset.to_polars())
+
+
+def test_stage_checkpoint_cache_store_failures_and_stray_entries(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import honestroles.checkpoints as checkpoints_module
+
+    frame = pl.DataFrame({"id": ["1"]})
+    assert StageCheckpointCache(tmp_path / "missing", max_bytes=1, max_entries=1).evict() == 0
+
+    root = tmp_path / "cache"
+    (root / ".abandoned.tmp").mkdir(parents=True)
+    (root / "stray").mkdir()
+    cache = StageCheckpointCache(root, max_bytes=10**9, max_entries=1)
+    assert cache.store("a", frame, {"stage": "clean"}) == 0
+    assert cache.store("b", frame, {"stage": "filter"}) == 1
+    assert cache.load("a") is None
+    assert cache.load("b").metadata == {"stage": "filter"}
+    assert sorted(path.name for path in root.iterdir()) == [".abandoned.tmp", "b", "stray"]
+
+    def fail_replace(*_args: object) -> None:
+        raise OSError("read-only cache")
+
+    monkeypatch.setattr(checkpoints_module.os, "replace", fail_replace)
+    assert cache.store("c", frame, {"stage": "label"}) == 0
+    assert cache.load("c") is None
+    assert not list(root.glob(".c.*.tmp"))
+
+
+def test_runtime_stage_cache_skips_checkpoints_after_non_fatal_errors(
+    pipeline_config_non_fail_fast_path: Path, monkeypatch
+) -> None:
+    import honestroles.runtime as runtime_module
+
+    def fail_stage(*_args, **_kwargs):
+        raise StageExecutionError("label", "boom")
+
+    monkeypatch.setattr(runtime_module, "label_stage", fail_stage)
+    pipeline_path = _with_stage_cache(pipeline_config_non_fail_fast_path)
+    result = HonestRolesRuntime.from_configs(pipeline_path).run()
+
+    diagnostics = result.diagnostics.to_dict()
+    assert diagnostics["cache"]["stored"] == ["clean", "filter"]
+    assert diagnostics["non_fatal_errors"][0]["stage"] == "label"
+
+
+def test_runtime_lazy_execution_fuses_expression_plugins(
+    pipeline_config_path: Path, tmp_path: Path, monkeypatch
+) -> None:
+    import honestroles.lazy as lazy_module
+
+    manifest_path = tmp_path / "expression_plugins.toml"
+    manifest_path.write_text(
+        """
+[[plugins]]
+name = "has_company"
+kind = "filter"
+callable = "tests.plugins.fixture_plugins:filter_has_company_expr"
+
+[[plugins]]
+name = "title_length"
+kind = "label"
+callable = "tests.plugins.fixture_plugins:label_title_length_expr"
+
+[[plugins]]
+name = "rate_bonus"
+kind = "rate"
+callable = "tests.plugins.fixture_plugins:rate_bonus_expr"
+
+[plugins.settings]
+bonus = 0.05
+""".strip(),
+        encoding="utf-8",
+    )
+    eager = HonestRolesRuntime.from_configs(pipeline_config_path, manifest_path).run()
+
+    calls: list[int] = []
+    original = lazy_module.pl.collect_all
+
+    def counting_collect_all(frames, *args, **kwargs):
+        calls.append(len(frames))
+        return original(frames, *args, **kwargs)
+
+    monkeypatch.setattr(lazy_module.pl, "collect_all", counting_collect_all)
+    lazy = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_config_path, "lazy"), manifest_path
+    ).run()
+
+    assert len(calls) == 1
+    assert lazy.diagnostics.runtime.execution == "lazy"
+    assert lazy.dataset.to_polars().equals(eager.dataset.to_polars())
+    assert "title_length" in eager.dataset.columns()
+
+
+def _with_skills_stage(pipeline_path: Path, dictionary: dict[str, list[str]]) -> Path:
+    (pipeline_path.parent / "skills.json").write_text(json.dumps(dictionary), encoding="utf-8")
+    text = pipeline_path.read_text(encoding="utf-8")
+    pipeline_path.write_text(
+        text
+        + '\n\n[stages.skills]\nenabled = true\ndictionary = "skills.json"\nmode = "replace"\n'
+        + '\n[stages.skills.terms]\n"Amazon Web Services" = ["aws"]\n',
+        encoding="utf-8",
+    )
+    return pipeline_path
+
+
+def test_runtime_skills_stage_populates_canonical_skills(
+    pipeline_config_path: Path, plugin_manifest_path: Path
+) -> None:
+    pipeline_path = _with_skills_stage(
+        pipeline_config_path, {"Python": ["python3"], "SQL": [], "ML": ["machine learning"]}
+    )
+
+    eager = HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+    lazy = HonestRolesRuntime.from_configs(
+        _with_execution(pipeline_path, "lazy"), plugin_manifest_path
+    ).run()
+
+    assert eager.dataset.to_polars()["skills"].to_list() == [["Python", "SQL"]]
+    diagnostics = eager.diagnostics.to_dict()
+    assert diagnostics["stage_rows"]["skills"] == diagnostics["stage_rows"]["filter"]
+    assert lazy.dataset.to_polars().equals(eager.dataset.to_polars())
+
+
+def test_runtime_non_fail_fast_records_skills_stage_error(
+    pipeline_config_non_fail_fast_path: Path,
+) -> None:
+    pipeline_path = _with_skills_stage(pipeline_config_non_fail_fast_path, {})
+    (pipeline_path.parent / "skills.json").write_text("[]", encoding="utf-8")
+
+    for execution in ("eager", "lazy"):
+        result = HonestRolesRuntime.from_configs(_with_execution(pipeline_path, execution)).run()
+        errors = result.diagnostics.to_dict()["non_fatal_errors"]
+        assert [entry["stage"] for entry in errors] == ["skills"]
+        assert "expected an object" in errors[0]["detail"]
+
+    pipeline_path.write_text(
+        pipeline_path.read_text(encoding="utf-8").replace("fail_fast = false", "fail_fast = true"),
+        encoding="utf-8",
+    )
+    with pytest.raises(StageExecutionError, match="expected an object"):
+        HonestRolesRuntime.from_configs(pipeline_path).run()
+
+
+def test_runtime_stage_cache_keys_skills_by_dictionary_content(
+    pipeline_config_path: Path, plugin_manifest_path: Path
+) -> None:
+    pipeline_path = _with_stage_cache(
+        _with_skills_stage(pipeline_config_path, {"Python": []})
+    )
+    HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+
+    (pipeline_path.parent / "skills.json").write_text(
+        json.dumps({"Python": [], "SQL": []}), encoding="utf-8"
+    )
+    rerun = HonestRolesRuntime.from_configs(pipeline_path, plugin_manifest_path).run()
+
+    assert rerun.diagnostics.to_dict()["cache"]["resumed_from"] == "filter"
+    assert ["Python", "SQL"] in rerun.dataset.to_polars()["skills"].to_list()
+
+
+def test_runtime_partitioned_input_matches_single_file(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    combined = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(combined, 100)
+    frame = pl.read_parquet(combined)
+    for index, start in enumerate((0, 40, 70)):
+        target = tmp_path / "parts" / f"shard={index}" / "part.parquet"
+        target.parent.mkdir(parents=True)
+        frame.slice(start, {0: 40, 40: 30, 70: 30}[start]).write_parquet(target)
+
+    eager = HonestRolesRuntime.from_configs(
+        _write_streaming_pipeline(tmp_path, combined, execution="eager", match=True),
+        plugin_manifest_path,
+    ).run()
+    partitioned_path = _write_streaming_pipeline(
+        tmp_path,
+        tmp_path / "parts" / "shard=*" / "*.parquet",
+        execution="eager",
+        match=True,
+    )
+    partitioned_path.write_text(
+        partitioned_path.read_text(encoding="utf-8").replace(
+            "[runtime.streaming]", "[runtime.partitions]\nworkers = 2\n\n[runtime.streaming]"
+        ),
+        encoding="utf-8",
+    )
+    partitioned = HonestRolesRuntime.from_configs(partitioned_path, plugin_manifest_path).run()
+
+    assert partitioned.dataset.to_polars().equals(eager.dataset.to_polars())
+    assert partitioned.application_plan == eager.application_plan
+    diagnostics = partitioned.diagnostics.to_dict()
+    assert diagnostics["stage_rows"] == eager.diagnostics.to_dict()["stage_rows"]
+    partitions = diagnostics["partitions"]
+    assert [entry["stage_rows"]["input"] for entry in partitions] == [40, 30, 30]
+    assert sum(entry["stage_rows"]["filter"] for entry in partitions) == (
+        diagnostics["stage_rows"]["filter"]
+    )
+    assert partitions[0]["path"].endswith("shard=0/part.parquet")
+    assert "partitions" not in eager.diagnostics.to_dict()
+    telemetry = {entry["stage"]: entry for entry in diagnostics["telemetry"]}
+    assert telemetry["input"]["calls"] == 3
+    assert telemetry["match"]["calls"] == 1
+
+
+def test_runtime_partitioned_input_in_process_records_hive_values_and_errors(
+    tmp_path: Path, fail_plugin_manifest_path: Path
+) -> None:
+    from honestroles.runtime import _run_partition_worker
+
+    corpus = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(corpus, 30)
+    frame = pl.read_parquet(corpus)
+    for region, part in (("eu", frame.head(20)), ("us", frame.tail(10))):
+        target = tmp_path / "parts" / f"region={region}" / "part.parquet"
+        target.parent.mkdir(parents=True)
+        part.write_parquet(target)
+    path = _write_streaming_pipeline(
+        tmp_path, tmp_path / "parts" / "region=*" / "*.parquet", execution="eager", match=True
+    )
+    path.write_text(
+        path.read_text(encoding="utf-8")
+        .replace('kind = "parquet"', 'kind = "parquet"\nhive_partitioning = true')
+        .replace("[runtime]", "[runtime]\nfail_fast = false")
+        .replace("[runtime.streaming]", "[runtime.partitions]\nworkers = 2\n\n[runtime.streaming]"),
+        encoding="utf-8",
+    )
+    # A registry without a manifest cannot reach worker processes, so the
+    # partitions run in-process.
+    runtime = HonestRolesRuntime.from_configs(path, fail_plugin_manifest_path)
+    runtime = HonestRolesRuntime(
+        pipeline_spec=runtime.pipeline_spec,
+        plugin_registry=runtime.plugin_registry,
+        pipeline_config_path=runtime.pipeline_config_path,
+    )
+    diagnostics = runtime.run().diagnostics.to_dict()
+
+    partitions = diagnostics["partitions"]
+    assert [entry["hive"] for entry in partitions] == [{"region": "eu"}, {"region": "us"}]
+    assert [entry["stage_rows"]["input"] for entry in partitions] == [20, 10]
+    assert [error["stage"] for error in partitions[0]["non_fatal_errors"]] == ["filter"]
+    assert [error["stage"] for error in diagnostics["non_fatal_errors"]] == ["filter", "filter"]
+
+    worker = _run_partition_worker(
+        runtime.pipeline_spec, path, fail_plugin_manifest_path, runtime._input_partitions()[1]
+    )
+    assert worker.stage_rows.counts["input"] == 10
+    assert worker.frame["region"].unique().to_list() == ["us"]
+
+
+def test_merge_input_payloads_adds_counts_and_keeps_first_mapping() -> None:
+    from honestroles.runtime import _merge_input_payloads
+
+    merged = _merge_input_payloads(
+        [
+            {"enabled": True, "applied": {"remote": "flag"}, "conflicts": {"remote": 2}},
+            {"enabled": False, "applied": {"remote": "other"}, "conflicts": {"remote": 1}},
+            {"unresolved": ["salary_min", "salary_max"]},
+            {"unresolved": ["salary_max", "posted_at"]},
+        ]
+    )
+    assert merged == {
+        "enabled": True,
+        "applied": {"remote": "flag"},
+        "conflicts": {"remote": 3},
+        "unresolved": ["salary_min", "salary_max", "posted_at"],
+    }
+
+
+def _with_incremental(pipeline_path: Path, state_path: Path) -> Path:
+    text = pipeline_path.read_text(encoding="utf-8")
+    target = pipeline_path.with_name(f"incremental_{pipeline_path.name}")
+    target.write_text(
+        text.replace(
+            "[runtime.streaming]",
+            f'[runtime.incremental]\nenabled = true\npath = "{state_path}"\n\n'
+            "[runtime.streaming]",
+        ),
+        encoding="utf-8",
+    )
+    return target
+
+
+def test_runtime_incremental_reprocesses_only_changed_rows(
+    tmp_path: Path, plugin_manifest_path: Path
+) -> None:
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 100)
+    state_path = tmp_path / "state"
+    pipeline = _write_streaming_pipeline(tmp_path, input_path, execution="eager", match=True)
+    incremental = _with_incremental(pipeline, state_path)
+
+    def run(path: Path):
+        return HonestRolesRuntime.from_configs(path, plugin_manifest_path).run()
+
+    first = run(incremental)
+    assert first.diagnostics.to_dict()["incremental"] == {
+        "resumed": False,
+        "input_rows": 100,
+        "processed_rows": 100,
+        "reused_rows": 0,
+        "dropped_rows": 0,
+        "stored": True,
+    }
+    assert first.dataset.to_polars().equals(run(pipeline).dataset.to_polars())
+
+    # Change two rows, delete three and append four.
+    frame = pl.read_parquet(input_path)
+    changed = frame.with_columns(
+        pl.when(pl.col("id").is_in(["1", "4"]))
+        .then(pl.lit("Python and Rust"))
+        .otherwise(pl.col("description_text"))
+        .alias("description_text")
+    ).filter(~pl.col("id").is_in(["10", "11", "12"]))
+    extra = frame.head(4).with_columns((pl.col("id") + "-new").alias("id"))
+    pl.concat([changed, extra]).write_parquet(input_path)
+
+    second = run(incremental)
+    diagnostics = second.diagnostics.to_dict()
+    assert diagnostics["incremental"]["resumed"] is True
+    assert diagnostics["incremental"]["processed_rows"] == 6
+    assert diagnostics["incremental"]["dropped_rows"] == 5
+    assert diagnostics["stage_rows"]["input"] == 6
+    full = run(pipeline)
+    assert second.dataset.to_polars().equals(full.dataset.to_polars())
+    assert second.application_plan == full.application_plan
+    assert run(incremental).diagnostics.to_dict()["incremental"]["processed_rows"] == 0
+
+    # Changing a stage option invalidates every stored fingerprint.
+    incremental.write_text(
+        incremental.read_text(encoding="utf-8").replace('["python"]', '["python", "sql"]'),
+        encoding="utf-8",
+    )
+    pipeline.write_text(
+        pipeline.read_text(encoding="utf-8").replace('["python"]', '["python", "sql"]'),
+        encoding="utf-8",
+    )
+    invalidated = run(incremental)
+    assert invalidated.diagnostics.to_dict()["incremental"]["resumed"] is False
+    assert invalidated.diagnostics.to_dict()["incremental"]["processed_rows"] == 101
+    assert invalidated.dataset.to_polars().equals(run(pipeline).dataset.to_polars())
+
+
+def test_incremental_row_keys_prefer_payload_hash_and_number_duplicates() -> None:
+    frame = pl.DataFrame(
+        {"source_payload_hash": ["h1", "h1", None, None], "title": ["a", "b", "c", "c"]}
+    )
+
+    keys = with_row_keys(frame).get_column(ROW_KEY)
+
+    assert keys.n_unique() == 4
+    # The first occurrence keeps the plain fingerprint, so adding a duplicate
+    # later does not change the keys of rows already stored.
+    assert keys[0] == with_row_keys(frame.head(1)).get_column(ROW_KEY)[0]
+    assert keys[2] == with_row_keys(frame.slice(2, 1)).get_column(ROW_KEY)[0]
+
+
+def test_incremental_state_store_ignores_state_without_row_keys(tmp_path: Path) -> None:
+    store = IncrementalStateStore(tmp_path / "state")
+    assert store.load("key") is None
+
+    store.store("key", pl.DataFrame({ROW_KEY: ["not-a-hash"]}))
+    assert store.load("key") is None
+
+    state = with_row_keys(pl.DataFrame({"title": ["a"]}))
+    store.store("key", state)
+    assert store.load("key").equals(state)
+
+
+def test_runtime_incremental_partitioned_input_skips_state_after_errors(
+    tmp_path: Path, fail_plugin_manifest_path: Path
+) -> None:
+    corpus = tmp_path / "corpus.parquet"
+    _write_streaming_corpus(corpus, 40)
+    input_dir = tmp_path / "jobs"
+    input_dir.mkdir()
+    frame = pl.read_parquet(corpus)
+    frame.head(25).write_parquet(input_dir / "part-0.parquet")
+    frame.tail(15).write_parquet(input_dir / "part-1.parquet")
+    pipeline = _write_streaming_pipeline(tmp_path, input_dir, execution="eager", match=True)
+    pipeline.write_text(
+        pipeline.read_text(encoding="utf-8").replace("[runtime]", "[runtime]\nfail_fast = false"),
+        encoding="utf-8",
+    )
+    incremental = _with_incremental(pipeline, tmp_path / "state")
+
+    for _ in range(2):
+        result = HonestRolesRuntime.from_configs(incremental, fail_plugin_manifest_path).run()
+        diagnostics = result.diagnostics.to_dict()
+        assert diagnostics["non_fatal_errors"][0]["stage"] == "filter"
+        assert diagnostics["incremental"]["resumed"] is False
+        assert diagnostics["incremental"]["input_rows"] == 40
+        assert diagnostics["incremental"]["stored"] is False
+
+
+def test_runtime_incremental_requires_row_key_column(tmp_path: Path, monkeypatch) -> None:
+    import honestroles.runtime as runtime_module
+
+    input_path = tmp_path / "jobs.parquet"
+    _write_streaming_corpus(input_path, 10)
+    pipeline = _write_streaming_pipeline(tmp_path, input_path, execution="eager", match=True)
+    incremental = _with_incremental(pipeline, tmp_path / "state")
+
+    def drop_row_key(dataset, *_args, **_kwargs):
+        return dataset.transform(lambda frame: frame.drop(ROW_KEY))
+
+    monkeypatch.setattr(runtime_module, "rate_stage", drop_row_key)
+    with pytest.raises(StageExecutionError, match="was dropped during the run"):
+        HonestRolesRuntime.from_configs(incremental).run()
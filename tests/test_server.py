@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import http.client
+from http import HTTPStatus
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import stat
+import threading
+
+import polars as pl
+import pytest
+
+import honestroles.server as server_module
+from honestroles.errors import (
+    ConfigValidationError,
+    RuntimeInitializationError,
+    StageExecutionError,
+)
+from honestroles.plugins.errors import PluginExecutionError
+from honestroles.runtime import HonestRolesRuntime
+from honestroles.server import (
+    InputFrameCache,
+    LatencyMetrics,
+    RuntimePool,
+    RuntimeService,
+    _error_status,
+    _is_loopback,
+    create_server,
+    serve,
+)
+
+
+def test_runtime_service_reuses_runtimes_and_inputs(
+    pipeline_config_path: Path, plugin_manifest_path: Path
+) -> None:
+    service = RuntimeService(roots=[pipeline_config_path.parent], max_runtimes=1)
+    request = {
+        "pipeline_config": str(pipeline_config_path),
+        "plugins": str(plugin_manifest_path),
+        "rows": 1,
+    }
+    first = service.run(request)
+    second = service.run(request)
+    expected = HonestRolesRuntime.from_configs(pipeline_config_path, plugin_manifest_path).run()
+
+    first["diagnostics"].pop("telemetry")
+    second["diagnostics"].pop("telemetry")
+    assert first == second
+    assert first["diagnostics"]["stage_rows"] == expected.diagnostics.to_dict()["stage_rows"]
+    assert first["application_plan"] == [
+        entry.to_dict() for entry in expected.application_plan
+    ]
+    assert first["rows"][0]["id"] == expected.dataset.to_polars()["id"][0]
+    metrics = service.metrics()
+    assert metrics["runtimes"]["hits"] == 1
+    assert metrics["inputs"]["hits"] == 1
+    assert metrics["inputs"]["misses"] == 1
+
+    overridden = service.run(
+        {**request, "overrides": {"stages": {"match": {"top_k": 1}}}}
+    )
+    assert overridden["diagnostics"]["final_rows"] == 1
+    metrics = service.metrics()
+    assert metrics["runtimes"]["evictions"] == 1
+    assert metrics["inputs"]["hits"] == 2
+
+    # A rewritten config file is a different runtime.
+    pipeline_config_path.write_text(
+        pipeline_config_path.read_text(encoding="utf-8") + "\n", encoding="utf-8"
+    )
+    service.run(request)
+    assert service.metrics()["runtimes"]["misses"] == 3
+
+    with pytest.raises(ConfigValidationError, match="pipeline_config"):
+        service.run({})
+    with pytest.raises(ConfigValidationError, match="rows"):
+        service.run({**request, "rows": -1})
+
+
+def test_runtime_service_input_cache_respects_memory_budget(
+    pipeline_config_path: Path,
+) -> None:
+    service = RuntimeService(roots=[pipeline_config_path.parent], input_cache_bytes=1)
+    service.run({"pipeline_config": str(pipeline_config_path)})
+    service.run({"pipeline_config": str(pipeline_config_path)})
+    assert service.metrics()["inputs"] == {
+        "entries": 0,
+        "bytes": 0,
+        "max_bytes": 1,
+        "hits": 0,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+
+def test_latency_metrics_percentiles() -> None:
+    metrics = LatencyMetrics(window=4)
+    for elapsed in (5.0, 1.0, 2.0, 3.0, 4.0):
+        metrics.observe("/run", elapsed, ok=elapsed != 5.0)
+    assert metrics.to_dict()["/run"] == {
+        "requests": 5,
+        "errors": 1,
+        "mean_ms": 3.0,
+        "p50_ms": 2.0,
+        "p95_ms": 4.0,
+        "p99_ms": 4.0,
+        "max_ms": 4.0,
+    }
+
+
+def _request(
+    connection: http.client.HTTPConnection, method: str, path: str, body: object = None
+) -> tuple[int, dict]:
+    encoded = json.dumps(body).encode("utf-8") if body is not None else None
+    connection.request(method, path, body=encoded)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_http_server_runs_requests_and_reports_latency(
+    pipeline_config_path: Path, plugin_manifest_path: Path
+) -> None:
+    server = create_server(
+        RuntimeService(roots=[pipeline_config_path.parent]), host="127.0.0.1", port=0
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        assert _request(connection, "GET", "/health") == (200, {"status": "ok"})
+        status, payload = _request(
+            connection,
+            "POST",
+            "/run",
+            {"pipeline_config": str(pipeline_config_path), "plugins": str(plugin_manifest_path)},
+        )
+        assert status == 200
+        assert payload["diagnostics"]["final_rows"] > 0
+        expected = HonestRolesRuntime.from_configs(
+            pipeline_config_path, plugin_manifest_path
+        ).run()
+        assert payload["application_plan"] == [
+            entry.to_dict() for entry in expected.application_plan
+        ]
+        assert payload["application_plan"][0]["fit_rank"] == 1
+        status, payload = _request(
+            connection, "POST", "/run", {"pipeline_config": str(pipeline_config_path) + ".x"}
+        )
+        assert status == 400
+        assert payload["error"]["type"] == "ConfigValidationError"
+        assert _request(connection, "GET", "/missing")[0] == 404
+        status, metrics = _request(connection, "GET", "/metrics")
+        assert status == 200
+        assert metrics["requests"]["/run"]["requests"] == 2
+        assert metrics["requests"]["/run"]["errors"] == 1
+        assert metrics["requests"]["/run"]["max_ms"] > 0
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Unix sockets only")
+def test_unix_socket_server(tmp_path: Path, pipeline_config_path: Path) -> None:
+    socket_path = tmp_path / "honestroles.sock"
+    server = create_server(RuntimeService(roots=[tmp_path]), socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        import socket
+
+        class _UnixConnection(http.client.HTTPConnection):
+            def connect(self) -> None:
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.connect(str(socket_path))
+
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+        connection = _UnixConnection("localhost")
+        status, payload = _request(
+            connection, "POST", "/run", {"pipeline_config": str(pipeline_config_path)}
+        )
+        assert status == 200
+        assert payload["diagnostics"]["stage_rows"]["input"] == 3
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_runtime_service_rejects_paths_outside_roots(
+    pipeline_config_path: Path,
+    pipeline_config_non_fail_fast_path: Path,
+    plugin_manifest_path: Path,
+    tmp_path: Path,
+) -> None:
+    request = {"pipeline_config": str(pipeline_config_path)}
+    with pytest.raises(ConfigValidationError, match="pipeline_config .* outside"):
+        RuntimeService(roots=[tmp_path / "other"]).run(request)
+
+    service = RuntimeService(roots=[tmp_path])
+    with pytest.raises(ConfigValidationError, match="plugins .* outside"):
+        service.run({**request, "plugins": str(tmp_path.parent / "plugins.toml")})
+    with pytest.raises(ConfigValidationError, match="input.path .* outside"):
+        service.run(
+            {**request, "overrides": {"input": {"path": str(tmp_path.parent / "x.parquet")}}}
+        )
+    with pytest.raises(ConfigValidationError, match="stages.skills.dictionary .* outside"):
+        service.run(
+            {
+                **request,
+                "overrides": {
+                    "stages": {"skills": {"dictionary": str(tmp_path.parent / "v.json")}}
+                },
+            }
+        )
+    with pytest.raises(ConfigValidationError, match="'plugins' must be a path"):
+        service.run({**request, "plugins": 1})
+    with pytest.raises(ConfigValidationError, match="'overrides' must be an object"):
+        service.run({**request, "overrides": [1]})
+    assert service.run({**request, "plugins": str(plugin_manifest_path)})["diagnostics"]
+    assert service.run({"pipeline_config": str(pipeline_config_non_fail_fast_path)})
+
+
+def test_runtime_service_defaults_to_the_working_directory(
+    pipeline_config_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(pipeline_config_path.parent)
+    service = RuntimeService()
+    assert service.roots == (pipeline_config_path.parent.resolve(),)
+    assert service.run({"pipeline_config": "pipeline.toml"})["diagnostics"]
+
+
+def test_input_frame_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    paths = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.parquet"
+        pl.DataFrame({"x": list(range(100))}).write_parquet(path)
+        paths.append(path)
+    size = int(pl.read_parquet(paths[0]).estimated_size())
+    cache = InputFrameCache(max_bytes=size)
+
+    cache.read(paths[0])
+    cache.read(paths[1])
+    cache.read(paths[1])
+
+    assert cache.to_dict() == {
+        "entries": 1,
+        "bytes": size,
+        "max_bytes": size,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+    }
+
+
+def test_runtime_pool_bounds_registries_and_wraps_init_errors(
+    pipeline_config_path: Path, plugin_manifest_path: Path, tmp_path: Path, monkeypatch
+) -> None:
+    other_manifest = tmp_path / "plugins_other.toml"
+    other_manifest.write_text(
+        plugin_manifest_path.read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    pool = RuntimePool(1, InputFrameCache(0))
+    pool.get(pipeline_config_path, plugin_manifest_path)
+    pool.get(pipeline_config_path, other_manifest)
+    assert pool.to_dict()["plugin_registries"] == 1
+
+    def broken(**_kwargs):
+        raise RuntimeError("broken runtime")
+
+    invalid_config = tmp_path / "invalid.toml"
+    invalid_config.write_text("[input]\n", encoding="utf-8")
+    with pytest.raises(ConfigValidationError):
+        pool.get(invalid_config)
+
+    monkeypatch.setattr(server_module, "HonestRolesRuntime", broken)
+    with pytest.raises(RuntimeInitializationError, match="broken runtime"):
+        pool.get(pipeline_config_path)
+
+
+@pytest.mark.parametrize(
+    ("exc", "status"),
+    [
+        (ConfigValidationError("bad"), HTTPStatus.BAD_REQUEST),
+        (PluginExecutionError("p", "label", "bad"), HTTPStatus.UNPROCESSABLE_ENTITY),
+        (StageExecutionError("rate", "bad"), HTTPStatus.UNPROCESSABLE_ENTITY),
+        (RuntimeError("bad"), HTTPStatus.INTERNAL_SERVER_ERROR),
+    ],
+)
+def test_error_status(exc: Exception, status: HTTPStatus) -> None:
+    assert _error_status(exc) == status
+
+
+@pytest.mark.parametrize(
+    ("host", "loopback"),
+    [("localhost", True), ("::1", True), ("0.0.0.0", False), ("jobs.example", False)],
+)
+def test_is_loopback(host: str, loopback: bool) -> None:
+    assert _is_loopback(host) is loopback
+
+
+def _raw_request(
+    port: int, method: str, path: str, body: bytes, headers: dict
+) -> tuple[int, dict]:
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_http_server_requires_token_and_validates_bodies(
+    pipeline_config_path: Path,
+) -> None:
+    with pytest.raises(ConfigValidationError, match="requires a token"):
+        create_server(RuntimeService(), host="0.0.0.0", port=0)
+
+    server = create_server(
+        RuntimeService(roots=[pipeline_config_path.parent]),
+        host="localhost",
+        port=0,
+        token="secret",
+    )
+    port = server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    auth = {"Authorization": "Bearer secret"}
+    try:
+        assert _raw_request(port, "GET", "/health", b"", {})[0] == 200
+        status, payload = _raw_request(port, "GET", "/metrics", b"", {})
+        assert status == 401
+        assert payload["error"]["type"] == "Unauthorized"
+        wrong = {"Authorization": "Bearer x"}
+        assert _raw_request(port, "POST", "/run", b"{}", wrong)[0] == 401
+        assert _raw_request(port, "GET", "/metrics", b"", auth)[0] == 200
+        assert _raw_request(port, "GET", "/other", b"", auth)[0] == 404
+        assert _raw_request(port, "POST", "/other", b"{}", auth)[0] == 404
+
+        status, payload = _raw_request(port, "POST", "/run", b"{not json", auth)
+        assert (status, payload["error"]["type"]) == (400, "ConfigValidationError")
+        assert "invalid JSON" in payload["error"]["message"]
+        status, payload = _raw_request(port, "POST", "/run", b"[1]", auth)
+        assert "JSON object" in payload["error"]["message"]
+        status, payload = _raw_request(
+            port,
+            "POST",
+            "/run",
+            b"",
+            {**auth, "Content-Length": str(server_module._MAX_BODY_BYTES + 1)},
+        )
+        assert "too large" in payload["error"]["message"]
+        body = json.dumps({"pipeline_config": str(pipeline_config_path)}).encode("utf-8")
+        assert _raw_request(port, "POST", "/run", body, auth)[0] == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_server_closes_connections_with_unread_bodies(tmp_path: Path) -> None:
+    server = create_server(RuntimeService(roots=[tmp_path]), host="127.0.0.1", port=0)
+    port = server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for length, message in (
+            ("abc", "invalid Content-Length header 'abc'"),
+            ("-1", "invalid Content-Length header '-1'"),
+            (str(server_module._MAX_BODY_BYTES + 1), "too large"),
+        ):
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            try:
+                connection.putrequest("POST", "/run")
+                connection.putheader("Content-Length", length)
+                connection.endheaders()
+                response = connection.getresponse()
+                payload = json.loads(response.read())
+            finally:
+                connection.close()
+            assert response.status == 400
+            assert message in payload["error"]["message"]
+            assert response.getheader("Connection") == "close"
+
+        # A rejected body must not be parsed as a second request.
+        smuggled = b"GET /health HTTP/1.1\r\nHost: local\r\n\r\n"
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+            sock.sendall(
+                b"POST /other HTTP/1.1\r\nHost: local\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(smuggled), smuggled)
+            )
+            received = b""
+            while chunk := sock.recv(4096):
+                received += chunk
+        assert received.startswith(b"HTTP/1.1 404")
+        assert received.count(b"HTTP/1.1 ") == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_serve_logs_address_and_removes_socket(
+    tmp_path: Path, monkeypatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    def interrupt(self, *_args) -> None:
+        raise KeyboardInterrupt
+
+    socket_path = tmp_path / "serve.sock"
+    socket_path.write_text("stale", encoding="utf-8")
+    monkeypatch.setattr(server_module._ThreadingUnixHTTPServer, "serve_forever", interrupt)
+    monkeypatch.setattr(server_module._ThreadingTCPHTTPServer, "serve_forever", interrupt)
+    with caplog.at_level(logging.INFO, logger="honestroles.server"):
+        serve(socket_path=socket_path, roots=[tmp_path])
+        serve(port=0)
+
+    assert not socket_path.exists()
+    addresses = [json.loads(record.getMessage())["listening"] for record in caplog.records]
+    assert addresses[0] == f"unix:{socket_path}"
+    assert addresses[1].startswith("http://127.0.0.1:")
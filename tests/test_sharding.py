@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from honestroles.diagnostics import NonFatalStageError, ShardDiagnostics, StageRowCounts
+from honestroles.errors import ConfigValidationError
+from honestroles.sharding import ShardManifest, ShardSpec, ShardStore
+
+
+def _manifest(spec: ShardSpec, run_key: str = "run") -> ShardManifest:
+    return ShardManifest(
+        run_key=run_key,
+        diagnostics=ShardDiagnostics(
+            index=spec.index,
+            count=spec.count,
+            key="id",
+            stage_rows=StageRowCounts(counts={"input": 1}),
+            non_fatal_errors=(
+                NonFatalStageError(stage="label", error_type="ValueError", detail="bad"),
+            ),
+        ),
+    )
+
+
+def test_shard_spec_rejects_empty_shard_count() -> None:
+    with pytest.raises(ConfigValidationError, match="shard count must be >= 1"):
+        ShardSpec.parse("0/0")
+
+
+def test_shard_store_round_trips_manifest_without_candidates(tmp_path: Path) -> None:
+    store = ShardStore(tmp_path)
+    spec = ShardSpec(0, 1)
+    manifest = _manifest(spec)
+
+    store.store(spec, manifest, pl.DataFrame({"id": ["a"]}))
+    (shard,) = store.load("run")
+
+    assert shard.manifest.diagnostics == manifest.diagnostics
+    assert shard.read_output()["id"].to_list() == ["a"]
+    with pytest.raises(ConfigValidationError, match="shard 0 stored no match candidates"):
+        shard.read_candidates()
+
+
+def test_shard_store_rejects_mixed_shard_counts(tmp_path: Path) -> None:
+    store = ShardStore(tmp_path)
+    for spec in (ShardSpec(0, 1), ShardSpec(1, 2)):
+        store.store(spec, _manifest(spec), pl.DataFrame({"id": ["a"]}))
+
+    with pytest.raises(ConfigValidationError, match=r"different shard counts \[1, 2\]"):
+        store.load("run")
+
+
+@pytest.mark.parametrize("payload", ["{", json.dumps({"shard": {}})])
+def test_shard_store_rejects_corrupt_manifests(tmp_path: Path, payload: str) -> None:
+    (tmp_path / "shard-00000-of-00001.json").write_text(payload, encoding="utf-8")
+
+    with pytest.raises(ConfigValidationError, match="invalid shard manifest"):
+        ShardStore(tmp_path).load("run")
+
+
+def test_shard_store_load_empty_directory(tmp_path: Path) -> None:
+    with pytest.raises(ConfigValidationError, match="no shards for this pipeline config"):
+        ShardStore(tmp_path / "missing").load("run")
@@ -11,11 +11,17 @@ from honestroles.config.models import (
     LabelStageOptions,
     MatchStageOptions,
     RateStageOptions,
+    SkillStageOptions,
 )
 from honestroles.domain import JobDataset
-from honestroles.errors import StageExecutionError
+from honestroles.errors import ConfigValidationError, StageExecutionError
+from honestroles.lazy import _LazyStagePlan
 from honestroles.plugins.errors import PluginExecutionError
-from honestroles.plugins.types import PluginDefinition, RuntimeExecutionContext
+from honestroles.plugins.types import (
+    PluginDefinition,
+    PluginExpressions,
+    RuntimeExecutionContext,
+)
 from honestroles.stages import (
     _apply_filter_options,
     clean_stage,
@@ -23,7 +29,9 @@ from honestroles.stages import (
     label_stage,
     match_stage,
     rate_stage,
+    skills_stage,
 )
+from tests.plugins import fixture_plugins
 
 
 def _ctx() -> RuntimeExecutionContext:
@@ -72,10 +80,25 @@ def test_clean_stage_drop_null_titles_false_branch() -> None:
     assert out.row_count() == frame.height
 
 
+def test_clean_stage_drop_columns_nulls_canonical_and_drops_extra() -> None:
+    frame = _base_df().with_columns(pl.lit("x").alias("raw_payload"))
+    options = CleanStageOptions(drop_columns=("description_html", "raw_payload", "absent"))
+
+    out = clean_stage(JobDataset.from_polars(frame), options, _ctx()).to_polars()
+    assert "raw_payload" not in out.columns
+    assert out["description_html"].to_list() == [None, None]
+    assert out["description_text"].to_list() == ["python", "backend"]
+
+    extra_only = clean_stage(
+        JobDataset.from_polars(frame), CleanStageOptions(drop_columns=("raw_payload",)), _ctx()
+    ).to_polars()
+    assert extra_only["description_html"].to_list() == ["<p>python</p>", "<p>backend</p>"]
+
+
 def test_clean_stage_wraps_generic_exception(monkeypatch) -> None:
     import honestroles.stages as stages_module
 
-    def fail_clean_expr(_column: str) -> pl.Expr:
+    def fail_clean_expr(_column: str, _html_cache: object = None) -> pl.Expr:
         raise RuntimeError("x")
 
     monkeypatch.setattr(stages_module, "_clean_text_expr", fail_clean_expr)
@@ -96,6 +119,39 @@ def test_apply_filter_options_ignores_blank_keyword() -> None:
     assert out.height == _base_df().height
 
 
+def test_apply_filter_options_keyword_groups() -> None:
+    frame = pl.DataFrame(
+        {
+            "title": ["Python Engineer", "Data Analyst", "Senior Python Dev", None],
+            "description_text": ["AWS pipelines", "SQL on GCP", "unpaid; aws", "python gcp"],
+        }
+    )
+
+    def ids(options: FilterStageOptions) -> list[str | None]:
+        return _apply_filter_options(frame, options)["title"].to_list()
+
+    assert ids(FilterStageOptions(required_keywords=("PYTHON", " aws "))) == [
+        "Python Engineer",
+        "Senior Python Dev",
+    ]
+    assert ids(
+        FilterStageOptions(
+            keyword_groups=({"any_of": ["aws", "gcp"], "none_of": ["unpaid", "sql"]},)
+        )
+    ) == ["Python Engineer", None]
+    assert ids(
+        FilterStageOptions(
+            required_keywords=("python",),
+            keyword_groups=({"all_of": ["gcp"]}, {"any_of": ["gcp", "azure"]}),
+        )
+    ) == [None]
+    assert "__honestroles_keyword_text" not in _apply_filter_options(
+        frame, FilterStageOptions(required_keywords=("python",))
+    ).columns
+    with pytest.raises(ValueError, match="at least one non-empty keyword"):
+        FilterStageOptions(keyword_groups=({"all_of": ("  ",), "none_of": []},))
+
+
 def test_filter_stage_wraps_generic_exception(monkeypatch) -> None:
     import honestroles.stages as stages_module
 
@@ -109,6 +165,164 @@ def test_filter_stage_wraps_generic_exception(monkeypatch) -> None:
         filter_stage(_dataset(), FilterStageOptions(), _ctx())
 
 
+def test_skills_stage_matches_whole_aliases_in_one_pass() -> None:
+    frame = _base_df().with_columns(
+        pl.Series("title", ["Go Developer", "C++ / C# engineer"]),
+        pl.Series(
+            "description_text",
+            ["Good with Node.js, K8s.\nNo golang.", "Machine-learning and CI/CD; python3."],
+        ),
+    )
+    options = SkillStageOptions(
+        enabled=True,
+        terms={
+            "Go": ("golang",),
+            "Node.js": (),
+            "Kubernetes": ("k8s",),
+            "C++": (),
+            "C#": (),
+            "CI/CD": (),
+            "Machine Learning": ("machine learning",),
+            "Python": ("python3",),
+        },
+        mode="replace",
+    )
+
+    out = skills_stage(JobDataset.from_polars(frame), options, _ctx()).to_polars()
+
+    assert out["skills"].to_list() == [
+        ["Go", "Kubernetes", "Node.js"],
+        ["C#", "C++", "CI/CD", "Machine Learning", "Python"],
+    ]
+    merged = skills_stage(
+        JobDataset.from_polars(_base_df()),
+        SkillStageOptions(enabled=True, terms={"Backend": (), "python": ()}),
+        _ctx(),
+    ).to_polars()
+    assert merged["skills"].to_list() == [["python", "sql"], ["go", "Backend"]]
+
+
+def test_skills_stage_reads_dictionary_file_and_wraps_errors(tmp_path: Path) -> None:
+    dictionary = tmp_path / "skills.json"
+    dictionary.write_text('{"Python": ["py"], "SQL": ["postgres", "py"]}', encoding="utf-8")
+    options = SkillStageOptions(
+        enabled=True, dictionary=dictionary, terms={"Structured Query": ("sql",)}, mode="replace"
+    )
+
+    out = skills_stage(JobDataset.from_polars(_base_df()), options, _ctx()).to_polars()
+
+    # Inline terms claim "sql" first; "py" stays with the first dictionary entry.
+    assert out["skills"].to_list() == [["Python", "Structured Query"], []]
+
+    dictionary.write_text('["python"]', encoding="utf-8")
+    with pytest.raises(StageExecutionError, match="expected an object"):
+        skills_stage(JobDataset.from_polars(_base_df()), options, _ctx())
+    with pytest.raises(StageExecutionError, match="does not exist"):
+        skills_stage(
+            JobDataset.from_polars(_base_df()),
+            SkillStageOptions(enabled=True, dictionary=tmp_path / "missing.json"),
+            _ctx(),
+        )
+
+
+@pytest.mark.parametrize(
+    ("payload", "error"),
+    [
+        ("{", "invalid skill dictionary"),
+        ('{"": ["x"]}', "skill names must be non-empty strings"),
+        ('{"Python": "py"}', "aliases must be a list"),
+        ('{"Python": [1]}', "aliases must be strings"),
+    ],
+)
+def test_skills_stage_rejects_malformed_dictionary(
+    tmp_path: Path, payload: str, error: str
+) -> None:
+    dictionary = tmp_path / "skills.json"
+    dictionary.write_text(payload, encoding="utf-8")
+
+    with pytest.raises(StageExecutionError, match=error):
+        skills_stage(
+            JobDataset.from_polars(_base_df()),
+            SkillStageOptions(enabled=True, dictionary=dictionary),
+            _ctx(),
+        )
+
+
+def test_skills_stage_empty_vocabulary_finds_nothing(tmp_path: Path) -> None:
+    dictionary = tmp_path / "skills.json"
+    # "--" normalizes to nothing, so it never becomes an alias.
+    dictionary.write_text('{"--": []}', encoding="utf-8")
+
+    out = skills_stage(
+        JobDataset.from_polars(_base_df()),
+        SkillStageOptions(enabled=True, dictionary=dictionary, mode="replace"),
+        _ctx(),
+    ).to_polars()
+
+    assert out["skills"].to_list() == [[], []]
+
+
+def test_label_stage_compiles_configured_taxonomies() -> None:
+    frame = _base_df().with_columns(
+        pl.Series("title", ["Payments Data Analyst", "Senior Platform Engineer"]),
+        pl.Series("description_text", ["card payments", "kubernetes and HTML"]),
+    )
+    options = LabelStageOptions.model_validate(
+        {
+            "taxonomies": [
+                {
+                    "column": "label_role_category",
+                    "rules": [
+                        {"value": "analytics", "keywords": ["analyst"]},
+                        {"value": "platform", "keywords": ["platform", "data"]},
+                    ],
+                },
+                {
+                    "column": "label_domain",
+                    "source": "description_text",
+                    "resolution": "priority",
+                    "rules": [
+                        {"value": "web", "keywords": ["html"]},
+                        {"value": "infra", "keywords": ["kubernetes"], "priority": 2},
+                        {"value": "fintech", "keywords": ["Payments"], "priority": 2},
+                    ],
+                },
+            ]
+        }
+    )
+
+    out = label_stage(JobDataset.from_polars(frame), options, _ctx()).to_polars()
+
+    # Configured taxonomies replace the built-in one for the same column.
+    assert out["label_role_category"].to_list() == ["analytics", "platform"]
+    assert out["label_domain"].to_list() == ["fintech", "infra"]
+    assert out["label_seniority"].to_list() == ["mid", "senior"]
+    assert out["label_tech_stack"].to_list() == [[], []]
+    assert not [name for name in out.columns if name.startswith("__honestroles")]
+
+
+def test_label_taxonomy_first_match_uses_declaration_order_and_default() -> None:
+    options = LabelStageOptions.model_validate(
+        {
+            "taxonomies": [
+                {
+                    "column": "label_track",
+                    "default": "ic",
+                    "rules": [
+                        {"value": "manager", "keywords": ["manager"], "priority": -1},
+                        {"value": "lead", "keywords": ["lead", "manager"], "priority": 9},
+                    ],
+                }
+            ]
+        }
+    )
+    frame = _base_df().with_columns(pl.Series("title", ["Lead Engineering Manager", None]))
+
+    out = label_stage(JobDataset.from_polars(frame), options, _ctx()).to_polars()
+
+    assert out["label_track"].to_list() == ["manager", "ic"]
+
+
 def test_label_stage_plugin_exception_reraised() -> None:
     def explode(_dataset, _ctx):
         raise RuntimeError("boom")
@@ -246,9 +460,328 @@ def test_match_stage_adds_missing_label_when_rate_exists() -> None:
     assert "label_seniority" in ranked.to_polars().columns
 
 
+def test_match_stage_partial_top_k_keeps_stable_tie_order() -> None:
+    frame = pl.concat([_base_df()] * 4).with_columns(
+        pl.Series("id", [str(i) for i in range(8)]),
+        pl.Series("company", ["A", "B", "A", "B", "C", "A", "C", "B"]),
+        pl.Series("rate_composite", [0.5, 0.9, 0.5, 0.2, 0.9, 0.7, 0.5, None]),
+        pl.Series(
+            "label_seniority", ["Senior ", "junior", None, "mid", "senior", "junior", "x", None]
+        ),
+    )
+    dataset = JobDataset.from_polars(frame)
+
+    ranked, artifacts = match_stage(dataset, MatchStageOptions(top_k=4), _ctx())
+    expected = frame.sort("rate_composite", descending=True, nulls_last=True, maintain_order=True)
+    assert ranked.to_polars()["id"].to_list() == expected["id"].head(4).to_list()
+    assert ranked.to_polars()["id"].to_list() == ["1", "4", "5", "0"]
+    assert [entry.estimated_effort_minutes for entry in artifacts.application_plan] == [
+        12,
+        25,
+        12,
+        25,
+    ]
+    assert [entry.fit_rank for entry in artifacts.application_plan] == [1, 2, 3, 4]
+
+    grouped, plan = match_stage(
+        dataset, MatchStageOptions(top_k=1, group_by=["company"]), _ctx()
+    )
+    assert grouped.to_polars()["id"].to_list() == ["1", "4", "5"]
+    assert grouped.to_polars()["fit_rank"].to_list() == [1, 2, 3]
+    assert [entry.company for entry in plan.application_plan] == ["B", "C", "A"]
+
+
 def test_match_stage_wraps_generic_exception() -> None:
     class BadOptions:
         top_k = "oops"
 
     with pytest.raises(StageExecutionError):
         match_stage(_dataset(), BadOptions(), _ctx())
+
+
+
+def _expression_plugin(
+    name: str, kind: str, callable_name: str, settings: dict | None = None
+) -> PluginDefinition:
+    return PluginDefinition(
+        name=name,
+        kind=kind,  # type: ignore[arg-type]
+        callable_ref=f"tests.plugins.fixture_plugins:{callable_name}",
+        func=getattr(fixture_plugins, callable_name),
+        settings=settings or {},
+        contract="expressions",
+    )
+
+
+def test_label_stage_fuses_independent_expression_plugins(monkeypatch) -> None:
+    import honestroles.stages as stages_module
+
+    passes: list[tuple[str, ...]] = []
+    original = stages_module._apply_expression_batch
+
+    def counting_batch(frame, batch):
+        passes.append(tuple(plugin.name for plugin, _ in batch))
+        return original(frame, batch)
+
+    monkeypatch.setattr(stages_module, "_apply_expression_batch", counting_batch)
+    plugins = (
+        _expression_plugin("length", "label", "label_title_length_expr"),
+        _expression_plugin("note", "label", "label_note_expr"),
+        _expression_plugin("long", "label", "label_long_title_expr"),
+    )
+    result = label_stage(_dataset(), LabelStageOptions(), _ctx(), plugins=plugins)
+
+    assert passes == [("length", "note"), ("long",)]
+    frame = result.to_polars()
+    assert frame["title_length"].to_list() == [4, 11]
+    assert frame["plugin_label_note"].to_list() == ["plugin:note", "plugin:note"]
+    assert frame["long_title"].to_list() == [False, False]
+
+
+def test_rate_and_filter_expression_plugins_match_dataset_plugins() -> None:
+    settings = {"bonus": 0.05}
+    dataset_plugin = PluginDefinition(
+        name="bonus",
+        kind="rate",
+        callable_ref="tests.plugins.fixture_plugins:rate_bonus",
+        func=fixture_plugins.rate_bonus,
+        settings=settings,
+    )
+    fused = rate_stage(
+        _dataset(),
+        RateStageOptions(),
+        _ctx(),
+        plugins=(_expression_plugin("bonus", "rate", "rate_bonus_expr", settings),),
+    )
+    eager = rate_stage(_dataset(), RateStageOptions(), _ctx(), plugins=(dataset_plugin,))
+    assert fused.to_polars().equals(eager.to_polars())
+
+    frame = _base_df().with_columns(pl.Series("company", ["A", None], dtype=pl.String))
+    filtered = filter_stage(
+        JobDataset.from_polars(frame),
+        FilterStageOptions(),
+        _ctx(),
+        plugins=(_expression_plugin("has_company", "filter", "filter_has_company_expr"),),
+    )
+    assert filtered.to_polars()["id"].to_list() == ["1"]
+
+
+def test_expression_plugin_errors_name_the_failing_plugin() -> None:
+    def bad_cast(_schema, _ctx):
+        return PluginExpressions(
+            columns={"title_number": pl.col("title").cast(pl.Int64, strict=True)},
+            reads=("title",),
+        )
+
+    def unknown_read(_schema, _ctx):
+        return PluginExpressions(columns={"x": pl.lit(1)}, reads=("missing",))
+
+    def _plugin(name: str, func) -> PluginDefinition:
+        return PluginDefinition(
+            name=name, kind="label", callable_ref="x:y", func=func, contract="expressions"
+        )
+
+    ok = _expression_plugin("note", "label", "label_note_expr")
+    with pytest.raises(PluginExecutionError, match="plugin 'bad_cast'"):
+        label_stage(
+            _dataset(), LabelStageOptions(), _ctx(), plugins=(ok, _plugin("bad_cast", bad_cast))
+        )
+    with pytest.raises(PluginExecutionError, match="reads unknown columns: missing"):
+        label_stage(
+            _dataset(), LabelStageOptions(), _ctx(), plugins=(_plugin("unknown", unknown_read),)
+        )
+    predicate = _plugin("predicate", fixture_plugins.filter_has_company_expr)
+    with pytest.raises(PluginExecutionError, match="must set only columns"):
+        label_stage(_dataset(), LabelStageOptions(), _ctx(), plugins=(predicate,))
+
+
+@pytest.mark.parametrize(
+    ("kind", "result", "message"),
+    [
+        ("label", RuntimeError("boom"), "boom"),
+        ("label", {"x": pl.lit(1)}, "returned invalid type 'dict', expected PluginExpressions"),
+        ("filter", PluginExpressions(columns={"x": pl.lit(1)}), "must set only a predicate"),
+        ("label", PluginExpressions(columns={"title": pl.lit(1)}), "returned invalid expressions"),
+    ],
+)
+def test_expression_plugin_contract_errors(kind: str, result: object, message: str) -> None:
+    def plugin(_schema, _ctx):
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    definition = PluginDefinition(
+        name="bad", kind=kind, callable_ref="x:y", func=plugin, contract="expressions"  # type: ignore[arg-type]
+    )
+    stage = filter_stage if kind == "filter" else label_stage
+    options = FilterStageOptions() if kind == "filter" else LabelStageOptions()
+    with pytest.raises(PluginExecutionError, match=message):
+        stage(_dataset(), options, _ctx(), plugins=(definition,))
+
+
+def test_expression_batch_failure_names_every_plugin_when_none_fails_alone(
+    monkeypatch,
+) -> None:
+    import honestroles.stages as stages_module
+
+    original = stages_module._fuse_expressions
+
+    def fail_fused(frame, batch):
+        if len(batch) > 1:
+            raise ValueError("fused pass failed")
+        return original(frame, batch)
+
+    monkeypatch.setattr(stages_module, "_fuse_expressions", fail_fused)
+    plugins = (
+        _expression_plugin("length", "label", "label_title_length_expr"),
+        _expression_plugin("note", "label", "label_note_expr"),
+    )
+    with pytest.raises(PluginExecutionError, match="plugin 'length, note'.*fused pass failed"):
+        label_stage(_dataset(), LabelStageOptions(), _ctx(), plugins=plugins)
+
+
+def _declared_plugin(
+    name: str, func, *, reads: str, writes: str, order: int = 0
+) -> PluginDefinition:
+    from honestroles.plugins.types import PluginSpec
+
+    return PluginDefinition(
+        name=name,
+        kind="label",
+        callable_ref="x:y",
+        func=func,
+        order=order,
+        spec=PluginSpec(capabilities=(f"reads:{reads}", f"writes:{writes}")),
+    )
+
+
+def test_concurrent_waves_split_on_declared_conflicts() -> None:
+    from honestroles.stages import _concurrent_waves
+
+    def noop(dataset, _ctx):
+        return dataset
+
+    first = _declared_plugin("a", noop, reads="title", writes="x")
+    second = _declared_plugin("b", noop, reads="company", writes="y")
+    dependent = _declared_plugin("c", noop, reads="x", writes="z")
+    undeclared = PluginDefinition(name="d", kind="label", callable_ref="x:y", func=noop)
+
+    waves = _concurrent_waves((first, second, dependent, undeclared))
+    assert [[plugin.name for plugin in wave] for wave in waves] == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+    ]
+
+
+def test_label_stage_runs_declared_plugins_concurrently(monkeypatch) -> None:
+    import threading
+
+    import honestroles.stages as stages_module
+
+    monkeypatch.setattr(stages_module.os, "cpu_count", lambda: 4)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _column_plugin(column: str, value: str):
+        def plugin(dataset, _ctx):
+            barrier.wait()
+            return dataset.transform(
+                lambda frame: frame.with_columns(
+                    pl.lit(value).alias(column), pl.lit("ignored").alias("scratch")
+                )
+            )
+
+        return plugin
+
+    plugins = (
+        _declared_plugin("one", _column_plugin("col_one", "1"), reads="title", writes="col_one"),
+        _declared_plugin("two", _column_plugin("col_two", "2"), reads="title", writes="col_two"),
+    )
+    result = label_stage(_dataset(), LabelStageOptions(), _ctx(), plugins=plugins)
+
+    frame = result.to_polars()
+    assert frame["col_one"].to_list() == ["1", "1"]
+    assert frame["col_two"].to_list() == ["2", "2"]
+    assert "scratch" not in frame.columns
+    assert frame.columns[-2:] == ["col_one", "col_two"]
+
+
+def test_concurrent_plugins_must_preserve_rows() -> None:
+    def drop_rows(dataset, _ctx):
+        return dataset.transform(lambda frame: frame.head(1).with_columns(pl.lit(1).alias("a")))
+
+    def add_column(dataset, _ctx):
+        return dataset.transform(lambda frame: frame.with_columns(pl.lit(2).alias("b")))
+
+    plugins = (
+        _declared_plugin("drop", drop_rows, reads="title", writes="a"),
+        _declared_plugin("add", add_column, reads="title", writes="b"),
+    )
+    with pytest.raises(PluginExecutionError, match="plugin 'drop'.*preserve row count"):
+        label_stage(_dataset(), LabelStageOptions(), _ctx(), plugins=plugins)
+
+
+def test_concurrent_plugins_must_write_declared_columns() -> None:
+    def add_column(dataset, _ctx):
+        return dataset.transform(lambda frame: frame.with_columns(pl.lit(2).alias("b")))
+
+    plugins = (
+        _declared_plugin("lazy", lambda dataset, _ctx: dataset, reads="title", writes="a"),
+        _declared_plugin("add", add_column, reads="title", writes="b"),
+    )
+    with pytest.raises(PluginExecutionError, match="plugin 'lazy'.*did not write declared columns: a"):
+        label_stage(_dataset(), LabelStageOptions(), _ctx(), plugins=plugins)
+
+
+def test_lazy_plan_blames_the_stage_being_built_when_its_plugins_collect() -> None:
+    plan = _LazyStagePlan(frame=pl.LazyFrame({"title": ["x"]}))
+    plan.record("input")
+
+    with pytest.raises(StageExecutionError, match="stage 'label' failed"):
+        with plan.stage("label"):
+            plan.frame = plan.frame.with_columns(pl.col("title").cast(pl.Int64))
+            plan.collect()
+
+
+def test_lazy_plan_passes_through_package_errors_from_collect() -> None:
+    def fail(_values: pl.Series) -> pl.Series:
+        raise ConfigValidationError("raised inside the plan")
+
+    plan = _LazyStagePlan(frame=pl.LazyFrame({"title": ["x"]}))
+    plan.record("input")
+    plan.frame = plan.frame.with_columns(pl.col("title").map_batches(fail, return_dtype=pl.String))
+
+    with pytest.raises(ConfigValidationError, match="raised inside the plan"):
+        plan.collect()
+
+
+def test_execute_lazy_skips_disabled_stages() -> None:
+    from honestroles.config.models import StageConfig
+    from honestroles.lazy import execute_lazy
+    from honestroles.plugins.registry import PluginRegistry
+
+    stages = StageConfig.model_validate(
+        {name: {"enabled": False} for name in ("clean", "filter", "label", "rate", "match")}
+    )
+    result = execute_lazy(_base_df().lazy(), stages, _ctx(), PluginRegistry())
+
+    assert result.dataset.to_polars().equals(_base_df())
+    assert result.stage_rows.counts == {"input": 2}
+
+
+def test_lazy_plan_wraps_build_errors_and_skips_failed_stages() -> None:
+    frame = _base_df()
+    plan = _LazyStagePlan(frame=frame.lazy(), fail_fast=False)
+    plan.record("input")
+
+    with plan.stage("label"):
+        raise ValueError("bad option")
+    with plan.stage("rate"):
+        plan.frame = plan.frame.with_columns(pl.lit(0.5).alias("rate_composite"))
+
+    assert plan.collect().to_polars().columns == [*frame.columns, "rate_composite"]
+    assert [(error.stage, error.error_type) for error in plan.non_fatal_errors] == [
+        ("label", "StageExecutionError")
+    ]
+    rows = frame.height
+    assert plan.stage_rows.to_dict() == {"input": rows, "label": rows, "rate": rows}
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from honestroles.config.models import IpcWriterConfig
+from honestroles.streaming import ParquetPartWriter, iter_batches, merge_top_k
+
+
+def test_iter_batches_slices_input_and_rejects_empty_batches() -> None:
+    frame = pl.DataFrame({"id": [str(i) for i in range(5)]}).lazy()
+
+    assert [batch.height for batch in iter_batches(frame, 2)] == [2, 2, 1]
+    assert [batch.height for batch in iter_batches(frame.head(0), 2)] == [0]
+    with pytest.raises(ValueError, match="batch_rows must be >= 1"):
+        next(iter_batches(frame, 0))
+
+
+def test_merge_top_k_without_scores_keeps_input_order() -> None:
+    first = pl.DataFrame({"id": ["a", "b"]})
+    second = pl.DataFrame({"id": ["c"]})
+
+    pool = merge_top_k(None, first, 2)
+    assert merge_top_k(pool, second, 2)["id"].to_list() == ["a", "b"]
+
+
+@pytest.mark.parametrize("ipc", [None, IpcWriterConfig()])
+def test_part_writer_finalizes_empty_batches_with_their_schema(
+    tmp_path: Path, ipc: IpcWriterConfig | None
+) -> None:
+    target = tmp_path / ("out.arrow" if ipc is not None else "out.parquet")
+    writer = ParquetPartWriter(target, ipc=ipc)
+    empty = pl.DataFrame({"id": ["a"], "score": [1.0]}).clear()
+
+    writer.write(empty)
+    writer.write(empty)
+    writer.finalize()
+
+    assert writer.rows_written == 0
+    assert not writer.parts_dir.exists()
+    assert writer.empty_frame().schema == empty.schema
+
+
+@pytest.mark.parametrize("ipc", [None, IpcWriterConfig()])
+def test_part_writer_merges_parts_in_order(tmp_path: Path, ipc: IpcWriterConfig | None) -> None:
+    target = tmp_path / ("out.arrow" if ipc is not None else "out.parquet")
+    writer = ParquetPartWriter(target, ipc=ipc)
+
+    writer.write(pl.DataFrame({"id": ["a", "b"]}))
+    writer.write(pl.DataFrame({"id": []}, schema={"id": pl.String}))
+    writer.write(pl.DataFrame({"id": ["c"]}))
+    writer.finalize()
+
+    written = pl.read_ipc(target) if ipc is not None else pl.read_parquet(target)
+    assert written["id"].to_list() == ["a", "b", "c"]
+    assert writer.rows_written == 3
+    assert not writer.parts_dir.exists()
+
+
+def test_part_writer_finalizes_without_batches(tmp_path: Path) -> None:
+    writer = ParquetPartWriter(tmp_path / "out.parquet")
+
+    writer.finalize()
+
+    assert pl.read_parquet(tmp_path / "out.parquet").shape == (0, 0)
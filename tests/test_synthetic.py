@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from honestroles.cli.main import main
+from honestroles.errors import ConfigValidationError
+from honestroles.ingest.dedup import deduplicate_records
+from honestroles.ingest.normalize import normalize_records
+from honestroles.schema import CANONICAL_SOURCE_FIELDS
+from honestroles.synthetic import (
+    SYNTHETIC_JOB_COLUMNS,
+    SYNTHETIC_SOURCES,
+    generate_synthetic_corpus,
+    parse_row_count,
+    synthetic_jobs,
+    synthetic_raw_records,
+)
+
+
+def test_synthetic_jobs_are_deterministic_and_sliceable() -> None:
+    first = synthetic_jobs(2_000, seed=1).collect()
+    assert first.columns == list(SYNTHETIC_JOB_COLUMNS)
+    assert set(CANONICAL_SOURCE_FIELDS) <= set(first.columns)
+    assert first.equals(synthetic_jobs(2_000, seed=1).collect())
+    assert not first.equals(synthetic_jobs(2_000, seed=2).collect())
+    assert first.slice(500, 300).equals(synthetic_jobs(300, seed=1, offset=500).collect())
+
+    assert set(first.get_column("source")) == set(SYNTHETIC_SOURCES)
+    assert 0 < first.get_column("location").null_count() < 300
+    assert 800 < first.get_column("salary_min").null_count() < 1_400
+    assert first.get_column("description_html").str.contains("<li>").all()
+    posted = first.get_column("posted_at").drop_nulls()
+    assert posted.str.starts_with("2025-").all()
+    company_counts = first.get_column("company").value_counts(sort=True)
+    assert company_counts.get_column("count")[0] > 10 * company_counts.get_column("count")[-1]
+
+
+def test_synthetic_jobs_include_exact_and_near_duplicates() -> None:
+    frame = synthetic_jobs(4_000).collect()
+
+    exact = frame.filter(frame.select(["source", "source_job_id"]).is_duplicated())
+    assert exact.height > 0
+    relisted = frame.filter(pl.col("apply_url").str.contains("utm_source=", literal=True))
+    assert relisted.height > 0
+    base_url = relisted.get_column("apply_url")[0].split("?")[0]
+    assert base_url in set(frame.get_column("apply_url"))
+
+    content = frame.group_by("description_html", "company").agg(
+        pl.col("source").n_unique().alias("sources")
+    )
+    assert content.filter(pl.col("sources") > 1).height > 0
+    assert frame.get_column("title").str.starts_with("Sr. ").any()
+
+
+@pytest.mark.parametrize("source", SYNTHETIC_SOURCES)
+def test_synthetic_raw_payloads_normalize_like_their_rows(source: str) -> None:
+    jobs = synthetic_jobs(1_500, seed=3).filter(pl.col("source") == source).collect()
+    raw = synthetic_raw_records(1_500, source, seed=3).collect()
+    assert raw.height == jobs.height
+
+    records = [
+        normalize_records(
+            [item["payload"]],
+            source=source,
+            source_ref=item["source_ref"],
+            ingested_at_utc="2026-01-01T00:00:00+00:00",
+        )[0]
+        for item in raw.to_dicts()
+    ]
+    for record, expected in zip(records, jobs.to_dicts(), strict=True):
+        assert record["source_job_id"] == expected["source_job_id"]
+        assert record["title"] == expected["title"]
+        assert record["location"] == expected["location"]
+        assert record["apply_url"] == expected["apply_url"]
+        assert bool(record["remote"]) == expected["remote"]
+        assert record["description_html"] == expected["description_html"]
+        assert record["posted_at"] is not None or expected["posted_at"] is None
+    _, dropped = deduplicate_records(records)
+    assert dropped > 0
+
+
+def test_generate_synthetic_corpus_streams_every_format(tmp_path: Path) -> None:
+    result = generate_synthetic_corpus(output_dir=tmp_path, rows=1_000, seed=5, chunk_rows=300)
+
+    jobs = pl.read_parquet(tmp_path / "jobs.parquet")
+    assert jobs.equals(synthetic_jobs(1_000, seed=5).collect())
+    assert pl.read_ndjson(tmp_path / "jobs.ndjson").height == 1_000
+    raw_lines = 0
+    for source in SYNTHETIC_SOURCES:
+        lines = (tmp_path / "raw" / f"{source}.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == result.source_counts[source]
+        assert set(json.loads(lines[0])) == {"source_ref", "payload"}
+        raw_lines += len(lines)
+    assert raw_lines == 1_000
+    assert sum(result.variant_counts.values()) == 1_000
+    assert result.variant_counts["crosspost"] > 0
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest == result.to_payload()
+
+    only_parquet = generate_synthetic_corpus(
+        output_dir=tmp_path / "parquet-only", rows=10, formats=["parquet"]
+    )
+    assert set(only_parquet.files) == {"parquet"}
+    with pytest.raises(ConfigValidationError, match="invalid synthetic format"):
+        generate_synthetic_corpus(output_dir=tmp_path, rows=10, formats=["csv"])
+
+
+def test_generate_synthetic_corpus_raw_only_and_invalid_sizes(tmp_path: Path) -> None:
+    raw_only = generate_synthetic_corpus(
+        output_dir=tmp_path, rows=20, formats=["raw-jsonl"], chunk_rows=7
+    )
+    assert set(raw_only.files) == {f"raw_{source}" for source in SYNTHETIC_SOURCES}
+    assert not (tmp_path / "jobs.parquet").exists()
+    assert not (tmp_path / ".jobs.parquet.parts").exists()
+
+    with pytest.raises(ConfigValidationError, match="rows must be >= 1"):
+        generate_synthetic_corpus(output_dir=tmp_path, rows=0)
+    with pytest.raises(ConfigValidationError, match="chunk-rows must be >= 1"):
+        generate_synthetic_corpus(output_dir=tmp_path, rows=10, chunk_rows=0)
+    with pytest.raises(ConfigValidationError, match="unsupported synthetic source 'monster'"):
+        synthetic_raw_records(10, "monster")
+
+
+def test_parse_row_count() -> None:
+    assert parse_row_count("10000") == 10_000
+    assert parse_row_count("100k") == 100_000
+    assert parse_row_count("1.5M") == 1_500_000
+    with pytest.raises(ConfigValidationError, match="invalid row count"):
+        parse_row_count("lots")
+    with pytest.raises(ConfigValidationError, match="must be >= 1"):
+        parse_row_count("0")
+
+
+def test_cli_synthetic_generate(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output_dir = tmp_path / "corpus"
+    code = main(
+        [
+            "synthetic",
+            "generate",
+            "--rows",
+            "1k",
+            "--output-dir",
+            str(output_dir),
+            "--formats",
+            "parquet,raw-jsonl",
+            "--as-of",
+            "2025-06-01",
+        ]
+    )
+    assert code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["rows"] == 1_000
+    assert payload["as_of"] == "2025-06-01"
+    assert not (output_dir / "jobs.ndjson").exists()
+    posted = pl.read_parquet(output_dir / "jobs.parquet").get_column("posted_at").drop_nulls()
+    assert posted.max() < "2025-06-01"
+
+    assert main(["synthetic", "generate", "--rows", "10", "--output-dir", str(output_dir), "--as-of", "soon"]) == 2